@@ -21,6 +21,7 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.colors import HexColor
 import matplotlib.font_manager as fm
+from dataset_loader import load_dataset
 
 # 设置输出编码
 if sys.stdout.encoding != 'utf-8':
@@ -852,7 +853,7 @@ def main():
     
     # 读取数据
     print(f"\n正在读取文件: {EXCEL_FILE}")
-    df = pd.read_excel(EXCEL_FILE)
+    df = load_dataset(EXCEL_FILE)
     print(f"数据加载完成：{len(df)} 条记录，{len(df.columns)} 个字段")
     
     # 按relevance level分组
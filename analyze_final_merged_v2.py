@@ -21,6 +21,9 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.colors import HexColor
 import matplotlib.font_manager as fm
+from dataset_loader import load_dataset
+from chart_renderer import ChartJob, render_charts
+from requirement_features import extract_requirement_features
 from collections import Counter
 
 # 设置输出编码
@@ -195,175 +198,6 @@ def extract_job_level(job_title):
     else:
         return "Regular"
 
-# 学历关键词
-EDUCATION_KEYWORDS = {
-    'Bachelor': ['bachelor', "bachelor's", 'bs', 'b.s.', 'ba', 'b.a.', 'undergraduate'],
-    'Master': ['master', "master's", 'ms', 'm.s.', 'ma', 'm.a.', 'mba', 'm.sc.', 'meng'],
-    'PhD': ['phd', 'ph.d', 'ph.d.', 'doctorate', 'doctoral', 'd.phil'],
-    'Associate': ['associate', 'aa', 'a.a.', 'as', 'a.s.'],
-    'High School': ['high school', 'hs', 'h.s.', 'diploma']
-}
-
-# 专业关键词
-MAJOR_KEYWORDS = {
-    'Computer Science': ['computer science', 'cs', 'computing', 'software engineering'],
-    'Data Science': ['data science', 'data analytics', 'data analysis'],
-    'Mathematics': ['mathematics', 'math', 'statistics', 'statistical'],
-    'Engineering': ['engineering', 'engineer', 'electrical engineering', 'mechanical engineering'],
-    'AI/ML': ['artificial intelligence', 'machine learning', 'ai', 'ml', 'deep learning', 'neural network'],
-    'Business': ['business', 'mba', 'management', 'finance', 'economics'],
-    'Physics': ['physics', 'physical'],
-    'Information Systems': ['information systems', 'information technology', 'it', 'mis']
-}
-
-# 文科专业关键词
-LIBERAL_ARTS_KEYWORDS = {
-    'Liberal Arts': ['liberal arts', 'humanities', 'arts', 'literature', 'english', 'history', 'philosophy'],
-    'Social Sciences': ['psychology', 'sociology', 'anthropology', 'political science', 'international relations'],
-    'Communication': ['communication', 'journalism', 'media studies', 'public relations'],
-    'Education': ['education', 'teaching', 'pedagogy'],
-    'Languages': ['linguistics', 'language', 'translation', 'interpretation'],
-    'Design': ['design', 'graphic design', 'industrial design', 'user experience', 'ux', 'ui'],
-    'Business (Non-STEM)': ['business administration', 'marketing', 'advertising', 'public relations'],
-    'Law': ['law', 'legal', 'jurisprudence'],
-    'Arts': ['fine arts', 'visual arts', 'performing arts', 'music', 'theater', 'drama']
-}
-
-def extract_education(text):
-    """从文本中提取学历要求"""
-    if pd.isna(text) or not isinstance(text, str):
-        return []
-    
-    text_lower = text.lower()
-    found_degrees = []
-    
-    for degree, keywords in [('PhD', EDUCATION_KEYWORDS['PhD']),
-                             ('Master', EDUCATION_KEYWORDS['Master']),
-                             ('Bachelor', EDUCATION_KEYWORDS['Bachelor']),
-                             ('Associate', EDUCATION_KEYWORDS['Associate']),
-                             ('High School', EDUCATION_KEYWORDS['High School'])]:
-        for keyword in keywords:
-            if keyword in text_lower:
-                found_degrees.append(degree)
-                break
-    
-    return found_degrees
-
-def extract_major(text):
-    """从文本中提取专业要求"""
-    if pd.isna(text) or not isinstance(text, str):
-        return []
-    
-    text_lower = text.lower()
-    found_majors = []
-    
-    for major, keywords in MAJOR_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                found_majors.append(major)
-                break
-    
-    return found_majors
-
-def extract_liberal_arts_major(text):
-    """从文本中提取文科专业要求"""
-    if pd.isna(text) or not isinstance(text, str):
-        return []
-    
-    text_lower = text.lower()
-    found_majors = []
-    
-    for major, keywords in LIBERAL_ARTS_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                found_majors.append(major)
-                break
-    
-    return found_majors
-
-def extract_graduation_year_requirement(text):
-    """提取毕业年份要求（对应届生的要求）"""
-    if pd.isna(text) or not isinstance(text, str):
-        return None
-    
-    text_lower = text.lower()
-    
-    # 查找应届生相关关键词
-    new_grad_keywords = ['new grad', 'new graduate', 'recent graduate', 'recent grad', 
-                         'entry level', 'entry-level', 'college graduate', 'university graduate',
-                         'graduating', 'graduation', 'class of']
-    
-    is_new_grad = any(keyword in text_lower for keyword in new_grad_keywords)
-    
-    # 查找具体的毕业年份要求
-    year_patterns = [
-        r'class of\s+(\d{4})',
-        r'graduat(?:ed|ing|ion)\s+(?:in|from)\s+(\d{4})',
-        r'(\d{4})\s+graduate',
-        r'graduate\s+of\s+(\d{4})',
-    ]
-    
-    graduation_year = None
-    for pattern in year_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            year = int(match.group(1))
-            if 2020 <= year <= CURRENT_YEAR + 1:  # 合理的年份范围
-                graduation_year = year
-                break
-    
-    # 如果找到应届生关键词但没有具体年份，检查是否要求2024或2025年毕业
-    if is_new_grad and graduation_year is None:
-        if '2024' in text or '2025' in text:
-            if '2025' in text:
-                graduation_year = 2025
-            elif '2024' in text:
-                graduation_year = 2024
-    
-    return graduation_year if is_new_grad else None
-
-def extract_experience_years(text):
-    """提取工作经历年份要求"""
-    if pd.isna(text) or not isinstance(text, str):
-        return None
-    
-    text_lower = text.lower()
-    
-    # 查找经验要求模式
-    experience_patterns = [
-        r'(\d+)\+?\s*years?\s*(?:of)?\s*(?:experience|exp|work)',
-        r'(\d+)\+?\s*years?\s*(?:in|of)',
-        r'minimum\s+of\s+(\d+)\s*years?',
-        r'at least\s+(\d+)\s*years?',
-        r'(\d+)\s*-\s*(\d+)\s*years?\s*(?:of)?\s*(?:experience|exp)',
-    ]
-    
-    years_required = []
-    for pattern in experience_patterns:
-        matches = re.finditer(pattern, text_lower)
-        for match in matches:
-            if len(match.groups()) == 2:  # 范围，如 "3-5 years"
-                min_years = int(match.group(1))
-                max_years = int(match.group(2))
-                years_required.append((min_years, max_years))
-            else:  # 单个数字
-                years = int(match.group(1))
-                if 0 <= years <= 20:  # 合理的范围
-                    years_required.append(years)
-    
-    # 返回最常见的年份要求，或者范围
-    if years_required:
-        # 如果是单个数字，返回最常见的
-        single_years = [y for y in years_required if isinstance(y, int)]
-        if single_years:
-            return Counter(single_years).most_common(1)[0][0]
-        # 如果是范围，返回最小值
-        ranges = [y for y in years_required if isinstance(y, tuple)]
-        if ranges:
-            return ranges[0][0]
-    
-    return None
-
 def update_relevance_level(df):
     """更新relevance level：1是AI+，2是+AI，并且如果一个职位标签已经在Level 1里，就不归类到Level 2"""
     df = df.copy()
@@ -391,81 +225,56 @@ def extract_salary_value(salary_str):
         return float(numbers[0])
     return None
 
-def analyze_education_requirements(df):
+def requirement_features(df, features=None):
+    """专业要求字段的特征表（学历/专业/文科专业/应届生/工作经历，一次扫描；已提取时直接复用）"""
+    if features is None:
+        features = extract_requirement_features(df['专业要求'], current_year=CURRENT_YEAR)
+    return features
+
+def count_labels(labels, total):
+    """各标签出现次数（按次数排序）及占职位总数的百分比"""
+    all_labels = [label for row_labels in labels for label in row_labels]
+    if not all_labels:
+        return None, None
+    counts = pd.Series(all_labels).value_counts()
+    percentages = (counts / total * 100).apply(lambda x: round(x, 2))
+    return counts, percentages
+
+def analyze_education_requirements(df, features=None):
     """分析学历要求"""
     print("\n正在分析学历要求...")
-    
-    all_degrees = []
-    for text in df['专业要求'].dropna():
-        degrees = extract_education(text)
-        all_degrees.extend(degrees)
-    
-    if not all_degrees:
-        return None, None
-    
-    degree_counts = pd.Series(all_degrees).value_counts()
-    degree_percentages = (degree_counts / len(df) * 100).apply(lambda x: round(x, 2))
-    
-    return degree_counts, degree_percentages
+    return count_labels(requirement_features(df, features)['education'], len(df))
 
-def analyze_major_requirements(df):
+def analyze_major_requirements(df, features=None):
     """分析专业要求"""
     print("正在分析专业要求...")
-    
-    all_majors = []
-    for text in df['专业要求'].dropna():
-        majors = extract_major(text)
-        all_majors.extend(majors)
-    
-    if not all_majors:
-        return None, None
-    
-    major_counts = pd.Series(all_majors).value_counts()
-    major_percentages = (major_counts / len(df) * 100).apply(lambda x: round(x, 2))
-    
-    return major_counts, major_percentages
+    return count_labels(requirement_features(df, features)['majors'], len(df))
 
-def analyze_liberal_arts_requirements(df):
+def analyze_liberal_arts_requirements(df, features=None):
     """分析文科专业要求"""
     print("正在分析文科专业要求...")
-    
-    all_liberal_arts = []
-    for text in df['专业要求'].dropna():
-        majors = extract_liberal_arts_major(text)
-        all_liberal_arts.extend(majors)
-    
-    if not all_liberal_arts:
-        return None, None
-    
-    liberal_arts_counts = pd.Series(all_liberal_arts).value_counts()
-    liberal_arts_percentages = (liberal_arts_counts / len(df) * 100).apply(lambda x: round(x, 2))
-    
-    return liberal_arts_counts, liberal_arts_percentages
+    return count_labels(requirement_features(df, features)['liberal_arts'], len(df))
+
+def count_liberal_arts_jobs(df, features=None):
+    """包含文科专业要求的职位数"""
+    return int((requirement_features(df, features)['liberal_arts'].str.len() > 0).sum())
 
-def analyze_new_grad_requirements(df):
+def analyze_new_grad_requirements(df, features=None):
     """分析应届生要求"""
     print("正在分析应届生要求...")
     
-    graduation_years = []
-    for text in df['专业要求'].dropna():
-        year = extract_graduation_year_requirement(text)
-        if year is not None:
-            graduation_years.append(year)
+    graduation_years = requirement_features(df, features)['graduation_year'].dropna().tolist()
     
     new_grad_count = len(graduation_years)
     new_grad_percentage = round(new_grad_count / len(df) * 100, 2)
     
     return new_grad_count, new_grad_percentage, graduation_years
 
-def analyze_experience_requirements(df):
+def analyze_experience_requirements(df, features=None):
     """分析工作经历要求"""
     print("正在分析工作经历要求...")
     
-    experience_years = []
-    for text in df['专业要求'].dropna():
-        years = extract_experience_years(text)
-        if years is not None:
-            experience_years.append(years)
+    experience_years = requirement_features(df, features)['experience_years'].dropna().tolist()
     
     experience_count = len(experience_years)
     experience_percentage = round(experience_count / len(df) * 100, 2)
@@ -480,147 +289,243 @@ def analyze_experience_requirements(df):
     
     return experience_count, experience_percentage, experience_dist, experience_dist_percentages
 
-def generate_charts(df, df_level1, df_level2, output_dir, degree_counts=None, degree_percentages=None,
-                   major_counts=None, major_percentages=None, liberal_arts_counts=None, liberal_arts_percentages=None,
-                   experience_dist=None, experience_dist_percentages=None):
-    """生成所有图表"""
-    chart_files = []
-    
-    # 1. Relevance Level分布（更新为AI+和+AI）
+def chart_spec():
+    """图表样式（字体、whitegrid样式、DPI），进程池中的子进程按此绘图"""
+    rc = dict(sns.axes_style("whitegrid"))
+    rc.update({
+        'font.sans-serif': [available_font] if available_font else list(plt.rcParams['font.sans-serif']),
+        'font.family': 'sans-serif',
+        'axes.unicode_minus': False,
+    })
+    return {'dpi': 150, 'font': available_font, 'rc': rc}
+
+def _font(spec):
+    return spec['font'] if spec['font'] else 'sans-serif'
+
+def render_relevance_level(data, spec, path):
+    """1. Relevance Level分布：{'counts': Series, 'total': 职位总数}"""
+    font = _font(spec)
+    level_counts, total = data['counts'], data['total']
     fig, ax = plt.subplots(figsize=(8, 6))
-    if available_font:
-        plt.rcParams['font.sans-serif'] = [available_font]
-    level_counts = df['relevance level'].value_counts().sort_index()
     colors = ['#FF6B6B', '#4ECDC4']
     bars = ax.bar(level_counts.index.astype(str), level_counts.values, color=colors, alpha=0.7, edgecolor='black')
-    ax.set_xlabel('Relevance Level', fontsize=12, fontfamily=available_font if available_font else 'sans-serif')
-    ax.set_ylabel('职位数量', fontsize=12, fontfamily=available_font if available_font else 'sans-serif')
-    ax.set_title('AI相关职位Relevance Level分布', fontsize=14, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
+    ax.set_xlabel('Relevance Level', fontsize=12, fontfamily=font)
+    ax.set_ylabel('职位数量', fontsize=12, fontfamily=font)
+    ax.set_title('AI相关职位Relevance Level分布', fontsize=14, fontweight='bold', fontfamily=font)
     ax.set_xticks(range(len(level_counts)))
     ax.set_xticklabels(['Level 1 (AI+)', 'Level 2 (+AI)'])
     for i, (idx, val) in enumerate(level_counts.items()):
-        ax.text(i, val + 50, f'{val}\n({val/len(df)*100:.1f}%)', 
+        ax.text(i, val + 50, f'{val}\n({val/total*100:.1f}%)', 
                 ha='center', va='bottom', fontsize=11, fontweight='bold')
     plt.tight_layout()
-    chart1 = os.path.join(output_dir, 'chart1_relevance_level.png')
-    plt.savefig(chart1, dpi=150, bbox_inches='tight')
+    plt.savefig(path, dpi=spec['dpi'], bbox_inches='tight')
+    plt.close()
+
+def render_top_counts(data, spec, path):
+    """2/5/6. Top N 横向条形图：{'counts': Series, 'total', 'title', 'palette', 'offset', 'fontsize'}"""
+    font = _font(spec)
+    counts, total = data['counts'], data['total']
+    fig, ax = plt.subplots(figsize=(10, 8))
+    colors = sns.color_palette(data['palette'], len(counts))
+    bars = ax.barh(range(len(counts)), counts.values, color=colors)
+    ax.set_yticks(range(len(counts)))
+    ax.set_yticklabels(counts.index, fontsize=9, fontfamily=font)
+    ax.set_xlabel('职位数量', fontsize=12, fontfamily=font)
+    ax.set_title(data['title'], fontsize=14, fontweight='bold', fontfamily=font)
+    ax.invert_yaxis()
+    for i, (idx, val) in enumerate(counts.items()):
+        ax.text(val + data['offset'], i, f'{val} ({val/total*100:.2f}%)', 
+                va='center', fontsize=data['fontsize'])
+    plt.tight_layout()
+    plt.savefig(path, dpi=spec['dpi'], bbox_inches='tight')
+    plt.close()
+
+def render_job_labels_comparison(data, spec, path):
+    """3. 职位标签对比：{'level1': Series, 'level2': Series}"""
+    font = _font(spec)
+    label1, label2 = data['level1'], data['level2']
+    fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+    
+    colors1 = sns.color_palette("Reds", len(label1))
+    axes[0].barh(range(len(label1)), label1.values, color=colors1)
+    axes[0].set_yticks(range(len(label1)))
+    axes[0].set_yticklabels(label1.index, fontsize=8, fontfamily=font)
+    axes[0].set_xlabel('职位数量', fontsize=11, fontfamily=font)
+    axes[0].set_title('Level 1 (AI+) Top 10 职位标签', fontsize=12, fontweight='bold', fontfamily=font)
+    axes[0].invert_yaxis()
+    
+    colors2 = sns.color_palette("Blues", len(label2))
+    axes[1].barh(range(len(label2)), label2.values, color=colors2)
+    axes[1].set_yticks(range(len(label2)))
+    axes[1].set_yticklabels(label2.index, fontsize=8, fontfamily=font)
+    axes[1].set_xlabel('职位数量', fontsize=11, fontfamily=font)
+    axes[1].set_title('Level 2 (+AI) Top 10 职位标签', fontsize=12, fontweight='bold', fontfamily=font)
+    axes[1].invert_yaxis()
+    
+    plt.tight_layout()
+    plt.savefig(path, dpi=spec['dpi'], bbox_inches='tight')
+    plt.close()
+
+def render_category_bars(data, spec, path):
+    """4/8. 分类柱状图：{'counts': Series, 'percentages': Series, 'title', 'palette'}"""
+    font = _font(spec)
+    counts, percentages = data['counts'], data['percentages']
+    fig, ax = plt.subplots(figsize=(10, 6))
+    colors = sns.color_palette(data['palette'], len(counts))
+    bars = ax.bar(range(len(counts)), counts.values, color=colors, alpha=0.7, edgecolor='black')
+    ax.set_xticks(range(len(counts)))
+    ax.set_xticklabels(counts.index, fontsize=10, fontfamily=font, rotation=15, ha='right')
+    ax.set_ylabel('职位数量', fontsize=12, fontfamily=font)
+    ax.set_title(data['title'], fontsize=14, fontweight='bold', fontfamily=font)
+    for i, (idx, val) in enumerate(counts.items()):
+        ax.text(i, val + max(counts.values)*0.01, f'{val}\n({percentages[idx]:.1f}%)', 
+                ha='center', va='bottom', fontsize=10, fontweight='bold')
+    plt.tight_layout()
+    plt.savefig(path, dpi=spec['dpi'], bbox_inches='tight')
+    plt.close()
+
+def render_requirement_bars(data, spec, path):
+    """9/10. 专业要求横向条形图：{'counts': Series, 'percentages': Series, 'title', 'palette'}"""
+    font = _font(spec)
+    counts, percentages = data['counts'], data['percentages']
+    fig, ax = plt.subplots(figsize=(10, 6))
+    colors = sns.color_palette(data['palette'], len(counts))
+    bars = ax.barh(range(len(counts)), counts.values, color=colors, alpha=0.7, edgecolor='black')
+    ax.set_yticks(range(len(counts)))
+    ax.set_yticklabels(counts.index, fontsize=10, fontfamily=font)
+    ax.set_xlabel('职位数量', fontsize=12, fontfamily=font)
+    ax.set_title(data['title'], fontsize=14, fontweight='bold', fontfamily=font)
+    ax.invert_yaxis()
+    for i, (idx, val) in enumerate(counts.items()):
+        ax.text(val + max(counts.values)*0.01, i, f'{val} ({percentages[idx]:.1f}%)', 
+                va='center', fontsize=9)
+    plt.tight_layout()
+    plt.savefig(path, dpi=spec['dpi'], bbox_inches='tight')
+    plt.close()
+
+def render_experience(data, spec, path):
+    """11. 工作经历要求分布：{'experience': [(年数, 数量), ...], 'percentages': {年数: 百分比}}"""
+    font = _font(spec)
+    sorted_exp = data['experience']
+    years_list = [str(k) for k, v in sorted_exp]
+    counts_list = [v for k, v in sorted_exp]
+    fig, ax = plt.subplots(figsize=(10, 6))
+    colors = sns.color_palette("YlOrRd", len(years_list))
+    bars = ax.bar(range(len(years_list)), counts_list, color=colors, alpha=0.7, edgecolor='black')
+    ax.set_xticks(range(len(years_list)))
+    ax.set_xticklabels(years_list, fontsize=10, fontfamily=font, rotation=45, ha='right')
+    ax.set_ylabel('职位数量', fontsize=12, fontfamily=font)
+    ax.set_xlabel('工作经历要求（年）', fontsize=12, fontfamily=font)
+    ax.set_title('工作经历要求分布', fontsize=14, fontweight='bold', fontfamily=font)
+    for i, (years, count) in enumerate(sorted_exp):
+        ax.text(i, count + max(counts_list)*0.01, f'{count}\n({data["percentages"][years]:.1f}%)', 
+                ha='center', va='bottom', fontsize=9, fontweight='bold')
+    plt.tight_layout()
+    plt.savefig(path, dpi=spec['dpi'], bbox_inches='tight')
+    plt.close()
+
+def render_salary(data, spec, path):
+    """7. 薪资分布：{'values': [年薪, ...]}"""
+    font = _font(spec)
+    salary_series = pd.Series(data['values'])
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    axes[0].hist(salary_series, bins=50, color='coral', edgecolor='black', alpha=0.7)
+    axes[0].axvline(salary_series.mean(), color='red', linestyle='--', linewidth=2, 
+                    label=f'平均值: ${salary_series.mean():,.0f}')
+    axes[0].axvline(salary_series.median(), color='green', linestyle='--', linewidth=2, 
+                    label=f'中位数: ${salary_series.median():,.0f}')
+    axes[0].set_xlabel('年薪（美元）', fontsize=11, fontfamily=font)
+    axes[0].set_ylabel('频数', fontsize=11, fontfamily=font)
+    axes[0].set_title('年薪分布直方图', fontsize=12, fontweight='bold', fontfamily=font)
+    axes[0].legend(fontsize=9, prop={'family': font})
+    axes[0].grid(True, alpha=0.3)
+    
+    box_data = [salary_series]
+    axes[1].boxplot(box_data, vert=True, patch_artist=True,
+                    boxprops=dict(facecolor='lightcoral', alpha=0.7),
+                    medianprops=dict(color='red', linewidth=2))
+    axes[1].set_ylabel('年薪（美元）', fontsize=11, fontfamily=font)
+    axes[1].set_title('年薪箱线图', fontsize=12, fontweight='bold', fontfamily=font)
+    axes[1].set_xticklabels(['年薪'], fontfamily=font)
+    axes[1].grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(path, dpi=spec['dpi'], bbox_inches='tight')
     plt.close()
-    chart_files.append(chart1)
+
+def render_company_size(data, spec, path):
+    """12. 公司规模分布：{'values': [员工数, ...]}"""
+    font = _font(spec)
+    company_size = pd.Series(data['values'])
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    axes[0].hist(company_size, bins=50, color='steelblue', edgecolor='black', alpha=0.7)
+    axes[0].axvline(company_size.mean(), color='red', linestyle='--', linewidth=2, 
+                    label=f'平均值: {company_size.mean():.0f}')
+    axes[0].axvline(company_size.median(), color='green', linestyle='--', linewidth=2, 
+                    label=f'中位数: {company_size.median():.0f}')
+    axes[0].set_xlabel('公司规模（员工数）', fontsize=11, fontfamily=font)
+    axes[0].set_ylabel('频数', fontsize=11, fontfamily=font)
+    axes[0].set_title('公司规模分布直方图', fontsize=12, fontweight='bold', fontfamily=font)
+    axes[0].legend(fontsize=9, prop={'family': font})
+    axes[0].grid(True, alpha=0.3)
+    
+    box_data = [company_size]
+    axes[1].boxplot(box_data, vert=True, patch_artist=True,
+                    boxprops=dict(facecolor='lightblue', alpha=0.7),
+                    medianprops=dict(color='red', linewidth=2))
+    axes[1].set_ylabel('公司规模（员工数）', fontsize=11, fontfamily=font)
+    axes[1].set_title('公司规模箱线图', fontsize=12, fontweight='bold', fontfamily=font)
+    axes[1].set_xticklabels(['公司规模'], fontfamily=font)
+    axes[1].grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(path, dpi=spec['dpi'], bbox_inches='tight')
+    plt.close()
+
+def build_chart_jobs(df, df_level1, df_level2, degree_counts=None, degree_percentages=None,
+                     major_counts=None, major_percentages=None, liberal_arts_counts=None, liberal_arts_percentages=None,
+                     experience_dist=None, experience_dist_percentages=None):
+    """图表任务：每个任务只包含其图表所需的汇总数据（没有数据的图表不生成）"""
+    spec = chart_spec()
+    total = len(df)
+    jobs = []
+    
+    # 1. Relevance Level分布（更新为AI+和+AI）
+    level_counts = df['relevance level'].value_counts().sort_index()
+    jobs.append(ChartJob('chart1_relevance_level.png', render_relevance_level,
+                         {'counts': level_counts, 'total': total}, spec))
     
     # 2. 职位标签分布（合并，使用职位标签）
     if '职位标签' in df.columns:
-        job_label_counts = df['职位标签'].value_counts().head(15)
-        fig, ax = plt.subplots(figsize=(10, 8))
-        if available_font:
-            plt.rcParams['font.sans-serif'] = [available_font]
-        colors = sns.color_palette("husl", len(job_label_counts))
-        bars = ax.barh(range(len(job_label_counts)), job_label_counts.values, color=colors)
-        ax.set_yticks(range(len(job_label_counts)))
-        ax.set_yticklabels(job_label_counts.index, fontsize=9, fontfamily=available_font if available_font else 'sans-serif')
-        ax.set_xlabel('职位数量', fontsize=12, fontfamily=available_font if available_font else 'sans-serif')
-        ax.set_title('Top 15 职位标签分布（合并分析）', fontsize=14, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-        ax.invert_yaxis()
-        for i, (idx, val) in enumerate(job_label_counts.items()):
-            ax.text(val + 5, i, f'{val} ({val/len(df)*100:.2f}%)', 
-                    va='center', fontsize=9)
-        plt.tight_layout()
-        chart2 = os.path.join(output_dir, 'chart2_job_labels_merged.png')
-        plt.savefig(chart2, dpi=150, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart2)
+        jobs.append(ChartJob('chart2_job_labels_merged.png', render_top_counts, {
+            'counts': df['职位标签'].value_counts().head(15), 'total': total,
+            'title': 'Top 15 职位标签分布（合并分析）', 'palette': 'husl', 'offset': 5, 'fontsize': 9,
+        }, spec))
     
     # 3. 职位标签对比（Level 1 vs Level 2）
     if '职位标签' in df.columns:
-        label1 = df_level1['职位标签'].value_counts().head(10)
-        label2 = df_level2['职位标签'].value_counts().head(10)
-        fig, axes = plt.subplots(1, 2, figsize=(16, 6))
-        if available_font:
-            plt.rcParams['font.sans-serif'] = [available_font]
-        
-        colors1 = sns.color_palette("Reds", len(label1))
-        axes[0].barh(range(len(label1)), label1.values, color=colors1)
-        axes[0].set_yticks(range(len(label1)))
-        axes[0].set_yticklabels(label1.index, fontsize=8, fontfamily=available_font if available_font else 'sans-serif')
-        axes[0].set_xlabel('职位数量', fontsize=11, fontfamily=available_font if available_font else 'sans-serif')
-        axes[0].set_title('Level 1 (AI+) Top 10 职位标签', fontsize=12, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-        axes[0].invert_yaxis()
-        
-        colors2 = sns.color_palette("Blues", len(label2))
-        axes[1].barh(range(len(label2)), label2.values, color=colors2)
-        axes[1].set_yticks(range(len(label2)))
-        axes[1].set_yticklabels(label2.index, fontsize=8, fontfamily=available_font if available_font else 'sans-serif')
-        axes[1].set_xlabel('职位数量', fontsize=11, fontfamily=available_font if available_font else 'sans-serif')
-        axes[1].set_title('Level 2 (+AI) Top 10 职位标签', fontsize=12, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-        axes[1].invert_yaxis()
-        
-        plt.tight_layout()
-        chart3 = os.path.join(output_dir, 'chart3_job_labels_comparison.png')
-        plt.savefig(chart3, dpi=150, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart3)
+        jobs.append(ChartJob('chart3_job_labels_comparison.png', render_job_labels_comparison, {
+            'level1': df_level1['职位标签'].value_counts().head(10),
+            'level2': df_level2['职位标签'].value_counts().head(10),
+        }, spec))
     
     # 4. 岗位级别分布
     if '岗位级别' in df.columns:
-        level_counts = df['岗位级别'].value_counts()
-        fig, ax = plt.subplots(figsize=(10, 6))
-        if available_font:
-            plt.rcParams['font.sans-serif'] = [available_font]
-        colors = sns.color_palette("Set3", len(level_counts))
-        bars = ax.bar(range(len(level_counts)), level_counts.values, color=colors, alpha=0.7, edgecolor='black')
-        ax.set_xticks(range(len(level_counts)))
-        ax.set_xticklabels(level_counts.index, fontsize=10, fontfamily=available_font if available_font else 'sans-serif', rotation=15, ha='right')
-        ax.set_ylabel('职位数量', fontsize=12, fontfamily=available_font if available_font else 'sans-serif')
-        ax.set_title('岗位级别分布', fontsize=14, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-        for i, (idx, val) in enumerate(level_counts.items()):
-            ax.text(i, val + max(level_counts.values)*0.01, f'{val}\n({val/len(df)*100:.1f}%)', 
-                    ha='center', va='bottom', fontsize=10, fontweight='bold')
-        plt.tight_layout()
-        chart4 = os.path.join(output_dir, 'chart4_job_levels.png')
-        plt.savefig(chart4, dpi=150, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart4)
+        job_level_counts = df['岗位级别'].value_counts()
+        jobs.append(ChartJob('chart4_job_levels.png', render_category_bars, {
+            'counts': job_level_counts, 'percentages': job_level_counts / total * 100,
+            'title': '岗位级别分布', 'palette': 'Set3',
+        }, spec))
     
     # 5. 公司分布
-    company_counts = df['公司名称'].value_counts().head(15)
-    fig, ax = plt.subplots(figsize=(10, 8))
-    if available_font:
-        plt.rcParams['font.sans-serif'] = [available_font]
-    colors = sns.color_palette("muted", len(company_counts))
-    bars = ax.barh(range(len(company_counts)), company_counts.values, color=colors)
-    ax.set_yticks(range(len(company_counts)))
-    ax.set_yticklabels(company_counts.index, fontsize=9, fontfamily=available_font if available_font else 'sans-serif')
-    ax.set_xlabel('职位数量', fontsize=12, fontfamily=available_font if available_font else 'sans-serif')
-    ax.set_title('Top 15 公司职位发布数量', fontsize=14, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-    ax.invert_yaxis()
-    for i, (idx, val) in enumerate(company_counts.items()):
-        ax.text(val + 1, i, f'{val} ({val/len(df)*100:.2f}%)', 
-                va='center', fontsize=8)
-    plt.tight_layout()
-    chart5 = os.path.join(output_dir, 'chart5_companies.png')
-    plt.savefig(chart5, dpi=150, bbox_inches='tight')
-    plt.close()
-    chart_files.append(chart5)
+    jobs.append(ChartJob('chart5_companies.png', render_top_counts, {
+        'counts': df['公司名称'].value_counts().head(15), 'total': total,
+        'title': 'Top 15 公司职位发布数量', 'palette': 'muted', 'offset': 1, 'fontsize': 8,
+    }, spec))
     
     # 6. 地理位置分布
-    location_counts = df['地点'].value_counts().head(15)
-    fig, ax = plt.subplots(figsize=(10, 8))
-    if available_font:
-        plt.rcParams['font.sans-serif'] = [available_font]
-    colors = sns.color_palette("coolwarm", len(location_counts))
-    bars = ax.barh(range(len(location_counts)), location_counts.values, color=colors)
-    ax.set_yticks(range(len(location_counts)))
-    ax.set_yticklabels(location_counts.index, fontsize=9, fontfamily=available_font if available_font else 'sans-serif')
-    ax.set_xlabel('职位数量', fontsize=12, fontfamily=available_font if available_font else 'sans-serif')
-    ax.set_title('Top 15 地理位置职位分布', fontsize=14, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-    ax.invert_yaxis()
-    for i, (idx, val) in enumerate(location_counts.items()):
-        ax.text(val + 1, i, f'{val} ({val/len(df)*100:.2f}%)', 
-                va='center', fontsize=8)
-    plt.tight_layout()
-    chart6 = os.path.join(output_dir, 'chart6_locations.png')
-    plt.savefig(chart6, dpi=150, bbox_inches='tight')
-    plt.close()
-    chart_files.append(chart6)
+    jobs.append(ChartJob('chart6_locations.png', render_top_counts, {
+        'counts': df['地点'].value_counts().head(15), 'total': total,
+        'title': 'Top 15 地理位置职位分布', 'palette': 'coolwarm', 'offset': 1, 'fontsize': 8,
+    }, spec))
     
     # 7. 薪资分布
     salary_estimates = df['年薪预估值'].dropna()
@@ -632,170 +537,67 @@ def generate_charts(df, df_level1, df_level2, output_dir, degree_counts=None, de
             extracted = extract_salary_value(val)
             if extracted:
                 salary_values.append(extracted)
-    
     if salary_values:
-        salary_series = pd.Series(salary_values)
-        fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-        if available_font:
-            plt.rcParams['font.sans-serif'] = [available_font]
-        axes[0].hist(salary_series, bins=50, color='coral', edgecolor='black', alpha=0.7)
-        axes[0].axvline(salary_series.mean(), color='red', linestyle='--', linewidth=2, 
-                        label=f'平均值: ${salary_series.mean():,.0f}')
-        axes[0].axvline(salary_series.median(), color='green', linestyle='--', linewidth=2, 
-                        label=f'中位数: ${salary_series.median():,.0f}')
-        axes[0].set_xlabel('年薪（美元）', fontsize=11, fontfamily=available_font if available_font else 'sans-serif')
-        axes[0].set_ylabel('频数', fontsize=11, fontfamily=available_font if available_font else 'sans-serif')
-        axes[0].set_title('年薪分布直方图', fontsize=12, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-        axes[0].legend(fontsize=9, prop={'family': available_font if available_font else 'sans-serif'})
-        axes[0].grid(True, alpha=0.3)
-        
-        box_data = [salary_series]
-        axes[1].boxplot(box_data, vert=True, patch_artist=True,
-                        boxprops=dict(facecolor='lightcoral', alpha=0.7),
-                        medianprops=dict(color='red', linewidth=2))
-        axes[1].set_ylabel('年薪（美元）', fontsize=11, fontfamily=available_font if available_font else 'sans-serif')
-        axes[1].set_title('年薪箱线图', fontsize=12, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-        axes[1].set_xticklabels(['年薪'], fontfamily=available_font if available_font else 'sans-serif')
-        axes[1].grid(True, alpha=0.3)
-        plt.tight_layout()
-        chart7 = os.path.join(output_dir, 'chart7_salary.png')
-        plt.savefig(chart7, dpi=150, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart7)
+        jobs.append(ChartJob('chart7_salary.png', render_salary, {'values': salary_values}, spec))
     
     # 8. 学历要求分布
     if degree_counts is None:
         degree_counts, degree_percentages = analyze_education_requirements(df)
     if degree_counts is not None and len(degree_counts) > 0:
-        fig, ax = plt.subplots(figsize=(10, 6))
-        if available_font:
-            plt.rcParams['font.sans-serif'] = [available_font]
-        colors = sns.color_palette("Set2", len(degree_counts))
-        bars = ax.bar(range(len(degree_counts)), degree_counts.values, color=colors, alpha=0.7, edgecolor='black')
-        ax.set_xticks(range(len(degree_counts)))
-        ax.set_xticklabels(degree_counts.index, fontsize=10, fontfamily=available_font if available_font else 'sans-serif', rotation=15, ha='right')
-        ax.set_ylabel('职位数量', fontsize=12, fontfamily=available_font if available_font else 'sans-serif')
-        ax.set_title('学历要求分布', fontsize=14, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-        for i, (idx, val) in enumerate(degree_counts.items()):
-            ax.text(i, val + max(degree_counts.values)*0.01, f'{val}\n({degree_percentages[idx]:.1f}%)', 
-                    ha='center', va='bottom', fontsize=10, fontweight='bold')
-        plt.tight_layout()
-        chart8 = os.path.join(output_dir, 'chart8_education.png')
-        plt.savefig(chart8, dpi=150, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart8)
+        jobs.append(ChartJob('chart8_education.png', render_category_bars, {
+            'counts': degree_counts, 'percentages': degree_percentages,
+            'title': '学历要求分布', 'palette': 'Set2',
+        }, spec))
     
     # 9. 专业要求分布
     if major_counts is None:
         major_counts, major_percentages = analyze_major_requirements(df)
     if major_counts is not None and len(major_counts) > 0:
         top_majors = major_counts.head(10)
-        fig, ax = plt.subplots(figsize=(10, 6))
-        if available_font:
-            plt.rcParams['font.sans-serif'] = [available_font]
-        colors = sns.color_palette("viridis", len(top_majors))
-        bars = ax.barh(range(len(top_majors)), top_majors.values, color=colors, alpha=0.7, edgecolor='black')
-        ax.set_yticks(range(len(top_majors)))
-        ax.set_yticklabels(top_majors.index, fontsize=10, fontfamily=available_font if available_font else 'sans-serif')
-        ax.set_xlabel('职位数量', fontsize=12, fontfamily=available_font if available_font else 'sans-serif')
-        ax.set_title('Top 10 专业要求分布', fontsize=14, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-        ax.invert_yaxis()
-        for i, (idx, val) in enumerate(top_majors.items()):
-            ax.text(val + max(top_majors.values)*0.01, i, f'{val} ({major_percentages[idx]:.1f}%)', 
-                    va='center', fontsize=9)
-        plt.tight_layout()
-        chart9 = os.path.join(output_dir, 'chart9_major.png')
-        plt.savefig(chart9, dpi=150, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart9)
+        jobs.append(ChartJob('chart9_major.png', render_requirement_bars, {
+            'counts': top_majors, 'percentages': major_percentages[top_majors.index],
+            'title': 'Top 10 专业要求分布', 'palette': 'viridis',
+        }, spec))
     
     # 10. 文科专业要求分布
     if liberal_arts_counts is None:
         liberal_arts_counts, liberal_arts_percentages = analyze_liberal_arts_requirements(df)
     if liberal_arts_counts is not None and len(liberal_arts_counts) > 0:
-        fig, ax = plt.subplots(figsize=(10, 6))
-        if available_font:
-            plt.rcParams['font.sans-serif'] = [available_font]
-        colors = sns.color_palette("pastel", len(liberal_arts_counts))
-        bars = ax.barh(range(len(liberal_arts_counts)), liberal_arts_counts.values, color=colors, alpha=0.7, edgecolor='black')
-        ax.set_yticks(range(len(liberal_arts_counts)))
-        ax.set_yticklabels(liberal_arts_counts.index, fontsize=10, fontfamily=available_font if available_font else 'sans-serif')
-        ax.set_xlabel('职位数量', fontsize=12, fontfamily=available_font if available_font else 'sans-serif')
-        ax.set_title('文科专业要求分布', fontsize=14, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-        ax.invert_yaxis()
-        for i, (idx, val) in enumerate(liberal_arts_counts.items()):
-            ax.text(val + max(liberal_arts_counts.values)*0.01, i, f'{val} ({liberal_arts_percentages[idx]:.1f}%)', 
-                    va='center', fontsize=9)
-        plt.tight_layout()
-        chart10 = os.path.join(output_dir, 'chart10_liberal_arts.png')
-        plt.savefig(chart10, dpi=150, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart10)
+        jobs.append(ChartJob('chart10_liberal_arts.png', render_requirement_bars, {
+            'counts': liberal_arts_counts, 'percentages': liberal_arts_percentages,
+            'title': '文科专业要求分布', 'palette': 'pastel',
+        }, spec))
     
     # 11. 工作经历要求分布
     if experience_dist is None:
         _, _, experience_dist, experience_dist_percentages = analyze_experience_requirements(df)
     if experience_dist and len(experience_dist) > 0:
-        sorted_exp = sorted(experience_dist.items())
-        years_list = [str(k) for k, v in sorted_exp]
-        counts_list = [v for k, v in sorted_exp]
-        fig, ax = plt.subplots(figsize=(10, 6))
-        if available_font:
-            plt.rcParams['font.sans-serif'] = [available_font]
-        colors = sns.color_palette("YlOrRd", len(years_list))
-        bars = ax.bar(range(len(years_list)), counts_list, color=colors, alpha=0.7, edgecolor='black')
-        ax.set_xticks(range(len(years_list)))
-        ax.set_xticklabels(years_list, fontsize=10, fontfamily=available_font if available_font else 'sans-serif', rotation=45, ha='right')
-        ax.set_ylabel('职位数量', fontsize=12, fontfamily=available_font if available_font else 'sans-serif')
-        ax.set_xlabel('工作经历要求（年）', fontsize=12, fontfamily=available_font if available_font else 'sans-serif')
-        ax.set_title('工作经历要求分布', fontsize=14, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-        for i, (years, count) in enumerate(sorted_exp):
-            ax.text(i, count + max(counts_list)*0.01, f'{count}\n({experience_dist_percentages[years]:.1f}%)', 
-                    ha='center', va='bottom', fontsize=9, fontweight='bold')
-        plt.tight_layout()
-        chart11 = os.path.join(output_dir, 'chart11_experience.png')
-        plt.savefig(chart11, dpi=150, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart11)
+        jobs.append(ChartJob('chart11_experience.png', render_experience, {
+            'experience': sorted(experience_dist.items()), 'percentages': experience_dist_percentages,
+        }, spec))
     
     # 12. 公司规模分布
     company_size = df['公司规模'].dropna()
     if len(company_size) > 0:
-        fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-        if available_font:
-            plt.rcParams['font.sans-serif'] = [available_font]
-        axes[0].hist(company_size, bins=50, color='steelblue', edgecolor='black', alpha=0.7)
-        axes[0].axvline(company_size.mean(), color='red', linestyle='--', linewidth=2, 
-                        label=f'平均值: {company_size.mean():.0f}')
-        axes[0].axvline(company_size.median(), color='green', linestyle='--', linewidth=2, 
-                        label=f'中位数: {company_size.median():.0f}')
-        axes[0].set_xlabel('公司规模（员工数）', fontsize=11, fontfamily=available_font if available_font else 'sans-serif')
-        axes[0].set_ylabel('频数', fontsize=11, fontfamily=available_font if available_font else 'sans-serif')
-        axes[0].set_title('公司规模分布直方图', fontsize=12, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-        axes[0].legend(fontsize=9, prop={'family': available_font if available_font else 'sans-serif'})
-        axes[0].grid(True, alpha=0.3)
-        
-        box_data = [company_size]
-        axes[1].boxplot(box_data, vert=True, patch_artist=True,
-                        boxprops=dict(facecolor='lightblue', alpha=0.7),
-                        medianprops=dict(color='red', linewidth=2))
-        axes[1].set_ylabel('公司规模（员工数）', fontsize=11, fontfamily=available_font if available_font else 'sans-serif')
-        axes[1].set_title('公司规模箱线图', fontsize=12, fontweight='bold', fontfamily=available_font if available_font else 'sans-serif')
-        axes[1].set_xticklabels(['公司规模'], fontfamily=available_font if available_font else 'sans-serif')
-        axes[1].grid(True, alpha=0.3)
-        plt.tight_layout()
-        chart12 = os.path.join(output_dir, 'chart12_company_size.png')
-        plt.savefig(chart12, dpi=150, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart12)
-    
-    return chart_files
+        jobs.append(ChartJob('chart12_company_size.png', render_company_size,
+                             {'values': company_size.tolist()}, spec))
+    
+    return jobs
+
+def generate_charts(df, df_level1, df_level2, output_dir, degree_counts=None, degree_percentages=None,
+                   major_counts=None, major_percentages=None, liberal_arts_counts=None, liberal_arts_percentages=None,
+                   experience_dist=None, experience_dist_percentages=None, workers=None):
+    """生成所有图表（进程池并行绘制；汇总数据未变化的图表直接复用已有图片）"""
+    jobs = build_chart_jobs(df, df_level1, df_level2, degree_counts, degree_percentages,
+                            major_counts, major_percentages, liberal_arts_counts, liberal_arts_percentages,
+                            experience_dist, experience_dist_percentages)
+    return render_charts(jobs, output_dir, workers=workers)
 
 def generate_text_report(df, df_level1, df_level2, degree_counts, degree_percentages,
                         major_counts, major_percentages, liberal_arts_counts, liberal_arts_percentages,
                         new_grad_count, new_grad_percentage, graduation_years,
                         experience_count, experience_percentage, experience_dist, experience_dist_percentages,
-                        output_file):
+                        output_file, features=None):
     """生成文本分析报告（增强版）"""
     report_lines = []
     
@@ -934,7 +736,7 @@ def generate_text_report(df, df_level1, df_level2, degree_counts, degree_percent
     if liberal_arts_counts is not None and len(liberal_arts_counts) > 0:
         report_lines.append("通过关键词筛选方法，从专业要求字段中提取的文科专业要求分布如下：")
         report_lines.append("")
-        total_liberal_arts_jobs = len(df[df['专业要求'].apply(lambda x: len(extract_liberal_arts_major(x)) > 0 if pd.notna(x) else False)])
+        total_liberal_arts_jobs = count_liberal_arts_jobs(df, features)
         report_lines.append(f"包含文科专业要求的职位总数: {total_liberal_arts_jobs} 个 ({total_liberal_arts_jobs/len(df)*100:.2f}%)")
         report_lines.append("")
         for major, count in liberal_arts_counts.items():
@@ -987,7 +789,7 @@ def generate_text_report(df, df_level1, df_level2, degree_counts, degree_percent
         f"工作经历要求：{experience_percentage:.2f}%的职位对工作经历有明确要求。",
     ]
     if liberal_arts_counts is not None and len(liberal_arts_counts) > 0:
-        total_liberal_arts_jobs = len(df[df['专业要求'].apply(lambda x: len(extract_liberal_arts_major(x)) > 0 if pd.notna(x) else False)])
+        total_liberal_arts_jobs = count_liberal_arts_jobs(df, features)
         findings.append(f"文科专业需求：{total_liberal_arts_jobs/len(df)*100:.2f}%的职位包含文科专业要求，表明市场对跨学科背景的需求。")
     
     for i, finding in enumerate(findings, 1):
@@ -1006,7 +808,7 @@ def create_pdf_report(df, df_level1, df_level2, chart_files, degree_counts, degr
                      major_counts, major_percentages, liberal_arts_counts, liberal_arts_percentages,
                      new_grad_count, new_grad_percentage, graduation_years,
                      experience_count, experience_percentage, experience_dist, experience_dist_percentages,
-                     output_path):
+                     output_path, features=None):
     """创建PDF报告（增强版）"""
     doc = SimpleDocTemplate(output_path, pagesize=A4,
                            rightMargin=72, leftMargin=72,
@@ -1211,7 +1013,7 @@ def create_pdf_report(df, df_level1, df_level2, chart_files, degree_counts, degr
         story.append(Image(chart_files[9], width=6*inch, height=3.6*inch))
         story.append(Spacer(1, 0.1*inch))
         
-        total_liberal_arts_jobs = len(df[df['专业要求'].apply(lambda x: len(extract_liberal_arts_major(x)) > 0 if pd.notna(x) else False)])
+        total_liberal_arts_jobs = count_liberal_arts_jobs(df, features)
         liberal_text = f"""
         通过关键词筛选方法，从专业要求字段中提取的文科专业要求分布如下。
         包含文科专业要求的职位总数: {total_liberal_arts_jobs} 个 ({total_liberal_arts_jobs/len(df)*100:.2f}%)。
@@ -1276,7 +1078,7 @@ def create_pdf_report(df, df_level1, df_level2, chart_files, degree_counts, degr
     findings.append(f"应届生要求：{new_grad_percentage:.2f}%的职位对应届生有要求。")
     findings.append(f"工作经历要求：{experience_percentage:.2f}%的职位对工作经历有明确要求。")
     if liberal_arts_counts is not None and len(liberal_arts_counts) > 0:
-        total_liberal_arts_jobs = len(df[df['专业要求'].apply(lambda x: len(extract_liberal_arts_major(x)) > 0 if pd.notna(x) else False)])
+        total_liberal_arts_jobs = count_liberal_arts_jobs(df, features)
         findings.append(f"文科专业需求：{total_liberal_arts_jobs/len(df)*100:.2f}%的职位包含文科专业要求，表明市场对跨学科背景的需求。")
     
     for i, finding in enumerate(findings, 1):
@@ -1294,7 +1096,7 @@ def main():
     
     # 读取数据
     print(f"\n正在读取文件: {EXCEL_FILE}")
-    df = pd.read_excel(EXCEL_FILE)
+    df = load_dataset(EXCEL_FILE)
     print(f"数据加载完成：{len(df)} 条记录，{len(df.columns)} 个字段")
     
     # 添加职位标签列
@@ -1336,16 +1138,20 @@ def main():
     print(f"  Level 1 (AI+): {len(df_level1)} 条 ({len(df_level1)/len(df)*100:.2f}%)")
     print(f"  Level 2 (+AI): {len(df_level2)} 条 ({len(df_level2)/len(df)*100:.2f}%)")
     
+    # 提取专业要求特征（一次扫描）
+    print("\n正在提取专业要求特征...")
+    features = requirement_features(df)
+    
     # 分析专业要求
-    degree_counts, degree_percentages = analyze_education_requirements(df)
-    major_counts, major_percentages = analyze_major_requirements(df)
-    liberal_arts_counts, liberal_arts_percentages = analyze_liberal_arts_requirements(df)
+    degree_counts, degree_percentages = analyze_education_requirements(df, features)
+    major_counts, major_percentages = analyze_major_requirements(df, features)
+    liberal_arts_counts, liberal_arts_percentages = analyze_liberal_arts_requirements(df, features)
     
     # 分析应届生要求
-    new_grad_count, new_grad_percentage, graduation_years = analyze_new_grad_requirements(df)
+    new_grad_count, new_grad_percentage, graduation_years = analyze_new_grad_requirements(df, features)
     
     # 分析工作经历要求
-    experience_count, experience_percentage, experience_dist, experience_dist_percentages = analyze_experience_requirements(df)
+    experience_count, experience_percentage, experience_dist, experience_dist_percentages = analyze_experience_requirements(df, features)
     
     # 生成图表
     print("\n正在生成图表...")
@@ -1363,7 +1169,7 @@ def main():
                         major_counts, major_percentages, liberal_arts_counts, liberal_arts_percentages,
                         new_grad_count, new_grad_percentage, graduation_years,
                         experience_count, experience_percentage, experience_dist, experience_dist_percentages,
-                        text_report_path)
+                        text_report_path, features=features)
     
     # 生成PDF报告
     print("\n正在生成PDF报告...")
@@ -1372,7 +1178,7 @@ def main():
                      major_counts, major_percentages, liberal_arts_counts, liberal_arts_percentages,
                      new_grad_count, new_grad_percentage, graduation_years,
                      experience_count, experience_percentage, experience_dist, experience_dist_percentages,
-                     pdf_path)
+                     pdf_path, features=features)
     
     print("\n" + "="*80)
     print("分析完成！所有结果已保存到:")
@@ -0,0 +1,10 @@
+"""
+Offline benchmark harness for the scrapers.
+
+- fixtures.py         recorded pages (search / job / company) keyed by URL
+- record_fixtures.py  records real pages through ZenRows (spends API credits once)
+- synthetic_pages.py  LinkedIn-shaped pages used when no recording matches
+- synthetic_corpus.py job records at 10k / 100k / 1M scale for dedup, mapping, analysis and export
+- zenrows_stub.py     local HTTP server with the ZENROWS_BASE_URL contract
+- test_bench_*.py     pytest-benchmark suites (python -m pytest benchmarks)
+"""
@@ -0,0 +1,160 @@
+"""
+Shared fixtures for the offline benchmarks.
+
+The scrapers are pointed at a local ZenRowsStub; every benchmark round runs in
+a fresh directory so checkpoints and the company cache never carry over.
+
+Environment knobs:
+    BENCH_ZENROWS_LATENCY     seconds per stub response (default 0)
+    BENCH_ZENROWS_JITTER      extra random latency (default 0)
+    BENCH_ZENROWS_ERROR_RATE  fraction of failed responses (default 0)
+    BENCH_JOBSPY_LATENCY      seconds per fake JobSpy search (default 0.1)
+    BENCH_FIXTURES_DIR        recorded fixtures (default benchmarks/fixtures if present)
+    BENCH_ROUNDS              rounds per benchmark (default 3)
+    BENCH_CORPUS_SIZES        synthetic corpus sizes, e.g. "10k,100k,1m" (default 10k)
+"""
+import os
+import sys
+import itertools
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import DEFAULT_FIXTURES_DIR, FixtureStore  # noqa: E402
+from benchmarks.zenrows_stub import ZenRowsStub  # noqa: E402
+from benchmarks.synthetic_corpus import Corpus, parse_size  # noqa: E402
+
+TEST_JOBSPY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test_jobspy")
+
+
+def _fixture_store():
+    directory = os.getenv("BENCH_FIXTURES_DIR") or DEFAULT_FIXTURES_DIR
+    if not os.path.exists(os.path.join(directory, FixtureStore.INDEX_FILE)):
+        return None
+    return FixtureStore(directory)
+
+
+def pytest_generate_tests(metafunc):
+    """Run corpus benchmarks once per size in BENCH_CORPUS_SIZES"""
+    if "corpus_size" in metafunc.fixturenames:
+        sizes = [size.strip() for size in os.getenv("BENCH_CORPUS_SIZES", "10k").split(",") if size.strip()]
+        metafunc.parametrize("corpus_size", [parse_size(size) for size in sizes], ids=sizes, scope="session")
+
+
+@pytest.fixture(scope="session")
+def corpus_cache():
+    # Only the current size is kept so 1M-record corpora are not held side by side
+    return {}
+
+
+@pytest.fixture
+def corpus(corpus_size, corpus_cache):
+    """Synthetic corpus of corpus_size records (generated once per size)"""
+    if corpus_size not in corpus_cache:
+        corpus_cache.clear()
+        corpus_cache[corpus_size] = Corpus(corpus_size)
+    return corpus_cache[corpus_size]
+
+
+@pytest.fixture
+def main_merged_module(monkeypatch, tmp_path):
+    """main_merged imported from inside tmp_path (main() writes outputs/<RUN_ID> under the cwd)"""
+    monkeypatch.chdir(tmp_path)
+    import main_merged
+    return main_merged
+
+
+@pytest.fixture
+def jobspy_module(monkeypatch, tmp_path):
+    """
+    test_jobspy/jobspy_max_scraper imported from inside tmp_path, with the
+    fallback exchange rates preloaded so nothing goes to the network.
+    """
+    import time
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(TEST_JOBSPY_DIR)
+    import jobspy_max_scraper
+
+    monkeypatch.setattr(jobspy_max_scraper, "_exchange_rate_cache", jobspy_max_scraper.get_fallback_exchange_rates())
+    monkeypatch.setattr(jobspy_max_scraper, "_exchange_rate_cache_time", time.time())
+    return jobspy_max_scraper
+
+
+@pytest.fixture(scope="session")
+def fake_scrape_jobs():
+    """
+    Stand-in for jobspy.scrape_jobs: BENCH_JOBSPY_LATENCY seconds per search,
+    then a deterministic slice of a synthetic pool of JobSpy rows.
+    """
+    import time
+    import zlib
+    import pandas as pd
+    from benchmarks.synthetic_corpus import generate_raw_jobs
+
+    latency = float(os.getenv("BENCH_JOBSPY_LATENCY", "0.1"))
+    pool = pd.DataFrame([{key: value for key, value in job.items() if not key.startswith("_")}
+                         for job in generate_raw_jobs(2000)])
+
+    def scrape_jobs(site_name, search_term, location, results_wanted, **kwargs):
+        time.sleep(latency)
+        count = min(results_wanted, 100)
+        start = zlib.crc32(f"{site_name}|{search_term}|{location}".encode("utf-8")) % (len(pool) - count)
+        return pool.iloc[start:start + count].reset_index(drop=True)
+
+    return scrape_jobs
+
+
+@pytest.fixture(scope="session")
+def rounds():
+    return int(os.getenv("BENCH_ROUNDS", "3"))
+
+
+@pytest.fixture(scope="session")
+def zenrows_stub():
+    """Running stub plus the environment the scrapers need to reach it"""
+    stub = ZenRowsStub(
+        store=_fixture_store(),
+        latency=float(os.getenv("BENCH_ZENROWS_LATENCY", "0")),
+        jitter=float(os.getenv("BENCH_ZENROWS_JITTER", "0")),
+        error_rate=float(os.getenv("BENCH_ZENROWS_ERROR_RATE", "0")),
+    )
+    with pytest.MonkeyPatch.context() as mp, stub:
+        mp.setenv("ZENROWS_API_KEY", os.getenv("ZENROWS_API_KEY") or "offline-benchmark")
+        mp.setenv("NO_PROXY", "127.0.0.1,localhost")
+        mp.setenv("no_proxy", "127.0.0.1,localhost")
+        yield stub
+
+
+@pytest.fixture
+def scraper(zenrows_stub, monkeypatch, tmp_path):
+    """scraper_linkedin_checkpoint wired to the stub, without throttling or delays"""
+    import scraper_linkedin_checkpoint as scraper_module
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(scraper_module, "ZENROWS_BASE_URL", zenrows_stub.base_url)
+    monkeypatch.setattr(scraper_module, "REQUEST_DELAY", 0)
+    monkeypatch.setattr(scraper_module, "MAX_PAGES", 3)
+    monkeypatch.setattr(scraper_module, "CACHE_FILE", str(tmp_path / "company_cache.json"))
+    monkeypatch.setattr(scraper_module.zenrows_limiter, "requests_per_minute", None)
+    zenrows_stub.requests.clear()
+    return scraper_module
+
+
+@pytest.fixture
+def run_dir(scraper, tmp_path):
+    """
+    Factory for a fresh per-round RunContext: checkpoint files and the company
+    cache live in a new directory (use in benchmark.pedantic setup).
+    """
+    from run_context import RunContext
+
+    counter = itertools.count()
+
+    def fresh():
+        directory = tmp_path / f"round_{next(counter)}"
+        directory.mkdir()
+        return RunContext(str(directory), cache_file=str(directory / "company_cache.json"))
+
+    return fresh
@@ -0,0 +1,96 @@
+"""
+Recorded HTML fixtures keyed by the target URL.
+
+Layout of a fixture directory:
+
+    index.json                 {url: {"kind": "search|job|company", "file": "job/<sha1>.html"}}
+    search/<sha1>.html
+    job/<sha1>.html
+    company/<sha1>.html
+"""
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+
+DEFAULT_FIXTURES_DIR = Path(__file__).parent / "fixtures"
+KINDS = ("search", "job", "company")
+
+
+def classify_url(url):
+    """Page kind of a LinkedIn URL: search, job, company (None if unknown)"""
+    if "/jobs/search" in url:
+        return "search"
+    if "/jobs/view" in url:
+        return "job"
+    if "/company/" in url:
+        return "company"
+    return None
+
+
+def url_digest(url):
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+class FixtureStore:
+    """Directory of recorded pages with a URL index (thread-safe)."""
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory=DEFAULT_FIXTURES_DIR):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._index = {}
+        index_path = self.directory / self.INDEX_FILE
+        if index_path.exists():
+            with open(index_path, "r", encoding="utf-8") as f:
+                self._index = json.load(f)
+        self._by_kind = {kind: sorted(url for url, entry in self._index.items() if entry["kind"] == kind)
+                         for kind in KINDS}
+
+    def __len__(self):
+        return len(self._index)
+
+    def count(self, kind):
+        return len(self._by_kind.get(kind, []))
+
+    def _read(self, entry):
+        with open(self.directory / entry["file"], "r", encoding="utf-8") as f:
+            return f.read()
+
+    def get(self, url):
+        """Recorded page for exactly this URL, or None"""
+        entry = self._index.get(url)
+        return self._read(entry) if entry else None
+
+    def pick(self, kind, url):
+        """A recorded page of the same kind, chosen deterministically from the URL (or None)"""
+        urls = self._by_kind.get(kind)
+        if not urls:
+            return None
+        chosen = urls[int(url_digest(url), 16) % len(urls)]
+        return self._read(self._index[chosen])
+
+    def put(self, url, html, kind=None):
+        """Store a page and update the index."""
+        kind = kind or classify_url(url) or "other"
+        relative = f"{kind}/{url_digest(url)}.html"
+        path = self.directory / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+        with self._lock:
+            self._index[url] = {"kind": kind, "file": relative}
+            self._by_kind.setdefault(kind, [])
+            if url not in self._by_kind[kind]:
+                self._by_kind[kind].append(url)
+                self._by_kind[kind].sort()
+            self._write_index()
+
+    def _write_index(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.directory / (self.INDEX_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.directory / self.INDEX_FILE)
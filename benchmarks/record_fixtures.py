@@ -0,0 +1,88 @@
+"""
+Record real LinkedIn pages through ZenRows into a fixture directory.
+
+Search pages are fetched first; job pages are taken from their cards and
+company pages from the job pages, so one run yields a consistent set of all
+three kinds. Already recorded URLs are skipped, so the recorder can be
+re-run to top up a directory. Needs ZENROWS_API_KEY (spends API credits).
+
+    python -m benchmarks.record_fixtures --locations "New York, NY" "Austin, TX" --pages 2 --jobs 40
+"""
+import os
+import re
+import sys
+import argparse
+from urllib.parse import quote_plus
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import KEYWORDS  # noqa: E402
+from scraper_linkedin_checkpoint import zenrows_get, normalize_company_url  # noqa: E402
+
+from .fixtures import DEFAULT_FIXTURES_DIR, FixtureStore  # noqa: E402
+
+
+def search_url(keywords, location, page):
+    """Same URL shape fetch_linkedin_list_with_checkpoint requests (merged keywords)"""
+    keyword = quote_plus(" OR ".join(f'"{kw}"' for kw in keywords))
+    return (f"https://www.linkedin.com/jobs/search?keywords={keyword}"
+            f"&location={location.replace(' ', '%20')}&start={page * 25}")
+
+
+def record(store, url):
+    """Fetch url unless already recorded; returns the HTML (or None on failure)"""
+    html = store.get(url)
+    if html is not None:
+        return html
+    html = zenrows_get(url)
+    if html:
+        store.put(url, html)
+    return html
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record LinkedIn search/job/company pages as benchmark fixtures")
+    parser.add_argument("--out", default=str(DEFAULT_FIXTURES_DIR), help="Fixture directory")
+    parser.add_argument("--locations", nargs="+", default=["New York, NY", "San Francisco, CA"])
+    parser.add_argument("--pages", type=int, default=2, help="Search pages per location")
+    parser.add_argument("--jobs", type=int, default=30, help="Job pages to record")
+    parser.add_argument("--companies", type=int, default=20, help="Company pages to record")
+    args = parser.parse_args()
+
+    store = FixtureStore(args.out)
+    job_urls = []
+    for location in args.locations:
+        for page in range(args.pages):
+            html = record(store, search_url(KEYWORDS, location, page))
+            if not html:
+                print(f"Search page failed: {location} page {page + 1}")
+                continue
+            for link in BeautifulSoup(html, "html.parser").find_all("a", class_="base-card__full-link"):
+                if link.has_attr("href") and link["href"] not in job_urls:
+                    job_urls.append(link["href"])
+    print(f"Search pages: {store.count('search')} recorded, {len(job_urls)} job links found")
+
+    company_urls = []
+    for url in job_urls[:args.jobs]:
+        html = record(store, url)
+        if not html:
+            continue
+        tag = BeautifulSoup(html, "html.parser").find("a", href=re.compile(r"/company/"))
+        if tag:
+            company_url = normalize_company_url(tag["href"])
+            if company_url.startswith("/company/"):
+                company_url = "https://www.linkedin.com" + company_url
+            if company_url not in company_urls:
+                company_urls.append(company_url)
+    print(f"Job pages: {store.count('job')} recorded, {len(company_urls)} company links found")
+
+    for url in company_urls[:args.companies]:
+        record(store, url)
+    print(f"Company pages: {store.count('company')} recorded")
+    print(f"Fixtures saved to {store.directory} ({len(store)} pages)")
+
+
+if __name__ == "__main__":
+    main()
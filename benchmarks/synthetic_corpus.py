@@ -0,0 +1,430 @@
+"""
+Synthetic job corpus for scale testing (10k / 100k / 1M records).
+
+Records look like what JobSpy returns (title, company, location, description,
+min_amount/max_amount/currency/interval, date_posted, site, job_url):
+
+- titles follow the job_classifier categories with a realistic weighting
+  (Data Science and AI engineering dominate, niche AI roles form a long tail)
+  plus seniority prefixes
+- companies follow a Zipf-like distribution (a few companies post most jobs)
+- six regions with their own locations and currencies (USD/GBP/CAD/AUD/SGD/HKD)
+- salaries in every format the parsers accept: ranges, K notation, monthly,
+  hourly, "Salary: X", currency codes, "+ super"; about 40% carry structured
+  amounts, the rest only mention the salary in the description
+- exact duplicates (re-posted / seen on both platforms) and near duplicates
+  (case and whitespace variants, other location, less complete copy)
+
+Descriptions come from a fixed pool per region, so 1M records share strings
+and stay within a few hundred MB.
+
+    from benchmarks.synthetic_corpus import generate_raw_jobs, to_export_rows, to_report_frame
+
+    raw = generate_raw_jobs(100_000)
+    rows = to_export_rows(raw)          # "Job Title", "Company Name", ... (config.FIELDS)
+    df = to_report_frame(rows)          # final_merged_report columns (职位名称, 专业要求, ...)
+
+Writing a corpus for manual runs of the analysis scripts:
+
+    python -m benchmarks.synthetic_corpus --size 100k --out outputs/synthetic_100k.xlsx
+"""
+import os
+import sys
+import json
+import random
+import argparse
+from bisect import bisect_right
+from datetime import date, timedelta
+from itertools import accumulate
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+# job_classifier category -> (weight, [(title, job label)])
+TITLE_MIX = {
+    "Data Science": (30, [
+        ("Data Scientist", "Data Scientist"), ("Data Analyst", "Data Analyst"),
+        ("Data Engineer", "Data Engineer"), ("Data Science Manager", "Data Scientist"),
+    ]),
+    "Other AI Related": (22, [
+        ("AI Engineer", "AI Engineer"), ("AI Research Scientist", "AI Research Scientist"),
+        ("Generative AI Engineer", "AI Engineer"), ("AI/ML Engineer", "AI/ML Engineer"),
+        ("AI Software Engineer", "AI Engineer"),
+    ]),
+    "Other": (20, [
+        ("Machine Learning Engineer", "ML Engineer"), ("NLP Engineer", "NLP Engineer"),
+        ("Computer Vision Engineer", "Computer Vision Engineer"), ("Research Scientist", "Research Scientist"),
+        ("Deep Learning Engineer", "Deep Learning Engineer"), ("MLOps Engineer", "MLOps Engineer"),
+    ]),
+    "AI Product Manager": (5, [("AI Product Manager", "AI Product Manager"), ("AI Product Owner", "AI Product Manager")]),
+    "AI Architecture": (4, [("AI Solution Architect", "AI Architect"), ("AI Architect", "AI Architect")]),
+    "AI Operations": (3, [("AI Infrastructure Engineer", "AI Infrastructure Engineer"),
+                          ("AI Platform Engineer", "AI Platform Engineer")]),
+    "AI Training": (3, [("AI Trainer", "AI Trainer"), ("AI Training Specialist", "AI Trainer")]),
+    "Data Annotation": (2, [("Data Annotation Specialist", "Data Annotator"), ("Data Labeling Analyst", "Data Annotator")]),
+    "AI Sales": (2, [("AI Sales Manager", "AI Sales"), ("AI Account Manager", "AI Sales")]),
+    "AI+Industry": (2, [("AI Healthcare Specialist", "AI+Industry"), ("AI Finance Analyst", "AI+Industry")]),
+    "Robotics": (2, [("Robotics Engineer", "Robotics Engineer"), ("Autonomous Systems Engineer", "Robotics Engineer")]),
+    "AI Conversation": (1, [("Conversational AI Designer", "Conversational AI"), ("AI Chatbot Developer", "Conversational AI")]),
+    "AI Governance": (1, [("AI Governance Specialist", "AI Governance"), ("AI Policy Analyst", "AI Governance")]),
+    "AI Ethics": (1, [("Responsible AI Lead", "AI Ethics"), ("AI Ethics Researcher", "AI Ethics")]),
+    "AI Hardware": (1, [("AI Hardware Engineer", "AI Hardware Engineer"), ("AI Accelerator Architect", "AI Hardware Engineer")]),
+    "AI Design": (1, [("AI UX Designer", "AI Designer")]),
+}
+
+# (prefix, job level, weight, salary multiplier)
+SENIORITY = [
+    ("", "Mid-level", 45, 1.0), ("Senior ", "Senior", 25, 1.3), ("Staff ", "Senior", 5, 1.6),
+    ("Lead ", "Senior", 6, 1.5), ("Principal ", "Senior", 3, 1.8), ("Junior ", "Entry", 8, 0.7),
+    ("Associate ", "Entry", 5, 0.75), ("Intern - ", "Intern", 3, 0.4),
+]
+
+# region -> (weight, currency, symbol, locations)
+REGIONS = {
+    "United States": (60, "USD", "$", [
+        "New York, NY", "San Francisco, CA", "Seattle, WA", "Austin, TX", "Boston, MA", "Chicago, IL",
+        "Los Angeles, CA", "Atlanta, GA", "Denver, CO", "Remote",
+    ]),
+    "United Kingdom": (12, "GBP", "£", ["London, England", "Manchester, England", "Edinburgh, Scotland", "Cambridge, England"]),
+    "Canada": (8, "CAD", "C$", ["Toronto, ON", "Vancouver, BC", "Montreal, QC"]),
+    "Australia": (8, "AUD", "A$", ["Sydney, NSW", "Melbourne, VIC", "Brisbane, QLD"]),
+    "Singapore": (6, "SGD", "S$", ["Singapore"]),
+    "Hong Kong": (6, "HKD", "HK$", ["Hong Kong", "Kowloon, Hong Kong"]),
+}
+
+# 1 unit of currency in USD (same values as the scrapers' fallback rates)
+FX_TO_USD = {"USD": 1.0, "GBP": 1.27, "CAD": 0.73, "AUD": 0.67, "SGD": 0.74, "HKD": 0.13, "EUR": 1.09}
+
+REQUIREMENTS = [
+    "Bachelor's degree in Computer Science, Statistics or a related field and 3+ years of experience with Python and SQL.",
+    "Master's degree or PhD in Machine Learning, Mathematics or Physics; 5+ years of experience building production ML systems.",
+    "PhD in Computer Science or Electrical Engineering with publications in NLP or computer vision venues.",
+    "2+ years of experience with PyTorch or TensorFlow; experience with AWS, GCP or Azure is a plus.",
+    "Open to Class of 2025 and 2026 graduates with a Bachelor's or Master's degree in a quantitative field.",
+    "Degree in Economics, Psychology, Linguistics or Communications; strong writing skills and 1-3 years of experience.",
+    "7+ years of experience in software engineering, including 3 years leading machine learning teams.",
+    "Experience with Spark, Airflow and dbt; familiarity with experimentation and A/B testing frameworks.",
+    "Bachelor's degree in Business, Marketing or Finance and 4+ years of experience selling enterprise software.",
+    "",
+]
+INTROS = [
+    "{company} is building the next generation of AI products used by millions of customers worldwide.",
+    "Join {company}'s applied science team to ship machine learning models into production.",
+    "At {company}, our data platform powers decisions across every business line.",
+    "{company} is hiring to scale its generative AI platform and research organisation.",
+]
+BENEFITS = (
+    "We offer comprehensive health, dental and vision insurance, a retirement plan with company match, "
+    "flexible remote work, learning budgets and generous parental leave."
+)
+POOL_SIZE = 512  # descriptions per region
+
+DUPLICATE_RATE = 0.05
+NEAR_DUPLICATE_RATE = 0.05
+STRUCTURED_SALARY_RATE = 0.4
+START_DATE = date(2025, 10, 1)
+DATE_SPAN_DAYS = 90
+
+
+def _weighted(items, weight):
+    """(items, cumulative weights) for fast repeated rng.choices"""
+    return list(items), list(accumulate(weight(item) for item in items))
+
+
+def _pick(rng, table):
+    items, cum = table
+    return items[bisect_right(cum, rng.random() * cum[-1])]
+
+
+def _money(value):
+    return f"{int(round(value, -2)):,}"
+
+
+def salary_text(rng, symbol, code, low, high, interval):
+    """One salary string in a format the parsers accept (amounts in local currency)"""
+    if interval == "hourly":
+        return f"{symbol}{low:.0f} - {symbol}{high:.0f} per hour"
+    if interval == "monthly":
+        return rng.choice([
+            f"{symbol}{_money(low)} - {symbol}{_money(high)} per month",
+            f"{code} {_money(low)} - {_money(high)} monthly",
+        ])
+    formats = [
+        f"{symbol}{_money(low)} - {symbol}{_money(high)} per year",
+        f"{symbol}{_money(low)}-{symbol}{_money(high)}",
+        f"{symbol}{int(low // 1000)}K - {symbol}{int(high // 1000)}K",
+        f"{int(low // 1000)}k - {int(high // 1000)}k",
+        f"Salary: {symbol}{_money((low + high) / 2)}",
+        f"{code} {_money(low)} - {_money(high)} annually",
+    ]
+    if code == "AUD":
+        formats.append(f"{symbol}{_money(low)} - {symbol}{_money(high)} + 15.4% super")
+    return rng.choice(formats)
+
+
+def _salary(rng, currency, symbol, multiplier):
+    """(min, max, interval, text) in local currency"""
+    annual_usd = rng.uniform(70_000, 170_000) * multiplier
+    annual = annual_usd / FX_TO_USD[currency]
+    interval = rng.choices(["yearly", "monthly", "hourly"], weights=[75, 15, 10])[0]
+    divisor = {"yearly": 1, "monthly": 12, "hourly": 2080}[interval]
+    low = annual * rng.uniform(0.8, 0.95) / divisor
+    high = annual * rng.uniform(1.05, 1.25) / divisor
+    return low, high, interval, salary_text(rng, symbol, currency, low, high, interval)
+
+
+def _description_pool(seed):
+    """region -> list of (description, requirements, salary tuple or None)"""
+    rng = random.Random(f"descriptions-{seed}")
+    pool = {}
+    for region, (_, currency, symbol, _) in REGIONS.items():
+        entries = []
+        for _ in range(POOL_SIZE):
+            requirements = rng.choice(REQUIREMENTS)
+            salary = _salary(rng, currency, symbol, rng.choice([0.7, 1.0, 1.3, 1.6])) if rng.random() < 0.7 else None
+            parts = [rng.choice(INTROS).format(company="The company"),
+                     "Responsibilities: design, train and evaluate models, partner with product teams "
+                     "and own the quality of data pipelines."]
+            if requirements:
+                parts.append(f"Requirements: {requirements}")
+            if salary:
+                parts.append(f"Compensation: the salary range for this role is {salary[3]}.")
+            parts.append(" ".join([BENEFITS] * rng.randint(1, 4)))
+            entries.append((" ".join(parts), requirements, salary))
+        pool[region] = entries
+    return pool
+
+
+def _company_pool(count, rng):
+    stems = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Cyberdyne", "Tyrell",
+             "Vandelay", "Aperture", "Massive", "Oscorp", "Wonka", "Nakatomi", "Soylent", "Gringotts", "Pied Piper"]
+    kinds = ["AI", "Labs", "Analytics", "Systems", "Technologies", "Data", "Robotics", "Health", "Capital", "Cloud"]
+    names = [f"{rng.choice(stems)} {rng.choice(kinds)} {i}" for i in range(count)]
+    sizes = [rng.choice(["12", "85", "430", "2300", "11000", "54000", ""]) for _ in range(count)]
+    # Zipf-like: weight 1/rank
+    return list(zip(names, sizes)), list(accumulate(1.0 / (rank + 1) for rank in range(count)))
+
+
+def _near_duplicate(rng, job, regions):
+    """A slightly different copy of job (what dedup has to reason about)"""
+    twin = dict(job)
+    variant = rng.randrange(4)
+    if variant == 0:
+        twin["title"] = "  " + job["title"].upper() + " "
+    elif variant == 1:
+        twin["company"] = job["company"].lower().replace(" ", "  ")
+    elif variant == 2:
+        twin["location"] = rng.choice(regions[job["_region"]][3])
+    else:
+        twin["description"] = ""
+        twin["min_amount"] = twin["max_amount"] = None
+        twin["company_size"] = ""
+    twin["site"] = rng.choice(["indeed", "linkedin"])
+    return twin
+
+
+def generate_raw_jobs(count, seed=0, duplicate_rate=DUPLICATE_RATE, near_duplicate_rate=NEAR_DUPLICATE_RATE,
+                      structured_salary_rate=STRUCTURED_SALARY_RATE):
+    """
+    JobSpy-style job dicts (deterministic for a given count and seed).
+
+    Each record also carries "_region" (region name), "_category" (job_classifier
+    category), "_label" (job label), "_level" (job level) and the requirements
+    and salary text used in its description.
+    """
+    rng = random.Random(seed)
+    titles = _weighted(
+        [(category, title, label) for category, (weight, entries) in TITLE_MIX.items() for title, label in entries],
+        lambda item: TITLE_MIX[item[0]][0] / len(TITLE_MIX[item[0]][1]),
+    )
+    seniority = _weighted(SENIORITY, lambda item: item[2])
+    regions = _weighted(list(REGIONS.items()), lambda item: item[1][0])
+    companies = _company_pool(max(count // 8, 50), rng)
+    descriptions = _description_pool(seed)
+
+    jobs = []
+    for i in range(count):
+        roll = rng.random()
+        if jobs and roll < duplicate_rate:
+            twin = dict(rng.choice(jobs))
+            twin["site"] = rng.choice(["indeed", "linkedin"])
+            jobs.append(twin)
+            continue
+        if jobs and roll < duplicate_rate + near_duplicate_rate:
+            jobs.append(_near_duplicate(rng, rng.choice(jobs), REGIONS))
+            continue
+
+        category, base_title, label = _pick(rng, titles)
+        prefix, level, _, multiplier = _pick(rng, seniority)
+        region, (_, currency, symbol, locations) = _pick(rng, regions)
+        company, company_size = _pick(rng, companies)
+        description, requirements, described_salary = rng.choice(descriptions[region])
+
+        min_amount = max_amount = interval = None
+        if rng.random() < structured_salary_rate:
+            min_amount, max_amount, interval, _ = _salary(rng, currency, symbol, multiplier)
+            min_amount, max_amount = round(min_amount, 2), round(max_amount, 2)
+        site = "indeed" if rng.random() < 0.6 else "linkedin"
+        job_id = f"{site[:2]}-{seed}-{i}"
+        jobs.append({
+            "id": job_id,
+            "site": site,
+            "title": prefix + base_title,
+            "company": company,
+            "location": rng.choice(locations),
+            "description": description,
+            "min_amount": min_amount,
+            "max_amount": max_amount,
+            "currency": currency if min_amount is not None else None,
+            "interval": interval,
+            "date_posted": (START_DATE + timedelta(days=rng.randrange(DATE_SPAN_DAYS))).isoformat(),
+            "job_url": f"https://www.{site}.com/jobs/view/{job_id}",
+            "company_size": company_size,
+            "_region": region,
+            "_category": category,
+            "_label": label,
+            "_level": level,
+            "_requirements": requirements,
+            "_described_salary": described_salary[3] if described_salary else "",
+        })
+    return jobs
+
+
+def _estimated_annual(job):
+    if job["min_amount"] is None:
+        return ""
+    factor = {"monthly": 12, "hourly": 2080}.get(job["interval"], 1)
+    return f"${int((job['min_amount'] + job['max_amount']) / 2 * factor * FX_TO_USD[job['currency']]):,}"
+
+
+def to_export_rows(raw_jobs):
+    """Rows with the config.FIELDS columns (what main_merged/exporters handle)"""
+    rows = []
+    for job in raw_jobs:
+        if job["min_amount"] is not None:
+            symbol = REGIONS[job["_region"]][2]
+            salary_range = f"{symbol}{job['min_amount']:,.0f} - {symbol}{job['max_amount']:,.0f} ({job['interval']})"
+        else:
+            salary_range = job["_described_salary"]
+        rows.append({
+            "Job Title": job["title"],
+            "Company Name": job["company"],
+            "Requirements": job["_requirements"],
+            "Location": job["location"],
+            "Salary Range": salary_range,
+            "Estimated Annual Salary": _estimated_annual(job),
+            "Job Description": job["description"],
+            "Team Size/Business Line Size": "",
+            "Company Size": job["company_size"],
+            "Posted Date": job["date_posted"],
+            "Job Status": "Active",
+            "Platform": job["site"].title(),
+            "Job Link": job["job_url"],
+        })
+    return rows
+
+
+def to_job_data(raw_jobs):
+    """JobData objects (test_jobspy/core/job_data.py) built the way the scrapers build them"""
+    test_jobspy = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test_jobspy")
+    if test_jobspy not in sys.path:
+        sys.path.insert(0, test_jobspy)
+    from core.job_data import JobData
+    return [JobData.from_jobspy_dict(job, platform=job["site"]) for job in raw_jobs]
+
+
+# config.FIELDS column -> final_merged_report column
+REPORT_COLUMNS = {
+    "Job Title": "职位名称", "Company Name": "公司名称", "Requirements": "专业要求", "Location": "地点",
+    "Salary Range": "薪资要求", "Estimated Annual Salary": "年薪预估值", "Job Description": "工作描述",
+    "Team Size/Business Line Size": "团队规模/业务线规模", "Company Size": "公司规模",
+    "Posted Date": "职位发布时间", "Job Status": "职位状态", "Platform": "招聘平台", "Job Link": "职位链接",
+}
+
+
+def to_report_frame(rows, raw_jobs=None):
+    """
+    DataFrame shaped like final_merged_report.xlsx (relevance level, 职位标签,
+    岗位级别 + Chinese field names), as read by the analysis scripts.
+    """
+    import pandas as pd
+
+    df = pd.DataFrame(rows).rename(columns=REPORT_COLUMNS)
+    if raw_jobs is not None:
+        labels = [job["_label"] for job in raw_jobs]
+        levels = [job["_level"] for job in raw_jobs]
+        relevance = [1 if job["_category"] in ("Data Science", "Other AI Related", "Other") else 2 for job in raw_jobs]
+    else:
+        labels = df["职位名称"].str.strip().tolist()
+        levels = ["Mid-level"] * len(df)
+        relevance = [1] * len(df)
+    df.insert(0, "岗位级别", levels)
+    df.insert(0, "职位标签", labels)
+    df.insert(0, "relevance level", relevance)
+    df["年薪预估值"] = df["年薪预估值"].replace("", None)
+    df["公司规模"] = pd.to_numeric(df["公司规模"], errors="coerce")
+    return df
+
+
+class Corpus:
+    """One generated corpus with its derived views built on first use."""
+
+    def __init__(self, count, seed=0):
+        self.count = count
+        self.seed = seed
+        self._raw = self._rows = self._frame = None
+
+    @property
+    def raw(self):
+        if self._raw is None:
+            self._raw = generate_raw_jobs(self.count, seed=self.seed)
+        return self._raw
+
+    @property
+    def rows(self):
+        if self._rows is None:
+            self._rows = to_export_rows(self.raw)
+        return self._rows
+
+    @property
+    def report_frame(self):
+        if self._frame is None:
+            self._frame = to_report_frame(self.rows, self.raw)
+        return self._frame
+
+
+def parse_size(text):
+    """'10k' / '1m' / '2500' -> record count"""
+    text = str(text).strip().lower()
+    if text in SIZES:
+        return SIZES[text]
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    return int(float(text.rstrip("km")) * multiplier)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic job corpus for scale testing")
+    parser.add_argument("--size", default="10k", help="Record count: 10k, 100k, 1m or a number")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", required=True, help=".xlsx / .parquet (report columns) or .jsonl (raw JobSpy records)")
+    args = parser.parse_args()
+
+    raw = generate_raw_jobs(parse_size(args.size), seed=args.seed)
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    if args.out.endswith(".jsonl"):
+        with open(args.out, "w", encoding="utf-8") as f:
+            for job in raw:
+                f.write(json.dumps(job, ensure_ascii=False) + "\n")
+    else:
+        df = to_report_frame(to_export_rows(raw), raw)
+        if args.out.endswith(".parquet"):
+            df.to_parquet(args.out, index=False)
+        else:
+            sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            from exporter import StreamingExporter
+            with StreamingExporter(args.out, list(df.columns)) as writer:
+                writer.write_dataframe(df)
+    print(f"Wrote {len(raw):,} records to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Deterministic LinkedIn-shaped pages for offline runs.
+
+Each page is derived from its URL, so repeated requests return the same HTML.
+The markup carries exactly the selectors scraper_linkedin_checkpoint.py reads:
+
+- search:  div.base-card with h3.base-search-card__title, h4.base-search-card__subtitle,
+           span.job-search-card__location, time[datetime], a.base-card__full-link
+- job:     div.show-more-less-html__markup (description with requirements and salary)
+           and an a[href*="/company/"] link
+- company: JSON-LD numberOfEmployees, the about-module dd tag, or plain "N employees" text
+"""
+import random
+import hashlib
+from html import escape
+from urllib.parse import urlparse, parse_qs
+
+CARDS_PER_PAGE = 25
+# Search results end after this many pages (exercises the "no more cards" path)
+PAGES_PER_SEARCH = 4
+
+TITLES = [
+    "AI Engineer", "Machine Learning Engineer", "Senior Data Scientist", "NLP Engineer",
+    "Deep Learning Researcher", "Applied Scientist", "ML Ops Engineer", "Computer Vision Engineer",
+    "AI Product Manager", "Research Scientist, LLMs", "Data Scientist II", "Staff ML Engineer",
+]
+COMPANIES = [
+    "Acme AI", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Analytics", "Wayne Data",
+    "Cyberdyne", "Soylent Systems", "Tyrell Corp", "Vandelay Industries", "Massive Dynamic",
+    "Aperture Science", "Black Mesa", "Oscorp", "Wonka Tech", "Nakatomi", "Gringotts Analytics",
+]
+SALARIES = [
+    "$120,000 - $160,000 per year", "$65 - $85 per hour", "$9,000 - $12,000 per month",
+    "$140K - $190K annually", "$150,000/yr", "",
+]
+REQUIREMENT_LINES = [
+    "Requirements: Bachelor's or Master's degree in Computer Science, 3+ years of experience with Python, "
+    "PyTorch or TensorFlow, and experience deploying machine learning models to production environments at scale.",
+    "What you'll need: 5+ years of experience building NLP systems, strong knowledge of transformers and "
+    "large language models, familiarity with distributed training and cloud platforms such as AWS or GCP.",
+    "Qualifications: PhD or equivalent experience in machine learning, proficiency with SQL and Spark, "
+    "experience with experimentation platforms and a track record of shipping data products.",
+]
+
+
+def _rng(url):
+    return random.Random(int(hashlib.sha1(url.encode("utf-8")).hexdigest(), 16))
+
+
+def _slug(name):
+    return "".join(ch.lower() if ch.isalnum() else "-" for ch in name).strip("-")
+
+
+def search_page(url):
+    params = parse_qs(urlparse(url).query)
+    location = params.get("location", ["United States"])[0]
+    start = int(params.get("start", ["0"])[0] or 0)
+    if start >= CARDS_PER_PAGE * PAGES_PER_SEARCH:
+        return "<html><body><ul class='jobs-search__results-list'></ul></body></html>"
+
+    rng = _rng(url)
+    cards = []
+    for i in range(CARDS_PER_PAGE):
+        title = rng.choice(TITLES)
+        company = rng.choice(COMPANIES)
+        job_id = int(hashlib.sha1(f"{title}|{company}|{location}".encode("utf-8")).hexdigest()[:10], 16)
+        cards.append(
+            "<li><div class='base-card relative'>"
+            f"<a class='base-card__full-link' href='https://www.linkedin.com/jobs/view/{job_id}?refId=x&amp;trk=public_jobs'>"
+            f"<span class='sr-only'>{escape(title)}</span></a>"
+            "<div class='base-search-card__info'>"
+            f"<h3 class='base-search-card__title'>{escape(title)}</h3>"
+            f"<h4 class='base-search-card__subtitle'><a href='https://www.linkedin.com/company/{_slug(company)}?trk=x'>"
+            f"{escape(company)}</a></h4>"
+            f"<div class='base-search-card__metadata'><span class='job-search-card__location'>{escape(location)}</span>"
+            f"<time class='job-search-card__listdate' datetime='2025-12-{1 + i % 28:02d}'>1 week ago</time></div>"
+            "</div></div></li>"
+        )
+    return ("<html><head><title>Jobs</title></head><body><ul class='jobs-search__results-list'>"
+            + "".join(cards) + "</ul></body></html>")
+
+
+def job_page(url):
+    rng = _rng(url)
+    company = rng.choice(COMPANIES)
+    salary = rng.choice(SALARIES)
+    paragraphs = [
+        f"{company} is hiring to build production AI systems used by millions of customers.",
+        rng.choice(REQUIREMENT_LINES),
+        "You will collaborate with product and research teams, own model quality, and mentor engineers.",
+    ]
+    if salary:
+        paragraphs.append(f"The base salary range for this role is {salary}, plus equity and benefits.")
+    paragraphs += ["Benefits include health insurance, 401(k) matching and flexible remote work."] * rng.randint(2, 8)
+    description = "".join(f"<p>{escape(text)}</p>" for text in paragraphs)
+    salary_block = (f"<div class='compensation__salary-range'><span class='compensation__salary'>{escape(salary)}</span></div>"
+                    if salary and rng.random() < 0.5 else "")
+    return (
+        "<html><body><section class='top-card-layout'>"
+        f"<a class='topcard__org-name-link' href='https://www.linkedin.com/company/{_slug(company)}?trk=public_jobs_topcard-org-name'>"
+        f"{escape(company)}</a></section>{salary_block}"
+        f"<div class='show-more-less-html__markup'>{description}</div>"
+        + "<div class='filler'>" + "<span>related job</span>" * rng.randint(50, 200) + "</div>"
+        + "</body></html>"
+    )
+
+
+def company_page(url):
+    rng = _rng(url)
+    employees = rng.choice([12, 85, 430, 2300, 11000, 54000])
+    variant = rng.randrange(3)
+    if variant == 0:
+        body = (
+            "<script type='application/ld+json'>"
+            f'{{"@context": "http://schema.org", "@type": "Organization", "numberOfEmployees": {{"value": {employees}}}}}'
+            "</script>"
+        )
+    elif variant == 1:
+        body = (f"<dl><dt>Company size</dt><dd class='org-about-company-module__company-size-definition-text'>"
+                f"{employees:,} employees</dd></dl>")
+    else:
+        body = f"<div class='org-top-card'><p>Software Development</p><span>{employees:,} employees</span></div>"
+    return "<html><body>" + "<div>About us</div>" * rng.randint(20, 80) + body + "</body></html>"
+
+
+PAGE_BUILDERS = {"search": search_page, "job": job_page, "company": company_page}
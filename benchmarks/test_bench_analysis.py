@@ -0,0 +1,51 @@
+"""Analysis scripts on a final_merged_report-shaped corpus (text extraction and report generation)."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_requirement_analysis(benchmark, rounds, corpus):
+    """analyze_final_merged_v2: relevance update + requirement features + education/major/new-grad/experience counts"""
+    pytest.importorskip("reportlab")
+    pytest.importorskip("seaborn")
+    import analyze_final_merged_v2 as analysis
+
+    df = corpus.report_frame
+
+    def analyze():
+        updated, _ = analysis.update_relevance_level(df)
+        features = analysis.requirement_features(updated)
+        return (
+            analysis.analyze_education_requirements(updated, features),
+            analysis.analyze_major_requirements(updated, features),
+            analysis.analyze_liberal_arts_requirements(updated, features),
+            analysis.analyze_new_grad_requirements(updated, features),
+            analysis.analyze_experience_requirements(updated, features),
+        )
+
+    (degree_counts, _), *_ = benchmark.pedantic(analyze, rounds=rounds, iterations=1)
+    benchmark.extra_info["records"] = len(df)
+    assert degree_counts is not None
+
+
+def test_human_report(benchmark, rounds, corpus, tmp_path):
+    import generate_human_report
+
+    df = corpus.report_frame
+    output_file = tmp_path / "human_report.txt"
+    benchmark.pedantic(generate_human_report.generate_human_report,
+                       args=({"Sheet1": df}, ["Sheet1"], str(output_file)), rounds=rounds, iterations=1)
+    benchmark.extra_info["records"] = len(df)
+    assert output_file.stat().st_size > 0
+
+
+def test_statistical_report(benchmark, rounds, corpus, tmp_path):
+    pytest.importorskip("scipy")
+    import analyze_report
+
+    df = corpus.report_frame
+    output_file = tmp_path / "statistical_report.txt"
+    benchmark.pedantic(analyze_report.generate_statistical_report,
+                       args=({"Sheet1": df}, ["Sheet1"], str(output_file)), rounds=rounds, iterations=1)
+    benchmark.extra_info["records"] = len(df)
+    assert output_file.stat().st_size > 0
@@ -0,0 +1,99 @@
+"""generate_local_report cross-region charts: first render vs a re-run with unchanged aggregates (chart cache)."""
+import itertools
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("seaborn")
+pytest.importorskip("docx")
+
+
+@pytest.fixture
+def report_module(monkeypatch):
+    from benchmarks.conftest import TEST_JOBSPY_DIR
+
+    monkeypatch.syspath_prepend(TEST_JOBSPY_DIR)
+    import generate_local_report
+
+    return generate_local_report
+
+
+@pytest.fixture
+def all_data(corpus, report_module):
+    """Corpus rows split into per-region frames with the report's column names"""
+    import pandas as pd
+    from benchmarks.synthetic_corpus import to_export_rows
+
+    regions = {}
+    for job, row in zip(corpus.raw, to_export_rows(corpus.raw)):
+        row["Estimated Annual Salary (USD)"] = row["Estimated Annual Salary"]
+        regions.setdefault(job["_region"], []).append(row)
+    return {region: report_module.map_excel_columns_to_standard(pd.DataFrame(rows))
+            for region, rows in regions.items()}
+
+
+def _chart_jobs(report_module, all_data):
+    from report_analytics import ReportAnalytics
+
+    return list(report_module.build_chart_jobs(ReportAnalytics(all_data)).values())
+
+
+@pytest.mark.parametrize("cache", ["cold", "cached"])
+def test_region_charts(benchmark, rounds, tmp_path, report_module, all_data, cache):
+    from chart_renderer import render_charts
+
+    counter = itertools.count()
+
+    def setup():
+        charts_dir = str(tmp_path / f"charts_{next(counter)}")
+        if cache == "cached":
+            render_charts(_chart_jobs(report_module, all_data), charts_dir, workers=1)
+        return (charts_dir,), {}
+
+    def render(charts_dir):
+        return render_charts(_chart_jobs(report_module, all_data), charts_dir)
+
+    paths = benchmark.pedantic(render, setup=setup, rounds=rounds, iterations=1)
+    benchmark.extra_info["charts"] = len(paths)
+    assert len(paths) == 5 and all(os.path.getsize(path) > 0 for path in paths)
+
+
+def test_changed_aggregate_rerenders_only_its_chart(tmp_path, report_module, all_data):
+    """New posting dates change the time series table only; the other images are reused"""
+    from chart_renderer import load_chart_cache, render_charts
+
+    charts_dir = str(tmp_path / "charts")
+    render_charts(_chart_jobs(report_module, all_data), charts_dir, workers=1)
+    before = load_chart_cache(charts_dir)
+    mtimes = {name: os.path.getmtime(os.path.join(charts_dir, name)) for name in before}
+
+    region = next(iter(all_data))
+    all_data[region] = all_data[region].assign(posted_date="2024-01-15")
+    render_charts(_chart_jobs(report_module, all_data), charts_dir, workers=1)
+    after = load_chart_cache(charts_dir)
+
+    assert {name for name in before if before[name] != after[name]} == {"time_series_chart.png"}
+    for name in before.keys() - {"time_series_chart.png"}:
+        assert os.path.getmtime(os.path.join(charts_dir, name)) == mtimes[name]
+
+
+def test_fingerprint_covers_render_module_helpers(tmp_path, monkeypatch):
+    """Editing a helper or constant of the render function's module changes the fingerprint"""
+    import importlib
+    import sys
+    import chart_renderer
+
+    module_path = tmp_path / "fingerprint_charts.py"
+    source = "PALETTE = 'Blues'\n\ndef _style():\n    return PALETTE\n\ndef render(data, spec, path):\n    _style()\n"
+    module_path.write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    fingerprints = []
+    for palette in ("Blues", "Greens"):
+        module_path.write_text(source.replace("Blues", palette))
+        monkeypatch.setattr(chart_renderer, "_module_hashes", {})
+        monkeypatch.delitem(sys.modules, "fingerprint_charts", raising=False)
+        module = importlib.import_module("fingerprint_charts")
+        fingerprints.append(chart_renderer.ChartJob("a.png", module.render, {"x": 1}).fingerprint())
+    assert fingerprints[0] != fingerprints[1]
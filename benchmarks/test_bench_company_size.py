@@ -0,0 +1,22 @@
+"""Company size lookups with an empty cache (fetch + JSON-LD/dd/text fallbacks)."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+COMPANY_COUNT = 30
+
+
+def test_company_size(benchmark, rounds, scraper, run_dir, zenrows_stub):
+    companies = [(f"Company {i}", f"https://www.linkedin.com/company/company-{i}?trk=public_jobs")
+                 for i in range(COMPANY_COUNT)]
+
+    def lookup_all(cache, ctx):
+        return [scraper.get_company_size(name, url, cache, ctx) for name, url in companies]
+
+    def setup():
+        return ({}, run_dir()), {}
+
+    sizes = benchmark.pedantic(lookup_all, setup=setup, rounds=rounds, iterations=1)
+    benchmark.extra_info["companies"] = COMPANY_COUNT
+    benchmark.extra_info["stub_requests"] = dict(zenrows_stub.requests)
+    assert any(sizes)
@@ -0,0 +1,65 @@
+"""CurrencyConverter at corpus scale: get_rate per salary vs convert_many over the whole column."""
+import json
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture
+def converter(monkeypatch):
+    from benchmarks.conftest import TEST_JOBSPY_DIR
+
+    monkeypatch.syspath_prepend(TEST_JOBSPY_DIR)
+    from core.currency_converter import CurrencyConverter
+
+    return CurrencyConverter.from_rates(CurrencyConverter.FALLBACK_RATES)
+
+
+def _salary_column(raw):
+    """Structured min_amount and currency of the jobs that have one"""
+    salaries = [(job["min_amount"], job.get("currency")) for job in raw
+                if job.get("min_amount") is not None and not np.isnan(job["min_amount"])]
+    return [amount for amount, _ in salaries], [currency for _, currency in salaries]
+
+
+def _per_value(converter, amounts, currencies):
+    return np.array([amount * converter.get_rate(currency or "USD", "USD")
+                     for amount, currency in zip(amounts, currencies)])
+
+
+@pytest.mark.parametrize("mode", ["get_rate", "convert_many"])
+def test_salary_column_to_usd(benchmark, rounds, corpus, converter, mode):
+    amounts, currencies = _salary_column(corpus.raw)
+    if mode == "get_rate":
+        usd = benchmark.pedantic(_per_value, args=(converter, amounts, currencies), rounds=rounds, iterations=1)
+    else:
+        usd = benchmark.pedantic(converter.convert_many, args=(amounts, currencies, "USD"),
+                                 rounds=rounds, iterations=1)
+    benchmark.extra_info["salaries"] = len(amounts)
+    np.testing.assert_allclose(usd, _per_value(converter, amounts, currencies))
+
+
+def test_convert_many_matches_get_rate(converter):
+    """Aliases, unknown and missing codes (valued as USD), NaN amounts, and a non-USD target"""
+    currencies = ["GBP", "£", "hk$", "XYZ", None, "", "USD", "EUR"]
+    amounts = [100.0, 100.0, 100.0, 100.0, 100.0, 100.0, np.nan, 100.0]
+    for target in ["USD", "EUR"]:
+        expected = [amount * converter.get_rate(currency or "USD", target)
+                    for amount, currency in zip(amounts, currencies)]
+        np.testing.assert_allclose(converter.convert_many(amounts, currencies, target), expected)
+    np.testing.assert_allclose(converter.convert_many([1.0, 2.0], "GBP"), [1.27, 2.54])
+
+
+def test_rates_snapshot_pins_rates(converter, tmp_path):
+    from core.currency_converter import CurrencyConverter
+
+    snapshot = str(tmp_path / "rates.json")
+    assert converter.save_snapshot(snapshot)
+    with open(snapshot, "r", encoding="utf-8") as f:
+        assert json.load(f)["rates"] == CurrencyConverter.FALLBACK_RATES
+
+    pinned = CurrencyConverter(cache_file=str(tmp_path / "cache.json"), rates_snapshot=snapshot)
+    assert pinned.rates == CurrencyConverter.FALLBACK_RATES
+    assert not (tmp_path / "cache.json").exists()  # neither the cache nor the API was used
@@ -0,0 +1,48 @@
+"""Deduplication at corpus scale: main_merged, cross-platform and JobDataCollection."""
+import pytest
+
+from benchmarks.synthetic_corpus import to_job_data
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_deduplicate_jobs(benchmark, rounds, corpus, main_merged_module):
+    rows = corpus.rows
+    half = len(rows) // 2
+    merged = benchmark.pedantic(main_merged_module.deduplicate_jobs, args=(rows[:half], rows[half:]),
+                                rounds=rounds, iterations=1)
+    benchmark.extra_info["records"] = len(rows)
+    benchmark.extra_info["unique"] = len(merged)
+    assert 0 < len(merged) < len(rows)
+
+
+def test_deduplicate_cross_platform(benchmark, rounds, corpus, jobspy_module):
+    import pandas as pd
+
+    df = pd.DataFrame(corpus.rows)
+    df_indeed = df[df["Platform"] == "Indeed"].reset_index(drop=True)
+    df_linkedin = df[df["Platform"] == "Linkedin"].reset_index(drop=True)
+
+    _, df_linkedin_dedup, df_combined = benchmark.pedantic(
+        jobspy_module.deduplicate_cross_platform, args=(df_indeed, df_linkedin), rounds=rounds, iterations=1
+    )
+    benchmark.extra_info["records"] = len(df)
+    benchmark.extra_info["linkedin_removed"] = len(df_linkedin) - len(df_linkedin_dedup)
+    assert len(df_linkedin_dedup) < len(df_linkedin)
+    assert len(df_combined) == len(df_indeed) + len(df_linkedin_dedup)
+
+
+def test_job_data_collection(benchmark, rounds, corpus, jobspy_module):
+    from core.job_data import JobDataCollection
+
+    jobs = to_job_data(corpus.raw)
+
+    def add_all():
+        collection = JobDataCollection()
+        collection.add_many(jobs)
+        return collection
+
+    collection = benchmark.pedantic(add_all, rounds=rounds, iterations=1)
+    benchmark.extra_info["records"] = len(jobs)
+    benchmark.extra_info["unique"] = len(collection)
+    assert 0 < len(collection) < len(jobs)
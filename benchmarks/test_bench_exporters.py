@@ -0,0 +1,100 @@
+"""Exporters at corpus scale: streamed Excel, Parquet (+ Excel conversion) and Parquet sidecars."""
+import itertools
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _paths(tmp_path, suffix):
+    counter = itertools.count()
+    return lambda: tmp_path / f"export_{next(counter)}{suffix}"
+
+
+def test_export_to_excel(benchmark, rounds, corpus, tmp_path):
+    from exporter import export_to_excel
+
+    next_path = _paths(tmp_path, ".xlsx")
+    benchmark.pedantic(export_to_excel, setup=lambda: ((corpus.rows, str(next_path())), {}),
+                       rounds=rounds, iterations=1)
+    benchmark.extra_info["records"] = len(corpus.rows)
+    assert list(tmp_path.glob("*.xlsx"))
+
+
+def test_streaming_exporter_parquet(benchmark, rounds, corpus, tmp_path):
+    from exporter import StreamingExporter, HAS_PYARROW
+    from config import FIELDS
+
+    if not HAS_PYARROW:
+        pytest.skip("pyarrow not installed")
+    next_path = _paths(tmp_path, ".xlsx")
+
+    def export(path):
+        with StreamingExporter(str(path), FIELDS, parquet=True) as writer:
+            writer.write_rows(corpus.rows)
+        return writer
+
+    writer = benchmark.pedantic(export, setup=lambda: ((next_path(),), {}), rounds=rounds, iterations=1)
+    benchmark.extra_info["records"] = len(corpus.rows)
+    assert writer.parquet_path and list(tmp_path.glob("*.parquet"))
+
+
+@pytest.mark.parametrize("parquet", [True, False])
+def test_failed_export_leaves_no_output(tmp_path, parquet):
+    """An exception inside the with block propagates and no partial Parquet/Excel file is left"""
+    from exporter import StreamingExporter, HAS_PYARROW
+    from config import FIELDS
+
+    if parquet and not HAS_PYARROW:
+        pytest.skip("pyarrow not installed")
+    path = tmp_path / "failed.xlsx"
+    with pytest.raises(RuntimeError):
+        with StreamingExporter(str(path), FIELDS, parquet=parquet, chunk_size=2) as writer:
+            writer.write_rows([{field: "x" for field in FIELDS}] * 5)
+            raise RuntimeError("scrape failed")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_parquet_sidecar_roundtrip(benchmark, rounds, corpus, tmp_path):
+    """dataset_loader sidecar write + read (what the analysis scripts load)"""
+    from dataset_loader import HAS_PYARROW, write_sidecar, read_sidecar
+
+    if not HAS_PYARROW:
+        pytest.skip("pyarrow not installed")
+    df = corpus.report_frame
+    next_path = _paths(tmp_path, ".parquet")
+
+    def roundtrip(path):
+        write_sidecar(df, str(path))
+        return read_sidecar(str(path))
+
+    loaded = benchmark.pedantic(roundtrip, setup=lambda: ((next_path(),), {}), rounds=rounds, iterations=1)
+    benchmark.extra_info["records"] = len(df)
+    assert list(loaded.columns) == list(df.columns)
+
+
+def test_sidecar_matches_read_excel(tmp_path):
+    """Partly numeric text columns and missing cells load from the sidecar as read_excel returns them"""
+    import datetime
+
+    import pandas as pd
+    from dataset_loader import HAS_PYARROW, load_dataset, sidecar_path
+
+    if not HAS_PYARROW:
+        pytest.skip("pyarrow not installed")
+    path = str(tmp_path / "mixed.xlsx")
+    pd.DataFrame({
+        "Job Title": ["Engineer", None, "Analyst", "Scientist"],
+        "Team Size/Business Line Size": [50, "10-20 people", None, 3.5],
+        "Posted Date": [datetime.datetime(2024, 1, 2), "yesterday", None, 7],
+        "Remote": [True, False, None, True],
+        "Openings": [1, 2, 3, 4],
+    }).to_excel(path, index=False)
+
+    expected = pd.read_excel(path)
+    load_dataset(path)  # writes the sidecar
+    assert os.path.exists(sidecar_path(path))
+    loaded = load_dataset(path)
+    pd.testing.assert_frame_equal(loaded, expected)
+    assert [type(v) for v in loaded["Team Size/Business Line Size"]] == [int, str, float, float]
@@ -0,0 +1,54 @@
+"""scrapers.JobSpyScraper.scrape: one search per platform at a time vs the per-platform thread pools."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+KEYWORDS = ["AI Engineer", "Machine Learning Engineer", "Data Scientist"]
+LOCATIONS = ["New York, NY", "Austin, TX", "Seattle, WA", "Boston, MA"]
+CONCURRENCY = {
+    "serial": {"linkedin": 1, "indeed": 1},
+    "concurrent": None,  # JobSpyScraper.DEFAULT_PLATFORM_CONCURRENCY
+}
+
+
+@pytest.fixture
+def scraper_module(fake_scrape_jobs, monkeypatch):
+    """scrapers.jobspy_scraper with fake JobSpy searches and the fallback exchange rates (no network)"""
+    from benchmarks.conftest import TEST_JOBSPY_DIR
+
+    monkeypatch.syspath_prepend(TEST_JOBSPY_DIR)
+    from scrapers import jobspy_scraper
+
+    converter_class = jobspy_scraper.CurrencyConverter
+
+    def offline_converter(rates_snapshot=None):
+        return converter_class.from_rates(converter_class.FALLBACK_RATES)
+
+    monkeypatch.setattr(jobspy_scraper, "HAS_JOBSPY", True)
+    monkeypatch.setattr(jobspy_scraper, "scrape_jobs", fake_scrape_jobs, raising=False)
+    monkeypatch.setattr(jobspy_scraper, "CurrencyConverter", offline_converter)
+    return jobspy_scraper
+
+
+def _scraper(module, concurrency):
+    return module.JobSpyScraper(request_delay=0, results_per_search=50, platform_concurrency=concurrency)
+
+
+@pytest.mark.parametrize("mode", list(CONCURRENCY))
+def test_jobspy_scraper(benchmark, rounds, scraper_module, mode):
+    def run():
+        scraper = _scraper(scraper_module, CONCURRENCY[mode])
+        return scraper.scrape(KEYWORDS, LOCATIONS, filter_ai_related=False, verbose=False), scraper
+
+    collection, scraper = benchmark.pedantic(run, rounds=rounds, iterations=1)
+    benchmark.extra_info["searches"] = scraper.stats["total_requests"]
+    assert scraper.stats["total_requests"] == len(KEYWORDS) * len(LOCATIONS) * 2
+    keys = [job._dedup_key for job in collection]
+    assert len(keys) == len(set(keys)) > 0
+
+
+def test_max_total_jobs_cancels_searches(scraper_module):
+    scraper = _scraper(scraper_module, None)
+    collection = scraper.scrape(KEYWORDS, LOCATIONS, filter_ai_related=False, max_total_jobs=60, verbose=False)
+    assert len(collection) == 60
+    assert scraper.stats["total_requests"] < len(KEYWORDS) * len(LOCATIONS) * 2
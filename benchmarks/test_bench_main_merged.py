@@ -0,0 +1,36 @@
+"""End-to-end main_merged run: core + AI-related stages, merge, dedup and Excel export."""
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+LOCATIONS = ["New York, NY", "Austin, TX"]
+
+
+@pytest.fixture
+def main_merged(scraper, main_merged_module, monkeypatch):
+    """main_merged limited to a few locations, pages and detail pages"""
+    module = main_merged_module
+    monkeypatch.setattr(module, "get_us_locations_only", lambda: list(LOCATIONS))
+    monkeypatch.setattr(module, "DETAIL_LIMIT", 10)
+    monkeypatch.setattr(scraper, "MAX_PAGES", 2)
+    return module
+
+
+def test_main_merged_end_to_end(benchmark, rounds, main_merged, monkeypatch, tmp_path, zenrows_stub):
+    from checkpoint_manager import reset_paths
+
+    counter = iter(range(rounds))
+
+    def setup():
+        directory = tmp_path / f"e2e_{next(counter)}"
+        directory.mkdir()
+        monkeypatch.chdir(directory)
+        return (), {}
+
+    benchmark.pedantic(main_merged.main, setup=setup, rounds=rounds, iterations=1)
+    reset_paths()
+    report = os.path.join(main_merged.MERGED_OUTPUT_DIR, "merged_report.xlsx")
+    benchmark.extra_info["stub_requests"] = dict(zenrows_stub.requests)
+    assert os.path.exists(report)
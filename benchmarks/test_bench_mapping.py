@@ -0,0 +1,34 @@
+"""map_to_template_format at corpus scale (requirements + salary extraction, currency conversion)."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("workers", [1, 4], ids=["in_process", "process_pool"])
+def test_map_to_template_format(benchmark, rounds, corpus, jobspy_module, workers):
+    raw = corpus.raw
+    df = benchmark.pedantic(jobspy_module.map_to_template_format, args=(raw,), kwargs={"workers": workers},
+                            rounds=rounds, iterations=1)
+    benchmark.extra_info["records"] = len(raw)
+    benchmark.extra_info["with_salary"] = int((df["Salary Range"] != "").sum())
+    assert len(df) == len(raw)
+    assert (df["Salary Range"] != "").any()
+    assert list(df["Job Link"]) == [job["job_url"] for job in raw]
+
+
+def test_pool_workers_report_regex_metrics(corpus, jobspy_module, monkeypatch):
+    """Timings recorded in the pool processes end up in the parent's metrics, as in process"""
+    from metrics import get_metrics, reset_metrics
+
+    monkeypatch.setattr(jobspy_module, "MAP_CHUNK_SIZE", 100)
+    monkeypatch.setattr(jobspy_module, "MAP_PARALLEL_MIN_JOBS", 0)
+    raw = corpus.raw[:400]
+
+    counts = {}
+    for workers in (1, 2):
+        reset_metrics()
+        jobspy_module.map_to_template_format(raw, workers=workers)
+        stages = get_metrics().snapshot()["stages"]
+        counts[workers] = {stage: stages[stage]["count"] for stage in ("regex.salary", "regex.requirements")}
+    reset_metrics()
+    assert counts[2] == counts[1] and counts[1]["regex.requirements"] >= len(raw)
@@ -0,0 +1,53 @@
+"""main_multi_country: countries one after another vs one process per country (RunContext per country)."""
+import itertools
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+COUNTRIES = {
+    "us": ["New York, NY", "Austin, TX"],
+    "uk": ["London, United Kingdom", "Manchester, United Kingdom"],
+    "sg": ["Singapore"],
+}
+NAMES = {"us": "US", "uk": "UK", "sg": "SG"}
+
+
+@pytest.fixture
+def multi_country(scraper, monkeypatch, tmp_path):
+    """main_multi_country limited to a few locations and detail pages, without a rate limit"""
+    monkeypatch.chdir(tmp_path)
+    import main_multi_country as module
+
+    monkeypatch.setattr(module, "DETAIL_LIMIT", 10)
+    monkeypatch.setattr(module, "ZENROWS_REQUESTS_PER_MINUTE", None)
+    monkeypatch.setattr(module, "SUPABASE_ENABLED", False)
+    return module
+
+
+@pytest.mark.parametrize("mode", ["sequential", "parallel"])
+def test_multi_country(benchmark, rounds, multi_country, mode, monkeypatch, tmp_path, zenrows_stub):
+    from config import get_country_output_paths
+
+    if mode == "parallel" and not hasattr(os, "fork"):
+        pytest.skip("worker processes need fork to inherit the stub wiring")
+    counter = itertools.count()
+
+    def run():
+        if mode == "parallel":
+            multi_country.run_countries_parallel(COUNTRIES, NAMES)
+        else:
+            for code, locations in COUNTRIES.items():
+                multi_country.process_single_country(code, locations, NAMES)
+
+    def setup():
+        directory = tmp_path / f"{mode}_{next(counter)}"
+        directory.mkdir()
+        monkeypatch.chdir(directory)
+        return (), {}
+
+    benchmark.pedantic(run, setup=setup, rounds=rounds, iterations=1)
+    benchmark.extra_info["countries"] = len(COUNTRIES)
+    for code in COUNTRIES:
+        assert os.path.exists(get_country_output_paths(code)["detail_report"])
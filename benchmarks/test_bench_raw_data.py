@@ -0,0 +1,52 @@
+"""jobspy_max_scraper raw data at corpus scale: jobs appended to the JSONL log, one checkpoint per batch."""
+import itertools
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+SAVES = 10
+
+
+def _save_in_batches(module, region_name, jobs, saves=SAVES):
+    raw_jobs, _ = module.open_raw_data(region_name)
+    seen_job_keys = module.SeenKeyIndex(module.get_checkpoint_files(region_name)[2])
+    for keyword_idx in range(saves):
+        batch = jobs[keyword_idx::saves]
+        seen_job_keys.update(module.generate_job_key(job) for job in batch)
+        raw_jobs.append(batch)
+        module.save_checkpoint(region_name, keyword_idx, 0, seen_job_keys, raw_jobs)
+    return raw_jobs
+
+
+def test_raw_data_checkpoints(benchmark, rounds, corpus, jobspy_module):
+    """SAVES checkpoints while the corpus arrives (each save writes only that batch)"""
+    counter = itertools.count()
+
+    def save_all(region_name):
+        _save_in_batches(jobspy_module, region_name, corpus.raw).close()
+        return region_name
+
+    region_name = benchmark.pedantic(save_all, setup=lambda: ((f"Region {next(counter)}",), {}),
+                                     rounds=rounds, iterations=1)
+    benchmark.extra_info["records"] = len(corpus.raw)
+    assert jobspy_module.load_checkpoint(region_name)["raw_data_count"] == len(corpus.raw)
+    assert sum(1 for _ in jobspy_module.iter_raw_data(region_name)) == len(corpus.raw)
+
+
+def test_resume_drops_uncommitted_jobs(jobspy_module):
+    """Jobs written after the last checkpoint are discarded when the run resumes"""
+    jobs = [{"title": f"ML Engineer {i}", "company": "Acme", "location": "London", "min_amount": float("nan")}
+            for i in range(30)]
+    raw_jobs = _save_in_batches(jobspy_module, "Resume", jobs[:20], saves=2)
+    raw_jobs.append(jobs[20:])  # collected, never checkpointed
+    raw_jobs.close()
+
+    checkpoint = jobspy_module.load_checkpoint("Resume")
+    raw_jobs, all_jobs = jobspy_module.open_raw_data("Resume", checkpoint)
+    assert len(all_jobs) == 20 and all_jobs[0]["min_amount"] is None
+    raw_jobs.append(jobs[25:])
+    jobspy_module.save_checkpoint("Resume", 2, 0, jobspy_module.load_seen_keys("Resume", checkpoint), raw_jobs)
+    raw_jobs.close()
+    assert jobspy_module.load_checkpoint("Resume")["raw_data_count"] == 25
+    assert [job["title"] for job in jobspy_module.load_raw_data("Resume")][20:] == [job["title"] for job in jobs[25:]]
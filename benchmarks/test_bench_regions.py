@@ -0,0 +1,67 @@
+"""jobspy_max_scraper: regions one after another vs one process per region (platforms concurrent within a region)."""
+import itertools
+import os
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+REGIONS = [
+    ("United States", "usa"),
+    ("United Kingdom", "uk"),
+    ("Australia", "australia"),
+    ("Hong Kong", "hong kong"),
+    ("Singapore", "singapore"),
+]
+KEYWORDS = ["AI Engineer", "Machine Learning Engineer"]
+JOBS_PER_SEARCH = 25
+
+
+@pytest.fixture
+def regions_module(jobspy_module, fake_scrape_jobs, monkeypatch):
+    """jobspy_max_scraper on two locations per region, fake JobSpy searches and no Supabase"""
+    import config_jobspy
+
+    monkeypatch.setitem(sys.modules, "jobspy", types.SimpleNamespace(scrape_jobs=fake_scrape_jobs))
+    monkeypatch.setattr(config_jobspy, "ENABLE_SUPABASE", False)
+    monkeypatch.setattr(config_jobspy, "EXPORT_PARQUET", False)
+    monkeypatch.setattr(jobspy_module, "REQUEST_DELAY", 0)
+    monkeypatch.setattr(jobspy_module, "get_locations_by_region",
+                        lambda region_name: [f"{region_name} City {i}" for i in range(2)])
+    return jobspy_module
+
+
+@pytest.mark.parametrize("mode", ["sequential", "parallel"])
+def test_regions(benchmark, rounds, regions_module, mode, monkeypatch, tmp_path):
+    if mode == "parallel" and not hasattr(os, "fork"):
+        pytest.skip("worker processes need fork to inherit the fake JobSpy module")
+    settings = {
+        "keywords": KEYWORDS,
+        "results_per_search": JOBS_PER_SEARCH,
+        "max_total_jobs": None,
+        "parsed_min_date": None,
+        "filter_ai_related": False,
+        "platform": "both",
+    }
+    counter = itertools.count()
+
+    def run():
+        if mode == "parallel":
+            return regions_module.run_regions_parallel(REGIONS, settings)
+        return [regions_module.region_summary(name, regions_module.scrape_region(name, code, **settings), 0)
+                for name, code in REGIONS]
+
+    def setup():
+        directory = tmp_path / f"{mode}_{next(counter)}"
+        directory.mkdir()
+        monkeypatch.chdir(directory)
+        return (), {}
+
+    summaries = benchmark.pedantic(run, setup=setup, rounds=rounds, iterations=1)
+    benchmark.extra_info["regions"] = len(REGIONS)
+    assert sorted(summary["region"] for summary in summaries) == sorted(name for name, _ in REGIONS)
+    for summary in summaries:
+        assert summary["status"] == "ok" and summary["jobs"] > 0
+        assert os.path.exists(summary["output_file"])
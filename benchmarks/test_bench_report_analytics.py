@@ -0,0 +1,107 @@
+"""Report aggregates (completeness, salary, dates, locations, platforms) on DuckDB over DataFrames and Parquet."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("duckdb")
+pytest.importorskip("pyarrow")
+
+AGGREGATES = ["completeness", "salary", "time_range", "location", "platform"]
+
+
+@pytest.fixture
+def analytics_class(monkeypatch):
+    from benchmarks.conftest import TEST_JOBSPY_DIR
+
+    monkeypatch.syspath_prepend(TEST_JOBSPY_DIR)
+    from report_analytics import ReportAnalytics
+
+    return ReportAnalytics
+
+
+@pytest.fixture
+def sources(corpus, tmp_path):
+    """Corpus split into per-region frames (report column names) and their Parquet files"""
+    import pandas as pd
+    from benchmarks.synthetic_corpus import to_export_rows
+    from dataset_loader import COLUMN_MAPPING
+
+    regions = {}
+    for job, row in zip(corpus.raw, to_export_rows(corpus.raw)):
+        row["Estimated Annual Salary (USD)"] = row["Estimated Annual Salary"]
+        regions.setdefault(job["_region"], []).append(row)
+    frames = {region: pd.DataFrame(rows).rename(columns=COLUMN_MAPPING) for region, rows in regions.items()}
+    paths = {}
+    for region, df in frames.items():
+        paths[region] = str(tmp_path / f"{region}.parquet")
+        df.to_parquet(paths[region], index=False)
+    return {"frame": frames, "parquet": paths}
+
+
+def _report_aggregates(analytics_class, sources):
+    analytics = analytics_class(sources)
+    result = {region: {name: getattr(analytics, name)(region) for name in AGGREGATES}
+              for region in analytics.regions}
+    analytics.close()
+    return result
+
+
+@pytest.mark.parametrize("source", ["frame", "parquet"])
+def test_report_aggregates(benchmark, rounds, corpus, analytics_class, sources, source):
+    result = benchmark.pedantic(_report_aggregates, args=(analytics_class, sources[source]),
+                                rounds=rounds, iterations=1)
+    benchmark.extra_info["records"] = len(corpus.raw)
+    assert sum(len(df) for df in sources["frame"].values()) == len(corpus.raw)
+    assert result == _report_aggregates(analytics_class, sources["frame"])
+
+
+def test_aggregates_of_unusual_values(analytics_class):
+    """Blank/whitespace cells, k notation, out-of-range salaries, unparseable dates, missing columns"""
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame({
+        'job_title': ['a', ' ', '', None, np.nan, 'b', '\t', 'c'],
+        'estimated_annual_salary_usd': ['$120k', 'USD 95,000', '£,k 70000', 'nan', None, '  45000 ',
+                                        'HK$1,200,000', '12k-15k'],
+        'posted_date': ['2025-01-03', '2025-02-10 12:30:00', '', None, 'garbage', '2024-12-31T08:00:00',
+                        '2025-01-03', '2025-02-28'],
+        'location': ['X', 'X', ' ', None, 'Y', 'Z', 'Y', 'X'],
+        'platform': ['Indeed', 'LinkedIn', 'Indeed', '', None, 'Indeed', 'LinkedIn', 'Indeed'],
+    })
+    analytics = analytics_class({'Odd': df, 'Titles only': pd.DataFrame({'job_title': ['x']}),
+                                 'Empty': pd.DataFrame()})
+    assert analytics.regions == ['Odd', 'Titles only'] and analytics.total_jobs == 9
+
+    completeness = analytics.completeness('Odd')
+    assert completeness['job_title'] == {'count': 3, 'percentage': 37.5}
+    assert completeness['company_name']['count'] == 0
+
+    salary = analytics.salary('Odd')
+    assert salary['values'] == [12000, 45000, 95000, 120000]
+    assert salary['median'] == 70000 and salary['std'] == pytest.approx(np.std(salary['values']))
+
+    time_range = analytics.time_range('Odd')
+    assert (time_range['count'], time_range['span_days']) == (5, 58)  # 2024-12-31 08:00 to 2025-02-28
+    assert time_range['unparsed'] == 1  # 'garbage' ('' and None are not dates)
+    assert time_range['monthly'] == {'months': ['2024-12', '2025-01', '2025-02'], 'counts': [1, 2, 2]}
+
+    assert analytics.location('Odd') == {'has_data': True, 'total_unique': 3,
+                                         'top_locations': {'X': 3, 'Y': 2, 'Z': 1}}
+    assert analytics.platform('Odd')['distribution'] == {'Indeed': 4, 'LinkedIn': 2}
+    assert analytics.date_bounds('Odd') == ('', 'garbage')
+    assert analytics.salary('Titles only') == {'has_data': False}
+    assert analytics.time_range('Titles only') == {'has_data': False, 'unparsed': 0}
+
+
+def test_posted_date_formats(analytics_class):
+    """Dates pandas parsed before: ISO 8601, slashes (month first), month names; the rest are counted"""
+    import pandas as pd
+
+    dates = ['2024-01-15', '2024-01-15T09:30:00Z', '2024/01/15', '01/15/2024', '15/01/2024', 'Jan 15, 2024',
+             'January 15, 2024', '15 Jan 2024', '15 January 2024', 'yesterday', ' ', None]
+    analytics = analytics_class({'Dates': pd.DataFrame({'posted_date': dates}),
+                                 'Undated': pd.DataFrame({'posted_date': ['soon', '']})})
+    time_range = analytics.time_range('Dates')
+    assert time_range['count'] == 9 and time_range['span_days'] == 0 and time_range['unparsed'] == 1
+    assert time_range['earliest'] == pd.Timestamp('2024-01-15')
+    assert analytics.time_range('Undated') == {'has_data': False, 'unparsed': 1}
@@ -0,0 +1,51 @@
+"""requirement_features at corpus scale: one scan per distinct requirement text (repeated and all-distinct texts)."""
+import pandas as pd
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("texts", ["corpus", "distinct"])
+def test_requirement_features(benchmark, rounds, corpus, texts):
+    from requirement_features import FEATURE_COLUMNS, extract_requirement_features
+
+    column = corpus.report_frame['专业要求']
+    if texts == "distinct":
+        column = column + pd.Series([f" (ref {i})" for i in range(len(column))], index=column.index)
+
+    features = benchmark.pedantic(extract_requirement_features, args=(column, 2025), rounds=rounds, iterations=1)
+    benchmark.extra_info["records"] = len(column)
+    benchmark.extra_info["distinct_texts"] = column.nunique()
+    assert list(features.columns) == FEATURE_COLUMNS and features.index.equals(column.index)
+    assert features['education'].str.len().sum() > 0
+
+
+def test_features_match_substring_checks():
+    """Keywords match anywhere in the text ('ba' in 'database'), prefixes of a longer hit included"""
+    from requirement_features import EDUCATION_KEYWORDS, MAJOR_KEYWORDS, extract_requirement_features
+
+    texts = pd.Series([
+        "Bachelor's in CS; 3-5 years of experience",
+        "PH.D. or M.Sc. in Mathematics, minimum of 2 years, at least 4 years, 2 years in ML",
+        "database, has, it, ui ux",
+        "new grad class of 2026, graduating in 2025",
+        "Entry-level role for 2024 grads",
+        "Recent Graduate; graduation from 2019 then 2023 graduate",
+        "1 year of exp, 1 year of work, 2 years of experience",
+        None, float("nan"), 12345, "",
+    ], index=range(10, 21))
+    features = extract_requirement_features(texts, current_year=2025)
+    assert features.index.equals(texts.index)
+
+    for text, degrees, majors in zip(texts, features['education'], features['majors']):
+        lower = text.lower() if isinstance(text, str) else ""
+        assert degrees == [d for d in ['PhD', 'Master', 'Bachelor', 'Associate', 'High School']
+                           if any(k in lower for k in EDUCATION_KEYWORDS[d])]
+        assert majors == [m for m, keywords in MAJOR_KEYWORDS.items() if any(k in lower for k in keywords)]
+
+    assert features['education'][12] == ['Bachelor', 'Associate']  # data(ba)se, h(as)
+    assert features['liberal_arts'][12] == ['Design']
+    assert features['graduation_year'].tolist() == [pd.NA, pd.NA, pd.NA, 2026, 2024, 2023] + [pd.NA] * 5
+    assert features['new_grad'].tolist() == [False, False, False, True, True, True] + [False] * 5
+    # "5 years of experience" is a single number, which wins over the 3-5 range
+    assert features['experience_years'].tolist() == [5, 2, pd.NA, pd.NA, pd.NA, pd.NA, 1] + [pd.NA] * 4
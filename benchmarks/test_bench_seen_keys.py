@@ -0,0 +1,56 @@
+"""jobspy_max_scraper checkpoints at corpus scale: seen keys appended to the uint64 hash file."""
+import itertools
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+SAVES = 10
+
+
+def test_checkpoint_saves(benchmark, rounds, corpus, jobspy_module):
+    """SAVES checkpoints while the corpus' job keys arrive (each save appends only the new hashes)"""
+    from core.seen_key_index import SeenKeyIndex
+    from core.raw_job_log import RawJobLog
+
+    keys = [jobspy_module.generate_job_key(job) for job in corpus.raw]
+    batches = [keys[i::SAVES] for i in range(SAVES)]
+    counter = itertools.count()
+
+    def save_all(region_name):
+        _, raw_data_file, seen_keys_file = jobspy_module.get_checkpoint_files(region_name)
+        seen_job_keys = SeenKeyIndex(seen_keys_file)
+        raw_jobs = RawJobLog(raw_data_file)
+        for keyword_idx, batch in enumerate(batches):
+            seen_job_keys.update(batch)
+            jobspy_module.save_checkpoint(region_name, keyword_idx, 0, seen_job_keys, raw_jobs)
+        return region_name, seen_job_keys
+
+    region_name, seen_job_keys = benchmark.pedantic(
+        save_all, setup=lambda: ((f"Region {next(counter)}",), {}), rounds=rounds, iterations=1
+    )
+    checkpoint_file, _, seen_keys_file = jobspy_module.get_checkpoint_files(region_name)
+    benchmark.extra_info["keys"] = len(seen_job_keys)
+    benchmark.extra_info["checkpoint_bytes"] = os.path.getsize(checkpoint_file)
+    benchmark.extra_info["seen_keys_bytes"] = os.path.getsize(seen_keys_file)
+    assert os.path.getsize(seen_keys_file) == 8 * len(seen_job_keys)
+
+    checkpoint = jobspy_module.load_checkpoint(region_name)
+    reloaded = jobspy_module.load_seen_keys(region_name, checkpoint)
+    assert len(reloaded) == len(seen_job_keys)
+    assert all(key in reloaded for key in keys[:1000])
+
+
+def test_legacy_key_list_migrates(jobspy_module):
+    """A checkpoint with the old seen_job_keys list resumes and is rewritten as hashes"""
+    from core.raw_job_log import RawJobLog
+
+    keys = ["ml engineer|||acme|||new york", "data scientist|||globex|||london"]
+    seen_job_keys = jobspy_module.load_seen_keys("Legacy", {"seen_job_keys": keys})
+    assert all(key in seen_job_keys for key in keys) and "other|||x|||y" not in seen_job_keys
+
+    raw_jobs = RawJobLog(jobspy_module.get_checkpoint_files("Legacy")[1])
+    jobspy_module.save_checkpoint("Legacy", 1, 0, seen_job_keys, raw_jobs)
+    checkpoint = jobspy_module.load_checkpoint("Legacy")
+    assert checkpoint["seen_keys_count"] == 2 and "seen_job_keys" not in checkpoint
@@ -0,0 +1,21 @@
+"""Stage 1: search list pages -> deduplicated job cards (fetch + parse + checkpoint)."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+LOCATIONS = ["New York, NY", "Austin, TX", "Seattle, WA"]
+
+
+def test_stage1_list(benchmark, rounds, scraper, run_dir, zenrows_stub):
+    from config import KEYWORDS
+
+    def setup():
+        return (KEYWORDS, LOCATIONS), {"ctx": run_dir()}
+
+    all_jobs, *_ = benchmark.pedantic(
+        scraper.fetch_linkedin_list_with_checkpoint, setup=setup, rounds=rounds, iterations=1
+    )
+    benchmark.extra_info["jobs"] = len(all_jobs)
+    benchmark.extra_info["stub_requests"] = dict(zenrows_stub.requests)
+    assert all_jobs
+    assert len({(job["Job Title"], job["Company Name"]) for job in all_jobs}) == len(all_jobs)
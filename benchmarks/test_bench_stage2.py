@@ -0,0 +1,37 @@
+"""Stage 2: job detail pages -> description, requirements, salary, company size."""
+import pytest
+
+from benchmarks.synthetic_pages import COMPANIES, TITLES
+
+pytest.importorskip("pytest_benchmark")
+
+JOB_COUNT = 20
+
+
+def make_jobs(count=JOB_COUNT):
+    """Stage 1 style job records pointing at detail pages"""
+    return [
+        {
+            "Job Title": TITLES[i % len(TITLES)],
+            "Company Name": COMPANIES[i % len(COMPANIES)],
+            "Location": "New York, NY",
+            "Job Link": f"https://www.linkedin.com/jobs/view/{4000000000 + i}",
+        }
+        for i in range(count)
+    ]
+
+
+def test_stage2_detail(benchmark, rounds, scraper, run_dir, zenrows_stub):
+    jobs_per_round = []
+
+    def setup():
+        jobs = make_jobs()
+        jobs_per_round.append(jobs)
+        return (jobs,), {"ctx": run_dir()}
+
+    benchmark.pedantic(scraper.enrich_job_details_with_checkpoint, setup=setup, rounds=rounds, iterations=1)
+    jobs = jobs_per_round[-1]
+    benchmark.extra_info["jobs"] = len(jobs)
+    benchmark.extra_info["stub_requests"] = dict(zenrows_stub.requests)
+    assert any(job.get("Job Description") for job in jobs)
+    assert any(job.get("Salary Range") for job in jobs)
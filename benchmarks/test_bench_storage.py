@@ -0,0 +1,54 @@
+"""supabase_storage.upsert_jobs against the local SQLite client: unchanged re-runs and max-rows capped lookups."""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("supabase")
+
+# More rows per title than one capped response carries
+ROWS = 2500
+MAX_ROWS = 1000
+
+
+def _jobs(count, title="AI Engineer"):
+    return [{"职位名称": title, "公司名称": f"Company {i}", "地点": "Singapore",
+             "工作描述": f"Build models #{i}", "招聘平台": "LinkedIn"} for i in range(count)]
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    from benchmarks.conftest import TEST_JOBSPY_DIR
+
+    monkeypatch.syspath_prepend(TEST_JOBSPY_DIR)
+    import supabase_storage
+    from supabase_local import LocalSupabaseClient
+
+    client = LocalSupabaseClient(max_rows=MAX_ROWS)
+    monkeypatch.setattr(supabase_storage, "supabase", client)
+    yield supabase_storage
+    client.close()
+
+
+def test_upsert_unchanged(benchmark, rounds, storage):
+    jobs = _jobs(ROWS)
+    assert storage.upsert_jobs(jobs, country_code="sg") == (ROWS, 0, 0, 0)
+
+    stats = benchmark.pedantic(storage.upsert_jobs, args=(jobs,), kwargs={"country_code": "sg"},
+                               rounds=rounds, iterations=1)
+    benchmark.extra_info["rows"] = ROWS
+    assert stats == (0, 0, ROWS, 0)
+
+
+def test_counts_past_the_max_rows_cap(storage):
+    """Every existing (title, company) key is found although one title matches more rows than a response holds"""
+    jobs = _jobs(ROWS) + _jobs(3, title="Data Scientist")
+    assert storage.upsert_jobs(jobs, country_code="sg") == (ROWS + 3, 0, 0, 0)
+    before = {row["company_name"]: row["updated_at"] for row in storage.supabase.table("jobs_sg").select(
+        "job_title, company_name, updated_at").eq("job_title", "AI Engineer").limit(ROWS).execute().data}
+    assert len(before) == MAX_ROWS  # the stand-in caps selects like PostgREST
+
+    jobs[ROWS - 1]["工作描述"] = "Changed"
+    jobs.append({"职位名称": "AI Engineer", "公司名称": "New Co"})
+    assert storage.upsert_jobs(jobs, country_code="sg") == (1, 1, ROWS + 2, 0)
+    after = storage.supabase.table("jobs_sg").select("company_name, updated_at").eq(
+        "job_title", "AI Engineer").execute().data
+    assert all(before[row["company_name"]] == row["updated_at"] for row in after if row["company_name"] in before)
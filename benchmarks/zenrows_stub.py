@@ -0,0 +1,168 @@
+"""
+Local stand-in for the ZenRows API (the ZENROWS_BASE_URL contract).
+
+    GET /?url=<target>&apikey=<key>[&js_render=...]  ->  200 text/html
+
+Pages come from recorded fixtures (exact URL first, then another recording of
+the same kind) and fall back to synthetic_pages. Latency and error rates are
+configurable so retry/backoff paths can be exercised:
+
+    with ZenRowsStub(latency=0.05, error_rate=0.02) as stub:
+        os.environ["ZENROWS_BASE_URL"] = stub.base_url
+
+Standalone:
+
+    python -m benchmarks.zenrows_stub --port 8099 --latency 0.2 --error-rate 0.05
+    ZENROWS_BASE_URL=http://127.0.0.1:8099/ ZENROWS_API_KEY=offline python main_merged.py
+"""
+import time
+import random
+import argparse
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from .fixtures import FixtureStore, classify_url
+from .synthetic_pages import PAGE_BUILDERS
+
+# Status codes used for injected failures (rate limit / upstream failure)
+ERROR_STATUSES = (429, 500, 422)
+
+
+class ZenRowsStub:
+    """Threaded HTTP server answering like ZenRows from fixtures or synthetic pages."""
+
+    def __init__(self, store=None, latency=0.0, jitter=0.0, error_rate=0.0, seed=0, host="127.0.0.1", port=0):
+        """
+        Args:
+            store: FixtureStore with recorded pages (None = synthetic pages only)
+            latency: Seconds added to every response
+            jitter: Extra uniform random latency in [0, jitter]
+            error_rate: Fraction of requests answered with 429/500/422
+            seed: Seed for the latency/error random source
+            host, port: Bind address (port 0 picks a free port)
+        """
+        self.store = store
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.requests = Counter()   # by kind, plus "error" and "recorded"
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    # ---- lifecycle ----
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ---- responses ----
+    def _draw(self):
+        """(delay, error_status or None) for one request"""
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            failed = self.error_rate and self._random.random() < self.error_rate
+            status = self._random.choice(ERROR_STATUSES) if failed else None
+        return delay, status
+
+    def render(self, url):
+        """(status, body) for a target URL"""
+        kind = classify_url(url)
+        if kind is None:
+            return 422, '{"code": "RESP001", "detail": "Could not get content"}'
+        if self.store is not None:
+            html = self.store.get(url)
+            if html is None:
+                html = self.store.pick(kind, url)
+            if html is not None:
+                self._count("recorded")
+                return 200, html
+        return 200, PAGE_BUILDERS[kind](url)
+
+    def _count(self, key):
+        with self._lock:
+            self.requests[key] += 1
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                params = parse_qs(urlparse(self.path).query)
+                target = params.get("url", [""])[0]
+                if not params.get("apikey", [""])[0]:
+                    return self._reply(401, '{"code": "AUTH001", "detail": "API key missing"}')
+                if not target:
+                    return self._reply(400, '{"code": "REQS001", "detail": "url is required"}')
+
+                delay, error_status = stub._draw()
+                if delay:
+                    time.sleep(delay)
+                if error_status:
+                    stub._count("error")
+                    return self._reply(error_status, '{"code": "STUB", "detail": "injected failure"}')
+
+                stub._count(classify_url(target) or "unknown")
+                status, body = stub.render(target)
+                self._reply(status, body)
+
+            def _reply(self, status, body):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8" if status == 200 else "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local ZenRows stand-in for offline runs and benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency in [0, jitter]")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument("--fixtures", default=None, help="Recorded fixture directory (default: synthetic pages only)")
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixtures) if args.fixtures else None
+    stub = ZenRowsStub(store, args.latency, args.jitter, args.error_rate, host=args.host, port=args.port).start()
+    print(f"ZenRows stand-in listening on {stub.base_url} "
+          f"(latency {args.latency}s, error rate {args.error_rate:.0%}, "
+          f"{len(store) if store else 0} recorded pages)")
+    print(f"  export ZENROWS_BASE_URL={stub.base_url} ZENROWS_API_KEY=offline")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
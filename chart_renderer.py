@@ -0,0 +1,164 @@
+"""
+Report charts as cached, parallel chart jobs.
+
+    from chart_renderer import ChartJob, render_charts
+
+    jobs = [ChartJob("companies.png", render_companies, {"counts": top_companies, "total": len(df)}, spec)]
+    paths = render_charts(jobs, output_dir)
+
+A ChartJob is a module-level function render(data, spec, path) applied to a
+small aggregate table (data) and a chart spec (dpi, font, "rc" params applied
+around the call). Its fingerprint hashes the data, the spec, the render
+function's code and the source of its module, so editing a helper or a palette
+in that module redraws its charts. Helpers imported from other modules are not
+covered; bump a "version" entry in the spec when changing those.
+render_charts keeps the fingerprints in chart_cache.json next to the images
+and renders only the jobs whose image is missing or whose fingerprint changed,
+on a process pool with the Agg backend when there are several of them.
+Re-running a report after a text change reuses every image.
+"""
+import os
+import sys
+import json
+import hashlib
+import inspect
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from metrics import get_metrics
+
+CACHE_FILE = "chart_cache.json"
+
+
+def _canonical(value):
+    """JSON-able form of an aggregate table (keeps order; pandas/NumPy values as plain lists)"""
+    if isinstance(value, dict):
+        return [[_canonical(k), _canonical(v)] for k, v in value.items()]
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, float):
+        return repr(value) if math.isnan(value) or math.isinf(value) else value
+    if value is None or isinstance(value, (str, int, bool)):
+        return value
+    if hasattr(value, "index") and hasattr(value, "tolist"):  # pandas Series
+        return {"index": [_canonical(i) for i in value.index.tolist()],
+                "values": _canonical(value.tolist()), "name": _canonical(value.name)}
+    if hasattr(value, "tolist"):  # NumPy array or scalar
+        return _canonical(value.tolist())
+    return repr(value)
+
+
+def _hash_code(code, digest):
+    """Feed a function's bytecode, names and constants (nested functions included) to digest"""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _hash_code(const, digest)
+        elif isinstance(const, frozenset):
+            digest.update(repr(sorted(const, key=repr)).encode("utf-8"))
+        else:
+            digest.update(repr(const).encode("utf-8"))
+
+
+_module_hashes = {}
+
+
+def _module_hash(module_name):
+    """sha256 of a module's source ('' if it has none), read once per process"""
+    if module_name not in _module_hashes:
+        try:
+            source = inspect.getsource(sys.modules[module_name])
+        except (KeyError, TypeError, OSError):
+            source = ""
+        _module_hashes[module_name] = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    return _module_hashes[module_name]
+
+
+@dataclass
+class ChartJob:
+    """One image: render(data, spec, path) draws data and saves it to path"""
+    filename: str
+    render: Callable[[Any, Dict[str, Any], str], None]
+    data: Any
+    spec: Dict[str, Any] = field(default_factory=dict)
+
+    def fingerprint(self) -> str:
+        """Hash of the render function (and its module's source), the data and the spec"""
+        digest = hashlib.sha256(self.render.__qualname__.encode("utf-8"))
+        _hash_code(self.render.__code__, digest)
+        digest.update(_module_hash(self.render.__module__).encode("utf-8"))
+        payload = json.dumps([_canonical(self.data), _canonical(self.spec)], ensure_ascii=False)
+        digest.update(payload.encode("utf-8"))
+        return digest.hexdigest()
+
+
+def _render_job(job, path):
+    import matplotlib.pyplot as plt
+
+    with plt.rc_context(job.spec.get("rc")):
+        job.render(job.data, job.spec, path)
+    plt.close("all")
+    return path
+
+
+def _init_worker():
+    """Pool workers draw off-screen"""
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def load_chart_cache(output_dir):
+    """filename -> fingerprint of the images already in output_dir"""
+    try:
+        with open(os.path.join(output_dir, CACHE_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def render_charts(jobs: List[ChartJob], output_dir: str, workers: Optional[int] = None,
+                  force: bool = False) -> List[str]:
+    """
+    Render the chart jobs whose image is missing or out of date.
+
+    Args:
+        jobs: Chart jobs (filenames unique within output_dir)
+        output_dir: Image directory (also holds chart_cache.json)
+        workers: Worker processes (None = os.cpu_count(), 1 = in this process)
+        force: Render every job, even if its image is up to date
+
+    Returns:
+        Image paths in job order
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    cache = load_chart_cache(output_dir)
+    metrics = get_metrics()
+
+    fingerprints = {job.filename: job.fingerprint() for job in jobs}
+    paths = [os.path.join(output_dir, job.filename) for job in jobs]
+    pending = []
+    for job, path in zip(jobs, paths):
+        fresh = not force and os.path.exists(path) and cache.get(job.filename) == fingerprints[job.filename]
+        metrics.cache("chart_cache", hit=fresh)
+        if not fresh:
+            pending.append((job, path))
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    with metrics.timer("charts.render"):
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                list(pool.map(_render_job, *zip(*pending)))
+        else:
+            for job, path in pending:
+                _render_job(job, path)
+    metrics.inc("charts.rendered", len(pending))
+    print(f"[Charts] {len(pending)} rendered, {len(jobs) - len(pending)} unchanged ({output_dir})")
+
+    if pending:
+        cache.update((job.filename, fingerprints[job.filename]) for job, _ in pending)
+        with open(os.path.join(output_dir, CACHE_FILE), "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    return paths
@@ -3,11 +3,16 @@
 Checkpoint管理器
 支持程序中断后从断点恢复
 支持国家特定的checkpoint路径
+
+所有函数都接受可选的 ctx（run_context.RunContext），传入时使用该运行自己的路径，
+多个国家可以在同一进程或并行进程中互不干扰地运行；不传时使用 set_country_paths
+设置的路径或默认路径。
 """
 import json
 import os
 from datetime import datetime
 from config import OUTPUT_DIR, CACHE_FILE
+from metrics import timed
 
 # Default paths (can be overridden for country-specific paths)
 _checkpoint_file = None
@@ -31,20 +36,28 @@ def reset_paths():
     _stage1_unique_data = None
     _stage2_detail_data = None
 
-def get_checkpoint_file():
+def get_checkpoint_file(ctx=None):
     """获取checkpoint文件路径"""
+    if ctx is not None:
+        return ctx.checkpoint_file
     return _checkpoint_file if _checkpoint_file else f"{OUTPUT_DIR}/checkpoint.json"
 
-def get_stage1_raw_file():
+def get_stage1_raw_file(ctx=None):
     """获取阶段1原始数据文件路径"""
+    if ctx is not None:
+        return ctx.stage1_raw_file
     return _stage1_raw_data if _stage1_raw_data else f"{OUTPUT_DIR}/stage1_raw_data.json"
 
-def get_stage1_unique_file():
+def get_stage1_unique_file(ctx=None):
     """获取阶段1去重数据文件路径"""
+    if ctx is not None:
+        return ctx.stage1_unique_file
     return _stage1_unique_data if _stage1_unique_data else f"{OUTPUT_DIR}/stage1_unique_data.json"
 
-def get_stage2_detail_file():
+def get_stage2_detail_file(ctx=None):
     """获取阶段2详情数据文件路径"""
+    if ctx is not None:
+        return ctx.stage2_detail_file
     return _stage2_detail_data if _stage2_detail_data else f"{OUTPUT_DIR}/stage2_detail_data.json"
 
 # For backward compatibility
@@ -54,10 +67,10 @@ STAGE1_UNIQUE_DATA = f"{OUTPUT_DIR}/stage1_unique_data.json"
 STAGE2_DETAIL_DATA = f"{OUTPUT_DIR}/stage2_detail_data.json"
 
 
-def load_checkpoint():
+def load_checkpoint(ctx=None):
     """加载checkpoint"""
     try:
-        checkpoint_file = get_checkpoint_file()
+        checkpoint_file = get_checkpoint_file(ctx)
         if os.path.exists(checkpoint_file):
             with open(checkpoint_file, "r", encoding="utf-8") as f:
                 return json.load(f)
@@ -66,23 +79,24 @@ def load_checkpoint():
     return None
 
 
-def save_checkpoint(stage, **kwargs):
+@timed("checkpoint.save")
+def save_checkpoint(stage, ctx=None, **kwargs):
     """保存checkpoint"""
     checkpoint = {
         "stage": stage,
         "last_update": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         **kwargs
     }
-    checkpoint_file = get_checkpoint_file()
+    checkpoint_file = get_checkpoint_file(ctx)
     os.makedirs(os.path.dirname(checkpoint_file), exist_ok=True)
     with open(checkpoint_file, "w", encoding="utf-8") as f:
         json.dump(checkpoint, f, indent=2, ensure_ascii=False)
 
 
-def load_stage1_raw_data():
+def load_stage1_raw_data(ctx=None):
     """加载阶段1的原始数据"""
     try:
-        stage1_file = get_stage1_raw_file()
+        stage1_file = get_stage1_raw_file(ctx)
         if os.path.exists(stage1_file):
             with open(stage1_file, "r", encoding="utf-8") as f:
                 return json.load(f)
@@ -91,18 +105,19 @@ def load_stage1_raw_data():
     return []
 
 
-def save_stage1_raw_data(data):
+@timed("checkpoint.stage1_raw_save")
+def save_stage1_raw_data(data, ctx=None):
     """保存阶段1的原始数据"""
-    stage1_file = get_stage1_raw_file()
+    stage1_file = get_stage1_raw_file(ctx)
     os.makedirs(os.path.dirname(stage1_file), exist_ok=True)
     with open(stage1_file, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
-def load_stage1_unique_data():
+def load_stage1_unique_data(ctx=None):
     """加载阶段1去重后的数据"""
     try:
-        stage1_unique_file = get_stage1_unique_file()
+        stage1_unique_file = get_stage1_unique_file(ctx)
         if os.path.exists(stage1_unique_file):
             with open(stage1_unique_file, "r", encoding="utf-8") as f:
                 return json.load(f)
@@ -111,18 +126,20 @@ def load_stage1_unique_data():
     return None
 
 
-def save_stage1_unique_data(data):
+@timed("checkpoint.stage1_unique_save")
+def save_stage1_unique_data(data, ctx=None):
     """保存阶段1去重后的数据"""
-    stage1_unique_file = get_stage1_unique_file()
+    stage1_unique_file = get_stage1_unique_file(ctx)
     os.makedirs(os.path.dirname(stage1_unique_file), exist_ok=True)
     with open(stage1_unique_file, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
-def load_stage2_detail_data():
+@timed("checkpoint.stage2_detail_load")
+def load_stage2_detail_data(ctx=None):
     """加载阶段2的详情数据"""
     try:
-        stage2_file = get_stage2_detail_file()
+        stage2_file = get_stage2_detail_file(ctx)
         if os.path.exists(stage2_file):
             with open(stage2_file, "r", encoding="utf-8") as f:
                 return json.load(f)
@@ -131,23 +148,24 @@ def load_stage2_detail_data():
     return {"jobs": [], "processed_urls": []}
 
 
-def save_stage2_detail_data(data):
+@timed("checkpoint.stage2_detail_save")
+def save_stage2_detail_data(data, ctx=None):
     """保存阶段2的详情数据"""
-    stage2_file = get_stage2_detail_file()
+    stage2_file = get_stage2_detail_file(ctx)
     os.makedirs(os.path.dirname(stage2_file), exist_ok=True)
     with open(stage2_file, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
-def get_processed_urls():
+def get_processed_urls(ctx=None):
     """获取已处理的职位链接列表"""
-    detail_data = load_stage2_detail_data()
+    detail_data = load_stage2_detail_data(ctx)
     return set(detail_data.get("processed_urls", []))
 
 
-def add_processed_job(job):
+def add_processed_job(job, ctx=None):
     """添加已处理的职位到详情数据"""
-    detail_data = load_stage2_detail_data()
+    detail_data = load_stage2_detail_data(ctx)
     if "jobs" not in detail_data:
         detail_data["jobs"] = []
     if "processed_urls" not in detail_data:
@@ -157,4 +175,4 @@ def add_processed_job(job):
     if job_url and job_url not in detail_data["processed_urls"]:
         detail_data["jobs"].append(job)
         detail_data["processed_urls"].append(job_url)
-        save_stage2_detail_data(detail_data)
+        save_stage2_detail_data(detail_data, ctx)
@@ -7,12 +7,6 @@ import os
 import sys
 from config import OUTPUT_DIR
 
-if sys.stdout.encoding != 'utf-8':
-    try:
-        sys.stdout.reconfigure(encoding='utf-8')
-    except:
-        pass
-
 CHECKPOINT_FILE = f"{OUTPUT_DIR}/checkpoint.json"
 STAGE1_RAW_DATA = f"{OUTPUT_DIR}/stage1_raw_data.json"
 STAGE1_UNIQUE_DATA = f"{OUTPUT_DIR}/stage1_unique_data.json"
@@ -47,6 +41,12 @@ def clear_checkpoint():
     # 注意：company_cache.json 不会被删除，保留公司规模缓存
 
 if __name__ == "__main__":
+    if sys.stdout.encoding != 'utf-8':
+        try:
+            sys.stdout.reconfigure(encoding='utf-8')
+        except:
+            pass
+    
     try:
         response = input("Clear all checkpoints and data? (yes/no): ")
     except:
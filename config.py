@@ -1,9 +1,21 @@
 # Global configuration
+# Importing this module has no side effects: .env is loaded and the location
+# tables are imported on first access of a setting that needs them.
 import os
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+_env_loaded = False
+
+
+def load_env():
+    """Load environment variables from the .env file (once, if python-dotenv is installed)"""
+    global _env_loaded
+    if not _env_loaded:
+        _env_loaded = True
+        try:
+            from dotenv import load_dotenv
+        except ImportError:
+            return
+        load_dotenv()
 
 # Test run ID (output folder name)
 RUN_ID = "BunchTest018"
@@ -16,9 +28,6 @@ TARGET_SITE = "linkedin"
 KEYWORDS = ["AI Engineer", "Machine Learning", "Deep Learning", "NLP", "Data Scientist"]
 USE_MERGED_KEYWORDS = True  # If True, search all keywords together with OR logic; If False, search each keyword separately
 
-
-from locations_config import LOCATIONS, LOCATIONS_BY_STATE
-
 LOCATION = "United States"  # Reserved for backward compatibility
 
 # Scraping parameters
@@ -30,6 +39,7 @@ REQUEST_DELAY = 0.3
 # Lazy check: only validate when actually needed (not during import)
 def get_zenrows_api_key():
     """Get ZenRows API key, raise error if not found"""
+    load_env()
     api_key = os.getenv("ZENROWS_API_KEY")
     if not api_key:
         raise ValueError(
@@ -40,14 +50,23 @@ def get_zenrows_api_key():
         )
     return api_key
 
-# For backward compatibility, try to get API key but don't raise error during import
-# This allows other scripts to import config.py without requiring API key
-ZENROWS_API_KEY = os.getenv("ZENROWS_API_KEY")  # May be None, will be checked when used
-ZENROWS_BASE_URL = "https://api.zenrows.com/v1/"
+# Settings read from the environment (.env) on first access, see __getattr__ below:
+#   ZENROWS_API_KEY   may be None, checked by get_zenrows_api_key() when used
+#   ZENROWS_BASE_URL  override to point the scrapers at a local stand-in (see benchmarks/zenrows_stub.py)
+#   SUPABASE_URL / SUPABASE_KEY  optional, for database storage
+_ENV_SETTINGS = {
+    "ZENROWS_API_KEY": None,
+    "ZENROWS_BASE_URL": "https://api.zenrows.com/v1/",
+    "SUPABASE_URL": "",
+    "SUPABASE_KEY": "",
+}
+# Shared ZenRows budget for every fetcher in the process (see rate_limiter.py)
+ZENROWS_REQUESTS_PER_MINUTE = 60
 
-# Supabase configuration (optional, for database storage)
-SUPABASE_URL = os.getenv("SUPABASE_URL", "")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY", "")
+# main_multi_country: scrape each country in its own process. All processes share
+# the ZENROWS_REQUESTS_PER_MINUTE budget; COUNTRY_WORKERS = None means one process per country
+PARALLEL_COUNTRIES = False
+COUNTRY_WORKERS = None
 
 # Output paths
 OUTPUT_DIR = f"outputs/{RUN_ID}"
@@ -56,6 +75,10 @@ DETAIL_REPORT = f"{OUTPUT_DIR}/report_stage2_detail.xlsx"
 ERROR_LOG = f"{OUTPUT_DIR}/error_log.txt"
 CACHE_FILE = f"{OUTPUT_DIR}/company_cache.json"
 
+# Also write a Parquet file next to the final Excel report (requires pyarrow).
+# The Parquet file is the canonical output; the Excel file is generated from it.
+EXPORT_PARQUET = False
+
 # Country-specific output paths
 def get_country_output_paths(country_code: str):
     """Return output paths based on country code"""
@@ -78,3 +101,17 @@ FIELDS = [
     "Posted Date", "Job Status",
     "Platform", "Job Link"
 ]
+
+
+def __getattr__(name):
+    """Resolve environment settings and location tables lazily (and cache them)"""
+    if name in _ENV_SETTINGS:
+        load_env()
+        value = os.getenv(name, _ENV_SETTINGS[name])
+    elif name in ("LOCATIONS", "LOCATIONS_BY_STATE"):
+        import locations_config
+        value = getattr(locations_config, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
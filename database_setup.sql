@@ -125,6 +125,14 @@ CREATE TABLE IF NOT EXISTS jobs_hk (
 CREATE INDEX IF NOT EXISTS idx_jobs_hk_platform ON jobs_hk(platform);
 CREATE INDEX IF NOT EXISTS idx_jobs_hk_location ON jobs_hk(location);
 
+-- 3. 内容哈希列（upsert_jobs 用它跳过未变化的行）
+-- 已有的表执行以下语句添加该列
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE jobs_uk ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE jobs_ca ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE jobs_sg ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE jobs_hk ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
 -- 注意：如果启用了RLS (Row Level Security)，需要为每个表设置策略
 -- 例如：
 -- ALTER TABLE jobs_uk ENABLE ROW LEVEL SECURITY;
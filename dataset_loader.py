@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""
+Shared dataset loader for the analysis/report scripts.
+
+Reading large .xlsx reports through openpyxl is slow, so each workbook gets a
+typed Parquet sidecar next to it (report.xlsx -> report.parquet). The loader
+uses the sidecar when it is newer than the workbook and rebuilds it otherwise.
+
+Sidecars store normalised snake_case column names; the original column names
+are kept in the Parquet metadata so callers get the same columns as read_excel.
+
+Usage:
+    python dataset_loader.py report.xlsx [more.xlsx ...]   # convert up front
+"""
+import os
+import re
+import json
+import argparse
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Excel column name -> standard column name (same names the report scripts use)
+COLUMN_MAPPING = {
+    "Job Title": "job_title",
+    "Company Name": "company_name",
+    "Requirements": "requirements",
+    "Location": "location",
+    "Salary Range": "salary_range",
+    "Estimated Annual Salary": "estimated_annual_salary",
+    "Estimated Annual Salary (USD)": "estimated_annual_salary_usd",
+    "Job Description": "job_description",
+    "Team Size/Business Line Size": "team_size",
+    "Company Size": "company_size",
+    "Posted Date": "posted_date",
+    "Job Status": "job_status",
+    "Platform": "platform",
+    "Job Link": "job_link",
+}
+
+# Parquet metadata keys
+_META_COLUMNS = b"jobscrapper.columns"
+_META_MIXED = b"jobscrapper.mixed_columns"
+
+
+def normalize_column_name(name):
+    """Map an Excel column name to a snake_case column name"""
+    name = str(name)
+    if name in COLUMN_MAPPING:
+        return COLUMN_MAPPING[name]
+    normalized = re.sub(r'[^0-9a-zA-Z]+', '_', name).strip('_').lower()
+    return normalized or "column"
+
+
+def sidecar_columns(original_columns):
+    """
+    Normalised (unique) column names plus the Parquet metadata that maps them
+    back to the original names.
+
+    Returns:
+        (list of normalised names, metadata dict)
+    """
+    normalized = []
+    seen = {}
+    for column in original_columns:
+        name = normalize_column_name(column)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}_{seen[name]}"
+        else:
+            seen[name] = 0
+        normalized.append(name)
+    column_map = dict(zip(normalized, [str(c) for c in original_columns]))
+    metadata = {_META_COLUMNS: json.dumps(column_map, ensure_ascii=False).encode("utf-8")}
+    return normalized, metadata
+
+
+def original_column_names(schema):
+    """Map normalised column names -> original names from a sidecar's Arrow schema"""
+    metadata = schema.metadata or {}
+    return json.loads(metadata.get(_META_COLUMNS, b"{}").decode("utf-8"))
+
+
+def sidecar_path(xlsx_path, sheet_name=None):
+    """Parquet sidecar path for a workbook (or for one sheet of it)"""
+    stem = os.path.splitext(str(xlsx_path))[0]
+    if sheet_name is None:
+        return f"{stem}.parquet"
+    safe_sheet = re.sub(r'[^0-9a-zA-Z_-]+', '_', str(sheet_name))
+    return f"{stem}.{safe_sheet}.parquet"
+
+
+def _sheets_manifest_path(xlsx_path):
+    return os.path.splitext(str(xlsx_path))[0] + ".sheets.json"
+
+
+def is_sidecar_fresh(xlsx_path, parquet_path):
+    """True if the sidecar exists and is at least as new as the workbook"""
+    if not os.path.exists(parquet_path):
+        return False
+    if not os.path.exists(xlsx_path):
+        return True
+    return os.path.getmtime(parquet_path) >= os.path.getmtime(xlsx_path)
+
+
+def _encode_cell(value):
+    """JSON text of one cell of a mixed-type column (datetimes tagged so they read back as datetimes)"""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, datetime):
+        return json.dumps({"datetime": value.isoformat()})
+    if not isinstance(value, (bool, int, float, str)):
+        value = str(value)
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _decode_cell(text):
+    value = json.loads(text)
+    if isinstance(value, dict):
+        return datetime.fromisoformat(value["datetime"])
+    return value
+
+
+def _typed_frame(df):
+    """
+    Give every column a Parquet-friendly type.
+
+    Returns the typed frame, each column's Arrow type (None = inferred) and
+    the positions of the JSON-encoded columns.
+    Numeric and datetime columns are kept as they are; object columns holding
+    only strings or only booleans are stored as such, with missing values as
+    nulls. Any other object column (e.g. partly numeric cells, which read_excel
+    returns as a mix of numbers and text) is stored as JSON text per cell, so
+    read_sidecar gives back the same values.
+    """
+    typed = {}
+    arrow_types = []
+    mixed = []
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series):
+            typed[column] = series
+            arrow_types.append(None)
+            continue
+        values = series.astype(object)
+        present = values.notna()
+        cell_types = set(map(type, values[present]))
+        if cell_types <= {str}:
+            arrow_types.append(pa.string())
+        elif cell_types <= {bool, np.bool_}:
+            arrow_types.append(pa.bool_())
+        else:
+            values = values.where(~present, values[present].map(_encode_cell))
+            arrow_types.append(pa.string())
+            mixed.append(len(arrow_types) - 1)
+        typed[column] = values.where(present, None)
+    return pd.DataFrame(typed, index=df.index), arrow_types, mixed
+
+
+def write_sidecar(df, parquet_path):
+    """Write DataFrame to a typed Parquet sidecar with normalised column names"""
+    if not HAS_PYARROW:
+        return None
+
+    original_columns = [str(c) for c in df.columns]
+    normalized, column_metadata = sidecar_columns(original_columns)
+
+    df_typed, arrow_types, mixed = _typed_frame(df)
+    df_typed.columns = normalized
+    inferred = pa.Schema.from_pandas(df_typed, preserve_index=False)
+    schema = pa.schema([
+        field if arrow_type is None else pa.field(field.name, arrow_type)
+        for field, arrow_type in zip(inferred, arrow_types)
+    ])
+    mixed_columns = [normalized[i] for i in mixed]
+
+    table = pa.Table.from_pandas(df_typed, schema=schema, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata.update(column_metadata)
+    if mixed_columns:
+        metadata[_META_MIXED] = json.dumps(mixed_columns, ensure_ascii=False).encode("utf-8")
+    table = table.replace_schema_metadata(metadata)
+
+    os.makedirs(os.path.dirname(os.path.abspath(parquet_path)), exist_ok=True)
+    tmp_path = f"{parquet_path}.tmp"
+    pq.write_table(table, tmp_path, compression="zstd")
+    os.replace(tmp_path, parquet_path)
+    return parquet_path
+
+
+def read_sidecar(parquet_path, columns=None, normalize_columns=False):
+    """
+    Read a Parquet sidecar.
+
+    Args:
+        parquet_path: Sidecar path
+        columns: Optional list of columns to read (original or normalised names)
+        normalize_columns: If True return snake_case names, otherwise the original names
+    """
+    parquet_file = pq.ParquetFile(parquet_path)
+    name_map = original_column_names(parquet_file.schema_arrow)
+
+    read_columns = None
+    if columns is not None:
+        reverse_map = {original: name for name, original in name_map.items()}
+        read_columns = [reverse_map.get(c, c) for c in columns]
+
+    df = parquet_file.read(columns=read_columns).to_pandas()
+
+    # Mixed-type columns hold JSON text per cell (see _typed_frame)
+    mixed_columns = json.loads((parquet_file.schema_arrow.metadata or {}).get(_META_MIXED, b"[]").decode("utf-8"))
+    for column in mixed_columns:
+        if column in df.columns:
+            df[column] = df[column].map(_decode_cell, na_action="ignore")
+
+    # Keep missing text values as NaN, like read_excel does
+    for column in df.columns:
+        if df[column].dtype == object:
+            df[column] = df[column].where(df[column].notna(), np.nan)
+
+    if not normalize_columns and name_map:
+        df = df.rename(columns=name_map)
+    return df
+
+
+def convert_excel_to_parquet(xlsx_path, sheet_name=0):
+    """Convert one sheet of a workbook to its Parquet sidecar, returns the sidecar path"""
+    if not HAS_PYARROW:
+        raise ImportError("pyarrow not available. Install with: pip install pyarrow")
+    df = pd.read_excel(xlsx_path, sheet_name=sheet_name)
+    parquet_path = sidecar_path(xlsx_path, None if sheet_name == 0 else sheet_name)
+    return write_sidecar(df, parquet_path)
+
+
+def load_dataset(xlsx_path, sheet_name=0, columns=None, normalize_columns=False, refresh=False):
+    """
+    Load a report workbook, preferring its Parquet sidecar.
+
+    Args:
+        xlsx_path: Path to the .xlsx file
+        sheet_name: Sheet to load (default: first sheet)
+        columns: Optional list of columns to load
+        normalize_columns: If True return snake_case column names
+        refresh: If True ignore the sidecar and re-read the workbook
+
+    Returns:
+        DataFrame
+    """
+    parquet_path = sidecar_path(xlsx_path, None if sheet_name == 0 else sheet_name)
+
+    if HAS_PYARROW and not refresh and is_sidecar_fresh(xlsx_path, parquet_path):
+        try:
+            return read_sidecar(parquet_path, columns=columns, normalize_columns=normalize_columns)
+        except Exception as e:
+            print(f"[WARNING] Could not read {parquet_path}, falling back to Excel: {str(e)[:100]}")
+
+    df = pd.read_excel(xlsx_path, sheet_name=sheet_name)
+
+    if HAS_PYARROW:
+        try:
+            write_sidecar(df, parquet_path)
+        except Exception as e:
+            print(f"[WARNING] Could not write Parquet sidecar {parquet_path}: {str(e)[:100]}")
+
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
+    if normalize_columns:
+        df = df.rename(columns={c: normalize_column_name(c) for c in df.columns})
+    return df
+
+
+def load_excel_sheets(xlsx_path, normalize_columns=False, refresh=False):
+    """
+    Load every sheet of a workbook, preferring Parquet sidecars.
+
+    Returns:
+        (dict sheet_name -> DataFrame, list of sheet names)
+    """
+    manifest_path = _sheets_manifest_path(xlsx_path)
+
+    if HAS_PYARROW and not refresh and is_sidecar_fresh(xlsx_path, manifest_path):
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                sheet_names = json.load(f)["sheets"]
+            dataframes = {}
+            for sheet_name in sheet_names:
+                dataframes[sheet_name] = read_sidecar(
+                    sidecar_path(xlsx_path, sheet_name), normalize_columns=normalize_columns
+                )
+            return dataframes, sheet_names
+        except Exception as e:
+            print(f"[WARNING] Could not read sheet sidecars for {xlsx_path}: {str(e)[:100]}")
+
+    # Parse the workbook once for all sheets
+    dataframes = pd.read_excel(xlsx_path, sheet_name=None)
+    sheet_names = list(dataframes.keys())
+
+    if HAS_PYARROW:
+        try:
+            for sheet_name, df in dataframes.items():
+                write_sidecar(df, sidecar_path(xlsx_path, sheet_name))
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                json.dump({"sheets": sheet_names}, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"[WARNING] Could not write sheet sidecars for {xlsx_path}: {str(e)[:100]}")
+
+    if normalize_columns:
+        dataframes = {
+            name: df.rename(columns={c: normalize_column_name(c) for c in df.columns})
+            for name, df in dataframes.items()
+        }
+    return dataframes, sheet_names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert report workbooks to Parquet sidecars")
+    parser.add_argument("files", nargs="+", help="Excel files to convert")
+    parser.add_argument("--all-sheets", action="store_true", help="Convert every sheet, not only the first")
+    args = parser.parse_args()
+
+    if not HAS_PYARROW:
+        print("[ERROR] pyarrow not available. Install with: pip install pyarrow")
+        return
+
+    for xlsx_path in args.files:
+        if not os.path.exists(xlsx_path):
+            print(f"[SKIP] Not found: {xlsx_path}")
+            continue
+        if args.all_sheets:
+            dataframes, sheet_names = load_excel_sheets(xlsx_path, refresh=True)
+            print(f"[OK] {xlsx_path}: {len(sheet_names)} sheets converted")
+        else:
+            parquet_path = convert_excel_to_parquet(xlsx_path)
+            print(f"[OK] {xlsx_path} -> {parquet_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,27 +14,16 @@ if sys.stdout.encoding != 'utf-8':
     except:
         pass
 
-# 在导入scraper之前，设置独立的缓存文件路径
+# 独立的输出目录和缓存文件（通过RunContext传给scraper和checkpoint函数）
 FINAL_OUTPUT_DIR = r"C:\Users\Dylan\JobScrapper\outputs\Final_Merged_Report"
 FINAL_CACHE_FILE = os.path.join(FINAL_OUTPUT_DIR, "company_cache.json")
 
-# 临时修改config模块的CACHE_FILE（在导入scraper之前）
-import config
-original_cache_file = config.CACHE_FILE
-config.CACHE_FILE = FINAL_CACHE_FILE
-
-# 现在导入scraper（它会使用修改后的CACHE_FILE）
 from scraper_linkedin_checkpoint import enrich_job_details_with_checkpoint
-import scraper_linkedin_checkpoint as scraper_module
-
-# 确保scraper模块也使用新的CACHE_FILE
-scraper_module.CACHE_FILE = FINAL_CACHE_FILE
-
 from checkpoint_manager import (
-    set_country_paths, reset_paths,
     save_checkpoint, load_checkpoint,
     load_stage2_detail_data, save_stage2_detail_data
 )
+from run_context import RunContext
 from exporter import export_to_excel
 from config import DETAIL_LIMIT, FIELDS
 
@@ -134,12 +123,12 @@ def main():
     print(f"\n【步骤4】补全职位详情（共 {len(incomplete_jobs)} 条）")
     print("-" * 60)
     
-    # 设置checkpoint路径
-    set_country_paths(FINAL_OUTPUT_DIR)
+    # checkpoint路径和公司规模缓存
+    ctx = RunContext(FINAL_OUTPUT_DIR, cache_file=FINAL_CACHE_FILE)
     
     # 清除旧的stage2_detail_data.json和checkpoint（避免使用之前的处理记录）
-    stage2_detail_file = os.path.join(FINAL_OUTPUT_DIR, "stage2_detail_data.json")
-    checkpoint_file = os.path.join(FINAL_OUTPUT_DIR, "checkpoint.json")
+    stage2_detail_file = ctx.stage2_detail_file
+    checkpoint_file = ctx.checkpoint_file
     
     if os.path.exists(stage2_detail_file):
         try:
@@ -158,6 +147,7 @@ def main():
     # 初始化新的checkpoint
     save_checkpoint(
         stage="stage2_detail",
+        ctx=ctx,
         processed_count=0,
         total_count=len(incomplete_jobs)
     )
@@ -172,7 +162,7 @@ def main():
     print(f"开始补全详情（共 {len(jobs_to_enrich)} 条，限制: {DETAIL_LIMIT}）")
     
     # 补全详情
-    enrich_job_details_with_checkpoint(jobs_to_enrich, start_index=start_index)
+    enrich_job_details_with_checkpoint(jobs_to_enrich, start_index=start_index, ctx=ctx)
     
     # 5. 更新原数据中的职位信息
     print("\n【步骤5】更新原数据中的职位信息")
@@ -229,11 +219,6 @@ def main():
     print(f"总职位数: {len(all_jobs)} 条")
     print(f"补全职位数: {updated_count} 条")
     
-    # 7. 重置路径和恢复CACHE_FILE
-    reset_paths()
-    config.CACHE_FILE = original_cache_file
-    scraper_module.CACHE_FILE = original_cache_file
-    
     print("\n" + "="*60)
     print("补全完成")
     print("="*60)
@@ -248,11 +233,4 @@ if __name__ == "__main__":
         print(f"程序出错: {str(e)}")
         import traceback
         print(traceback.format_exc())
-        # 确保重置路径和恢复CACHE_FILE
-        reset_paths()
-        try:
-            config.CACHE_FILE = original_cache_file
-            scraper_module.CACHE_FILE = original_cache_file
-        except:
-            pass
 
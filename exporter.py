@@ -1,12 +1,310 @@
 import os
+import math
 import pandas as pd
 from config import FIELDS
+from dataset_loader import sidecar_columns, original_column_names
+
+try:
+    import xlsxwriter
+    HAS_XLSXWRITER = True
+except ImportError:
+    HAS_XLSXWRITER = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Excel cell limit for string values
+EXCEL_MAX_CELL_LENGTH = 32767
+
+# Rows buffered before a Parquet row group is flushed
+PARQUET_CHUNK_SIZE = 2000
+
+_PARQUET_TYPES = {
+    "string": "string",
+    "int": "int64",
+    "float": "float64",
+}
+
+
+def _clean_cell(value):
+    """Convert a value to something Excel/Parquet can store (None for empty)"""
+    if value is None:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        # numpy scalar -> python scalar
+        try:
+            value = value.item()
+        except Exception:
+            pass
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    return str(value)
+
+
+class StreamingExcelWriter:
+    """
+    Append rows to an .xlsx file without holding the sheet in memory.
+    Uses xlsxwriter constant_memory mode, falls back to openpyxl write-only mode.
+    """
+
+    def __init__(self, path, columns):
+        self.path = path
+        self.columns = list(columns)
+        self.row_count = 0
+        dir_name = os.path.dirname(path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+
+        if HAS_XLSXWRITER:
+            self._workbook = xlsxwriter.Workbook(path, {
+                "constant_memory": True,
+                "strings_to_formulas": False,
+                "strings_to_urls": False,
+                "strings_to_numbers": False,
+            })
+            self._sheet = self._workbook.add_worksheet("Sheet1")
+            header_format = self._workbook.add_format({"bold": True})
+            for col_idx, column in enumerate(self.columns):
+                self._sheet.write_string(0, col_idx, str(column), header_format)
+        else:
+            from openpyxl import Workbook
+            self._workbook = Workbook(write_only=True)
+            self._sheet = self._workbook.create_sheet("Sheet1")
+            self._sheet.append(self.columns)
+
+    def write_row(self, row):
+        """Write one row (dict keyed by column, or sequence in column order)"""
+        if isinstance(row, dict):
+            values = [row.get(column, "") for column in self.columns]
+        else:
+            values = list(row)
+
+        cleaned = []
+        for value in values:
+            value = _clean_cell(value)
+            if isinstance(value, str) and len(value) > EXCEL_MAX_CELL_LENGTH:
+                value = value[:EXCEL_MAX_CELL_LENGTH]
+            cleaned.append(value)
+
+        if HAS_XLSXWRITER:
+            excel_row = self.row_count + 1
+            for col_idx, value in enumerate(cleaned):
+                if value is None or value == "":
+                    continue
+                if isinstance(value, str):
+                    self._sheet.write_string(excel_row, col_idx, value)
+                elif isinstance(value, bool):
+                    self._sheet.write_boolean(excel_row, col_idx, value)
+                else:
+                    self._sheet.write_number(excel_row, col_idx, value)
+        else:
+            self._sheet.append([None if value == "" else value for value in cleaned])
+
+        self.row_count += 1
+
+    def write_rows(self, rows):
+        """Write an iterable of rows"""
+        for row in rows:
+            self.write_row(row)
+
+    def close(self):
+        if self._workbook is None:
+            return
+        if HAS_XLSXWRITER:
+            self._workbook.close()
+        else:
+            self._workbook.save(self.path)
+        self._workbook = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class ParquetChunkWriter:
+    """
+    Append rows to a Parquet file in row groups of chunk_size rows.
+
+    dtypes maps column name -> "string" / "int" / "float" (default "string").
+    """
+
+    def __init__(self, path, columns, dtypes=None, chunk_size=PARQUET_CHUNK_SIZE):
+        if not HAS_PYARROW:
+            raise ImportError("pyarrow not available. Install with: pip install pyarrow")
+        self.path = path
+        self.columns = list(columns)
+        self.chunk_size = chunk_size
+        self.row_count = 0
+        dtypes = dtypes or {}
+        # Same layout as dataset_loader sidecars: normalised names, originals in metadata
+        normalized, metadata = sidecar_columns(self.columns)
+        self._field_names = dict(zip(self.columns, normalized))
+        self.schema = pa.schema([
+            (self._field_names[column], pa.type_for_alias(_PARQUET_TYPES[dtypes.get(column, "string")]))
+            for column in self.columns
+        ], metadata=metadata)
+        self._converters = {
+            column: dtypes.get(column, "string") for column in self.columns
+        }
+        self._buffer = []
+        dir_name = os.path.dirname(path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        self._writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+
+    def _convert(self, column, value):
+        value = _clean_cell(value)
+        if value is None or value == "":
+            return None
+        kind = self._converters[column]
+        try:
+            if kind == "int":
+                return int(float(value))
+            if kind == "float":
+                return float(value)
+        except (TypeError, ValueError):
+            return None
+        return str(value)
+
+    def write_row(self, row):
+        if not isinstance(row, dict):
+            row = dict(zip(self.columns, row))
+        self._buffer.append({
+            self._field_names[column]: self._convert(column, row.get(column)) for column in self.columns
+        })
+        self.row_count += 1
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.write_row(row)
+
+    def flush(self):
+        if not self._buffer:
+            return
+        table = pa.Table.from_pylist(self._buffer, schema=self.schema)
+        self._writer.write_table(table)
+        self._buffer = []
+
+    def close(self):
+        if self._writer is None:
+            return
+        self.flush()
+        self._writer.close()
+        self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def parquet_to_excel(parquet_path, xlsx_path, batch_size=PARQUET_CHUNK_SIZE):
+    """Generate an Excel file from a Parquet file, one record batch at a time"""
+    if not HAS_PYARROW:
+        raise ImportError("pyarrow not available. Install with: pip install pyarrow")
+    parquet_file = pq.ParquetFile(parquet_path)
+    names = parquet_file.schema_arrow.names
+    name_map = original_column_names(parquet_file.schema_arrow)
+    columns = [name_map.get(name, name) for name in names]
+    with StreamingExcelWriter(xlsx_path, columns) as writer:
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            for row in zip(*(column.to_pylist() for column in batch.columns)):
+                writer.write_row(row)
+    return xlsx_path
+
+
+class StreamingExporter:
+    """
+    Streaming export of job rows.
+
+    With parquet=True (and pyarrow installed) rows go to a Parquet file next to
+    the .xlsx, which is the canonical output; the Excel file is generated from
+    it on close(). Otherwise rows are streamed straight into the Excel file.
+    When the `with` body raises, the partial file is discarded and nothing is
+    converted, so a failed export never looks complete.
+    """
+
+    def __init__(self, xlsx_path, columns, parquet=False, dtypes=None, chunk_size=PARQUET_CHUNK_SIZE):
+        self.xlsx_path = xlsx_path
+        self.columns = list(columns)
+        self.parquet_path = None
+        if parquet and not HAS_PYARROW:
+            print("[WARNING] pyarrow not available, exporting Excel only. Install with: pip install pyarrow")
+            parquet = False
+        if parquet:
+            self.parquet_path = os.path.splitext(xlsx_path)[0] + ".parquet"
+            self._writer = ParquetChunkWriter(self.parquet_path, self.columns, dtypes=dtypes, chunk_size=chunk_size)
+        else:
+            self._writer = StreamingExcelWriter(xlsx_path, self.columns)
+
+    @property
+    def row_count(self):
+        return self._writer.row_count
+
+    def write_row(self, row):
+        self._writer.write_row(row)
+
+    def write_rows(self, rows):
+        self._writer.write_rows(rows)
+
+    def write_dataframe(self, df):
+        """Stream an existing DataFrame without building another copy"""
+        for row in df.itertuples(index=False, name=None):
+            self._writer.write_row(row)
+
+    def close(self):
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._writer = None
+        if self.parquet_path:
+            parquet_to_excel(self.parquet_path, self.xlsx_path)
+            # Keep the Parquet file newer than the workbook so loaders treat it as a fresh sidecar
+            os.utime(self.parquet_path, None)
+
+    def abort(self):
+        """Close the writer and remove the partial file (no Excel is generated)"""
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._writer = None
+        partial_path = self.parquet_path or self.xlsx_path
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+        return False
+
 
 def export_to_excel(job_list, path):
     if not job_list:
         print("No data to export")
         return
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    df = pd.DataFrame(job_list, columns=FIELDS)
-    df.to_excel(path, index=False)
+    with StreamingExcelWriter(path, FIELDS) as writer:
+        writer.write_rows(job_list)
     print(f"Exported: {os.path.abspath(path)}")
@@ -7,6 +7,7 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 import sys
+from dataset_loader import load_excel_sheets
 import re
 
 if sys.stdout.encoding != 'utf-8':
@@ -27,14 +28,11 @@ def analyze_excel_file(file_path):
     print(f"正在读取文件: {file_path}")
     
     try:
-        excel_file = pd.ExcelFile(file_path)
-        sheet_names = excel_file.sheet_names
+        all_dataframes, sheet_names = load_excel_sheets(file_path)
         print(f"发现 {len(sheet_names)} 个工作表: {', '.join(sheet_names)}")
         
-        all_dataframes = {}
         for sheet_name in sheet_names:
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
-            all_dataframes[sheet_name] = df
+            df = all_dataframes[sheet_name]
             print(f"工作表 '{sheet_name}': {len(df)} 行, {len(df.columns)} 列")
         
         return all_dataframes, sheet_names
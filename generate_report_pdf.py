@@ -24,6 +24,7 @@ if sys.stdout.encoding != 'utf-8':
 
 # 设置中文字体 - 查找并设置可用的中文字体
 import matplotlib.font_manager as fm
+from dataset_loader import load_dataset
 
 # 查找系统中可用的中文字体
 chinese_fonts = ['SimHei', 'Microsoft YaHei', 'SimSun', 'KaiTi', 'FangSong', 
@@ -479,7 +480,7 @@ def main():
     os.makedirs(output_dir, exist_ok=True)
     
     print("正在读取数据...")
-    df = pd.read_excel(file_path)
+    df = load_dataset(file_path)
     print(f"数据加载完成：{len(df)} 条记录")
     
     print("正在生成图表...")
@@ -9,8 +9,9 @@ from checkpoint_manager import (
     load_stage2_detail_data
 )
 from exporter import export_to_excel
-from config import KEYWORDS, LIST_REPORT, DETAIL_REPORT, TARGET_SITE, DETAIL_LIMIT, MAX_PAGES, USE_MERGED_KEYWORDS
+from config import KEYWORDS, LIST_REPORT, DETAIL_REPORT, TARGET_SITE, DETAIL_LIMIT, MAX_PAGES, USE_MERGED_KEYWORDS, RUN_ID, OUTPUT_DIR
 import traceback
+from metrics import reset_metrics
 
 # Optional: Supabase database storage
 try:
@@ -122,7 +123,7 @@ def main():
                 # Store to Supabase (if enabled) - silent
                 if supabase_initialized and unique_jobs:
                     try:
-                        upsert_jobs(unique_jobs, batch_size=100, country_code="us")
+                        upsert_jobs(unique_jobs, country_code="us")
                     except Exception:
                         pass
                 
@@ -142,7 +143,7 @@ def main():
                 # Update detail data in Supabase (if enabled) - silent
                 if supabase_initialized and detail_jobs:
                     try:
-                        upsert_jobs(detail_jobs, batch_size=100, country_code="us")
+                        upsert_jobs(detail_jobs, country_code="us")
                     except Exception:
                         pass
             else:
@@ -225,7 +226,7 @@ def main():
     # Store to Supabase (if enabled) - silent
     if supabase_initialized and unique_jobs:
         try:
-            upsert_jobs(unique_jobs, batch_size=100, country_code="us")
+            upsert_jobs(unique_jobs, country_code="us")
         except Exception:
             pass
     
@@ -249,15 +250,20 @@ def main():
     # Update detail data in Supabase (if enabled) - silent
     if supabase_initialized and detail_jobs:
         try:
-            upsert_jobs(detail_jobs, batch_size=100, country_code="us")
+            upsert_jobs(detail_jobs, country_code="us")
         except Exception:
             pass
     
     print("抓取完成")
 
 if __name__ == "__main__":
+    metrics = reset_metrics(RUN_ID)
     try:
         main()
     except Exception:
         print("程序出错：")
         print(traceback.format_exc())
+    finally:
+        # 各阶段耗时（网络/解析/checkpoint I/O）：metrics.json + Prometheus文本文件
+        metrics.write(OUTPUT_DIR)
+        print(metrics.summary())
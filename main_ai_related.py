@@ -3,40 +3,25 @@
 AI弱相关岗位独立抓取程序
 使用相同的抓取框架，但使用独立的关键词和输出目录
 """
-# 在导入scraper之前，设置独立的缓存文件路径
 import sys
 import os
 
-# 独立输出目录配置
+# 独立输出目录配置（通过RunContext传给scraper和checkpoint函数）
 AI_RELATED_RUN_ID = "AI_Related_Test001"
 AI_RELATED_OUTPUT_DIR = f"outputs/{AI_RELATED_RUN_ID}"
 AI_RELATED_CACHE_FILE = f"{AI_RELATED_OUTPUT_DIR}/company_cache.json"
 
-# 临时修改scraper模块的CACHE_FILE（通过monkey patching）
-# 先导入config获取原始值
-import config
-original_cache_file = config.CACHE_FILE
-
-# 修改config的CACHE_FILE
-config.CACHE_FILE = AI_RELATED_CACHE_FILE
-
-# 现在导入scraper（它会使用修改后的CACHE_FILE）
 from scraper_linkedin_checkpoint import (
     fetch_linkedin_list_with_checkpoint,
     enrich_job_details_with_checkpoint
 )
-import scraper_linkedin_checkpoint as scraper_module
-
-# 确保scraper模块也使用新的CACHE_FILE（因为它在导入时可能已经缓存了旧值）
-scraper_module.CACHE_FILE = AI_RELATED_CACHE_FILE
-
 from checkpoint_manager import (
     load_checkpoint, save_checkpoint,
     load_stage1_raw_data, save_stage1_raw_data,
     load_stage1_unique_data, save_stage1_unique_data,
-    load_stage2_detail_data,
-    set_country_paths, reset_paths
+    load_stage2_detail_data
 )
+from run_context import RunContext
 from exporter import export_to_excel
 from config import (
     TARGET_SITE, DETAIL_LIMIT, MAX_PAGES, 
@@ -155,7 +140,7 @@ def main():
         return
     
     # 设置独立的checkpoint路径
-    set_country_paths(AI_RELATED_OUTPUT_DIR)
+    ctx = RunContext(AI_RELATED_OUTPUT_DIR, cache_file=AI_RELATED_CACHE_FILE)
     
     # 获取美国地点
     us_locations = get_us_locations_only()
@@ -163,7 +148,7 @@ def main():
     print(f"输出目录: {AI_RELATED_OUTPUT_DIR}")
     
     # 检查checkpoint
-    checkpoint = load_checkpoint()
+    checkpoint = load_checkpoint(ctx)
     
     if checkpoint:
         print(f"\n发现checkpoint，从断点恢复...")
@@ -181,14 +166,14 @@ def main():
             print(f"从地点 {location_index+1}/{len(us_locations)} 关键词 {keyword_index+1}/{search_keyword_count} 第 {page+1} 页继续...")
             
             all_jobs, completed_locations, completed_keywords, final_location_idx, final_keyword_idx, final_page = fetch_linkedin_list_with_checkpoint(
-                AI_RELATED_KEYWORDS, us_locations, location_index, keyword_index, page, USE_MERGED_KEYWORDS
+                AI_RELATED_KEYWORDS, us_locations, location_index, keyword_index, page, USE_MERGED_KEYWORDS, ctx=ctx
             )
             
             # 检查阶段1是否完成
             expected_keyword_count = 1 if USE_MERGED_KEYWORDS else len(AI_RELATED_KEYWORDS)
             if final_location_idx >= len(us_locations) and final_keyword_idx >= expected_keyword_count:
                 # 阶段1完成
-                unique_jobs = load_stage1_unique_data()
+                unique_jobs = load_stage1_unique_data(ctx)
                 
                 if unique_jobs is None:
                     # 数据验证
@@ -204,7 +189,7 @@ def main():
                     if len(unique_jobs) != len(all_jobs):
                         print(f"数据验证: 发现重复，已去重 {len(all_jobs)} -> {len(unique_jobs)} 条")
                     
-                    save_stage1_unique_data(unique_jobs)
+                    save_stage1_unique_data(unique_jobs, ctx)
                 else:
                     print(f"\n使用已保存的去重数据: {len(unique_jobs)} 条")
                 
@@ -215,13 +200,14 @@ def main():
                 # 更新checkpoint到阶段2
                 save_checkpoint(
                     stage="stage2_detail",
+                    ctx=ctx,
                     processed_count=0,
                     total_count=len(unique_jobs)
                 )
                 
                 # 继续阶段2
                 detail_jobs = unique_jobs[:DETAIL_LIMIT]
-                enrich_job_details_with_checkpoint(detail_jobs, start_index=0)
+                enrich_job_details_with_checkpoint(detail_jobs, start_index=0, ctx=ctx)
                 export_to_excel(detail_jobs, AI_RELATED_DETAIL_REPORT)
                 print(f"已导出详情页数据: {AI_RELATED_DETAIL_REPORT}")
             else:
@@ -230,14 +216,14 @@ def main():
         elif stage == "stage2_detail":
             # 恢复阶段2
             processed_count = checkpoint.get('processed_count', 0)
-            unique_jobs = load_stage1_unique_data()
+            unique_jobs = load_stage1_unique_data(ctx)
             
             if unique_jobs is None:
                 print("错误：找不到去重后的数据，请重新运行阶段1")
                 return
             
             # 加载已处理的职位数据
-            detail_data = load_stage2_detail_data()
+            detail_data = load_stage2_detail_data(ctx)
             processed_jobs = detail_data.get("jobs", [])
             
             print(f"已处理 {len(processed_jobs)} 条职位")
@@ -246,7 +232,7 @@ def main():
             detail_jobs = unique_jobs[:DETAIL_LIMIT]
             
             # 继续处理剩余的职位
-            enrich_job_details_with_checkpoint(detail_jobs, start_index=processed_count)
+            enrich_job_details_with_checkpoint(detail_jobs, start_index=processed_count, ctx=ctx)
             
             # 合并已处理和新增的职位（按URL去重）
             final_jobs = {}
@@ -269,8 +255,6 @@ def main():
             print(f"已导出详情页数据: {AI_RELATED_DETAIL_REPORT}")
         
         print("\n抓取完成")
-        # 重置路径
-        reset_paths()
         return
     
     # 没有checkpoint，从头开始
@@ -280,7 +264,7 @@ def main():
         print(f"\n阶段1: 列表页抓取 ({len(us_locations)} 个地点，{len(AI_RELATED_KEYWORDS)} 个关键词分别搜索)")
     
     all_jobs, completed_locations, completed_keywords, final_location_idx, final_keyword_idx, final_page = fetch_linkedin_list_with_checkpoint(
-        AI_RELATED_KEYWORDS, us_locations, start_location_index=0, start_keyword_index=0, start_page=0, use_merged_keywords=USE_MERGED_KEYWORDS
+        AI_RELATED_KEYWORDS, us_locations, start_location_index=0, start_keyword_index=0, start_page=0, use_merged_keywords=USE_MERGED_KEYWORDS, ctx=ctx
     )
     
     # 数据验证
@@ -296,7 +280,7 @@ def main():
         print(f"数据验证: 发现重复，已去重 {len(all_jobs)} -> {len(unique_jobs)} 条")
     
     # 保存去重后的数据
-    save_stage1_unique_data(unique_jobs)
+    save_stage1_unique_data(unique_jobs, ctx)
     
     # 导出列表页报告
     export_to_excel(unique_jobs, AI_RELATED_LIST_REPORT)
@@ -305,6 +289,7 @@ def main():
     # 更新checkpoint到阶段2
     save_checkpoint(
         stage="stage2_detail",
+        ctx=ctx,
         processed_count=0,
         total_count=len(unique_jobs)
     )
@@ -313,19 +298,12 @@ def main():
     print(f"\n阶段2: 详情页抓取 ({len(unique_jobs[:DETAIL_LIMIT])} 条)")
     detail_jobs = unique_jobs[:DETAIL_LIMIT]
     
-    enrich_job_details_with_checkpoint(detail_jobs, start_index=0)
+    enrich_job_details_with_checkpoint(detail_jobs, start_index=0, ctx=ctx)
     
     # 导出详情页报告
     export_to_excel(detail_jobs, AI_RELATED_DETAIL_REPORT)
     print(f"已导出详情页数据: {AI_RELATED_DETAIL_REPORT}")
     
-    # 重置路径
-    reset_paths()
-    
-    # 恢复原始CACHE_FILE
-    config.CACHE_FILE = original_cache_file
-    scraper_module.CACHE_FILE = original_cache_file
-    
     print("\n" + "="*60)
     print("AI弱相关岗位抓取完成")
     print("="*60)
@@ -339,11 +317,4 @@ if __name__ == "__main__":
     except Exception:
         print("程序出错：")
         print(traceback.format_exc())
-        # 确保重置路径和恢复CACHE_FILE
-        reset_paths()
-        try:
-            config.CACHE_FILE = original_cache_file
-            scraper_module.CACHE_FILE = original_cache_file
-        except:
-            pass
 
@@ -8,81 +8,71 @@ import os
 import json
 import traceback
 import re
-import pandas as pd
 
-# Set independent cache file path before importing scraper
 import config
+from checkpoint_manager import (
+    load_checkpoint, save_checkpoint,
+    load_stage1_raw_data, save_stage1_raw_data,
+    load_stage1_unique_data, save_stage1_unique_data,
+    load_stage2_detail_data
+)
+from run_context import RunContext
+from config import (
+    TARGET_SITE, DETAIL_LIMIT, MAX_PAGES, 
+    KEYWORDS, USE_MERGED_KEYWORDS, FIELDS, EXPORT_PARQUET
+)
+
 MERGED_RUN_ID = config.RUN_ID  # Read RUN_ID from config
 MERGED_OUTPUT_DIR = f"outputs/{MERGED_RUN_ID}"
 MERGED_CACHE_FILE = f"{MERGED_OUTPUT_DIR}/company_cache.json"
-
-# Check if RUN_ID has changed, clear old checkpoints if changed
 _last_run_id_file = f"{MERGED_OUTPUT_DIR}/.last_run_id"
-if os.path.exists(_last_run_id_file):
-    try:
-        with open(_last_run_id_file, "r", encoding="utf-8") as f:
-            last_run_id = f.read().strip()
-        if last_run_id != MERGED_RUN_ID:
-            # RUN_ID changed, clear old checkpoint files
-            print(f"RUN_ID changed detected: {last_run_id} -> {MERGED_RUN_ID}")
-            print("Clearing old checkpoint files...")
-            checkpoint_files = [
-                f"{MERGED_OUTPUT_DIR}/core_jobs/checkpoint.json",
-                f"{MERGED_OUTPUT_DIR}/ai_related_jobs/checkpoint.json",
-                f"{MERGED_OUTPUT_DIR}/core_jobs/stage1_raw_data.json",
-                f"{MERGED_OUTPUT_DIR}/core_jobs/stage1_unique_data.json",
-                f"{MERGED_OUTPUT_DIR}/core_jobs/stage2_detail_data.json",
-                f"{MERGED_OUTPUT_DIR}/ai_related_jobs/stage1_raw_data.json",
-                f"{MERGED_OUTPUT_DIR}/ai_related_jobs/stage1_unique_data.json",
-                f"{MERGED_OUTPUT_DIR}/ai_related_jobs/stage2_detail_data.json",
-                f"{MERGED_OUTPUT_DIR}/stage1_raw_data_core.json",
-                f"{MERGED_OUTPUT_DIR}/stage1_unique_data_core.json",
-                f"{MERGED_OUTPUT_DIR}/stage2_detail_data_core.json",
-                f"{MERGED_OUTPUT_DIR}/stage1_raw_data_ai_related.json",
-                f"{MERGED_OUTPUT_DIR}/stage1_unique_data_ai_related.json",
-                f"{MERGED_OUTPUT_DIR}/stage2_detail_data_ai_related.json",
-            ]
-            for file_path in checkpoint_files:
-                if os.path.exists(file_path):
-                    try:
-                        os.remove(file_path)
-                        print(f"Deleted: {file_path}")
-                    except:
-                        pass
-    except:
-        pass
 
-# Save current RUN_ID
-os.makedirs(MERGED_OUTPUT_DIR, exist_ok=True)
-with open(_last_run_id_file, "w", encoding="utf-8") as f:
-    f.write(MERGED_RUN_ID)
+# The scraper (requests/bs4) and exporter (pandas) are imported when a run
+# starts, so importing this module is cheap and touches no files.
 
-# Temporarily modify config's CACHE_FILE
-original_cache_file = config.CACHE_FILE
-config.CACHE_FILE = MERGED_CACHE_FILE
 
-# Now import scraper (it will use the modified CACHE_FILE)
-from scraper_linkedin_checkpoint import (
-    fetch_linkedin_list_with_checkpoint,
-    enrich_job_details_with_checkpoint
-)
-import scraper_linkedin_checkpoint as scraper_module
+def prepare_run():
+    """Clear old checkpoints if RUN_ID changed and record the current RUN_ID"""
+    # Check if RUN_ID has changed, clear old checkpoints if changed
+    if os.path.exists(_last_run_id_file):
+        try:
+            with open(_last_run_id_file, "r", encoding="utf-8") as f:
+                last_run_id = f.read().strip()
+            if last_run_id != MERGED_RUN_ID:
+                # RUN_ID changed, clear old checkpoint files
+                print(f"RUN_ID changed detected: {last_run_id} -> {MERGED_RUN_ID}")
+                print("Clearing old checkpoint files...")
+                checkpoint_files = [
+                    f"{MERGED_OUTPUT_DIR}/core_jobs/checkpoint.json",
+                    f"{MERGED_OUTPUT_DIR}/ai_related_jobs/checkpoint.json",
+                    f"{MERGED_OUTPUT_DIR}/core_jobs/stage1_raw_data.json",
+                    f"{MERGED_OUTPUT_DIR}/core_jobs/stage1_unique_data.json",
+                    f"{MERGED_OUTPUT_DIR}/core_jobs/stage2_detail_data.json",
+                    f"{MERGED_OUTPUT_DIR}/ai_related_jobs/stage1_raw_data.json",
+                    f"{MERGED_OUTPUT_DIR}/ai_related_jobs/stage1_unique_data.json",
+                    f"{MERGED_OUTPUT_DIR}/ai_related_jobs/stage2_detail_data.json",
+                    f"{MERGED_OUTPUT_DIR}/stage1_raw_data_core.json",
+                    f"{MERGED_OUTPUT_DIR}/stage1_unique_data_core.json",
+                    f"{MERGED_OUTPUT_DIR}/stage2_detail_data_core.json",
+                    f"{MERGED_OUTPUT_DIR}/stage1_raw_data_ai_related.json",
+                    f"{MERGED_OUTPUT_DIR}/stage1_unique_data_ai_related.json",
+                    f"{MERGED_OUTPUT_DIR}/stage2_detail_data_ai_related.json",
+                ]
+                for file_path in checkpoint_files:
+                    if os.path.exists(file_path):
+                        try:
+                            os.remove(file_path)
+                            print(f"Deleted: {file_path}")
+                        except:
+                            pass
+        except:
+            pass
 
-# Ensure scraper module also uses the new CACHE_FILE
-scraper_module.CACHE_FILE = MERGED_CACHE_FILE
+    # Save current RUN_ID
+    os.makedirs(MERGED_OUTPUT_DIR, exist_ok=True)
+    with open(_last_run_id_file, "w", encoding="utf-8") as f:
+        f.write(MERGED_RUN_ID)
 
-from checkpoint_manager import (
-    load_checkpoint, save_checkpoint,
-    load_stage1_raw_data, save_stage1_raw_data,
-    load_stage1_unique_data, save_stage1_unique_data,
-    load_stage2_detail_data,
-    set_country_paths, reset_paths
-)
-from exporter import export_to_excel
-from config import (
-    TARGET_SITE, DETAIL_LIMIT, MAX_PAGES, 
-    KEYWORDS, USE_MERGED_KEYWORDS, FIELDS
-)
 
 # AI-related job keywords list (copied from main_ai_related.py)
 AI_RELATED_KEYWORDS = [
@@ -323,8 +313,7 @@ def deduplicate_jobs(jobs1, jobs2):
     
     return list(unique_jobs.values())
 
-# Note: Since we use set_country_paths, checkpoint_manager will automatically use the correct path
-# So we can directly use load_checkpoint and save_checkpoint
+# core_jobs / ai_related_jobs each pass their own RunContext to the checkpoint and scraper functions
 
 def load_stage_data_with_prefix(prefix, stage):
     """Load stage data with prefix"""
@@ -380,11 +369,13 @@ def scrape_core_jobs(us_locations):
     print("Stage A: Scraping Core AI Jobs (High Relevance)")
     print("="*60)
     
+    from scraper_linkedin_checkpoint import fetch_linkedin_list_with_checkpoint, enrich_job_details_with_checkpoint
+    
     # Set independent checkpoint path
     core_dir = f"{MERGED_OUTPUT_DIR}/core_jobs"
-    set_country_paths(core_dir)
+    ctx = RunContext(core_dir, cache_file=MERGED_CACHE_FILE)
     
-    checkpoint = load_checkpoint()
+    checkpoint = load_checkpoint(ctx)
     
     if checkpoint:
         print(f"\nCheckpoint found, resuming from breakpoint...")
@@ -399,7 +390,6 @@ def scrape_core_jobs(us_locations):
             if detail_data:
                 jobs = detail_data.get("jobs", [])
                 print(f"Core job scraping completed, loading saved data: {len(jobs)} jobs")
-                reset_paths()
                 return jobs
             else:
                 print("Warning: Checkpoint shows completed, but saved data not found, restarting...")
@@ -413,7 +403,7 @@ def scrape_core_jobs(us_locations):
             print(f"Resuming from location {location_index+1}/{len(us_locations)} keyword {keyword_index+1}/{search_keyword_count} page {page+1}...")
             
             all_jobs, completed_locations, completed_keywords, final_location_idx, final_keyword_idx, final_page = fetch_linkedin_list_with_checkpoint(
-                KEYWORDS, us_locations, location_index, keyword_index, page, USE_MERGED_KEYWORDS
+                KEYWORDS, us_locations, location_index, keyword_index, page, USE_MERGED_KEYWORDS, ctx=ctx
             )
             
             # Save raw data
@@ -440,17 +430,17 @@ def scrape_core_jobs(us_locations):
                 else:
                     print(f"\nUsing saved deduplicated data: {len(unique_jobs)} jobs")
                 
-                save_checkpoint("stage2_detail", processed_count=0, total_count=len(unique_jobs))
+                save_checkpoint("stage2_detail", ctx=ctx, processed_count=0, total_count=len(unique_jobs))
                 
                 detail_jobs = unique_jobs[:DETAIL_LIMIT]
-                enrich_job_details_with_checkpoint(detail_jobs, start_index=0)
+                enrich_job_details_with_checkpoint(detail_jobs, start_index=0, ctx=ctx)
                 
                 # Save detail data
                 detail_data = {"jobs": detail_jobs, "processed_urls": [job.get("Job Link", "") for job in detail_jobs]}
                 save_stage_data_with_prefix("core", "stage2_detail", detail_data)
                 
                 # Mark as completed
-                save_checkpoint("completed")
+                save_checkpoint("completed", ctx=ctx)
                 return detail_jobs
             else:
                 print("Stage 1 not completed, please continue running the program")
@@ -471,7 +461,7 @@ def scrape_core_jobs(us_locations):
             print(f"Resuming detail scraping from job {processed_count+1}...")
             
             detail_jobs = unique_jobs[:DETAIL_LIMIT]
-            enrich_job_details_with_checkpoint(detail_jobs, start_index=processed_count)
+            enrich_job_details_with_checkpoint(detail_jobs, start_index=processed_count, ctx=ctx)
             
             # Merge processed and new jobs
             final_jobs = {}
@@ -494,8 +484,7 @@ def scrape_core_jobs(us_locations):
             save_stage_data_with_prefix("core", "stage2_detail", detail_data)
             
             # Mark as completed
-            save_checkpoint("completed")
-            reset_paths()
+            save_checkpoint("completed", ctx=ctx)
             return final_job_list
     else:
         # No checkpoint, start from beginning
@@ -505,7 +494,7 @@ def scrape_core_jobs(us_locations):
             print(f"\nStage 1: List page scraping ({len(us_locations)} locations, {len(KEYWORDS)} keywords separate search)")
         
         all_jobs, completed_locations, completed_keywords, final_location_idx, final_keyword_idx, final_page = fetch_linkedin_list_with_checkpoint(
-            KEYWORDS, us_locations, start_location_index=0, start_keyword_index=0, start_page=0, use_merged_keywords=USE_MERGED_KEYWORDS
+            KEYWORDS, us_locations, start_location_index=0, start_keyword_index=0, start_page=0, use_merged_keywords=USE_MERGED_KEYWORDS, ctx=ctx
         )
         
         # Save raw data
@@ -527,24 +516,22 @@ def scrape_core_jobs(us_locations):
         save_stage_data_with_prefix("core", "stage1_unique", unique_jobs)
         
         # Update checkpoint to stage 2
-        save_checkpoint("stage2_detail", processed_count=0, total_count=len(unique_jobs))
+        save_checkpoint("stage2_detail", ctx=ctx, processed_count=0, total_count=len(unique_jobs))
         
         # Stage 2: Detail page scraping
         print(f"\nStage 2: Detail page scraping ({len(unique_jobs[:DETAIL_LIMIT])} jobs)")
         detail_jobs = unique_jobs[:DETAIL_LIMIT]
         
-        enrich_job_details_with_checkpoint(detail_jobs, start_index=0)
+        enrich_job_details_with_checkpoint(detail_jobs, start_index=0, ctx=ctx)
         
         # Save detail data
         detail_data = {"jobs": detail_jobs, "processed_urls": [job.get("Job Link", "") for job in detail_jobs]}
         save_stage_data_with_prefix("core", "stage2_detail", detail_data)
         
         # Mark as completed
-        save_checkpoint("completed")
-        reset_paths()
+        save_checkpoint("completed", ctx=ctx)
         return detail_jobs
     
-    reset_paths()
     return None
 
 def scrape_ai_related_jobs(us_locations):
@@ -553,11 +540,13 @@ def scrape_ai_related_jobs(us_locations):
     print("Stage B: Scraping AI-Related Jobs (Low Relevance)")
     print("="*60)
     
+    from scraper_linkedin_checkpoint import fetch_linkedin_list_with_checkpoint, enrich_job_details_with_checkpoint
+    
     # Set independent checkpoint path
     ai_related_dir = f"{MERGED_OUTPUT_DIR}/ai_related_jobs"
-    set_country_paths(ai_related_dir)
+    ctx = RunContext(ai_related_dir, cache_file=MERGED_CACHE_FILE)
     
-    checkpoint = load_checkpoint()
+    checkpoint = load_checkpoint(ctx)
     
     if checkpoint:
         print(f"\nCheckpoint found, resuming from breakpoint...")
@@ -572,7 +561,6 @@ def scrape_ai_related_jobs(us_locations):
             if detail_data:
                 jobs = detail_data.get("jobs", [])
                 print(f"AI-related job scraping completed, loading saved data: {len(jobs)} jobs")
-                reset_paths()
                 return jobs
             else:
                 print("Warning: Checkpoint shows completed, but saved data not found, restarting...")
@@ -586,7 +574,7 @@ def scrape_ai_related_jobs(us_locations):
             print(f"Resuming from location {location_index+1}/{len(us_locations)} keyword {keyword_index+1}/{search_keyword_count} page {page+1}...")
             
             all_jobs, completed_locations, completed_keywords, final_location_idx, final_keyword_idx, final_page = fetch_linkedin_list_with_checkpoint(
-                AI_RELATED_KEYWORDS, us_locations, location_index, keyword_index, page, USE_MERGED_KEYWORDS
+                AI_RELATED_KEYWORDS, us_locations, location_index, keyword_index, page, USE_MERGED_KEYWORDS, ctx=ctx
             )
             
             # Save raw data
@@ -613,17 +601,17 @@ def scrape_ai_related_jobs(us_locations):
                 else:
                     print(f"\nUsing saved deduplicated data: {len(unique_jobs)} jobs")
                 
-                save_checkpoint("stage2_detail", processed_count=0, total_count=len(unique_jobs))
+                save_checkpoint("stage2_detail", ctx=ctx, processed_count=0, total_count=len(unique_jobs))
                 
                 detail_jobs = unique_jobs[:DETAIL_LIMIT]
-                enrich_job_details_with_checkpoint(detail_jobs, start_index=0)
+                enrich_job_details_with_checkpoint(detail_jobs, start_index=0, ctx=ctx)
                 
                 # Save detail data
                 detail_data = {"jobs": detail_jobs, "processed_urls": [job.get("Job Link", "") for job in detail_jobs]}
                 save_stage_data_with_prefix("ai_related", "stage2_detail", detail_data)
                 
                 # Mark as completed
-                save_checkpoint("completed")
+                save_checkpoint("completed", ctx=ctx)
                 return detail_jobs
             else:
                 print("Stage 1 not completed, please continue running the program")
@@ -644,7 +632,7 @@ def scrape_ai_related_jobs(us_locations):
             print(f"Resuming detail scraping from job {processed_count+1}...")
             
             detail_jobs = unique_jobs[:DETAIL_LIMIT]
-            enrich_job_details_with_checkpoint(detail_jobs, start_index=processed_count)
+            enrich_job_details_with_checkpoint(detail_jobs, start_index=processed_count, ctx=ctx)
             
             # Merge processed and new jobs
             final_jobs = {}
@@ -667,8 +655,7 @@ def scrape_ai_related_jobs(us_locations):
             save_stage_data_with_prefix("ai_related", "stage2_detail", detail_data)
             
             # Mark as completed
-            save_checkpoint("completed")
-            reset_paths()
+            save_checkpoint("completed", ctx=ctx)
             return final_job_list
     else:
         # No checkpoint, start from beginning
@@ -678,7 +665,7 @@ def scrape_ai_related_jobs(us_locations):
             print(f"\nStage 1: List page scraping ({len(us_locations)} locations, {len(AI_RELATED_KEYWORDS)} keywords separate search)")
         
         all_jobs, completed_locations, completed_keywords, final_location_idx, final_keyword_idx, final_page = fetch_linkedin_list_with_checkpoint(
-            AI_RELATED_KEYWORDS, us_locations, start_location_index=0, start_keyword_index=0, start_page=0, use_merged_keywords=USE_MERGED_KEYWORDS
+            AI_RELATED_KEYWORDS, us_locations, start_location_index=0, start_keyword_index=0, start_page=0, use_merged_keywords=USE_MERGED_KEYWORDS, ctx=ctx
         )
         
         # Save raw data
@@ -700,24 +687,22 @@ def scrape_ai_related_jobs(us_locations):
         save_stage_data_with_prefix("ai_related", "stage1_unique", unique_jobs)
         
         # Update checkpoint to stage 2
-        save_checkpoint("stage2_detail", processed_count=0, total_count=len(unique_jobs))
+        save_checkpoint("stage2_detail", ctx=ctx, processed_count=0, total_count=len(unique_jobs))
         
         # Stage 2: Detail page scraping
         print(f"\nStage 2: Detail page scraping ({len(unique_jobs[:DETAIL_LIMIT])} jobs)")
         detail_jobs = unique_jobs[:DETAIL_LIMIT]
         
-        enrich_job_details_with_checkpoint(detail_jobs, start_index=0)
+        enrich_job_details_with_checkpoint(detail_jobs, start_index=0, ctx=ctx)
         
         # Save detail data
         detail_data = {"jobs": detail_jobs, "processed_urls": [job.get("Job Link", "") for job in detail_jobs]}
         save_stage_data_with_prefix("ai_related", "stage2_detail", detail_data)
         
         # Mark as completed
-        save_checkpoint("completed")
-        reset_paths()
+        save_checkpoint("completed", ctx=ctx)
         return detail_jobs
     
-    reset_paths()
     return None
 
 def main():
@@ -733,6 +718,9 @@ def main():
         print("Current version only supports LinkedIn, please set TARGET_SITE = 'linkedin'")
         return
     
+    from exporter import StreamingExporter
+    prepare_run()
+    
     # Get US locations
     us_locations = get_us_locations_only()
     print(f"\nScraping US locations only: {len(us_locations)} locations")
@@ -775,36 +763,23 @@ def main():
         job["Job Label"] = normalize_job_title(job_title)
         job["Job Level"] = extract_job_level(job_title)
     
-    # Build DataFrame according to merged_report_2.xlsx format
+    # Stream rows according to merged_report_2.xlsx format
     # Column order: relevance level | Job Label | Job Level | Job Title | ... (other FIELDS)
     print("\n[Generating Final Report]")
-    df_data = {
-        "relevance level": [job.get("relevance level", "") for job in merged_jobs],
-        "Job Label": [job.get("Job Label", "") for job in merged_jobs],
-        "Job Level": [job.get("Job Level", "") for job in merged_jobs],
-    }
-    
-    # Add other fields
-    for field in FIELDS:
-        df_data[field] = [job.get(field, "") for job in merged_jobs]
-    
-    df = pd.DataFrame(df_data)
+    columns = ["relevance level", "Job Label", "Job Level"] + FIELDS
     
-    # Export Excel
+    # Export Excel (and Parquet if enabled) row by row
     final_output_file = f"{MERGED_OUTPUT_DIR}/merged_report.xlsx"
     os.makedirs(MERGED_OUTPUT_DIR, exist_ok=True)
-    df.to_excel(final_output_file, index=False)
+    with StreamingExporter(final_output_file, columns, parquet=EXPORT_PARQUET,
+                           dtypes={"relevance level": "int"}) as writer:
+        writer.write_rows(merged_jobs)
     
     print(f"Exported: {final_output_file}")
     print(f"Total jobs: {len(merged_jobs)} jobs")
     print(f"  - Core jobs (relevance level = 1): {sum(1 for j in merged_jobs if j.get('relevance level') == 1)} jobs")
     print(f"  - AI-related jobs (relevance level = 2): {sum(1 for j in merged_jobs if j.get('relevance level') == 2)} jobs")
     
-    # Restore original CACHE_FILE
-    config.CACHE_FILE = original_cache_file
-    scraper_module.CACHE_FILE = original_cache_file
-    reset_paths()
-    
     print("\n" + "="*60)
     print("Merged Scraping Completed")
     print("="*60)
@@ -816,11 +791,4 @@ if __name__ == "__main__":
     except Exception:
         print("Program error:")
         print(traceback.format_exc())
-        # Ensure reset paths and restore CACHE_FILE
-        reset_paths()
-        try:
-            config.CACHE_FILE = original_cache_file
-            scraper_module.CACHE_FILE = original_cache_file
-        except:
-            pass
 
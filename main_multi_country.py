@@ -9,8 +9,15 @@ from checkpoint_manager import (
     load_stage2_detail_data
 )
 from exporter import export_to_excel
-from config import KEYWORDS, TARGET_SITE, DETAIL_LIMIT, MAX_PAGES, USE_MERGED_KEYWORDS, get_country_output_paths, OUTPUT_DIR
+from config import (
+    KEYWORDS, TARGET_SITE, DETAIL_LIMIT, MAX_PAGES, USE_MERGED_KEYWORDS, get_country_output_paths, OUTPUT_DIR, RUN_ID,
+    CACHE_FILE, ZENROWS_REQUESTS_PER_MINUTE, PARALLEL_COUNTRIES, COUNTRY_WORKERS
+)
+from run_context import RunContext
+from rate_limiter import ProcessSharedRateLimiter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import traceback
+from metrics import reset_metrics
 import os
 import json
 import shutil
@@ -61,8 +68,8 @@ def group_locations_by_country():
     return country_groups
 
 
-def process_single_country(country_code, country_locations, country_names):
-    """处理单个国家的抓取"""
+def process_single_country(country_code, country_locations, country_names, ctx=None):
+    """处理单个国家的抓取（ctx: 该国家的RunContext，默认为国家目录 + 共享的公司缓存）"""
     print(f"\n{'='*60}")
     print(f"开始处理: {country_names.get(country_code, country_code.upper())} ({len(country_locations)} 个地点)")
     print(f"{'='*60}")
@@ -70,6 +77,8 @@ def process_single_country(country_code, country_locations, country_names):
     # Get country-specific output paths
     country_paths = get_country_output_paths(country_code)
     os.makedirs(country_paths["dir"], exist_ok=True)
+    if ctx is None:
+        ctx = RunContext.for_country(country_code, cache_file=CACHE_FILE)
     
     # Initialize Supabase (if enabled) - silent mode
     supabase_initialized = False
@@ -80,12 +89,8 @@ def process_single_country(country_code, country_locations, country_names):
         except Exception:
             supabase_initialized = False
     
-    # Set country-specific paths in checkpoint_manager
-    from checkpoint_manager import set_country_paths, load_checkpoint
-    set_country_paths(country_paths["dir"])
-    
     # Load checkpoint for this country
-    checkpoint = load_checkpoint()
+    checkpoint = load_checkpoint(ctx)
     
     if checkpoint:
         print(f"\n发现checkpoint，从断点恢复...")
@@ -102,82 +107,76 @@ def process_single_country(country_code, country_locations, country_names):
             search_keyword_count = 1 if USE_MERGED_KEYWORDS else len(KEYWORDS)
             print(f"从地点 {location_index+1}/{len(country_locations)} 关键词 {keyword_index+1}/{search_keyword_count} 第 {page+1} 页继续...")
             
-            try:
-                all_jobs, completed_locations, completed_keywords, final_location_idx, final_keyword_idx, final_page = fetch_linkedin_list_with_checkpoint(
-                    KEYWORDS, country_locations, location_index, keyword_index, page, USE_MERGED_KEYWORDS
-                )
+            all_jobs, completed_locations, completed_keywords, final_location_idx, final_keyword_idx, final_page = fetch_linkedin_list_with_checkpoint(
+                KEYWORDS, country_locations, location_index, keyword_index, page, USE_MERGED_KEYWORDS, ctx=ctx
+            )
+            
+            expected_keyword_count = 1 if USE_MERGED_KEYWORDS else len(KEYWORDS)
+            if final_location_idx >= len(country_locations) and final_keyword_idx >= expected_keyword_count:
+                unique_jobs = load_stage1_unique_data(ctx)
                 
-                expected_keyword_count = 1 if USE_MERGED_KEYWORDS else len(KEYWORDS)
-                if final_location_idx >= len(country_locations) and final_keyword_idx >= expected_keyword_count:
-                    unique_jobs = load_stage1_unique_data()
-                    
-                    if unique_jobs is None:
-                        seen = set()
-                        unique_jobs = []
-                        for job in all_jobs:
-                            key = (job.get("职位名称", ""), job.get("公司名称", ""))
-                            if key[0] and key[1] and key not in seen:
-                                seen.add(key)
-                                unique_jobs.append(job)
-                        
-                        save_stage1_unique_data(unique_jobs)
-                    
-                    export_to_excel(unique_jobs, country_paths["list_report"])
-                    
-                    if supabase_initialized and unique_jobs:
-                        try:
-                            upsert_jobs(unique_jobs, batch_size=100, country_code=country_code)
-                        except Exception:
-                            pass
+                if unique_jobs is None:
+                    seen = set()
+                    unique_jobs = []
+                    for job in all_jobs:
+                        key = (job.get("Job Title", ""), job.get("Company Name", ""))
+                        if key[0] and key[1] and key not in seen:
+                            seen.add(key)
+                            unique_jobs.append(job)
                     
-                    from checkpoint_manager import save_checkpoint
-                    save_checkpoint("stage2_detail", processed_count=0, total_count=len(unique_jobs))
-                    
-                    detail_jobs = unique_jobs[:DETAIL_LIMIT]
-                    enrich_job_details_with_checkpoint(detail_jobs, start_index=0)
-                    export_to_excel(detail_jobs, country_paths["detail_report"])
-                    
-                    if supabase_initialized and detail_jobs:
-                        try:
-                            upsert_jobs(detail_jobs, batch_size=100, country_code=country_code)
-                        except Exception:
-                            pass
-                    
-                    print(f"\n✓ {country_names.get(country_code, country_code.upper())} 抓取完成")
-                else:
-                    print("阶段1尚未完成，请继续运行程序")
-            finally:
-                # Reset to default paths
-                from checkpoint_manager import reset_paths
-                reset_paths()
+                    save_stage1_unique_data(unique_jobs, ctx)
+                
+                export_to_excel(unique_jobs, country_paths["list_report"])
+                
+                if supabase_initialized and unique_jobs:
+                    try:
+                        upsert_jobs(unique_jobs, country_code=country_code)
+                    except Exception:
+                        pass
+                
+                save_checkpoint("stage2_detail", ctx=ctx, processed_count=0, total_count=len(unique_jobs))
+                
+                detail_jobs = unique_jobs[:DETAIL_LIMIT]
+                enrich_job_details_with_checkpoint(detail_jobs, start_index=0, ctx=ctx)
+                export_to_excel(detail_jobs, country_paths["detail_report"])
+                
+                if supabase_initialized and detail_jobs:
+                    try:
+                        upsert_jobs(detail_jobs, country_code=country_code)
+                    except Exception:
+                        pass
+                
+                print(f"\n✓ {country_names.get(country_code, country_code.upper())} 抓取完成")
+            else:
+                print("阶段1尚未完成，请继续运行程序")
             
         elif stage == "stage2_detail":
             processed_count = checkpoint.get('processed_count', 0)
-            unique_jobs = load_stage1_unique_data()
+            unique_jobs = load_stage1_unique_data(ctx)
             
             if unique_jobs is None:
                 print("错误：找不到去重后的数据，请重新运行阶段1")
                 return
             
-            detail_data = load_stage2_detail_data()
+            detail_data = load_stage2_detail_data(ctx)
             processed_jobs = detail_data.get("jobs", [])
             
             print(f"已处理 {len(processed_jobs)} 条职位")
             print(f"从第 {processed_count+1} 条继续抓取详情...")
             
             detail_jobs = unique_jobs[:DETAIL_LIMIT]
-            enrich_job_details_with_checkpoint(detail_jobs, start_index=processed_count)
+            enrich_job_details_with_checkpoint(detail_jobs, start_index=processed_count, ctx=ctx)
             
             final_jobs = {}
             for job in processed_jobs + detail_jobs:
-                url = job.get("职位链接", "")
+                url = job.get("Job Link", "")
                 if url:
                     final_jobs[url] = job
             
             final_job_list = []
             processed_urls = set()
             for job in detail_jobs:
-                url = job.get("职位链接", "")
+                url = job.get("Job Link", "")
                 if url and url not in processed_urls:
                     if url in final_jobs:
                         final_job_list.append(final_jobs[url])
@@ -189,54 +188,87 @@ def process_single_country(country_code, country_locations, country_names):
         return
     
     # No checkpoint, start from beginning
-    # Set country-specific paths in checkpoint_manager
-    from checkpoint_manager import set_country_paths
-    set_country_paths(country_paths["dir"])
+    if USE_MERGED_KEYWORDS:
+        print(f"\n阶段1: 列表页抓取 ({len(country_locations)} 个地点，{len(KEYWORDS)} 个关键词合并搜索)")
+    else:
+        print(f"\n阶段1: 列表页抓取 ({len(country_locations)} 个地点，{len(KEYWORDS)} 个关键词分别搜索)")
+    
+    all_jobs, completed_locations, completed_keywords, final_location_idx, final_keyword_idx, final_page = fetch_linkedin_list_with_checkpoint(
+        KEYWORDS, country_locations, start_location_index=0, start_keyword_index=0, start_page=0, use_merged_keywords=USE_MERGED_KEYWORDS, ctx=ctx
+    )
+    
+    seen = set()
+    unique_jobs = []
+    for job in all_jobs:
+        key = (job.get("Job Title", ""), job.get("Company Name", ""))
+        if key[0] and key[1] and key not in seen:
+            seen.add(key)
+            unique_jobs.append(job)
+    
+    if len(unique_jobs) != len(all_jobs):
+        print(f"数据验证: 发现重复，已去重 {len(all_jobs)} -> {len(unique_jobs)} 条")
+    
+    save_stage1_unique_data(unique_jobs, ctx)
+    export_to_excel(unique_jobs, country_paths["list_report"])
+    
+    save_checkpoint("stage2_detail", ctx=ctx, processed_count=0, total_count=len(unique_jobs))
     
+    print(f"\n阶段2: 详情页抓取 ({len(unique_jobs[:DETAIL_LIMIT])} 条)")
+    detail_jobs = unique_jobs[:DETAIL_LIMIT]
+    
+    enrich_job_details_with_checkpoint(detail_jobs, start_index=0, ctx=ctx)
+    export_to_excel(detail_jobs, country_paths["detail_report"])
+    
+    if supabase_initialized and detail_jobs:
+        try:
+            upsert_jobs(detail_jobs, country_code=country_code)
+        except Exception:
+            pass
+    
+    print(f"\n✓ {country_names.get(country_code, country_code.upper())} 抓取完成")
+
+
+# ZenRows limiter shared by all country processes (set by the pool initializer)
+_country_limiter = None
+
+
+def _init_country_worker(limiter):
+    global _country_limiter
+    _country_limiter = limiter
+
+
+def _process_country_in_worker(country_code, country_locations, country_names):
+    """在子进程中处理一个国家：独立的RunContext（国家目录、国家缓存）+ 共享的限速器"""
+    ctx = RunContext.for_country(country_code, limiter=_country_limiter)
+    metrics = reset_metrics(RUN_ID)
     try:
-        if USE_MERGED_KEYWORDS:
-            print(f"\n阶段1: 列表页抓取 ({len(country_locations)} 个地点，{len(KEYWORDS)} 个关键词合并搜索)")
-        else:
-            print(f"\n阶段1: 列表页抓取 ({len(country_locations)} 个地点，{len(KEYWORDS)} 个关键词分别搜索)")
-        
-        all_jobs, completed_locations, completed_keywords, final_location_idx, final_keyword_idx, final_page = fetch_linkedin_list_with_checkpoint(
-            KEYWORDS, country_locations, start_location_index=0, start_keyword_index=0, start_page=0, use_merged_keywords=USE_MERGED_KEYWORDS
-        )
-        
-        seen = set()
-        unique_jobs = []
-        for job in all_jobs:
-            key = (job.get("职位名称", ""), job.get("公司名称", ""))
-            if key[0] and key[1] and key not in seen:
-                seen.add(key)
-                unique_jobs.append(job)
-        
-        if len(unique_jobs) != len(all_jobs):
-            print(f"数据验证: 发现重复，已去重 {len(all_jobs)} -> {len(unique_jobs)} 条")
-        
-        save_stage1_unique_data(unique_jobs)
-        export_to_excel(unique_jobs, country_paths["list_report"])
-        
-        from checkpoint_manager import save_checkpoint
-        save_checkpoint("stage2_detail", processed_count=0, total_count=len(unique_jobs))
-        
-        print(f"\n阶段2: 详情页抓取 ({len(unique_jobs[:DETAIL_LIMIT])} 条)")
-        detail_jobs = unique_jobs[:DETAIL_LIMIT]
-        
-        enrich_job_details_with_checkpoint(detail_jobs, start_index=0)
-        export_to_excel(detail_jobs, country_paths["detail_report"])
-        
-        if supabase_initialized and detail_jobs:
-            try:
-                upsert_jobs(detail_jobs, batch_size=100, country_code=country_code)
-            except Exception:
-                pass
-        
-        print(f"\n✓ {country_names.get(country_code, country_code.upper())} 抓取完成")
+        process_single_country(country_code, country_locations, country_names, ctx)
     finally:
-        # Reset to default paths
-        from checkpoint_manager import reset_paths
-        reset_paths()
+        metrics.write(ctx.output_dir)
+
+
+def run_countries_parallel(country_groups, country_names, workers=None):
+    """
+    每个国家一个进程并行抓取
+    所有进程共享 ZENROWS_REQUESTS_PER_MINUTE 的全局限速；每个国家使用自己的checkpoint目录和公司缓存
+    """
+    countries = [(code, locations) for code, locations in country_groups.items() if locations]
+    limiter = ProcessSharedRateLimiter(ZENROWS_REQUESTS_PER_MINUTE)
+    workers = workers or len(countries)
+    print(f"\n并行模式: {len(countries)} 个国家，{workers} 个进程，共享限速 {ZENROWS_REQUESTS_PER_MINUTE} 次/分钟")
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_country_worker, initargs=(limiter,)) as pool:
+        futures = {
+            pool.submit(_process_country_in_worker, code, locations, country_names): code
+            for code, locations in countries
+        }
+        for future in as_completed(futures):
+            country_code = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                print(f"\n✗ {country_names.get(country_code, country_code.upper())} 处理失败: {str(e)}")
+
 
 def main():
     print(f"启动抓取程序（目标网站: {TARGET_SITE}）")
@@ -254,27 +286,35 @@ def main():
         if locations:
             print(f"  - {country_names.get(country_code, country_code.upper())}: {len(locations)} 个地点")
     
-    # Process each country
-    for country_code, country_locations in country_groups.items():
-        if not country_locations:
-            continue
-        
-        try:
-            process_single_country(country_code, country_locations, country_names)
-        except Exception as e:
-            print(f"\n✗ {country_names.get(country_code, country_code.upper())} 处理失败: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            continue
+    if PARALLEL_COUNTRIES:
+        run_countries_parallel(country_groups, country_names, COUNTRY_WORKERS)
+    else:
+        # Process each country
+        for country_code, country_locations in country_groups.items():
+            if not country_locations:
+                continue
+            
+            try:
+                process_single_country(country_code, country_locations, country_names)
+            except Exception as e:
+                print(f"\n✗ {country_names.get(country_code, country_code.upper())} 处理失败: {str(e)}")
+                import traceback
+                traceback.print_exc()
+                continue
     
     print(f"\n{'='*60}")
     print("所有国家抓取完成！")
     print(f"{'='*60}")
 
 if __name__ == "__main__":
+    metrics = reset_metrics(RUN_ID)
     try:
         main()
     except Exception:
         print("程序出错：")
         print(traceback.format_exc())
+    finally:
+        # 各阶段耗时（网络/解析/checkpoint I/O）：metrics.json + Prometheus文本文件
+        metrics.write(OUTPUT_DIR)
+        print(metrics.summary())
 
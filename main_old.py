@@ -165,7 +165,7 @@ def process_single_country(country_code, country_locations, country_names):
                 # Store to Supabase (if enabled) - silent
                 if supabase_initialized and unique_jobs:
                     try:
-                        upsert_jobs(unique_jobs, batch_size=100, country_code=country_code)
+                        upsert_jobs(unique_jobs, country_code=country_code)
                     except Exception:
                         pass
                 
@@ -184,7 +184,7 @@ def process_single_country(country_code, country_locations, country_names):
                 # Update detail data in Supabase (if enabled) - silent
                 if supabase_initialized and detail_jobs:
                     try:
-                        upsert_jobs(detail_jobs, batch_size=100, country_code=country_code)
+                        upsert_jobs(detail_jobs, country_code=country_code)
                     except Exception:
                         pass
             else:
@@ -281,7 +281,7 @@ def process_single_country(country_code, country_locations, country_names):
     # Update detail data in Supabase (if enabled) - silent
     if supabase_initialized and detail_jobs:
         try:
-            upsert_jobs(detail_jobs, batch_size=100, country_code=country_code)
+            upsert_jobs(detail_jobs, country_code=country_code)
         except Exception:
             pass
     
@@ -0,0 +1,288 @@
+"""
+Lightweight run metrics: stage timers, counters and gauges.
+
+    from metrics import get_metrics, timed
+
+    metrics = get_metrics()
+    with metrics.timer("fetch.zenrows"):
+        html = requests.get(...)
+    metrics.inc("jobs.new", len(new_jobs))
+    metrics.cache("ai_cache", hit=True)
+
+    @timed("checkpoint.save")
+    def save_checkpoint(...): ...
+
+    metrics.write(output_dir)   # metrics.json + metrics.prom
+
+Worker processes have their own registry: reset it per task, return
+get_metrics().export() with the result and merge() it in the parent.
+
+Each timed stage keeps a latency histogram (fixed buckets), count, total and
+max, so recording is O(1) and memory does not grow with the run. The snapshot
+adds requests/min per stage and cache hit rates; metrics.prom is in the
+Prometheus text format for the node_exporter textfile collector.
+"""
+import os
+import json
+import time
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+
+# Histogram bucket upper bounds in seconds (covers regex calls up to slow fetches)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+PROMETHEUS_PREFIX = "jobscraper"
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "count", "total", "max")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th observation"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class Metrics:
+    """Thread-safe registry of stage timers, counters and gauges for one run."""
+
+    def __init__(self, run_id=None, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset(run_id)
+
+    def reset(self, run_id=None):
+        """Clear everything and restart the run clock."""
+        with self._lock:
+            self.run_id = run_id
+            self.started_at = datetime.now()
+            self._start = time.perf_counter()
+            self._stages = {}
+            self._counters = {}
+            self._gauges = {}
+
+    # ---- recording ----
+    def observe(self, stage, seconds):
+        """Record one duration for a stage."""
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = _Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, stage):
+        """Time the block and record it under stage (also when it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+
+    def inc(self, name, value=1):
+        """Add value to a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name, value):
+        """Set a gauge to its current value."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def cache(self, name, hit):
+        """Count a cache lookup (name.hits / name.misses)."""
+        self.inc(f"{name}.hits" if hit else f"{name}.misses")
+
+    # ---- worker processes ----
+    def export(self):
+        """Raw stage histograms and counters, picklable, for merge() in another process."""
+        with self._lock:
+            stages = {stage: (list(h.counts), h.count, h.total, h.max) for stage, h in self._stages.items()}
+            return {"stages": stages, "counters": dict(self._counters)}
+
+    def merge(self, exported):
+        """Add the stages and counters exported by a worker process (same buckets)."""
+        with self._lock:
+            for stage, (counts, count, total, maximum) in exported["stages"].items():
+                histogram = self._stages.get(stage)
+                if histogram is None:
+                    histogram = self._stages[stage] = _Histogram(self.buckets)
+                histogram.counts = [a + b for a, b in zip(histogram.counts, counts)]
+                histogram.count += count
+                histogram.total += total
+                histogram.max = max(histogram.max, maximum)
+            for name, value in exported["counters"].items():
+                self._counters[name] = self._counters.get(name, 0) + value
+
+    # ---- reporting ----
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self._start
+
+    def snapshot(self):
+        """Current metrics as a JSON-serialisable dict."""
+        with self._lock:
+            elapsed = self.elapsed
+            minutes = elapsed / 60 if elapsed > 0 else 0
+            stages = {}
+            for stage, histogram in sorted(self._stages.items()):
+                stages[stage] = {
+                    "count": histogram.count,
+                    "total_s": round(histogram.total, 6),
+                    "mean_s": round(histogram.total / histogram.count, 6) if histogram.count else 0.0,
+                    "p50_s": histogram.quantile(0.5),
+                    "p95_s": histogram.quantile(0.95),
+                    "max_s": round(histogram.max, 6),
+                    "per_minute": round(histogram.count / minutes, 2) if minutes else 0.0,
+                    "share_of_run": round(histogram.total / elapsed, 4) if elapsed else 0.0,
+                    "buckets": {
+                        **{str(bound): count for bound, count in zip(self.buckets, histogram.counts)},
+                        "+Inf": histogram.counts[-1],
+                    },
+                }
+            counters = dict(sorted(self._counters.items()))
+            gauges = dict(sorted(self._gauges.items()))
+
+        cache_hit_rates = {}
+        for name in counters:
+            if name.endswith(".hits"):
+                cache = name[:-len(".hits")]
+                hits = counters[name]
+                total = hits + counters.get(f"{cache}.misses", 0)
+                cache_hit_rates[cache] = round(hits / total, 4) if total else 0.0
+
+        return {
+            "run_id": self.run_id,
+            "started_at": self.started_at.isoformat(),
+            "updated_at": datetime.now().isoformat(),
+            "elapsed_s": round(elapsed, 3),
+            "stages": stages,
+            "counters": counters,
+            "gauges": gauges,
+            "cache_hit_rates": cache_hit_rates,
+        }
+
+    def to_prometheus(self, prefix=PROMETHEUS_PREFIX):
+        """Metrics in the Prometheus text exposition format."""
+        snap = self.snapshot()
+        run = f'run_id="{_escape(snap["run_id"] or "")}"'
+        lines = []
+
+        name = f"{prefix}_stage_duration_seconds"
+        lines += [f"# HELP {name} Time spent per pipeline stage.", f"# TYPE {name} histogram"]
+        for stage, data in snap["stages"].items():
+            labels = f'{run},stage="{_escape(stage)}"'
+            cumulative = 0
+            for bound, count in data["buckets"].items():
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {data['total_s']}")
+            lines.append(f"{name}_count{{{labels}}} {data['count']}")
+
+        name = f"{prefix}_stage_per_minute"
+        lines += [f"# HELP {name} Stage operations per minute over the run.", f"# TYPE {name} gauge"]
+        for stage, data in snap["stages"].items():
+            lines.append(f'{name}{{{run},stage="{_escape(stage)}"}} {data["per_minute"]}')
+
+        name = f"{prefix}_events_total"
+        lines += [f"# HELP {name} Run counters.", f"# TYPE {name} counter"]
+        for counter, value in snap["counters"].items():
+            lines.append(f'{name}{{{run},name="{_escape(counter)}"}} {value}')
+
+        name = f"{prefix}_gauge"
+        lines += [f"# HELP {name} Run gauges.", f"# TYPE {name} gauge"]
+        for gauge, value in snap["gauges"].items():
+            lines.append(f'{name}{{{run},name="{_escape(gauge)}"}} {value}')
+
+        name = f"{prefix}_cache_hit_ratio"
+        lines += [f"# HELP {name} Cache hits / lookups.", f"# TYPE {name} gauge"]
+        for cache, rate in snap["cache_hit_rates"].items():
+            lines.append(f'{name}{{{run},cache="{_escape(cache)}"}} {rate}')
+
+        name = f"{prefix}_run_elapsed_seconds"
+        lines += [f"# TYPE {name} gauge", f"{name}{{{run}}} {snap['elapsed_s']}"]
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory, json_name="metrics.json", prom_name="metrics.prom"):
+        """Write metrics.json and the Prometheus text file into directory (atomically)."""
+        os.makedirs(directory, exist_ok=True)
+        json_path = os.path.join(directory, json_name)
+        prom_path = os.path.join(directory, prom_name)
+        _atomic_write(json_path, json.dumps(self.snapshot(), ensure_ascii=False, indent=2))
+        _atomic_write(prom_path, self.to_prometheus())
+        return json_path, prom_path
+
+    def summary(self, top=8):
+        """Short text summary: where the run's time went."""
+        snap = self.snapshot()
+        lines = [f"Run time: {snap['elapsed_s']:.1f}s"]
+        stages = sorted(snap["stages"].items(), key=lambda item: item[1]["total_s"], reverse=True)
+        for stage, data in stages[:top]:
+            lines.append(
+                f"  {stage:<24} {data['count']:>7} x  total {data['total_s']:>8.2f}s  "
+                f"mean {data['mean_s'] * 1000:>8.1f}ms  p95 <= {data['p95_s'] * 1000:>7.0f}ms  "
+                f"{data['per_minute']:>7.1f}/min"
+            )
+        for cache, rate in snap["cache_hit_rates"].items():
+            lines.append(f"  cache {cache}: {rate:.1%} hit rate")
+        return "\n".join(lines)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _atomic_write(path, text):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+# Process-wide registry shared by the scrapers, checkpoint code and AI client
+_metrics = Metrics()
+
+
+def get_metrics():
+    """The process-wide Metrics registry."""
+    return _metrics
+
+
+def reset_metrics(run_id=None):
+    """Reset the process-wide registry in place (at the start of a run) and return it."""
+    _metrics.reset(run_id)
+    return _metrics
+
+
+def timed(stage):
+    """Decorator: record each call's duration under stage in the process-wide registry."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_metrics().timer(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,185 @@
+"""
+Sliding-window rate limiter shared by the Gemini client and the ZenRows fetchers.
+
+Limits requests per minute and, optionally, tokens per minute. Request times are
+kept in a deque and old entries are dropped from the left, so each call costs
+O(1) amortised instead of rebuilding the window. The limiter is thread-safe and
+has both a blocking (wait_if_needed) and an asyncio (acquire_async) interface.
+
+ProcessSharedRateLimiter enforces one requests-per-minute budget across worker
+processes (e.g. one scraper process per country).
+"""
+import time
+import asyncio
+import threading
+import multiprocessing
+from collections import deque
+
+# Process-wide limiters by name (e.g. all ZenRows fetchers share "zenrows")
+_shared_limiters = {}
+_shared_lock = threading.Lock()
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limiter over a sliding window."""
+
+    def __init__(self, requests_per_minute=60, tokens_per_minute=None, window_seconds=60.0):
+        """
+        Args:
+            requests_per_minute: Max requests in any window (None = unlimited)
+            tokens_per_minute: Max tokens in any window (None = unlimited)
+            window_seconds: Window length (60s; shorter windows are for tests)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window_seconds = window_seconds
+        self._requests = deque()   # request timestamps
+        self._tokens = deque()     # (timestamp, tokens)
+        self._token_total = 0
+        self._lock = threading.Lock()
+
+    def _evict(self, now):
+        """Drop entries that left the window. Caller must hold _lock."""
+        window_start = now - self.window_seconds
+        while self._requests and self._requests[0] <= window_start:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= window_start:
+            self._token_total -= self._tokens.popleft()[1]
+
+    def _try_acquire(self, tokens):
+        """
+        Reserve a request (and tokens) if the window has room.
+
+        Returns:
+            (0, grant time) if reserved, otherwise (seconds to wait before trying again, None)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._evict(now)
+            wait = 0.0
+
+            if self.requests_per_minute and len(self._requests) >= self.requests_per_minute:
+                wait = self._requests[0] + self.window_seconds - now
+
+            # A request larger than the whole budget goes through once the window is empty
+            if (self.tokens_per_minute and tokens and self._tokens
+                    and self._token_total + tokens > self.tokens_per_minute):
+                freed = 0
+                needed = self._token_total + tokens - self.tokens_per_minute
+                token_wait = self._tokens[-1][0] + self.window_seconds - now
+                for timestamp, amount in self._tokens:
+                    freed += amount
+                    if freed >= needed:
+                        token_wait = timestamp + self.window_seconds - now
+                        break
+                wait = max(wait, token_wait)
+
+            if wait > 0:
+                return wait, None
+
+            self._requests.append(now)
+            if tokens:
+                self._tokens.append((now, tokens))
+                self._token_total += tokens
+            return 0.0, now
+
+    def wait_if_needed(self, tokens=0):
+        """
+        Block until a request (with the given token estimate) fits, then record it.
+
+        Returns:
+            time.monotonic() time the request was recorded at in the window
+        """
+        while True:
+            wait, granted = self._try_acquire(tokens)
+            if not wait:
+                return granted
+            # Sleep outside the lock so other workers are not blocked
+            time.sleep(max(wait, 0.01))
+
+    acquire = wait_if_needed
+
+    async def acquire_async(self, tokens=0):
+        """asyncio version of wait_if_needed (returns the grant time too)."""
+        while True:
+            wait, granted = self._try_acquire(tokens)
+            if not wait:
+                return granted
+            await asyncio.sleep(max(wait, 0.01))
+
+    def record_tokens(self, tokens):
+        """Add tokens known only after the response (e.g. output tokens) to the window."""
+        if not self.tokens_per_minute or tokens <= 0:
+            return
+        with self._lock:
+            self._tokens.append((time.monotonic(), tokens))
+            self._token_total += tokens
+
+    @property
+    def current_usage(self):
+        """(requests, tokens) currently in the window"""
+        with self._lock:
+            self._evict(time.monotonic())
+            return len(self._requests), self._token_total
+
+
+class ProcessSharedRateLimiter:
+    """
+    Requests-per-minute limiter shared by several processes.
+
+    The last requests_per_minute request times live in a ring buffer in shared
+    memory: a request may start once the slot it would overwrite (the oldest
+    request) has left the window. Create it in the parent and hand it to the
+    workers at process start (Process args or a pool initializer).
+    """
+
+    def __init__(self, requests_per_minute=60, window_seconds=60.0, context=None):
+        context = context or multiprocessing.get_context()
+        self.requests_per_minute = requests_per_minute
+        self.window_seconds = window_seconds
+        self._times = context.Array("d", [float("-inf")] * max(requests_per_minute or 0, 1), lock=False)
+        self._next = context.Value("i", 0, lock=False)
+        self._lock = context.Lock()
+
+    def _try_acquire(self, tokens=0):
+        """Reserve a request slot: (0, grant time) if reserved, otherwise (seconds to wait, None)"""
+        if not self.requests_per_minute:
+            return 0.0, time.monotonic()
+        with self._lock:
+            now = time.monotonic()
+            oldest = self._times[self._next.value]
+            if oldest > now - self.window_seconds:
+                return oldest + self.window_seconds - now, None
+            self._times[self._next.value] = now
+            self._next.value = (self._next.value + 1) % self.requests_per_minute
+            return 0.0, now
+
+    def wait_if_needed(self, tokens=0):
+        """
+        Block until a request fits in the shared window, then record it (tokens are not limited).
+
+        Returns:
+            time.monotonic() time the request was recorded at (system-wide clock, comparable across processes)
+        """
+        while True:
+            wait, granted = self._try_acquire(tokens)
+            if not wait:
+                return granted
+            time.sleep(max(wait, 0.01))
+
+    acquire = wait_if_needed
+
+    @property
+    def current_usage(self):
+        """(requests, tokens) currently in the window"""
+        with self._lock:
+            window_start = time.monotonic() - self.window_seconds
+            return sum(1 for t in self._times if t > window_start), 0
+
+
+def shared_limiter(name, requests_per_minute=60, tokens_per_minute=None):
+    """Get the process-wide limiter for name, creating it on first use."""
+    with _shared_lock:
+        if name not in _shared_limiters:
+            _shared_limiters[name] = RateLimiter(requests_per_minute, tokens_per_minute)
+        return _shared_limiters[name]
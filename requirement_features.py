@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+Requirement-text features (education, majors, new-grad, experience) in one pass.
+
+    from requirement_features import extract_requirement_features
+
+    features = extract_requirement_features(df['专业要求'])
+    features['education']         # ['PhD', 'Master'] per row
+    features['experience_years']  # 3 / <NA>
+
+All keyword lists are compiled into one trie-shaped regex, so each lowercased
+text is scanned once and every keyword it contains is found together (a hit
+also covers the shorter keywords that are its prefixes). Keywords match as
+substrings, like the `keyword in text` checks they replace. The graduation-year
+and experience regexes only run on the rows whose scan found their trigger
+words (a new-grad keyword / "year").
+"""
+import re
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# 学历关键词
+EDUCATION_KEYWORDS = {
+    'Bachelor': ['bachelor', "bachelor's", 'bs', 'b.s.', 'ba', 'b.a.', 'undergraduate'],
+    'Master': ['master', "master's", 'ms', 'm.s.', 'ma', 'm.a.', 'mba', 'm.sc.', 'meng'],
+    'PhD': ['phd', 'ph.d', 'ph.d.', 'doctorate', 'doctoral', 'd.phil'],
+    'Associate': ['associate', 'aa', 'a.a.', 'as', 'a.s.'],
+    'High School': ['high school', 'hs', 'h.s.', 'diploma']
+}
+
+# Order of the degrees in the education feature
+EDUCATION_PRIORITY = ['PhD', 'Master', 'Bachelor', 'Associate', 'High School']
+
+# 专业关键词
+MAJOR_KEYWORDS = {
+    'Computer Science': ['computer science', 'cs', 'computing', 'software engineering'],
+    'Data Science': ['data science', 'data analytics', 'data analysis'],
+    'Mathematics': ['mathematics', 'math', 'statistics', 'statistical'],
+    'Engineering': ['engineering', 'engineer', 'electrical engineering', 'mechanical engineering'],
+    'AI/ML': ['artificial intelligence', 'machine learning', 'ai', 'ml', 'deep learning', 'neural network'],
+    'Business': ['business', 'mba', 'management', 'finance', 'economics'],
+    'Physics': ['physics', 'physical'],
+    'Information Systems': ['information systems', 'information technology', 'it', 'mis']
+}
+
+# 文科专业关键词
+LIBERAL_ARTS_KEYWORDS = {
+    'Liberal Arts': ['liberal arts', 'humanities', 'arts', 'literature', 'english', 'history', 'philosophy'],
+    'Social Sciences': ['psychology', 'sociology', 'anthropology', 'political science', 'international relations'],
+    'Communication': ['communication', 'journalism', 'media studies', 'public relations'],
+    'Education': ['education', 'teaching', 'pedagogy'],
+    'Languages': ['linguistics', 'language', 'translation', 'interpretation'],
+    'Design': ['design', 'graphic design', 'industrial design', 'user experience', 'ux', 'ui'],
+    'Business (Non-STEM)': ['business administration', 'marketing', 'advertising', 'public relations'],
+    'Law': ['law', 'legal', 'jurisprudence'],
+    'Arts': ['fine arts', 'visual arts', 'performing arts', 'music', 'theater', 'drama']
+}
+
+# 应届生关键词
+NEW_GRAD_KEYWORDS = ['new grad', 'new graduate', 'recent graduate', 'recent grad',
+                     'entry level', 'entry-level', 'college graduate', 'university graduate',
+                     'graduating', 'graduation', 'class of']
+
+# 毕业年份要求
+GRADUATION_YEAR_PATTERNS = [re.compile(p) for p in [
+    r'class of\s+(\d{4})',
+    r'graduat(?:ed|ing|ion)\s+(?:in|from)\s+(\d{4})',
+    r'(\d{4})\s+graduate',
+    r'graduate\s+of\s+(\d{4})',
+]]
+
+# 工作经验要求（每个模式都含 "year"）
+EXPERIENCE_PATTERNS = [re.compile(p) for p in [
+    r'(\d+)\+?\s*years?\s*(?:of)?\s*(?:experience|exp|work)',
+    r'(\d+)\+?\s*years?\s*(?:in|of)',
+    r'minimum\s+of\s+(\d+)\s*years?',
+    r'at least\s+(\d+)\s*years?',
+    r'(\d+)\s*-\s*(\d+)\s*years?\s*(?:of)?\s*(?:experience|exp)',
+]]
+EXPERIENCE_TRIGGER = 'year'
+
+FEATURE_COLUMNS = ['education', 'majors', 'liberal_arts', 'new_grad', 'graduation_year', 'experience_years']
+
+
+def _trie_regex(keywords):
+    """Regex matching the longest of keywords at a position (alternatives nested by common prefix)"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:  # a keyword ends here: the longer continuations are optional (tried first)
+            return ('(?:' + body + ')?') if len(branches) == 1 else body + '?'
+        return body
+
+    return build(trie)
+
+
+class KeywordScanner:
+    """All keyword -> label lists of a set of features, found in one scan per text"""
+
+    def __init__(self, feature_keywords):
+        """
+        Args:
+            feature_keywords: {feature: {label: [keyword, ...]}} (label order is kept per feature)
+        """
+        self.labels = [(feature, label) for feature, groups in feature_keywords.items() for label in groups]
+        keyword_bits = {}
+        for bit, (feature, label) in enumerate(self.labels):
+            for keyword in feature_keywords[feature][label]:
+                keyword_bits[keyword] = keyword_bits.get(keyword, 0) | (1 << bit)
+
+        # Every keyword starting where a longer one matched is a prefix of it
+        self.masks = {}
+        for keyword in keyword_bits:
+            mask = 0
+            for other, bits in keyword_bits.items():
+                if keyword.startswith(other):
+                    mask |= bits
+            self.masks[keyword] = mask
+        self.pattern = re.compile('(?=(' + _trie_regex(keyword_bits) + '))')
+        self._decoded = {}
+
+    def scan(self, text_lower):
+        """Label bitmask of a lowercased text"""
+        masks = self.masks
+        mask = 0
+        for keyword in set(self.pattern.findall(text_lower)):
+            mask |= masks[keyword]
+        return mask
+
+    def decode(self, mask):
+        """{feature: [labels]} of a bitmask"""
+        if mask not in self._decoded:
+            decoded = {}
+            for bit, (feature, label) in enumerate(self.labels):
+                if mask >> bit & 1:
+                    decoded.setdefault(feature, []).append(label)
+            self._decoded[mask] = decoded
+        return self._decoded[mask]
+
+
+_SCANNER = KeywordScanner({
+    'education': {degree: EDUCATION_KEYWORDS[degree] for degree in EDUCATION_PRIORITY},
+    'majors': MAJOR_KEYWORDS,
+    'liberal_arts': LIBERAL_ARTS_KEYWORDS,
+    'new_grad': {True: NEW_GRAD_KEYWORDS},
+    'experience': {True: [EXPERIENCE_TRIGGER]},
+})
+
+
+def graduation_year(text, text_lower, current_year):
+    """Required graduation year of a new-grad posting (None if it names none)"""
+    for pattern in GRADUATION_YEAR_PATTERNS:
+        match = pattern.search(text_lower)
+        if match:
+            year = int(match.group(1))
+            if 2020 <= year <= current_year + 1:  # 合理的年份范围
+                return year
+    # 没有具体年份时，检查是否提到2024或2025年毕业
+    if '2025' in text:
+        return 2025
+    if '2024' in text:
+        return 2024
+    return None
+
+
+def experience_years(text_lower):
+    """Most common required years of experience (the first range's minimum if only ranges are given)"""
+    years_required = []
+    for pattern in EXPERIENCE_PATTERNS:
+        for match in pattern.finditer(text_lower):
+            if len(match.groups()) == 2:  # 范围，如 "3-5 years"
+                years_required.append((int(match.group(1)), int(match.group(2))))
+            else:
+                years = int(match.group(1))
+                if 0 <= years <= 20:  # 合理的范围
+                    years_required.append(years)
+
+    single_years = [y for y in years_required if isinstance(y, int)]
+    if single_years:
+        return Counter(single_years).most_common(1)[0][0]
+    ranges = [y for y in years_required if isinstance(y, tuple)]
+    if ranges:
+        return ranges[0][0]
+    return None
+
+
+def text_features(text, current_year):
+    """Feature tuple (FEATURE_COLUMNS order) of one requirement text"""
+    if not isinstance(text, str):
+        return [], [], [], False, None, None
+    text_lower = text.lower()
+    found = _SCANNER.decode(_SCANNER.scan(text_lower))
+    is_new_grad = 'new_grad' in found
+    return (
+        found.get('education', []),
+        found.get('majors', []),
+        found.get('liberal_arts', []),
+        is_new_grad,
+        graduation_year(text, text_lower, current_year) if is_new_grad else None,
+        experience_years(text_lower) if 'experience' in found else None,
+    )
+
+
+def extract_requirement_features(texts, current_year=None):
+    """
+    Education / major / new-grad / experience features of a requirements column.
+
+    Each distinct text is scanned once and its features are broadcast to the
+    rows that share it (the label lists are shared too; treat them as read-only).
+
+    Args:
+        texts: Series (or list) of requirement texts; non-strings give empty features
+        current_year: Latest plausible graduation year - 1 (default: this year)
+
+    Returns:
+        DataFrame on the same index with columns
+        education, majors, liberal_arts (label lists), new_grad (bool),
+        graduation_year and experience_years (Int64, <NA> when not stated)
+    """
+    if current_year is None:
+        current_year = datetime.now().year
+    texts = texts if isinstance(texts, pd.Series) else pd.Series(list(texts), dtype=object)
+
+    codes, uniques = pd.factorize(texts)
+    rows = [text_features(text, current_year) for text in uniques]
+    rows.append(text_features(None, current_year))  # missing values (code -1)
+    table = pd.DataFrame(rows, columns=FEATURE_COLUMNS)
+    table['new_grad'] = table['new_grad'].astype(bool)
+    for column in ['graduation_year', 'experience_years']:
+        table[column] = pd.array([row[FEATURE_COLUMNS.index(column)] for row in rows], dtype='Int64')
+
+    features = table.take(np.where(codes < 0, len(uniques), codes))
+    features.index = texts.index
+    return features
@@ -0,0 +1,57 @@
+"""
+Per-run state passed through the scraper and checkpoint APIs.
+
+    from run_context import RunContext
+
+    ctx = RunContext.for_country("uk")
+    checkpoint = load_checkpoint(ctx)
+    jobs, *_ = fetch_linkedin_list_with_checkpoint(KEYWORDS, locations, ctx=ctx)
+    enrich_job_details_with_checkpoint(jobs, ctx=ctx)
+
+A RunContext holds the checkpoint/stage files, the company cache and the limits
+of one run, so several runs (e.g. one per country) can share an interpreter or
+run in parallel processes without touching module globals. Settings left as
+None fall back to the config/scraper defaults.
+"""
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from config import get_country_output_paths
+
+
+@dataclass
+class RunContext:
+    """Output directory, company cache and limits of one run"""
+    output_dir: str
+    cache_file: Optional[str] = None        # company size cache (None = config.CACHE_FILE)
+    max_pages: Optional[int] = None         # list pages per keyword/location (None = config.MAX_PAGES)
+    request_delay: Optional[float] = None   # pause between requests (None = config.REQUEST_DELAY)
+    limiter: Optional[Any] = None           # ZenRows rate limiter (None = the process-wide one)
+
+    @classmethod
+    def for_country(cls, country_code, **settings):
+        """Context writing to outputs/<RUN_ID>/<COUNTRY>, with the country's own company cache"""
+        paths = get_country_output_paths(country_code)
+        settings.setdefault("cache_file", paths["cache_file"])
+        return cls(paths["dir"], **settings)
+
+    @property
+    def checkpoint_file(self):
+        return f"{self.output_dir}/checkpoint.json"
+
+    @property
+    def stage1_raw_file(self):
+        return f"{self.output_dir}/stage1_raw_data.json"
+
+    @property
+    def stage1_unique_file(self):
+        return f"{self.output_dir}/stage1_unique_data.json"
+
+    @property
+    def stage2_detail_file(self):
+        return f"{self.output_dir}/stage2_detail_data.json"
+
+    def setting(self, name, default):
+        """The context's value for name, or default when it is not set"""
+        value = getattr(self, name)
+        return default if value is None else value
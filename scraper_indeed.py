@@ -6,8 +6,14 @@ import urllib.parse
 from bs4 import BeautifulSoup
 from config import (
     LOCATION, MAX_PAGES, REQUEST_DELAY, ZENROWS_API_KEY, ZENROWS_BASE_URL,
-    LIST_LIMIT, DETAIL_LIMIT, CACHE_FILE, ERROR_LOG
+    LIST_LIMIT, DETAIL_LIMIT, CACHE_FILE, ERROR_LOG,
+    ZENROWS_REQUESTS_PER_MINUTE
 )
+from rate_limiter import shared_limiter
+from metrics import get_metrics
+
+# One ZenRows budget shared by every fetcher in this process
+zenrows_limiter = shared_limiter("zenrows", ZENROWS_REQUESTS_PER_MINUTE)
 
 # Basic utilities
 def zenrows_get(url, retries=3, delay=2):
@@ -21,14 +27,18 @@ def zenrows_get(url, retries=3, delay=2):
                 'js_render': 'true',  # Indeed may need JS rendering
                 'premium_proxy': 'true',  # Use premium proxy
             }
-            r = requests.get(ZENROWS_BASE_URL, params=params, timeout=30)
+            zenrows_limiter.wait_if_needed()
+            with get_metrics().timer("fetch.zenrows"):
+                r = requests.get(ZENROWS_BASE_URL, params=params, timeout=30)
             if r.status_code == 200:
                 return r.text
             elif r.status_code == 400:
                 # 400 error, try without extra parameters
                 print(f"ZenRows 400错误，尝试简化参数...")
                 params_simple = {'url': url, 'apikey': ZENROWS_API_KEY}
-                r2 = requests.get(ZENROWS_BASE_URL, params=params_simple, timeout=30)
+                zenrows_limiter.wait_if_needed()
+                with get_metrics().timer("fetch.zenrows"):
+                    r2 = requests.get(ZENROWS_BASE_URL, params=params_simple, timeout=30)
                 if r2.status_code == 200:
                     return r2.text
                 else:
@@ -40,6 +50,7 @@ def zenrows_get(url, retries=3, delay=2):
                     print(f"错误响应: {r.text[:200]}")
         except Exception as e:
             print(f"请求异常 第{attempt+1}次: {str(e)}")
+        get_metrics().inc("fetch.zenrows.failed_attempts")
         time.sleep(delay * (attempt + 1))
     return None
 
@@ -5,8 +5,14 @@ import json
 from bs4 import BeautifulSoup
 from config import (
     LOCATION, MAX_PAGES, REQUEST_DELAY, ZENROWS_API_KEY, ZENROWS_BASE_URL,
-    LIST_LIMIT, DETAIL_LIMIT, CACHE_FILE, ERROR_LOG
+    LIST_LIMIT, DETAIL_LIMIT, CACHE_FILE, ERROR_LOG,
+    ZENROWS_REQUESTS_PER_MINUTE
 )
+from rate_limiter import shared_limiter
+from metrics import get_metrics
+
+# One ZenRows budget shared by every fetcher in this process
+zenrows_limiter = shared_limiter("zenrows", ZENROWS_REQUESTS_PER_MINUTE)
 
 # Basic utilities
 def zenrows_get(url, retries=3, delay=2):
@@ -14,13 +20,16 @@ def zenrows_get(url, retries=3, delay=2):
     for attempt in range(retries):
         try:
             params = {'url': url, 'apikey': ZENROWS_API_KEY}
-            r = requests.get(ZENROWS_BASE_URL, params=params, timeout=30)
+            zenrows_limiter.wait_if_needed()
+            with get_metrics().timer("fetch.zenrows"):
+                r = requests.get(ZENROWS_BASE_URL, params=params, timeout=30)
             if r.status_code == 200:
                 return r.text
             else:
                 print(f"ZenRows 请求失败[{r.status_code}] 第{attempt+1}次: {url}")
         except Exception as e:
             print(f"请求异常 第{attempt+1}次: {str(e)}")
+        get_metrics().inc("fetch.zenrows.failed_attempts")
         time.sleep(delay * (attempt + 1))
     return None
 
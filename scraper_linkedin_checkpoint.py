@@ -11,51 +11,69 @@ from bs4 import BeautifulSoup
 from config import (
     MAX_PAGES, REQUEST_DELAY, ZENROWS_BASE_URL,
     LIST_LIMIT, DETAIL_LIMIT, CACHE_FILE, ERROR_LOG,
-    get_zenrows_api_key
+    get_zenrows_api_key, ZENROWS_REQUESTS_PER_MINUTE
 )
+from rate_limiter import shared_limiter
+from metrics import get_metrics
 from checkpoint_manager import (
     save_checkpoint, load_checkpoint, save_stage1_raw_data, load_stage1_raw_data,
     get_processed_urls, add_processed_job
 )
 
+# One ZenRows budget shared by every fetcher in this process
+zenrows_limiter = shared_limiter("zenrows", ZENROWS_REQUESTS_PER_MINUTE)
+
 # Basic utilities
-def zenrows_get(url, retries=3, delay=2):
-    """ZenRows request with retry mechanism"""
+def zenrows_get(url, retries=3, delay=2, limiter=None):
+    """ZenRows request with retry mechanism (limiter defaults to the process-wide ZenRows limiter)"""
     api_key = get_zenrows_api_key()  # Validate API key when actually used
+    limiter = limiter or zenrows_limiter
     for attempt in range(retries):
         try:
             params = {'url': url, 'apikey': api_key}
-            r = requests.get(ZENROWS_BASE_URL, params=params, timeout=30)
+            limiter.wait_if_needed()
+            with get_metrics().timer("fetch.zenrows"):
+                r = requests.get(ZENROWS_BASE_URL, params=params, timeout=30)
             if r.status_code == 200:
                 return r.text
             else:
                 print(f"ZenRows request failed [{r.status_code}] attempt {attempt+1}: {url}")
         except Exception as e:
             print(f"Request exception attempt {attempt+1}: {str(e)}")
+        get_metrics().inc("fetch.zenrows.failed_attempts")
         time.sleep(delay * (attempt + 1))
     return None
 
 
-def load_cache():
+def _setting(ctx, name, default):
+    """Run context setting, or the module default without a context"""
+    return ctx.setting(name, default) if ctx is not None else default
+
+
+def load_cache(ctx=None):
     try:
-        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+        with open(_setting(ctx, "cache_file", CACHE_FILE), "r", encoding="utf-8") as f:
             return json.load(f)
     except:
         return {}
 
-def save_cache(cache):
-    with open(CACHE_FILE, "w", encoding="utf-8") as f:
+def save_cache(cache, ctx=None):
+    with open(_setting(ctx, "cache_file", CACHE_FILE), "w", encoding="utf-8") as f:
         json.dump(cache, f, ensure_ascii=False, indent=2)
 
 
 # Scrape LinkedIn job listings with checkpoint support
-def fetch_linkedin_list_with_checkpoint(keywords, locations, start_location_index=0, start_keyword_index=0, start_page=0, use_merged_keywords=True):
+def fetch_linkedin_list_with_checkpoint(keywords, locations, start_location_index=0, start_keyword_index=0, start_page=0, use_merged_keywords=True, ctx=None):
     """
     Scrape LinkedIn job listings page, supports multiple locations, resume from specified location/keyword/page
     If use_merged_keywords=True, combine all keywords with OR logic to reduce duplicate API calls
+    ctx (RunContext) selects the checkpoint files, page limit, delay and rate limiter of this run
     Returns: (all_jobs, completed_locations, completed_keywords, final_location_index, final_keyword_index, final_page)
     """
-    all_jobs = load_stage1_raw_data()  # Load existing data
+    max_pages = _setting(ctx, "max_pages", MAX_PAGES)
+    request_delay = _setting(ctx, "request_delay", REQUEST_DELAY)
+    limiter = _setting(ctx, "limiter", None)
+    all_jobs = load_stage1_raw_data(ctx)  # Load existing data
     
     # Build seen set from existing data (real-time deduplication)
     seen = set()
@@ -114,7 +132,7 @@ def fetch_linkedin_list_with_checkpoint(keywords, locations, start_location_inde
             consecutive_zero_pages = 0  # Track consecutive pages with 0 new jobs
             location_new_count = 0  # Track new jobs for this location
             
-            for page in range(start_from_page, MAX_PAGES):
+            for page in range(start_from_page, max_pages):
                 start = page * 25
                 if len(all_jobs) + len(results) >= LIST_LIMIT:
                     break
@@ -129,13 +147,14 @@ def fetch_linkedin_list_with_checkpoint(keywords, locations, start_location_inde
                 location_encoded = location.replace(' ', '%20')
                 url = f"https://www.linkedin.com/jobs/search?keywords={keyword_encoded}&location={location_encoded}&start={start}"
                 
-                html = zenrows_get(url)
+                html = zenrows_get(url, limiter=limiter)
                 if not html:
                     print(f"Location {loc_idx+1}/{len(locations)} {location}: Page {page + 1} scraping failed")
                     continue
                 
-                soup = BeautifulSoup(html, 'html.parser')
-                cards = soup.find_all('div', class_='base-card')
+                with get_metrics().timer("parse.list_page"):
+                    soup = BeautifulSoup(html, 'html.parser')
+                    cards = soup.find_all('div', class_='base-card')
                 
                 # Check if there are still results
                 if not cards or len(cards) == 0:
@@ -204,20 +223,21 @@ def fetch_linkedin_list_with_checkpoint(keywords, locations, start_location_inde
                 
                 # Save checkpoint and data after each page (only save unique jobs)
                 all_jobs.extend(results)
-                save_stage1_raw_data(all_jobs)
+                save_stage1_raw_data(all_jobs, ctx)
                 # Save checkpoint: save current completed page (resume from page+1 next time)
                 save_checkpoint(
                     stage="stage1_list",
+                    ctx=ctx,
                     current_location_index=loc_idx,
                     current_keyword_index=kw_idx,
                     current_page=page,  # Current completed page (0-based), resume from page+1 next time
                     completed_locations=completed_locations,
-                    completed_keywords=completed_keywords + [keyword] if page == MAX_PAGES - 1 else completed_keywords,
+                    completed_keywords=completed_keywords + [keyword] if page == max_pages - 1 else completed_keywords,
                     total_jobs_count=len(all_jobs)
                 )
                 results = []  # Clear, already saved to all_jobs
                 
-                time.sleep(REQUEST_DELAY)
+                time.sleep(request_delay)
             
             # Display location summary (only if new jobs found)
             if location_new_count > 0:
@@ -357,7 +377,7 @@ def normalize_company_url(company_url):
     
     return company_url
 
-def get_company_size(company_name, company_url, cache):
+def get_company_size(company_name, company_url, cache, ctx=None):
     """Get company size (employee count)"""
     if not company_name or not company_url:
         return ''
@@ -375,10 +395,10 @@ def get_company_size(company_name, company_url, cache):
     
     normalized_url = normalize_company_url(company_url)
     full_url = "https://www.linkedin.com" + normalized_url if normalized_url.startswith("/company/") else normalized_url
-    html = zenrows_get(full_url)
+    html = zenrows_get(full_url, limiter=_setting(ctx, "limiter", None))
     if not html:
         cache[company_name] = ''
-        save_cache(cache)
+        save_cache(cache, ctx)
         return ''
     
     soup = BeautifulSoup(html, "html.parser")
@@ -396,7 +416,7 @@ def get_company_size(company_name, company_url, cache):
                             if isinstance(emp_data, dict) and 'value' in emp_data:
                                 employee_num = int(emp_data['value'])
                                 cache[company_name] = str(employee_num)
-                                save_cache(cache)
+                                save_cache(cache, ctx)
                                 return str(employee_num)
             elif isinstance(data, dict) and data.get('@type') == 'Organization':
                 if 'numberOfEmployees' in data:
@@ -404,7 +424,7 @@ def get_company_size(company_name, company_url, cache):
                     if isinstance(emp_data, dict) and 'value' in emp_data:
                         employee_num = int(emp_data['value'])
                         cache[company_name] = str(employee_num)
-                        save_cache(cache)
+                        save_cache(cache, ctx)
                         return str(employee_num)
         except:
             continue
@@ -416,7 +436,7 @@ def get_company_size(company_name, company_url, cache):
         num = extract_employee_number(text)
         if num:
             cache[company_name] = num
-            save_cache(cache)
+            save_cache(cache, ctx)
             return num
     
     # Method 3: Find all elements containing "employees"
@@ -426,7 +446,7 @@ def get_company_size(company_name, company_url, cache):
             num = extract_employee_number(text)
             if num:
                 cache[company_name] = num
-                save_cache(cache)
+                save_cache(cache, ctx)
                 return num
     
     # Method 4: String node
@@ -436,21 +456,24 @@ def get_company_size(company_name, company_url, cache):
         num = extract_employee_number(text)
         if num:
             cache[company_name] = num
-            save_cache(cache)
+            save_cache(cache, ctx)
             return num
     
     cache[company_name] = ''
-    save_cache(cache)
+    save_cache(cache, ctx)
     return ''
 
 
-def enrich_job_details_with_checkpoint(job_list, start_index=0):
+def enrich_job_details_with_checkpoint(job_list, start_index=0, ctx=None):
     """
     Enrich job details, supports resuming from specified index
     Automatically skip already processed jobs
+    ctx (RunContext) selects the checkpoint files, company cache, delay and rate limiter of this run
     """
-    cache = load_cache()
-    processed_urls = get_processed_urls()
+    request_delay = _setting(ctx, "request_delay", REQUEST_DELAY)
+    limiter = _setting(ctx, "limiter", None)
+    cache = load_cache(ctx)
+    processed_urls = get_processed_urls(ctx)
     
     print(f"\nStarting detail page scraping ({len(job_list)} jobs total, starting from job {start_index+1})")
     
@@ -476,6 +499,7 @@ def enrich_job_details_with_checkpoint(job_list, start_index=0):
             if (idx + 1) % 5 == 0 or idx == len(job_list) - 1:
                 save_checkpoint(
                     stage="stage2_detail",
+                    ctx=ctx,
                     processed_count=idx + 1,
                     total_count=len(job_list)
                 )
@@ -485,7 +509,7 @@ def enrich_job_details_with_checkpoint(job_list, start_index=0):
         if job_url in processed_urls:
             continue
         
-        html = zenrows_get(job_url)
+        html = zenrows_get(job_url, limiter=limiter)
         if not html:
             consecutive_failures += 1
             # Report each failure in PowerShell
@@ -498,6 +522,7 @@ def enrich_job_details_with_checkpoint(job_list, start_index=0):
             if (idx + 1) % 5 == 0 or idx == len(job_list) - 1:
                 save_checkpoint(
                     stage="stage2_detail",
+                    ctx=ctx,
                     processed_count=idx + 1,
                     total_count=len(job_list)
                 )
@@ -506,14 +531,17 @@ def enrich_job_details_with_checkpoint(job_list, start_index=0):
         # Reset consecutive failures on success
         consecutive_failures = 0
         
+        parse_started = time.perf_counter()
         soup = BeautifulSoup(html, 'html.parser')
 
         # Job description
         desc = soup.find('div', class_='show-more-less-html__markup')
         description = desc.get_text(separator=' ', strip=True) if desc else ''
         job["Job Description"] = description
+        get_metrics().observe("parse.detail_page", time.perf_counter() - parse_started)
 
         # Professional requirements
+        regex_started = time.perf_counter()
         requirements_text = ''
         req_patterns = [
             r'(?:requirements?|qualifications?|required|must have|minimum requirements?)[\s:]*\n?([^\n]{100,800})',
@@ -555,8 +583,10 @@ def enrich_job_details_with_checkpoint(job_list, start_index=0):
                 requirements_text = first_half[:500].strip()
         
         job["Requirements"] = requirements_text
+        get_metrics().observe("regex.requirements", time.perf_counter() - regex_started)
 
         # Salary logic (keep original complete logic)
+        regex_started = time.perf_counter()
         salary_raw = ''
         salary_tags = soup.find_all(string=re.compile(r'\$'))
         for tag in salary_tags:
@@ -656,16 +686,17 @@ def enrich_job_details_with_checkpoint(job_list, start_index=0):
         else:
             job["Salary Range"] = ''
             job["Estimated Annual Salary"] = ''
+        get_metrics().observe("regex.salary", time.perf_counter() - regex_started)
 
         # Company size
         company_tag = soup.find('a', href=re.compile(r'/company/'))
         if company_tag:
             company_url = company_tag['href']
-            size = get_company_size(job["Company Name"], company_url, cache)
+            size = get_company_size(job["Company Name"], company_url, cache, ctx)
             job["Company Size"] = size
         
         # Save processed job
-        add_processed_job(job)
+        add_processed_job(job, ctx)
         
         # Progress reporting: every 50 jobs or on last job
         current_progress = idx + 1
@@ -679,11 +710,12 @@ def enrich_job_details_with_checkpoint(job_list, start_index=0):
         if (idx + 1) % 5 == 0 or idx == len(job_list) - 1:
             save_checkpoint(
                 stage="stage2_detail",
+                ctx=ctx,
                 processed_count=idx + 1,
                 total_count=len(job_list)
             )
 
-        time.sleep(REQUEST_DELAY)
+        time.sleep(request_delay)
     
     print(f"\nDetail page scraping completed: Processed {len(job_list)} jobs")
     return job_list
@@ -4,9 +4,22 @@ Supabase数据存储模块
 将抓取的职位数据存储到Supabase数据库
 """
 import os
-from supabase import create_client, Client
-from typing import List, Dict, Optional
+import sys
+import json
+import hashlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, NamedTuple, TYPE_CHECKING
 from datetime import datetime
+from metrics import get_metrics, timed
+
+# The supabase client is imported in init_supabase() (it is slow to import);
+# callers still get ImportError here when the package is missing.
+if "supabase" not in sys.modules and importlib.util.find_spec("supabase") is None:
+    raise ImportError("No module named 'supabase'. Install with: pip install supabase")
+if TYPE_CHECKING:
+    from supabase import Client
+
 try:
     from config import SUPABASE_URL, SUPABASE_KEY
 except ImportError:
@@ -14,7 +27,7 @@ except ImportError:
     SUPABASE_KEY = os.getenv("SUPABASE_KEY", "")
 
 # 初始化Supabase客户端
-supabase: Optional[Client] = None
+supabase: Optional["Client"] = None
 
 def init_supabase():
     """初始化Supabase客户端（静默模式，不输出）"""
@@ -25,6 +38,7 @@ def init_supabase():
             "SUPABASE_URL=your_supabase_url\n"
             "SUPABASE_KEY=your_supabase_anon_key"
         )
+    from supabase import create_client
     supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
 
 def prepare_job_data(job: Dict) -> Dict:
@@ -67,68 +81,178 @@ def get_country_table(country_code: str) -> str:
     }
     return country_table_map.get(country_code.lower(), "jobs")  # 默认使用jobs表（美国）
 
-def upsert_jobs(jobs: List[Dict], batch_size: int = 100, country_code: str = "us") -> tuple[int, int]:
+# 参与内容哈希的字段（时间戳不参与）
+HASH_FIELDS = [
+    "job_title", "company_name", "location", "job_description", "requirements",
+    "salary_range", "estimated_annual_salary", "team_size", "company_size",
+    "posted_date", "job_status", "platform", "job_url",
+]
+
+# 查询已有哈希时每个请求携带的职位名称数（避免URL过长）
+HASH_LOOKUP_CHUNK = 100
+# 查询已有哈希时每页的行数（不超过 PostgREST 的 max-rows，Supabase 默认 1000）
+HASH_LOOKUP_PAGE_SIZE = 1000
+
+
+class UpsertStats(NamedTuple):
+    """upsert_jobs 的结果统计"""
+    inserted: int
+    updated: int
+    skipped: int
+    failed: int
+
+
+def compute_content_hash(job_data: Dict) -> str:
+    """职位内容哈希（用于判断数据库中的行是否需要更新）"""
+    payload = json.dumps(
+        {field: job_data.get(field, "") for field in HASH_FIELDS},
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _job_key(job_data: Dict) -> tuple:
+    return (job_data.get("job_title", ""), job_data.get("company_name", ""))
+
+
+def _fetch_existing_hashes(table_name: str, keys: List[tuple], max_workers: int, errors: List[str]) -> Dict[tuple, Optional[str]]:
+    """查询已存在职位的内容哈希：(职位名称, 公司名称) -> content_hash"""
+    titles = sorted({title for title, _ in keys})
+    wanted = set(keys)
+    chunks = [titles[i:i + HASH_LOOKUP_CHUNK] for i in range(0, len(titles), HASH_LOOKUP_CHUNK)]
+
+    def lookup(chunk):
+        # 按 id 分页：常见职位名称在各公司下的行数会超过单次响应的行数上限
+        rows = []
+        last_id = None
+        while True:
+            query = supabase.table(table_name).select(
+                "id, job_title, company_name, content_hash"
+            ).in_("job_title", chunk)
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            page = query.order("id").limit(HASH_LOOKUP_PAGE_SIZE).execute().data or []
+            rows.extend(page)
+            if len(page) < HASH_LOOKUP_PAGE_SIZE:
+                return rows
+            last_id = page[-1]["id"]
+
+    existing = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(lookup, chunk): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            try:
+                rows = future.result()
+            except Exception as e:
+                errors.append(f"查询已有数据失败: {str(e)}")
+                raise
+            for row in rows:
+                key = (row.get("job_title", ""), row.get("company_name", ""))
+                if key in wanted:
+                    existing[key] = row.get("content_hash")
+    return existing
+
+
+def _upsert_with_bisect(table_name: str, rows: List[Dict], errors: List[str]) -> List[Dict]:
+    """
+    写入一批数据；失败时二分重试，最终只有真正有问题的行失败。
+
+    返回: 写入失败的行
+    """
+    try:
+        supabase.table(table_name).upsert(rows, on_conflict="job_title,company_name").execute()
+        return []
+    except Exception as e:
+        if len(rows) == 1:
+            errors.append(f"单条写入失败: {rows[0].get('job_title', 'Unknown')} - {str(e)}")
+            return rows
+        mid = len(rows) // 2
+        return (_upsert_with_bisect(table_name, rows[:mid], errors)
+                + _upsert_with_bisect(table_name, rows[mid:], errors))
+
+
+@timed("storage.supabase_upsert")
+def upsert_jobs(jobs: List[Dict], batch_size: int = 500, country_code: str = "us", max_workers: int = 4) -> UpsertStats:
     """
     批量插入或更新职位数据（UPSERT）
     使用职位名称+公司名称作为唯一键进行去重
-    
+
+    每行计算内容哈希，与数据库中已存储的哈希相同的行直接跳过（不改写、不更新updated_at），
+    只有新增和变化的行按批次并发写入；批次失败时二分定位出错的行。
+
     参数:
         jobs: 职位数据列表
         batch_size: 批次大小
         country_code: 国家代码 (us, uk, ca, sg, hk)
-    
-    返回: (插入数量, 更新数量)
+        max_workers: 并发请求数
+
+    返回: UpsertStats(inserted, updated, skipped, failed)
     """
     if not supabase:
         init_supabase()
-    
+
     table_name = get_country_table(country_code)
-    inserted_count = 0
-    updated_count = 0
     errors = []
-    
-    # 分批处理，避免单次请求过大
-    for i in range(0, len(jobs), batch_size):
-        batch = jobs[i:i + batch_size]
-        batch_data = []
-        
-        for job in batch:
-            try:
-                job_data = prepare_job_data(job)
-                batch_data.append(job_data)
-            except Exception as e:
-                errors.append(f"数据准备失败: {job.get('职位名称', 'Unknown')} - {str(e)}")
-                continue
-        
-        if not batch_data:
-            continue
-        
+
+    # 准备数据（同一唯一键只保留最后一条）
+    rows_by_key = {}
+    failed = 0
+    for job in jobs:
         try:
-            # 使用UPSERT：如果(job_title, company_name)已存在则更新，否则插入
-            result = supabase.table(table_name).upsert(
-                batch_data,
-                on_conflict="job_title,company_name"  # 冲突时更新
-            ).execute()
-            
-            # 统计插入和更新数量（Supabase upsert不直接返回，需要查询）
-            # 简化处理：假设都是新插入
-            inserted_count += len(batch_data)
-            
+            job_data = prepare_job_data(job)
         except Exception as e:
-            errors.append(f"批量插入失败 (批次 {i//batch_size + 1}): {str(e)}")
-            # 如果批量失败，尝试逐条插入
-            for job_data in batch_data:
-                try:
-                    supabase.table(table_name).upsert(job_data, on_conflict="job_title,company_name").execute()
-                    inserted_count += 1
-                except Exception as e2:
-                    errors.append(f"单条插入失败: {job_data.get('job_title', 'Unknown')} - {str(e2)}")
-    
+            errors.append(f"数据准备失败: {job.get('职位名称', 'Unknown')} - {str(e)}")
+            failed += 1
+            continue
+        # created_at 由数据库默认值生成，更新时保持不变
+        job_data.pop("created_at", None)
+        job_data["content_hash"] = compute_content_hash(job_data)
+        rows_by_key[_job_key(job_data)] = job_data
+
+    if not rows_by_key:
+        return UpsertStats(0, 0, 0, failed)
+
+    # 对比已存储的内容哈希
+    try:
+        existing = _fetch_existing_hashes(table_name, list(rows_by_key), max_workers, errors)
+        classified = True
+    except Exception:
+        # 无法查询时全部写入；无法区分新增/更新，按新增计
+        existing = {}
+        classified = False
+
+    new_keys = set()
+    changed_rows = []
+    skipped = 0
+    for key, job_data in rows_by_key.items():
+        if key in existing and existing[key] == job_data["content_hash"]:
+            skipped += 1
+            continue
+        if key not in existing:
+            new_keys.add(key)
+        changed_rows.append(job_data)
+
+    # 并发写入变化的行
+    batches = [changed_rows[i:i + batch_size] for i in range(0, len(changed_rows), batch_size)]
+    failed_keys = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for failed_rows in executor.map(lambda batch: _upsert_with_bisect(table_name, batch, errors), batches):
+            failed_keys.update(_job_key(row) for row in failed_rows)
+
+    written = [_job_key(row) for row in changed_rows if _job_key(row) not in failed_keys]
+    inserted = sum(1 for key in written if key in new_keys)
+    updated = len(written) - inserted if classified else 0
+
     if errors:
         # 静默处理错误，不输出到控制台
         pass
-    
-    return inserted_count, updated_count
+
+    stats = UpsertStats(inserted, updated, skipped, failed + len(failed_keys))
+    metrics = get_metrics()
+    for field, value in stats._asdict().items():
+        metrics.inc(f"storage.rows_{field}", value)
+    return stats
+
 
 def get_job_count(country_code: str = "us") -> int:
     """获取数据库中的职位总数"""
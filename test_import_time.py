@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+测试模块导入开销（python -X importtime）
+
+- 轻量工具（config、clear_checkpoint、check_data、main_merged）的导入时间不超过预算
+- 入口和报告脚本导入时不加载 pandas/bs4/matplotlib/docx/supabase/genai 等重依赖
+- 导入不产生副作用（不在当前目录创建 .last_run_id、checkpoint 等文件）
+
+每个模块都在新的子进程和临时目录中导入，取多次运行的最小值以减少抖动。
+运行: python test_import_time.py
+"""
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+JOBSPY_DIR = os.path.join(ROOT, "test_jobspy")
+
+# Cumulative import time budget per module (ms); generous so slow CI machines pass
+BUDGETS_MS = {
+    "config": 50,
+    "clear_checkpoint": 60,
+    "check_data": 60,
+    "checkpoint_manager": 80,
+    "main_merged": 150,
+}
+
+HEAVY_MODULES = [
+    "pandas", "numpy", "bs4", "matplotlib", "seaborn",
+    "docx", "supabase", "google.generativeai", "dotenv", "locations_config",
+]
+
+# Modules that must import without any heavy dependency (report scripts load theirs in main())
+LIGHT_MODULES = [
+    "config", "clear_checkpoint", "check_data", "main_merged",
+    "generate_supabase_report", "generate_local_report", "compare_datasets",
+]
+
+RUNS = 3
+
+
+def run_python(args, cwd):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([ROOT, JOBSPY_DIR, env.get("PYTHONPATH", "")])
+    result = subprocess.run([sys.executable] + args, cwd=cwd, env=env,
+                            capture_output=True, text=True, encoding="utf-8")
+    assert result.returncode == 0, result.stderr[-2000:]
+    return result
+
+
+def import_time_ms(module):
+    """Cumulative import time of module (ms), best of RUNS fresh interpreters"""
+    best = None
+    for _ in range(RUNS):
+        with tempfile.TemporaryDirectory() as cwd:
+            result = run_python(["-X", "importtime", "-c", f"import {module}"], cwd)
+        for line in result.stderr.splitlines():
+            # "import time:  self [us] | cumulative | imported package"
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                cumulative = int(parts[1]) / 1000
+                best = cumulative if best is None else min(best, cumulative)
+                break
+    assert best is not None, f"{module} missing from -X importtime output"
+    return best
+
+
+def test_import_time_budgets():
+    for module, budget in BUDGETS_MS.items():
+        elapsed = import_time_ms(module)
+        print(f"  {module}: {elapsed:.1f} ms (budget {budget} ms)")
+        assert elapsed <= budget, f"{module} imports in {elapsed:.1f} ms, budget {budget} ms"
+
+
+def test_no_heavy_dependencies():
+    code = ("import sys, json, {module}; "
+            "print(json.dumps([m for m in {heavy!r} if m in sys.modules]))")
+    for module in LIGHT_MODULES:
+        with tempfile.TemporaryDirectory() as cwd:
+            result = run_python(["-c", code.format(module=module, heavy=HEAVY_MODULES)], cwd)
+        loaded = json.loads(result.stdout.strip().splitlines()[-1])
+        print(f"  {module}: {loaded or 'no heavy dependencies'}")
+        assert not loaded, f"importing {module} loads {loaded}"
+
+
+def test_import_has_no_side_effects():
+    for module in ["main_merged", "check_data", "clear_checkpoint", "jobspy_max_scraper"]:
+        with tempfile.TemporaryDirectory() as cwd:
+            run_python(["-c", f"import {module}"], cwd)
+            created = os.listdir(cwd)
+        print(f"  {module}: {created or 'no files created'}")
+        assert not created, f"importing {module} created {created}"
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Import time tests")
+    print("=" * 60)
+    test_import_time_budgets()
+    test_no_heavy_dependencies()
+    test_import_has_no_side_effects()
+    print("[OK] All import time tests passed")
@@ -7,9 +7,11 @@ Provides Gemini API integration for job analysis.
 from .gemini_client import GeminiClient
 from .prompts import PromptManager
 from .batch_processor import BatchProcessor
+from .result_cache import ResultCache
 
 __all__ = [
     'GeminiClient',
     'PromptManager',
     'BatchProcessor',
+    'ResultCache',
 ]
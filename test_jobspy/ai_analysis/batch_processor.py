@@ -7,6 +7,8 @@ Supports checkpointing, progress tracking, and cost control.
 import os
 import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 from dataclasses import dataclass, asdict
@@ -42,6 +44,8 @@ class BatchProcessor:
     - Progress tracking
     - Cost estimation
     - Rate limiting
+    - Concurrent workers sharing the client's rate limiter and daily budget
+    - Packed requests (several jobs per prompt) with single-job fallback
     """
 
     def __init__(
@@ -50,6 +54,9 @@ class BatchProcessor:
         prompt_manager: PromptManager = None,
         checkpoint_dir: Optional[str] = None,
         checkpoint_interval: int = 10,
+        max_workers: int = 1,
+        job_retries: int = 1,
+        pack_size: int = 1,
     ):
         """
         Initialize batch processor.
@@ -59,10 +66,20 @@ class BatchProcessor:
             prompt_manager: PromptManager instance (optional)
             checkpoint_dir: Directory for checkpoint files
             checkpoint_interval: Save checkpoint every N jobs
+            max_workers: Number of concurrent analysis workers (1 = sequential)
+            job_retries: Extra attempts per job when analysis returns no result
+            pack_size: Jobs sent per request (1 = one request per job)
         """
         self.client = gemini_client
         self.prompt_manager = prompt_manager or PromptManager()
         self.checkpoint_interval = checkpoint_interval
+        self.max_workers = max(1, max_workers)
+        self.job_retries = max(0, job_retries)
+        self.pack_size = max(1, pack_size)
+
+        # Jobs that had to be re-sent on their own after a packed request
+        self._fallback_lock = threading.Lock()
+        self.fallback_count = 0
 
         # Checkpoint directory
         if checkpoint_dir:
@@ -130,31 +147,28 @@ class BatchProcessor:
         print(f"  Remaining: {total - processed}")
         print(f"{'=' * 50}\n")
 
-        # Process each job
-        for i, job in enumerate(collection):
-            # Skip already processed
-            if job.job_id in processed_ids or job._dedup_key in processed_ids:
-                continue
-
-            # Prepare job data for prompt
-            job_data = {
-                "title": job.title,
-                "company": job.company,
-                "location": job.location,
-                "salary_range": job.salary_range or "Not specified",
-                "description": job.description[:4000] if job.description else "No description",
-            }
+        pending = [
+            job for job in collection
+            if job.job_id not in processed_ids and job._dedup_key not in processed_ids
+        ]
+        groups = self._pack(pending)
+        started = time.time()
+        processed_before = processed
 
-            # Analyze with AI
-            result = self.client.analyze(prompt, job_data)
+        # Results are applied on this thread only, so processed_ids and the
+        # checkpoint only ever contain jobs whose analysis has finished.
+        def record(job: JobData, result: Optional[Dict[str, Any]]):
+            nonlocal processed
 
             if result:
                 job.ai_analysis = result
                 job.ai_analyzed = True
 
-            # Track progress
+            # Track progress (jobs skipped because the daily budget ran out
+            # stay out of processed_ids so they are picked up on resume)
             processed += 1
-            processed_ids.add(job.job_id or job._dedup_key)
+            if result or self.client.has_daily_quota():
+                processed_ids.add(job.job_id or job._dedup_key)
 
             # Progress callback
             if progress_callback:
@@ -168,14 +182,118 @@ class BatchProcessor:
             if processed % self.checkpoint_interval == 0:
                 self._save_checkpoint(batch_id, processed, total, list(processed_ids))
 
+        if self.pack_size > 1:
+            print(f"[BatchProcessor] Packing {self.pack_size} jobs per request ({len(groups)} requests)")
+
+        if self.max_workers <= 1:
+            for group in groups:
+                for job, result in zip(group, self.analyze_group(prompt, group)):
+                    record(job, result)
+        else:
+            print(f"[BatchProcessor] Running {self.max_workers} concurrent workers")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self.analyze_group, prompt, group): group for group in groups}
+                try:
+                    for future in as_completed(futures):
+                        for job, result in zip(futures[future], future.result()):
+                            record(job, result)
+                except KeyboardInterrupt:
+                    # Drop queued work; finished jobs are already in processed_ids
+                    for future in futures:
+                        future.cancel()
+                    self._save_checkpoint(batch_id, processed, total, list(processed_ids))
+                    raise
+
         # Final checkpoint
         self._save_checkpoint(batch_id, processed, total, list(processed_ids))
 
         # Print summary
-        self._print_summary(processed, total)
+        self._print_summary(processed, total, processed - processed_before, time.time() - started)
 
         return collection
 
+    @staticmethod
+    def job_prompt_data(job: JobData) -> Dict[str, Any]:
+        """Prepare job fields for the prompt template."""
+        return {
+            "title": job.title,
+            "company": job.company,
+            "location": job.location,
+            "salary_range": job.salary_range or "Not specified",
+            "description": job.description[:4000] if job.description else "No description",
+        }
+
+    def analyze_job(self, prompt: str, job: JobData, cache_checked: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Analyze a single job, retrying when no result comes back.
+
+        Safe to call from worker threads; the client's rate limiter and daily
+        counter are shared. Does not modify the job. Only the first attempt
+        looks the job up in the result cache (none if cache_checked).
+        """
+        job_data = self.job_prompt_data(job)
+
+        result = self.client.analyze(prompt, job_data, cache_checked=cache_checked)
+        attempt = 0
+        while not result and attempt < self.job_retries and self.client.has_daily_quota():
+            attempt += 1
+            time.sleep(self.client.BASE_RETRY_DELAY * attempt)
+            result = self.client.analyze(prompt, job_data, cache_checked=True)
+
+        return result
+
+    def analyze_group(self, prompt: str, jobs: List[JobData]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Analyze a group of jobs with one packed request.
+
+        Jobs missing from the packed response (or malformed) are re-sent on
+        their own via analyze_job. Safe to call from worker threads.
+
+        Returns:
+            Results in the same order as jobs
+        """
+        if len(jobs) == 1:
+            return [self.analyze_job(prompt, jobs[0])]
+
+        # Short ids keep the prompt small and are easy for the model to echo back
+        packed_ids = [f"J{i}" for i in range(1, len(jobs) + 1)]
+        packed = self.client.analyze_packed(
+            prompt,
+            {job_id: self.job_prompt_data(job) for job_id, job in zip(packed_ids, jobs)},
+        )
+
+        results = []
+        for job_id, job in zip(packed_ids, jobs):
+            result = packed.get(job_id)
+            if not result and self.client.has_daily_quota():
+                with self._fallback_lock:
+                    self.fallback_count += 1
+                # analyze_packed already counted its cache miss
+                result = self.analyze_job(prompt, job, cache_checked=True)
+            results.append(result)
+
+        return results
+
+    def analyze_jobs(self, prompt: str, jobs: List[JobData]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Analyze jobs without checkpointing, using packing and workers as configured.
+
+        Returns:
+            Results in the same order as jobs
+        """
+        groups = self._pack(jobs)
+        if self.max_workers <= 1 or len(groups) <= 1:
+            group_results = [self.analyze_group(prompt, group) for group in groups]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(groups))) as executor:
+                group_results = list(executor.map(lambda group: self.analyze_group(prompt, group), groups))
+
+        return [result for results in group_results for result in results]
+
+    def _pack(self, jobs: List[JobData]) -> List[List[JobData]]:
+        """Split jobs into groups of pack_size."""
+        return [jobs[i:i + self.pack_size] for i in range(0, len(jobs), self.pack_size)]
+
     def process_jobs(
         self,
         jobs: List[JobData],
@@ -250,9 +368,10 @@ class BatchProcessor:
         except Exception as e:
             print(f"[BatchProcessor] Error saving checkpoint: {e}")
 
-    def _print_summary(self, processed: int, total: int):
+    def _print_summary(self, processed: int, total: int, processed_this_run: int = 0, elapsed: float = 0.0):
         """Print processing summary."""
         stats = self.client.stats
+        jobs_analyzed = stats['jobs_analyzed']
 
         print(f"\n{'=' * 50}")
         print("Batch Processing Complete")
@@ -262,6 +381,18 @@ class BatchProcessor:
         print(f"  Input tokens: {stats['input_tokens']:,}")
         print(f"  Output tokens: {stats['output_tokens']:,}")
         print(f"  Estimated cost: ${stats['estimated_cost_usd']:.4f}")
+        if self.pack_size > 1:
+            print(f"  Pack size: {self.pack_size} (single-job fallbacks: {self.fallback_count})")
+        if stats['request_count']:
+            print(f"  Jobs per request: {jobs_analyzed / stats['request_count']:.2f}")
+        if jobs_analyzed:
+            print(f"  Cost per job: ${stats['estimated_cost_usd'] / jobs_analyzed:.6f}")
+            print(f"  API latency per job: {stats['total_latency_s'] / jobs_analyzed:.2f}s")
+        if processed_this_run:
+            print(f"  Wall time per job: {elapsed / processed_this_run:.2f}s")
+        if 'cache_hit_rate' in stats:
+            print(f"  Cache hit rate: {stats['cache_hit_rate']:.1%} "
+                  f"({stats['cache_hits']} hits, {stats['cache_entries']} cached results)")
         print(f"{'=' * 50}")
 
     def clear_checkpoint(self, batch_id: str) -> bool:
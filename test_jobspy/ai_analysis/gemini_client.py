@@ -2,21 +2,38 @@
 """
 Gemini API Client for job analysis.
 Supports rate limiting, retry logic, and cost tracking.
+The client is thread-safe and can be shared by concurrent analysis workers.
 """
 
 import time
 import json
+import threading
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
+from .result_cache import ResultCache
+
+# google.generativeai takes about a second to import, so it is only loaded
+# when the first GeminiClient is created
+genai = None
 try:
-    import google.generativeai as genai
-    HAS_GENAI = True
+    HAS_GENAI = importlib.util.find_spec("google.generativeai") is not None
 except ImportError:
     HAS_GENAI = False
+if not HAS_GENAI:
     print("[WARNING] google-generativeai not available. Install with: pip install google-generativeai")
 
 
+def _import_genai():
+    global genai
+    if genai is None:
+        import google.generativeai
+        genai = google.generativeai
+    return genai
+
+
 @dataclass
 class TokenUsage:
     """Track token usage for cost estimation."""
@@ -42,30 +59,11 @@ class TokenUsage:
         return input_cost + output_cost
 
 
-class RateLimiter:
-    """Simple rate limiter with sliding window."""
+class _PackedFieldMarkers(dict):
+    """format_map() mapping that renders every placeholder as <name>."""
 
-    def __init__(self, requests_per_minute: int = 60):
-        self.requests_per_minute = requests_per_minute
-        self.request_times: List[float] = []
-
-    def wait_if_needed(self):
-        """Wait if rate limit would be exceeded."""
-        now = time.time()
-        window_start = now - 60
-
-        # Remove old requests outside the window
-        self.request_times = [t for t in self.request_times if t > window_start]
-
-        # Check if we need to wait
-        if len(self.request_times) >= self.requests_per_minute:
-            # Wait until oldest request exits the window
-            wait_time = self.request_times[0] - window_start + 0.1
-            if wait_time > 0:
-                time.sleep(wait_time)
-
-        # Record this request
-        self.request_times.append(time.time())
+    def __missing__(self, key):
+        return f"<{key}>"
 
 
 class GeminiClient:
@@ -78,12 +76,21 @@ class GeminiClient:
     MAX_RETRIES = 3
     BASE_RETRY_DELAY = 2.0
 
+    # Rough prompt size estimate for the tokens-per-minute limit
+    CHARS_PER_TOKEN = 4
+
+    # Output budget for packed requests
+    MAX_OUTPUT_TOKENS_PER_JOB = 1024
+    MAX_PACKED_OUTPUT_TOKENS = 8192
+
     def __init__(
         self,
         api_key: str,
         model: str = None,
-        rate_limit_per_minute: int = 60,
         daily_limit: int = 1000,
+        rate_limiter=None,
+        cache: Optional[ResultCache] = None,
+        metrics=None,
     ):
         """
         Initialize Gemini client.
@@ -91,8 +98,11 @@ class GeminiClient:
         Args:
             api_key: Gemini API key
             model: Model name (default: gemini-2.0-flash-exp)
-            rate_limit_per_minute: Maximum requests per minute
             daily_limit: Maximum requests per day
+            rate_limiter: Requests/tokens-per-minute limiter shared by the workers, e.g.
+                rate_limiter.RateLimiter from the repository root (None = only daily_limit)
+            cache: ResultCache consulted before every request (optional)
+            metrics: Run metrics registry, e.g. metrics.get_metrics() (None = not recorded)
         """
         if not HAS_GENAI:
             raise ImportError(
@@ -104,33 +114,67 @@ class GeminiClient:
         self.daily_limit = daily_limit
 
         # Configure API
+        _import_genai()
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel(self.model_name)
 
-        # Rate limiting
-        self.rate_limiter = RateLimiter(rate_limit_per_minute)
+        # Rate limiting and run metrics come from the caller
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+
+        # Result cache
+        self.cache = cache
 
-        # Usage tracking
+        # Usage tracking (guarded by _lock, shared by concurrent workers)
+        self._lock = threading.Lock()
         self.token_usage = TokenUsage()
         self.request_count = 0
+        self.jobs_analyzed = 0
+        self.total_latency = 0.0
         self._daily_count = 0
         self._daily_reset_time = time.time()
 
-    def _check_daily_limit(self) -> bool:
-        """Check and reset daily limit if needed."""
+    def _reset_daily_if_needed(self):
+        """Reset daily count after 24 hours. Caller must hold _lock."""
         now = time.time()
-        # Reset daily count after 24 hours
         if now - self._daily_reset_time > 86400:
             self._daily_count = 0
             self._daily_reset_time = now
 
-        return self._daily_count < self.daily_limit
+    def _check_daily_limit(self) -> bool:
+        """Check and reset daily limit if needed."""
+        with self._lock:
+            self._reset_daily_if_needed()
+            return self._daily_count < self.daily_limit
+
+    def _reserve_daily_slot(self) -> bool:
+        """
+        Reserve one request from the daily budget.
+
+        Reserving up front keeps concurrent workers from overshooting the limit.
+        """
+        with self._lock:
+            self._reset_daily_if_needed()
+            if self._daily_count >= self.daily_limit:
+                return False
+            self._daily_count += 1
+            return True
+
+    def _release_daily_slot(self):
+        """Return a reserved slot when no request was completed."""
+        with self._lock:
+            self._daily_count = max(0, self._daily_count - 1)
+
+    def has_daily_quota(self) -> bool:
+        """True if the daily limit has not been reached."""
+        return self._check_daily_limit()
 
     def analyze(
         self,
         prompt: str,
         job_data: Dict[str, Any],
         timeout: float = 30.0,
+        cache_checked: bool = False,
     ) -> Optional[Dict[str, Any]]:
         """
         Analyze a job using the provided prompt.
@@ -139,14 +183,12 @@ class GeminiClient:
             prompt: The prompt template with {placeholders}
             job_data: Job data dictionary to fill placeholders
             timeout: Request timeout in seconds
+            cache_checked: The caller already missed the cache for this job
+                (e.g. analyze_packed); skip the lookup, still store the result
 
         Returns:
             Parsed response as dictionary, or None on failure
         """
-        if not self._check_daily_limit():
-            print(f"[GeminiClient] Daily limit reached ({self.daily_limit})")
-            return None
-
         # Format prompt with job data
         try:
             formatted_prompt = prompt.format(**job_data)
@@ -154,37 +196,128 @@ class GeminiClient:
             print(f"[GeminiClient] Prompt formatting error: missing key {e}")
             return None
 
-        # Rate limiting
-        self.rate_limiter.wait_if_needed()
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(prompt, self.model_name, job_data)
+            if not cache_checked:
+                cached = self.cache.get(cache_key)
+                if self.metrics:
+                    self.metrics.cache("ai_cache", hit=bool(cached))
+                if cached:
+                    return cached
+
+        text = self._generate(formatted_prompt, max_output_tokens=1024)
+        if not text:
+            return None
+
+        with self._lock:
+            self.jobs_analyzed += 1
+        result = self._parse_response(text)
+
+        if cache_key:
+            self.cache.put(cache_key, self.model_name, result)
+        return result
+
+    def analyze_packed(
+        self,
+        prompt: str,
+        jobs_data: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze several jobs with a single request.
+
+        The template instructions are sent once, followed by every job, and the
+        model is asked for a JSON array with one object per job id.
+
+        Args:
+            prompt: The prompt template with {placeholders}
+            jobs_data: Job id -> job data dictionary
+
+        Returns:
+            Job id -> parsed result, only for items that came back valid.
+            Missing ids should be retried with analyze(..., cache_checked=True).
+        """
+        # Cached jobs are not sent; keys match the ones analyze() uses
+        results = {}
+        cache_keys = {}
+        if self.cache is not None:
+            for job_id, job_data in jobs_data.items():
+                cache_keys[job_id] = self.cache.make_key(prompt, self.model_name, job_data)
+                cached = self.cache.get(cache_keys[job_id])
+                if self.metrics:
+                    self.metrics.cache("ai_cache", hit=bool(cached))
+                if cached:
+                    results[job_id] = cached
+            jobs_data = {k: v for k, v in jobs_data.items() if k not in results}
+
+        if not jobs_data:
+            return results
+
+        formatted_prompt = self._format_packed_prompt(prompt, jobs_data)
+        max_output_tokens = min(self.MAX_OUTPUT_TOKENS_PER_JOB * len(jobs_data), self.MAX_PACKED_OUTPUT_TOKENS)
+
+        text = self._generate(formatted_prompt, max_output_tokens=max_output_tokens)
+        if not text:
+            return results
+
+        packed = self._parse_packed_response(text, set(jobs_data))
+        with self._lock:
+            self.jobs_analyzed += len(packed)
+
+        if self.cache is not None:
+            for job_id, result in packed.items():
+                self.cache.put(cache_keys[job_id], self.model_name, result)
+
+        results.update(packed)
+        return results
+
+    def _generate(self, formatted_prompt: str, max_output_tokens: int) -> Optional[str]:
+        """
+        Send one request (daily budget, rate limiting and retries included).
+
+        Returns:
+            Response text, or None on failure
+        """
+        if not self._reserve_daily_slot():
+            print(f"[GeminiClient] Daily limit reached ({self.daily_limit})")
+            return None
+
+        # Rate limiting (input tokens estimated at ~4 characters per token)
+        estimated_tokens = len(formatted_prompt) // self.CHARS_PER_TOKEN
+        if self.rate_limiter:
+            self.rate_limiter.wait_if_needed(tokens=estimated_tokens)
 
         # Retry loop
         for attempt in range(self.MAX_RETRIES):
             try:
+                started = time.time()
                 response = self.model.generate_content(
                     formatted_prompt,
                     generation_config=genai.types.GenerationConfig(
                         temperature=0.3,
-                        max_output_tokens=1024,
+                        max_output_tokens=max_output_tokens,
                     ),
                 )
-
-                # Update counters
-                self.request_count += 1
-                self._daily_count += 1
-
-                # Track token usage if available
-                if hasattr(response, 'usage_metadata'):
-                    usage = response.usage_metadata
-                    self.token_usage.add(
-                        input_tokens=getattr(usage, 'prompt_token_count', 0),
-                        output_tokens=getattr(usage, 'candidates_token_count', 0),
-                    )
-
-                # Parse response
-                if response.text:
-                    return self._parse_response(response.text)
-                else:
-                    return None
+                latency = time.time() - started
+                if self.metrics:
+                    self.metrics.observe("ai.request", latency)
+
+                # Update counters (daily slot was reserved before the request)
+                with self._lock:
+                    self.request_count += 1
+                    self.total_latency += latency
+
+                    # Track token usage if available
+                    if hasattr(response, 'usage_metadata'):
+                        usage = response.usage_metadata
+                        input_tokens = getattr(usage, 'prompt_token_count', 0) or 0
+                        output_tokens = getattr(usage, 'candidates_token_count', 0) or 0
+                        self.token_usage.add(input_tokens=input_tokens, output_tokens=output_tokens)
+                        # Charge the limiter for what the estimate missed
+                        if self.rate_limiter:
+                            self.rate_limiter.record_tokens(output_tokens + max(0, input_tokens - estimated_tokens))
+
+                return response.text or None
 
             except Exception as e:
                 error_msg = str(e)
@@ -202,8 +335,92 @@ class GeminiClient:
                     continue
 
                 print(f"[GeminiClient] Error: {error_msg[:100]}")
+                self._release_daily_slot()
                 return None
 
+        self._release_daily_slot()
+        return None
+
+    @staticmethod
+    def _format_packed_prompt(prompt: str, jobs_data: Dict[str, Dict[str, Any]]) -> str:
+        """Build one prompt that carries the template instructions once and every job."""
+        # Template placeholders become <field> markers that point at the job blocks
+        instructions = prompt.format_map(_PackedFieldMarkers()).strip()
+
+        parts = [
+            f"You will analyze {len(jobs_data)} job postings in one response.",
+            "Apply the instructions below to EACH job separately. "
+            "Values shown as <field> are given per job in the job blocks that follow.",
+            "",
+            "--- INSTRUCTIONS ---",
+            instructions,
+            "--- END INSTRUCTIONS ---",
+        ]
+
+        for job_id, job_data in jobs_data.items():
+            parts.append("")
+            parts.append(f"### Job ID: {job_id}")
+            for field, value in job_data.items():
+                parts.append(f"<{field}>: {value}")
+
+        parts.append("")
+        parts.append(
+            "Respond ONLY with a valid JSON array containing exactly one object per job. "
+            "Each object must follow the structure described in the instructions and "
+            f'include a "job_id" field set to the job\'s ID (e.g. "{next(iter(jobs_data))}"). '
+            "No additional text."
+        )
+        return "\n".join(parts)
+
+    def _parse_packed_response(self, text: str, expected_ids: set) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse and validate a packed response.
+
+        Items that are not objects, carry an unknown or duplicate job_id, or
+        have no fields besides job_id are dropped.
+        """
+        items = self._parse_json_array(text)
+        if items is None:
+            print("[GeminiClient] Packed response is not a JSON array")
+            return {}
+
+        results = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            job_id = str(item.get("job_id", ""))
+            if job_id not in expected_ids or job_id in results:
+                continue
+            result = {k: v for k, v in item.items() if k != "job_id"}
+            if not result or "raw_response" in result:
+                continue
+            results[job_id] = result
+
+        return results
+
+    @staticmethod
+    def _parse_json_array(text: str) -> Optional[List[Any]]:
+        """Find and parse a JSON array in response text."""
+        text = text.strip()
+
+        candidates = [text]
+        import re
+        for pattern in (r'```json\s*([\s\S]*?)\s*```', r'```\s*([\s\S]*?)\s*```'):
+            match = re.search(pattern, text)
+            if match:
+                candidates.append(match.group(1))
+        start, end = text.find('['), text.rfind(']')
+        if start != -1 and end > start:
+            candidates.append(text[start:end + 1])
+
+        for candidate in candidates:
+            try:
+                parsed = json.loads(candidate)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(parsed, list):
+                return parsed
+
         return None
 
     def _parse_response(self, text: str) -> Dict[str, Any]:
@@ -246,6 +463,7 @@ class GeminiClient:
         prompt: str,
         jobs: List[Dict[str, Any]],
         progress_callback=None,
+        max_workers: int = 1,
     ) -> List[Optional[Dict[str, Any]]]:
         """
         Analyze multiple jobs.
@@ -254,34 +472,52 @@ class GeminiClient:
             prompt: The prompt template
             jobs: List of job data dictionaries
             progress_callback: Optional callback(current, total)
+            max_workers: Number of concurrent requests (1 = sequential)
 
         Returns:
-            List of analysis results
+            List of analysis results (same order as jobs)
         """
-        results = []
         total = len(jobs)
 
-        for i, job in enumerate(jobs):
-            result = self.analyze(prompt, job)
-            results.append(result)
+        if max_workers <= 1:
+            results = []
+            for i, job in enumerate(jobs):
+                result = self.analyze(prompt, job)
+                results.append(result)
+
+                if progress_callback:
+                    progress_callback(i + 1, total)
+
+            return results
 
-            if progress_callback:
-                progress_callback(i + 1, total)
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.analyze, prompt, job): i for i, job in enumerate(jobs)}
+            for done, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                if progress_callback:
+                    progress_callback(done, total)
 
         return results
 
     @property
     def stats(self) -> Dict[str, Any]:
         """Get client statistics."""
-        return {
-            "model": self.model_name,
-            "request_count": self.request_count,
-            "daily_count": self._daily_count,
-            "daily_limit": self.daily_limit,
-            "input_tokens": self.token_usage.input_tokens,
-            "output_tokens": self.token_usage.output_tokens,
-            "estimated_cost_usd": self.token_usage.estimate_cost(),
-        }
+        with self._lock:
+            stats = {
+                "model": self.model_name,
+                "request_count": self.request_count,
+                "daily_count": self._daily_count,
+                "daily_limit": self.daily_limit,
+                "input_tokens": self.token_usage.input_tokens,
+                "output_tokens": self.token_usage.output_tokens,
+                "estimated_cost_usd": self.token_usage.estimate_cost(),
+                "jobs_analyzed": self.jobs_analyzed,
+                "total_latency_s": self.total_latency,
+            }
+        if self.cache is not None:
+            stats.update(self.cache.stats)
+        return stats
 
     def print_stats(self):
         """Print usage statistics."""
@@ -295,4 +531,7 @@ class GeminiClient:
         print(f"  Input tokens: {stats['input_tokens']:,}")
         print(f"  Output tokens: {stats['output_tokens']:,}")
         print(f"  Estimated cost: ${stats['estimated_cost_usd']:.4f}")
+        if self.cache is not None:
+            print(f"  Cache hit rate: {stats['cache_hit_rate']:.1%} "
+                  f"({stats['cache_hits']} hits, {stats['cache_misses']} misses)")
         print("=" * 40)
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent cache for AI analysis results.
+
+Results are content-addressed: the key is a hash of the prompt template text,
+the model name and the normalised job payload. Re-running a region or starting
+a new RUN_ID reuses results for unchanged jobs, and editing a template only
+invalidates the entries made with that template.
+"""
+
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+
+class ResultCache:
+    """SQLite-backed result cache (thread-safe, shared by concurrent workers)."""
+
+    def __init__(self, db_path: str):
+        """
+        Initialize result cache.
+
+        Args:
+            db_path: SQLite database file (created if missing)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        # Lookup statistics for this process
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(value: Any) -> Any:
+        """Collapse whitespace so formatting-only changes map to the same key."""
+        if isinstance(value, str):
+            return " ".join(value.split())
+        return value
+
+    def make_key(self, template: str, model: str, job_data: Dict[str, Any]) -> str:
+        """Content hash of template text, model name and job payload."""
+        payload = json.dumps(
+            {
+                "template": template,
+                "model": model,
+                "job": {k: self._normalize(v) for k, v in job_data.items()},
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+
+    def put(self, key: str, model: str, result: Dict[str, Any]):
+        """Store a parsed result (unparsed raw responses are not cached)."""
+        if not result or "raw_response" in result:
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, model, result, created_at) VALUES (?, ?, ?, ?)",
+                (key, model, json.dumps(result, ensure_ascii=False), time.time()),
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_hit_rate": self.hit_rate,
+            "cache_entries": len(self),
+        }
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -5,36 +5,40 @@ Creates a detailed Word document comparing salary, job counts, industry distribu
 """
 import sys
 import io
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-import seaborn as sns
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
 import os
 from pathlib import Path
 import re
 
-# Set matplotlib to use a backend that works without display
-plt.switch_backend('Agg')
-# Set style
-sns.set_style("whitegrid")
-plt.rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+# Shared loader (prefers Parquet sidecars over re-parsing the Excel files)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pandas, matplotlib and python-docx are imported by the functions that use
+# them, so importing this module (or --help) stays instant
+
+
+def set_chart_style():
+    """Headless matplotlib backend and the comparison chart style (called by main)"""
+    import matplotlib
+    matplotlib.use('Agg')  # Backend that works without display
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    sns.set_style("whitegrid")
+    plt.rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS', 'DejaVu Sans']
+    plt.rcParams['axes.unicode_minus'] = False
+
 
 # ============================================================================
 # COMPARISON CONFIGURATION - Modify these settings as needed
 # ============================================================================
 
 # Paths to the two datasets to compare
+# Use MIRROR_SOURCE ("supabase") to compare against the local Supabase mirror
 # Examples:
 #   DATASET1_PATH = "output/BunchGlobal_2025_12_26"
 #   DATASET2_PATH = "output/BunchGlobal_2025_01_18"
+#   DATASET1_PATH = "supabase"
 DATASET1_PATH = "output/BunchGlobal_2025_12_26"
 DATASET2_PATH = "output/BunchGlobal_2025_01_18"
 DATASET1_LABEL = "December 2025"
@@ -43,6 +47,11 @@ DATASET2_LABEL = "January 2025"
 # Excel file name to look for in each region subdirectory
 EXCEL_FILENAME = "jobspy_max_output.xlsx"
 
+# Dataset path that means "the local Supabase mirror" (see supabase_mirror.py)
+MIRROR_SOURCE = "supabase"
+# Pull rows changed since the last sync before loading the mirror
+SYNC_MIRROR = True
+
 # Region name mapping (folder name -> display name)
 REGION_NAME_MAP = {
     "united_states": "United States",
@@ -80,6 +89,8 @@ def map_excel_columns_to_standard(df):
 
 def load_data_from_folder(folder_path):
     """Load all Excel files from a folder structure"""
+    import pandas as pd
+    from dataset_loader import load_dataset
     folder_path = Path(folder_path)
     
     if not folder_path.exists():
@@ -98,7 +109,7 @@ def load_data_from_folder(folder_path):
         region_name = REGION_NAME_MAP.get(subdir.name, subdir.name.replace('_', ' ').title())
         
         try:
-            df = pd.read_excel(excel_file)
+            df = load_dataset(excel_file)
             if df.empty:
                 all_data[region_name] = pd.DataFrame()
                 continue
@@ -113,8 +124,35 @@ def load_data_from_folder(folder_path):
     return all_data
 
 
+def load_data_from_mirror(sync=SYNC_MIRROR):
+    """Load all region tables from the local Supabase mirror, pulling changed rows first"""
+    import supabase_config
+    from supabase_reader import create_client_from_config
+    from supabase_mirror import SupabaseMirror, MIRROR_DB
+    
+    region_table_map = getattr(supabase_config, 'REGION_TABLE_MAP', {})
+    mirror = SupabaseMirror(getattr(supabase_config, 'SUPABASE_MIRROR_DB', MIRROR_DB))
+    try:
+        if sync:
+            try:
+                mirror.sync_all(create_client_from_config(), region_table_map)
+            except Exception as e:
+                print(f"    Sync skipped (using local mirror): {str(e)[:100]}")
+        return mirror.load_all(region_table_map)
+    finally:
+        mirror.close()
+
+
+def load_dataset_source(path):
+    """Load a dataset from a folder of region Excel files or from the Supabase mirror"""
+    if path == MIRROR_SOURCE:
+        return load_data_from_mirror()
+    return load_data_from_folder(path)
+
+
 def extract_salary_value(salary_str):
     """Extract numeric salary value from string"""
+    import pandas as pd
     if pd.isna(salary_str) or not salary_str:
         return None
     
@@ -144,6 +182,7 @@ def extract_salary_value(salary_str):
 
 def analyze_salary(df):
     """Analyze salary data"""
+    import numpy as np
     if df.empty:
         return {'has_data': False}
     
@@ -174,6 +213,7 @@ def analyze_salary(df):
 
 def categorize_job_title(title):
     """Categorize job title into industry/role category"""
+    import pandas as pd
     if pd.isna(title) or not title:
         return "Other"
     
@@ -277,6 +317,8 @@ def analyze_location_distribution(df):
 
 def create_comparison_chart_salary(data1, data2, label1, label2, output_dir):
     """Create salary comparison chart"""
+    import numpy as np
+    import matplotlib.pyplot as plt
     salary_data = {}
     
     for region_name in set(list(data1.keys()) + list(data2.keys())):
@@ -359,6 +401,9 @@ def create_comparison_chart_salary(data1, data2, label1, label2, output_dir):
 
 def create_comparison_chart_job_counts(data1, data2, label1, label2, output_dir):
     """Create job count comparison chart"""
+    import pandas as pd
+    import numpy as np
+    import matplotlib.pyplot as plt
     regions = sorted(set(list(data1.keys()) + list(data2.keys())))
     
     counts1 = [len(data1.get(r, pd.DataFrame())) for r in regions]
@@ -422,6 +467,8 @@ def create_comparison_chart_job_counts(data1, data2, label1, label2, output_dir)
 
 def create_comparison_chart_categories(data1, data2, label1, label2, output_dir):
     """Create job category comparison chart"""
+    import numpy as np
+    import matplotlib.pyplot as plt
     # Aggregate categories across all regions
     all_categories1 = {}
     all_categories2 = {}
@@ -493,6 +540,7 @@ def create_comparison_chart_categories(data1, data2, label1, label2, output_dir)
 
 def add_heading(doc, text, level=1):
     """Add a heading to document"""
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
     heading = doc.add_heading(text, level=level)
     heading.alignment = WD_ALIGN_PARAGRAPH.LEFT
     return heading
@@ -542,6 +590,11 @@ def add_comparison_table(doc, data1, data2, label1, label2, headers):
 
 def generate_comparison_report(data1, data2, label1, label2, output_path, path1, path2):
     """Generate comprehensive comparison Word report"""
+    import pandas as pd
+    import numpy as np
+    from docx import Document
+    from docx.shared import Inches
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
     print(f"\nGenerating comparison report: {output_path}")
     
     doc = Document()
@@ -817,6 +870,11 @@ The comparison covers:
 
 def main():
     """Main function"""
+    # UTF-8 console output (set here rather than at import time)
+    if getattr(sys.stdout, 'encoding', '').lower() != 'utf-8':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    set_chart_style()
+    
     print("="*60)
     print("Job Data Comparison Report Generator")
     print("="*60)
@@ -828,12 +886,12 @@ def main():
     try:
         # Load data from both folders
         print(f"\nLoading Dataset 1: {DATASET1_PATH}")
-        data1 = load_data_from_folder(DATASET1_PATH)
+        data1 = load_dataset_source(DATASET1_PATH)
         total1 = sum(len(df) for df in data1.values() if not df.empty)
         print(f"  Loaded {total1:,} total records")
         
         print(f"\nLoading Dataset 2: {DATASET2_PATH}")
-        data2 = load_data_from_folder(DATASET2_PATH)
+        data2 = load_dataset_source(DATASET2_PATH)
         total2 = sum(len(df) for df in data2.values() if not df.empty)
         print(f"  Loaded {total2:,} total records")
         
@@ -43,3 +43,19 @@ ENABLE_SINGAPORE = True  # Singapore
 # Make sure to configure supabase_config.py first
 ENABLE_SUPABASE = True  # Set to True after configuring Supabase
 
+
+# Export format (optional)
+# If True, also write jobspy_max_output.parquet (requires pyarrow) as the canonical output;
+# the Excel file is then generated from the Parquet file
+EXPORT_PARQUET = False
+
+# Parallel regions (optional)
+# If True, each enabled region is scraped in its own process and Indeed/LinkedIn run
+# concurrently within a region; a run then takes about as long as its slowest region
+PARALLEL_REGIONS = False
+REGION_WORKERS = None  # Number of worker processes (None = one per enabled region)
+
+# Exchange rates snapshot (optional)
+# If set, USD salaries are converted with the rates stored in this file; when the file
+# does not exist yet, the rates fetched on the first run are written to it
+EXCHANGE_RATES_SNAPSHOT = None  # e.g. "output/exchange_rates_snapshot.json"
@@ -176,6 +176,27 @@ RETRY_ATTEMPTS = 3
 # 重试延迟基数（秒，使用指数退避）
 RETRY_DELAY = 2.0
 
+# 每个平台同时进行的搜索数（LinkedIn比Indeed更容易限流）
+PLATFORM_CONCURRENCY = {
+    "linkedin": 2,
+    "indeed": 4,
+}
+
+# 每个平台每分钟最多搜索次数（None = 不限制，仅按 REQUEST_DELAY 间隔）
+PLATFORM_RATE_LIMITS = {
+    "linkedin": 20,
+    "indeed": 60,
+}
+
+# =============================================================================
+# 汇率配置
+# =============================================================================
+
+# 固定汇率快照文件（设为 None 表示每次运行重新获取汇率）
+# 文件存在时直接使用其中的汇率；不存在时首次获取汇率后写入，之后的运行结果可复现
+EXCHANGE_RATES_SNAPSHOT = None
+# EXCHANGE_RATES_SNAPSHOT = "output/exchange_rates_snapshot.json"
+
 # =============================================================================
 # 过滤配置
 # =============================================================================
@@ -209,6 +230,9 @@ GEMINI_MODEL = "gemini-2.5-flash-preview-05-20"
 # 每分钟请求限制
 AI_RATE_LIMIT_PER_MINUTE = 60
 
+# 每分钟token限制（None = 不限制；输入token按字符数估算，响应后按实际用量补记）
+AI_TOKENS_PER_MINUTE = None
+
 # 每日请求限制
 AI_DAILY_LIMIT = 1000
 
@@ -221,6 +245,24 @@ RESUME_FROM_CHECKPOINT = True
 # Checkpoint保存间隔（每处理N个职位保存一次）
 CHECKPOINT_INTERVAL = 10
 
+# 并发分析线程数（1 = 顺序执行）
+# 所有线程共享同一个限速器和每日配额，吞吐量上限仍为 AI_RATE_LIMIT_PER_MINUTE
+AI_CONCURRENCY = 8
+
+# 单个职位分析失败（无结果）时的额外重试次数
+AI_JOB_RETRIES = 1
+
+# 每个请求打包的职位数（1 = 每个职位单独请求）
+# 模板说明只发送一次，模型按职位ID返回JSON数组；缺失或格式错误的职位会单独重新分析
+# 打包后请求数和输入token约减少为原来的 1/N，每日配额可覆盖更多职位
+AI_PACK_SIZE = 5
+
+# AI分析结果缓存（SQLite，按 模板文本 + 模型 + 职位内容 的哈希存储）
+# 换RUN_ID或重新分析同一地区时，内容未变的职位直接复用结果，不再调用API
+# 修改Prompt模板只会使该模板的缓存失效
+ENABLE_AI_CACHE = True
+AI_CACHE_FILE = Path(__file__).parent / "output" / "ai_cache.sqlite"
+
 # =============================================================================
 # 实时AI分析配置（边爬边分析）
 # =============================================================================
@@ -233,13 +275,20 @@ CHECKPOINT_INTERVAL = 10
 # - 充分利用爬虫的等待时间
 ENABLE_REALTIME_AI = True
 
-# 每批分析的职位数（累积到这个数量后立即进行AI分析）
+# 每批的职位数：每提交（按顺序分析完成）这么多职位算一批
 # 建议值：5-10，太小会增加检查点开销，太大会增加中断损失
 AI_BATCH_SIZE = 5
 
 # 实时分析检查点保存间隔（每处理N批保存一次）
 REALTIME_CHECKPOINT_INTERVAL = 1
 
+# 流水线模式：爬取线程把职位放入有界队列，AI分析线程（AI_CONCURRENCY个）并发消费
+# 队列满时爬取线程等待（背压），总耗时约为爬取和分析中较慢的一方
+REALTIME_QUEUE_SIZE = 50
+
+# 爬取线程数（同时请求招聘平台的数量，过大容易被限流）
+REALTIME_SCRAPE_WORKERS = 1
+
 # =============================================================================
 # 地区配置
 # =============================================================================
@@ -402,6 +451,7 @@ def print_config():
     else:
         print(f"  目标地区: {DEFAULT_REGION}")
     print(f"  爬取平台: {', '.join(PLATFORMS)}")
+    print(f"  平台并发数: {', '.join(f'{p} x{PLATFORM_CONCURRENCY.get(p, 1)}' for p in PLATFORMS)}")
     print(f"  搜索关键词数: {len(effective['keywords'])}")
     print(f"  每次搜索结果数: {effective['results_per_search']}")
     print(f"  最大职位数/地区: {effective['max_total_jobs'] or '无限制'}")
@@ -411,12 +461,19 @@ def print_config():
         print(f"  AI模型: {GEMINI_MODEL}")
         print(f"  Prompt模板: {PROMPT_TEMPLATE}")
         print(f"  每分钟限制: {AI_RATE_LIMIT_PER_MINUTE}")
+        if AI_TOKENS_PER_MINUTE:
+            print(f"  每分钟token限制: {AI_TOKENS_PER_MINUTE:,}")
         print(f"  每日限制: {AI_DAILY_LIMIT}")
+        print(f"  并发线程数: {AI_CONCURRENCY}")
+        print(f"  每请求职位数: {AI_PACK_SIZE}")
+        print(f"  结果缓存: {AI_CACHE_FILE if ENABLE_AI_CACHE else '否'}")
         print(f"  断点续传: {'是' if RESUME_FROM_CHECKPOINT else '否'}")
         print(f"  实时分析模式: {'是' if ENABLE_REALTIME_AI else '否'}")
         if ENABLE_REALTIME_AI:
             print(f"  批处理大小: {AI_BATCH_SIZE}")
             print(f"  检查点间隔: 每 {REALTIME_CHECKPOINT_INTERVAL} 批")
+            print(f"  队列大小: {REALTIME_QUEUE_SIZE}")
+            print(f"  爬取线程数: {REALTIME_SCRAPE_WORKERS}")
 
     warnings = validate_config()
     if warnings:
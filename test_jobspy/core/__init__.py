@@ -7,10 +7,16 @@ Contains data models, salary processing, and currency conversion.
 from .job_data import JobData, JobDataCollection
 from .salary_processor import SalaryProcessor
 from .currency_converter import CurrencyConverter
+from .checkpoint_log import CheckpointLog
+from .seen_key_index import SeenKeyIndex
+from .raw_job_log import RawJobLog
 
 __all__ = [
     'JobData',
     'JobDataCollection',
     'SalaryProcessor',
     'CurrencyConverter',
+    'CheckpointLog',
+    'SeenKeyIndex',
+    'RawJobLog',
 ]
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Append-only checkpoint log for realtime scraping + AI analysis.
+
+Layout of a log directory:
+
+    manifest.json          committed segments and their record counts, stats
+    segment_00001.jsonl    one JSON record per line: {"key": ..., "job": {...}}
+    segment_00002.jsonl
+    ...
+
+Each checkpoint appends only the newly committed jobs and rewrites the small
+manifest. Lines past a segment's committed count (a torn write from a crash)
+are ignored on load. A resumed run always starts a new segment, and once there
+are too many segments they are compacted into one (first record per key wins,
+same as loading).
+"""
+
+import os
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
+
+from .job_data import JobData, JobDataCollection
+
+
+class CheckpointLog:
+    """Segmented append-only log of analysed jobs."""
+
+    MANIFEST_FILE = "manifest.json"
+    SEGMENT_MAX_RECORDS = 2000
+    COMPACT_SEGMENTS = 16
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_records: int = SEGMENT_MAX_RECORDS,
+        compact_segments: int = COMPACT_SEGMENTS,
+    ):
+        """
+        Initialize checkpoint log.
+
+        Args:
+            directory: Log directory (created if missing)
+            segment_max_records: Records per segment before starting a new one
+            compact_segments: Compact once the log has more segments than this
+        """
+        self.directory = Path(directory)
+        self.segment_max_records = segment_max_records
+        self.compact_segments = compact_segments
+
+        self._manifest = self._read_manifest()
+        self._active: Optional[Dict[str, Any]] = None
+        self._file = None
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / self.MANIFEST_FILE
+
+    def exists(self) -> bool:
+        return self.manifest_path.exists()
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        if self.manifest_path.exists():
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"[CheckpointLog] Error loading manifest: {e}")
+        return {"segments": [], "next_segment": 1, "count": 0, "stats": {}}
+
+    def _write_manifest(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._manifest, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp_path, self.manifest_path)
+
+    @property
+    def count(self) -> int:
+        """Number of committed records (before de-duplication)."""
+        return sum(seg["records"] for seg in self._manifest["segments"])
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return self._manifest.get("stats", {})
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _open_segment(self):
+        """Start a new segment file."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        number = self._manifest["next_segment"]
+        self._manifest["next_segment"] = number + 1
+        self._active = {"file": f"segment_{number:05d}.jsonl", "records": 0}
+        self._manifest["segments"].append(self._active)
+        self._file = open(self.directory / self._active["file"], 'a', encoding='utf-8')
+
+    def append(self, jobs: List[JobData]):
+        """Append newly committed jobs (visible after the next commit())."""
+        for job in jobs:
+            if self._active is None or self._active["records"] >= self.segment_max_records:
+                self._close_segment()
+                self._open_segment()
+            record = {"key": job._dedup_key, "job": job.to_dict()}
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            self._active["records"] += 1
+
+    def commit(self, stats: Optional[Dict[str, Any]] = None):
+        """Flush appended records and record them in the manifest."""
+        if self._file:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+        self._manifest["count"] = self.count
+        self._manifest["timestamp"] = datetime.now().isoformat()
+        if stats is not None:
+            self._manifest["stats"] = stats
+        self._write_manifest()
+
+        if len(self._manifest["segments"]) > self.compact_segments:
+            self.compact()
+
+    def _close_segment(self):
+        if self._file:
+            self._file.close()
+        self._file = None
+        self._active = None
+
+    def close(self):
+        self._close_segment()
+
+    def compact(self):
+        """Merge all segments into one, keeping the first record per key."""
+        self._close_segment()
+
+        records: Dict[str, str] = {}
+        for record, line in self._iter_lines():
+            records.setdefault(record["key"], line)
+
+        old_files = [seg["file"] for seg in self._manifest["segments"]]
+        number = self._manifest["next_segment"]
+        self._manifest["next_segment"] = number + 1
+        compacted = {"file": f"segment_{number:05d}.jsonl", "records": len(records)}
+
+        with open(self.directory / compacted["file"], 'w', encoding='utf-8') as f:
+            for line in records.values():
+                f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Switch the manifest first, then drop the old segments
+        self._manifest["segments"] = [compacted]
+        self._manifest["count"] = self.count
+        self._write_manifest()
+        for name in old_files:
+            try:
+                (self.directory / name).unlink()
+            except OSError:
+                pass
+
+        print(f"[CheckpointLog] Compacted {len(old_files)} segments into {compacted['file']} ({len(records)} records)")
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _iter_lines(self) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """Yield (record, raw line) for every committed record."""
+        for seg in self._manifest["segments"]:
+            path = self.directory / seg["file"]
+            if not path.exists():
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                for i, line in enumerate(f):
+                    if i >= seg["records"]:
+                        break
+                    line = line.rstrip("\n")
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(record, dict) and "key" in record:
+                        yield record, line
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream committed records in write order."""
+        for record, _ in self._iter_lines():
+            yield record
+
+    def load_into(self, collection: JobDataCollection) -> Set[str]:
+        """
+        Stream the log into a collection.
+
+        Returns:
+            Set of processed dedup keys
+        """
+        processed_ids = set()
+        for record in self.iter_records():
+            if record["key"] in processed_ids:
+                continue
+            try:
+                collection.add(JobData.from_dict(record["job"]), deduplicate=False)
+                processed_ids.add(record["key"])
+            except Exception as e:
+                print(f"[CheckpointLog] Error restoring job: {e}")
+        return processed_ids
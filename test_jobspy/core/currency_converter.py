@@ -2,14 +2,20 @@
 """
 Currency Converter with real-time exchange rate API support.
 Uses exchangerate-api.com (free tier) with local caching.
+
+convert_many() converts whole columns at once: currency codes are mapped to
+indices of a NumPy rate vector (one per target currency, rebuilt only when the
+rates change). A rates snapshot file pins the rates for reproducible runs.
 """
 
 import time
 import json
 import os
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Tuple, Union
 from pathlib import Path
 
+import numpy as np
+
 try:
     import requests
     HAS_REQUESTS = True
@@ -56,6 +62,7 @@ class CurrencyConverter:
         cache_file: Optional[str] = None,
         cache_duration: int = CACHE_DURATION,
         auto_initialize: bool = True,
+        rates_snapshot: Optional[str] = None,
     ):
         """
         Initialize currency converter.
@@ -64,16 +71,43 @@ class CurrencyConverter:
             cache_file: Path to cache file (optional)
             cache_duration: Cache duration in seconds
             auto_initialize: If True, fetch rates immediately
+            rates_snapshot: Pinned rates file (see save_snapshot); if it exists its
+                rates are used as-is, otherwise it is written after the first fetch
         """
         self.cache_duration = cache_duration
         self.cache_file = cache_file or self._get_default_cache_path()
+        self.rates_snapshot = rates_snapshot
         self._rates: Dict[str, float] = {}
         self._cache_time: Optional[float] = None
         self._using_fallback = False
+        self._pinned = False
+
+        # Rate vectors per target currency, built from _rates on first use
+        self._table_rates: Optional[Dict[str, float]] = None
+        self._code_index: Dict[str, int] = {}
+        self._usd_vector: Optional[np.ndarray] = None
+        self._target_vectors: Dict[str, np.ndarray] = {}
 
         if auto_initialize:
             self.initialize()
 
+    @classmethod
+    def from_rates(cls, rates: Dict[str, float]) -> "CurrencyConverter":
+        """Converter pinned to the given rates (1 unit of currency = X USD); never fetches."""
+        converter = cls(cache_file=os.devnull, auto_initialize=False)
+        converter._rates = dict(rates)
+        converter._cache_time = time.time()
+        converter._pinned = True
+        return converter
+
+    @classmethod
+    def from_snapshot(cls, path: str) -> "CurrencyConverter":
+        """Converter pinned to the rates in a snapshot file written by save_snapshot."""
+        converter = cls(cache_file=os.devnull, auto_initialize=False)
+        if not converter._load_snapshot(path):
+            raise ValueError(f"No exchange rates in snapshot {path}")
+        return converter
+
     def _get_default_cache_path(self) -> str:
         """Get default cache file path."""
         # Store in test_jobspy/output directory
@@ -88,6 +122,21 @@ class CurrencyConverter:
         Returns:
             True if real-time rates were fetched, False if using fallback
         """
+        if self._pinned:
+            return not self._using_fallback
+
+        # A pinned snapshot wins over the cache and the API
+        if self.rates_snapshot and self._load_snapshot(self.rates_snapshot):
+            print(f"[CurrencyConverter] Using pinned rates from {self.rates_snapshot}")
+            return not self._using_fallback
+
+        rates_fetched = self._initialize_rates()
+        if self.rates_snapshot:
+            self.save_snapshot(self.rates_snapshot)
+        return rates_fetched
+
+    def _initialize_rates(self) -> bool:
+        """Cache, then API, then fallback rates."""
         # Try to load from cache first
         if self._load_from_cache():
             print(f"[CurrencyConverter] Loaded rates from cache (age: {self._get_cache_age():.0f}s)")
@@ -203,11 +252,126 @@ class CurrencyConverter:
             return float('inf')
         return time.time() - self._cache_time
 
+    def _load_snapshot(self, path: str) -> bool:
+        """Pin the rates stored in a snapshot file (True if it was loaded)."""
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            rates = snapshot.get('rates', {})
+        except Exception as e:
+            print(f"[CurrencyConverter] Snapshot load error: {str(e)[:50]}")
+            return False
+        if not rates:
+            return False
+        self._rates = rates
+        self._cache_time = snapshot.get('timestamp', time.time())
+        self._using_fallback = snapshot.get('is_fallback', False)
+        self._pinned = True
+        return True
+
+    def save_snapshot(self, path: str) -> bool:
+        """
+        Write the current rates to a snapshot file (pass it as rates_snapshot to reuse them).
+
+        Returns:
+            True if successful
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'timestamp': self._cache_time,
+                    'rates': self._rates,
+                    'is_fallback': self._using_fallback,
+                }, f, indent=2)
+            return True
+        except Exception as e:
+            print(f"[CurrencyConverter] Snapshot save error: {str(e)[:50]}")
+            return False
+
     def _normalize_currency(self, currency: str) -> str:
         """Normalize currency code."""
         currency = str(currency).upper().strip()
         return self.CURRENCY_ALIASES.get(currency, currency)
 
+    def _rate_table(self) -> Tuple[Dict[str, int], np.ndarray]:
+        """Currency code -> index, and the vector of USD rates (rebuilt when the rates change)."""
+        if not self._rates:
+            self.initialize()
+        if self._table_rates is not self._rates:
+            codes = list(self._rates)
+            self._code_index = {code: i for i, code in enumerate(codes)}
+            self._usd_vector = np.array([self._rates[code] for code in codes], dtype=float)
+            self._target_vectors = {}
+            self._table_rates = self._rates
+        return self._code_index, self._usd_vector
+
+    def rate_vector(self, to_currency: str = "USD") -> Tuple[Dict[str, int], np.ndarray]:
+        """
+        Rates from every known currency to one target.
+
+        Returns:
+            (code -> index, vector where vector[index] = rate from that code to to_currency)
+        """
+        index, usd_vector = self._rate_table()
+        target = self._normalize_currency(to_currency)
+        if target not in self._target_vectors:
+            target_to_usd = usd_vector[index[target]] if target in index else 1.0
+            if target == 'USD':
+                vector = usd_vector
+            else:
+                vector = usd_vector / target_to_usd if target_to_usd != 0 else usd_vector
+            self._target_vectors[target] = vector
+        return index, self._target_vectors[target]
+
+    def convert_many(
+        self,
+        amounts: Iterable[float],
+        currencies: Union[str, Iterable[Optional[str]]],
+        to_currency: str = "USD",
+    ) -> np.ndarray:
+        """
+        Convert a column of amounts in one operation.
+
+        Args:
+            amounts: Amounts (NaN stays NaN)
+            currencies: One currency code for all amounts, or one code per amount;
+                unknown or missing codes are valued at 1 USD, as in get_rate
+            to_currency: Target currency code
+
+        Returns:
+            Float array of converted amounts
+        """
+        values = np.asarray(amounts, dtype=float)
+        index, vector = self.rate_vector(to_currency)
+        target = self._normalize_currency(to_currency)
+        # Two extra slots: unknown/missing codes (valued at 1 USD) and the target itself (1.0)
+        unknown_rate = vector[index['USD']] if 'USD' in index else 1.0
+        rates = np.concatenate([vector, [unknown_rate, 1.0]])
+        unknown, same = len(vector), len(vector) + 1
+
+        def slot(code: str) -> int:
+            if not code or code.lower() in ('none', 'nan'):
+                return unknown
+            code = self._normalize_currency(code)
+            if code == target:
+                return same
+            return index.get(code, unknown)
+
+        if isinstance(currencies, str):
+            return values * rates[slot(currencies)]
+
+        codes = np.array(['' if code is None else str(code) for code in currencies], dtype=str)
+        if codes.shape != values.shape:
+            raise ValueError(f"{codes.size} currencies for {values.size} amounts")
+        unique_codes, inverse = np.unique(codes, return_inverse=True)
+        slots = np.array([slot(code) for code in unique_codes], dtype=np.intp)
+        return values * rates[slots[inverse]]
+
     def get_rate(self, from_currency: str, to_currency: str = "USD") -> float:
         """
         Get exchange rate from one currency to another.
@@ -277,6 +441,11 @@ class CurrencyConverter:
         """Check if using fallback rates."""
         return self._using_fallback
 
+    @property
+    def rates(self) -> Dict[str, float]:
+        """Current rates (1 unit of currency = X USD)."""
+        return dict(self._rates)
+
     @property
     def available_currencies(self) -> list:
         """Get list of available currency codes."""
@@ -8,6 +8,7 @@ from dataclasses import dataclass, field, asdict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import re
+import threading
 import pandas as pd
 
 
@@ -165,12 +166,16 @@ class JobData:
 
 
 class JobDataCollection:
-    """Collection of JobData with deduplication support."""
+    """
+    Collection of JobData with deduplication support.
+    add() and claim_key() are thread-safe, so concurrent scraper workers can share one collection.
+    """
 
     def __init__(self):
         self.jobs: List[JobData] = []
         self._seen_keys: set = set()
         self._cross_platform_keys: set = set()
+        self._lock = threading.RLock()
 
     def add(self, job: JobData, deduplicate: bool = True) -> bool:
         """
@@ -183,19 +188,33 @@ class JobDataCollection:
         Returns:
             True if job was added, False if duplicate
         """
-        if deduplicate and job._dedup_key in self._seen_keys:
-            return False
+        xp_key = job.generate_cross_platform_key()
+        with self._lock:
+            if deduplicate and job._dedup_key in self._seen_keys:
+                return False
 
-        self.jobs.append(job)
-        self._seen_keys.add(job._dedup_key)
+            self.jobs.append(job)
+            self._seen_keys.add(job._dedup_key)
 
-        # Track cross-platform key
-        xp_key = job.generate_cross_platform_key()
-        if xp_key:
-            self._cross_platform_keys.add(xp_key)
+            # Track cross-platform key
+            if xp_key:
+                self._cross_platform_keys.add(xp_key)
 
         return True
 
+    def claim_key(self, dedup_key: str) -> bool:
+        """
+        Mark a dedup key as seen before the job is filtered or added.
+
+        Returns:
+            True if the key was new (the caller owns the job), False if already seen
+        """
+        with self._lock:
+            if dedup_key in self._seen_keys:
+                return False
+            self._seen_keys.add(dedup_key)
+            return True
+
     def add_many(self, jobs: List[JobData], deduplicate: bool = True) -> int:
         """
         Add multiple jobs to collection.
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Append-only JSONL log of raw scraped jobs.
+
+Jobs are serialised once, when they are appended, and written as one JSON
+object per line. commit() flushes them and returns the number of committed
+lines; the caller stores that count in its checkpoint, which acts as the
+manifest. Readers stream only the committed lines, and the first append after
+a resume drops whatever follows them (a torn write from a crash, or jobs
+collected after the last checkpoint), so a checkpoint costs time proportional
+to the jobs collected since the previous one.
+"""
+
+import os
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+
+class RawJobLog:
+    """Committed-prefix JSONL log of job dicts."""
+
+    def __init__(self, path: str, count: int = 0, serialize: Optional[Callable[[Dict], Dict]] = None):
+        """
+        Initialize raw job log.
+
+        Args:
+            path: JSONL file
+            count: Lines already committed in path (0 = start a new log)
+            serialize: Turns a job into a JSON-serialisable dict (default: unchanged)
+        """
+        self.path = path
+        self.count = count
+        self.serialize = serialize or (lambda job: job)
+        self._file = None
+        self._pending = 0
+
+    def __len__(self) -> int:
+        return self.count + self._pending
+
+    def iter_jobs(self) -> Iterator[Dict[str, Any]]:
+        """Stream the committed jobs in write order."""
+        if not self.count or not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for i, line in enumerate(f):
+                if i >= self.count:
+                    break
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def _committed_bytes(self) -> int:
+        """Byte offset just past the committed lines."""
+        offset = 0
+        with open(self.path, "rb") as f:
+            for i, line in enumerate(f):
+                if i >= self.count:
+                    break
+                offset += len(line)
+        return offset
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.count and os.path.exists(self.path):
+            offset = self._committed_bytes()
+            self._file = open(self.path, "r+b")
+            self._file.seek(offset)
+            self._file.truncate()
+        else:
+            self.count = 0
+            self._file = open(self.path, "wb")
+
+    def append(self, jobs: Iterable[Dict[str, Any]]):
+        """Serialise and write jobs (committed on the next commit())."""
+        lines = [json.dumps(self.serialize(job), ensure_ascii=False) + "\n" for job in jobs]
+        if not lines:
+            return
+        if self._file is None:
+            self._open()
+        self._file.write("".join(lines).encode("utf-8"))
+        self._pending += len(lines)
+
+    def commit(self) -> int:
+        """
+        Flush appended jobs to disk.
+
+        Returns:
+            Number of committed jobs (record this in the checkpoint)
+        """
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self.count += self._pending
+        self._pending = 0
+        return self.count
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -16,7 +16,8 @@ import requests
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import get_zenrows_api_key, ZENROWS_BASE_URL
+from config import get_zenrows_api_key, ZENROWS_BASE_URL, ZENROWS_REQUESTS_PER_MINUTE
+from rate_limiter import shared_limiter
 
 # Test configuration
 TEST_OUTPUT_DIR = "test_jobspy/output"
@@ -35,6 +36,10 @@ EXPECTED_FIELDS = [
 ]
 
 
+# One ZenRows budget shared by every fetcher in this process
+zenrows_limiter = shared_limiter("zenrows", ZENROWS_REQUESTS_PER_MINUTE)
+
+
 def zenrows_get(url, retries=3, delay=2):
     """ZenRows request with retry mechanism"""
     api_key = get_zenrows_api_key()
@@ -46,11 +51,13 @@ def zenrows_get(url, retries=3, delay=2):
                 'js_render': 'true',
                 'premium_proxy': 'true',
             }
+            zenrows_limiter.wait_if_needed()
             r = requests.get(ZENROWS_BASE_URL, params=params, timeout=60)
             if r.status_code == 200:
                 return r.text
             elif r.status_code == 400:
                 params_simple = {'url': url, 'apikey': api_key}
+                zenrows_limiter.wait_if_needed()
                 r2 = requests.get(ZENROWS_BASE_URL, params=params_simple, timeout=60)
                 if r2.status_code == 200:
                     return r2.text
@@ -6,28 +6,17 @@ Supports analyzing data from a specified folder containing region subdirectories
 """
 import sys
 import io
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-import seaborn as sns
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
 import os
 import argparse
 from pathlib import Path
 from io import BytesIO
 
-# Set matplotlib to use a backend that works without display
-plt.switch_backend('Agg')
-# Set style
-sns.set_style("whitegrid")
-plt.rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS', 'DejaVu Sans']
-plt.rcParams['axes.unicode_minus'] = False
+# Shared loader (prefers Parquet sidecars over re-parsing the Excel files)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pandas, python-docx and the chart modules are imported by the functions that
+# use them, so importing this module (or --help) stays instant
 
 # ============================================================================
 # REPORT CONFIGURATION - Modify these settings as needed
@@ -111,8 +100,10 @@ def load_data_from_folder(folder_path):
         folder_path: Path to the folder containing region subdirectories
     
     Returns:
-        Dictionary mapping region names to DataFrames
+        Dictionary mapping region names to Parquet sidecar paths (DataFrames without pyarrow)
     """
+    import pandas as pd
+    from dataset_loader import load_dataset, sidecar_path, is_sidecar_fresh, convert_excel_to_parquet, HAS_PYARROW
     folder_path = Path(folder_path)
     
     if not folder_path.exists():
@@ -143,7 +134,16 @@ def load_data_from_folder(folder_path):
         
         try:
             print(f"  Loading data from {region_name}...")
-            df = pd.read_excel(excel_file)
+            if HAS_PYARROW:
+                # The report queries the Parquet sidecar in place (built from the workbook if stale)
+                parquet_file = sidecar_path(excel_file)
+                if not is_sidecar_fresh(excel_file, parquet_file):
+                    convert_excel_to_parquet(excel_file)
+                all_data[region_name] = parquet_file
+                print(f"    Using {Path(parquet_file).name}")
+                continue
+            
+            df = load_dataset(excel_file)
             
             if df.empty:
                 print(f"    Warning: File is empty")
@@ -163,464 +163,66 @@ def load_data_from_folder(folder_path):
     return all_data
 
 
-def calculate_completeness(df):
-    """Calculate data completeness for each field"""
-    if df.empty:
-        return {}
-    
-    total = len(df)
-    completeness = {}
-    
-    fields = [
-        'job_title', 'company_name', 'requirements', 'location',
-        'salary_range', 'estimated_annual_salary', 'estimated_annual_salary_usd',
-        'job_description', 'team_size', 'company_size',
-        'posted_date', 'job_status', 'platform', 'job_link'
-    ]
-    
-    for field in fields:
-        if field in df.columns:
-            non_empty = df[field].notna() & (df[field] != '') & (df[field].astype(str).str.strip() != '')
-            count = non_empty.sum()
-            completeness[field] = {
-                'count': count,
-                'percentage': (count / total * 100) if total > 0 else 0
-            }
-        else:
-            completeness[field] = {'count': 0, 'percentage': 0}
-    
-    return completeness
-
-
-def extract_salary_value(salary_str):
-    """Extract numeric salary value from string"""
-    if pd.isna(salary_str) or not salary_str:
-        return None
-    
-    salary_str = str(salary_str).strip()
-    if not salary_str or salary_str == 'nan':
-        return None
-    
-    # Remove currency symbols and extract numbers
-    import re
-    # Match patterns like $100,000 or $100k or 100,000
-    patterns = [
-        r'[\$£€A\$S\$HK\$C\$]?\s*([\d,]+)\s*[kK]',  # $100k or 100k
-        r'[\$£€A\$S\$HK\$C\$]?\s*([\d,]+)',  # $100,000 or 100,000
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, salary_str)
-        if match:
-            value_str = match.group(1).replace(',', '')
-            try:
-                value = float(value_str)
-                # If it's a K notation, multiply by 1000
-                if 'k' in salary_str.lower():
-                    value *= 1000
-                return value
-            except:
-                pass
-    
-    return None
-
-
-def analyze_salary(df, region_name):
-    """Analyze salary data"""
-    if df.empty:
-        return {}
-    
-    # Extract USD salaries
-    usd_salaries = []
-    for salary_str in df.get('estimated_annual_salary_usd', []):
-        salary_val = extract_salary_value(salary_str)
-        if salary_val and 10000 <= salary_val <= 500000:  # Reasonable range
-            usd_salaries.append(salary_val)
-    
-    if not usd_salaries:
-        return {'has_data': False}
-    
-    usd_salaries = np.array(usd_salaries)
-    
-    return {
-        'has_data': True,
-        'count': len(usd_salaries),
-        'mean': float(np.mean(usd_salaries)),
-        'median': float(np.median(usd_salaries)),
-        'std': float(np.std(usd_salaries)),
-        'min': float(np.min(usd_salaries)),
-        'max': float(np.max(usd_salaries)),
-        'q25': float(np.percentile(usd_salaries, 25)),
-        'q75': float(np.percentile(usd_salaries, 75)),
-        'values': usd_salaries.tolist()
-    }
-
-
-def analyze_time_range(df):
-    """Analyze posted date range"""
-    if df.empty or 'posted_date' not in df.columns:
-        return {}
-    
-    dates = []
-    for date_str in df['posted_date']:
-        if pd.notna(date_str) and date_str:
-            try:
-                date_obj = pd.to_datetime(date_str)
-                dates.append(date_obj)
-            except:
-                pass
-    
-    if not dates:
-        return {'has_data': False}
-    
-    dates = pd.to_datetime(dates)
-    
-    return {
-        'has_data': True,
-        'count': len(dates),
-        'earliest': dates.min(),
-        'latest': dates.max(),
-        'span_days': (dates.max() - dates.min()).days,
-        'dates': dates
-    }
-
-
-def analyze_location(df):
-    """Analyze location distribution"""
-    if df.empty or 'location' not in df.columns:
-        return {}
-    
-    locations = df['location'].dropna()
-    locations = locations[locations.astype(str).str.strip() != '']
-    
-    if locations.empty:
-        return {'has_data': False}
-    
-    location_counts = locations.value_counts()
-    
-    return {
-        'has_data': True,
-        'total_unique': len(location_counts),
-        'top_locations': location_counts.head(10).to_dict()
-    }
-
-
-def analyze_platform(df):
-    """Analyze platform distribution"""
-    if df.empty or 'platform' not in df.columns:
-        return {}
-    
-    platforms = df['platform'].dropna()
-    platforms = platforms[platforms.astype(str).str.strip() != '']
-    
-    if platforms.empty:
-        return {'has_data': False}
-    
-    platform_counts = platforms.value_counts()
-    
-    return {
-        'has_data': True,
-        'distribution': platform_counts.to_dict()
-    }
-
-
-def create_chart_completeness(all_data, output_dir):
-    """Create completeness comparison chart"""
-    regions = []
-    completeness_scores = []
-    
-    for region_name, df in all_data.items():
-        if not df.empty:
-            comp = calculate_completeness(df)
-            # Calculate overall completeness
-            total_fields = len(comp)
-            filled_fields = sum(v['count'] for v in comp.values())
-            total_records = len(df)
-            overall = (filled_fields / (total_fields * total_records) * 100) if total_records > 0 else 0
-            regions.append(region_name)
-            completeness_scores.append(overall)
-    
-    if not regions:
-        return None
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    bars = ax.bar(regions, completeness_scores, color=sns.color_palette("husl", len(regions)))
-    ax.set_ylabel('Overall Completeness (%)', fontsize=12)
-    ax.set_xlabel('Region', fontsize=12)
-    ax.set_title('Data Completeness by Region', fontsize=14, fontweight='bold')
-    ax.set_ylim(0, 100)
-    
-    # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.1f}%',
-                ha='center', va='bottom', fontsize=10)
-    
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
-    
-    chart_path = os.path.join(output_dir, 'completeness_chart.png')
-    plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-    plt.close()
+def build_chart_jobs(analytics):
+    """
+    Cross-region chart jobs, keyed by report section (charts without data are left out)
     
-    return chart_path
-
-
-def create_chart_salary_distribution(all_data, output_dir):
-    """Create salary distribution comparison chart"""
+    Each job holds only the small aggregate table its chart draws, so
+    render_charts can skip charts whose table has not changed since the last run.
+    """
+    from chart_renderer import ChartJob
+    import region_charts
+    spec = region_charts.chart_spec()
+    completeness = {'regions': [], 'scores': []}
     salary_data = {}
-    
-    for region_name, df in all_data.items():
-        if not df.empty:
-            salary_info = analyze_salary(df, region_name)
-            if salary_info.get('has_data'):
-                salary_data[region_name] = salary_info['values']
-    
-    if not salary_data:
-        return None
-    
-    fig, axes = plt.subplots(2, 1, figsize=(12, 10))
-    
-    # Box plot
-    ax1 = axes[0]
-    data_for_box = [salary_data[r] for r in salary_data.keys()]
-    labels = list(salary_data.keys())
-    bp = ax1.boxplot(data_for_box, tick_labels=labels, patch_artist=True)
-    for patch in bp['boxes']:
-        patch.set_facecolor(sns.color_palette("husl", len(labels))[bp['boxes'].index(patch)])
-    ax1.set_ylabel('Annual Salary (USD)', fontsize=12)
-    ax1.set_title('Salary Distribution by Region (Box Plot)', fontsize=14, fontweight='bold')
-    ax1.grid(True, alpha=0.3)
-    plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha='right')
-    
-    # Bar chart with statistics
-    ax2 = axes[1]
-    means = [np.mean(salary_data[r]) for r in labels]
-    medians = [np.median(salary_data[r]) for r in labels]
-    x = np.arange(len(labels))
-    width = 0.35
-    
-    bars1 = ax2.bar(x - width/2, means, width, label='Mean', color='skyblue')
-    bars2 = ax2.bar(x + width/2, medians, width, label='Median', color='lightcoral')
-    
-    ax2.set_ylabel('Annual Salary (USD)', fontsize=12)
-    ax2.set_xlabel('Region', fontsize=12)
-    ax2.set_title('Mean vs Median Salary by Region', fontsize=14, fontweight='bold')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(labels, rotation=45, ha='right')
-    ax2.legend()
-    ax2.grid(True, alpha=0.3, axis='y')
-    
-    plt.tight_layout()
-    
-    chart_path = os.path.join(output_dir, 'salary_distribution_chart.png')
-    plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return chart_path
-
-
-def create_chart_time_series(all_data, output_dir):
-    """Create time series chart of job postings"""
     time_data = {}
-    
-    for region_name, df in all_data.items():
-        if not df.empty:
-            time_info = analyze_time_range(df)
-            if time_info.get('has_data'):
-                dates = time_info['dates']
-                # Count by month
-                monthly_counts = dates.to_period('M').value_counts().sort_index()
-                time_data[region_name] = monthly_counts
-    
-    if not time_data:
-        return None
-    
-    fig, ax = plt.subplots(figsize=(14, 6))
-    
-    for region_name, monthly_counts in time_data.items():
-        ax.plot(monthly_counts.index.astype(str), monthly_counts.values, 
-                marker='o', label=region_name, linewidth=2, markersize=6)
-    
-    ax.set_xlabel('Month', fontsize=12)
-    ax.set_ylabel('Number of Job Postings', fontsize=12)
-    ax.set_title('Job Postings Over Time by Region', fontsize=14, fontweight='bold')
-    ax.legend()
-    ax.grid(True, alpha=0.3)
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
-    
-    chart_path = os.path.join(output_dir, 'time_series_chart.png')
-    plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return chart_path
-
-
-def create_chart_platform_distribution(all_data, output_dir):
-    """Create platform distribution chart"""
     platform_data = {}
-    
-    for region_name, df in all_data.items():
-        if not df.empty:
-            platform_info = analyze_platform(df)
-            if platform_info.get('has_data'):
-                platform_data[region_name] = platform_info['distribution']
-    
-    if not platform_data:
-        return None
-    
-    # Aggregate across all regions
-    total_platforms = {}
-    for region_data in platform_data.values():
-        for platform, count in region_data.items():
-            total_platforms[platform] = total_platforms.get(platform, 0) + count
-    
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-    
-    # Overall distribution
-    platforms = list(total_platforms.keys())
-    counts = list(total_platforms.values())
-    colors = sns.color_palette("husl", len(platforms))
-    ax1.pie(counts, labels=platforms, autopct='%1.1f%%', colors=colors, startangle=90)
-    ax1.set_title('Overall Platform Distribution', fontsize=14, fontweight='bold')
-    
-    # By region
-    regions = list(platform_data.keys())
-    indeed_counts = [platform_data[r].get('Indeed', 0) for r in regions]
-    linkedin_counts = [platform_data[r].get('LinkedIn', 0) for r in regions]
-    
-    x = np.arange(len(regions))
-    width = 0.35
-    ax2.bar(x - width/2, indeed_counts, width, label='Indeed', color='#2164f3')
-    ax2.bar(x + width/2, linkedin_counts, width, label='LinkedIn', color='#0077b5')
-    ax2.set_xlabel('Region', fontsize=12)
-    ax2.set_ylabel('Number of Jobs', fontsize=12)
-    ax2.set_title('Platform Distribution by Region', fontsize=14, fontweight='bold')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(regions, rotation=45, ha='right')
-    ax2.legend()
-    ax2.grid(True, alpha=0.3, axis='y')
-    
-    plt.tight_layout()
-    
-    chart_path = os.path.join(output_dir, 'platform_distribution_chart.png')
-    plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return chart_path
-
-
-def create_chart_region_comparison(all_data, output_dir):
-    """Create comprehensive region comparison chart"""
-    regions = []
-    job_counts = []
-    salary_means = []
-    
-    for region_name, df in all_data.items():
-        if not df.empty:
-            regions.append(region_name)
-            job_counts.append(len(df))
-            salary_info = analyze_salary(df, region_name)
-            if salary_info.get('has_data'):
-                salary_means.append(salary_info['mean'])
-            else:
-                salary_means.append(0)
-    
-    if not regions:
-        return None
-    
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-    
-    # Job count
-    ax1 = axes[0, 0]
-    bars1 = ax1.bar(regions, job_counts, color=sns.color_palette("husl", len(regions)))
-    ax1.set_ylabel('Number of Jobs', fontsize=12)
-    ax1.set_title('Total Job Count by Region', fontsize=12, fontweight='bold')
-    ax1.tick_params(axis='x', rotation=45)
-    for bar in bars1:
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height)}',
-                ha='center', va='bottom', fontsize=9)
-    
-    # Average salary
-    ax2 = axes[0, 1]
-    valid_salaries = [(r, s) for r, s in zip(regions, salary_means) if s > 0]
-    if valid_salaries:
-        regions_valid, salaries_valid = zip(*valid_salaries)
-        bars2 = ax2.bar(regions_valid, salaries_valid, color='lightgreen')
-        ax2.set_ylabel('Average Salary (USD)', fontsize=12)
-        ax2.set_title('Average Salary by Region', fontsize=12, fontweight='bold')
-        ax2.tick_params(axis='x', rotation=45)
-        for bar in bars2:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'${int(height):,}',
-                    ha='center', va='bottom', fontsize=9)
-    
-    # Completeness
-    ax3 = axes[1, 0]
-    completeness_scores = []
-    for region_name in regions:
-        df = all_data[region_name]
-        if not df.empty:
-            comp = calculate_completeness(df)
-            total_fields = len(comp)
-            filled_fields = sum(v['count'] for v in comp.values())
-            total_records = len(df)
-            overall = (filled_fields / (total_fields * total_records) * 100) if total_records > 0 else 0
-            completeness_scores.append(overall)
-        else:
-            completeness_scores.append(0)
-    
-    bars3 = ax3.bar(regions, completeness_scores, color='orange')
-    ax3.set_ylabel('Completeness (%)', fontsize=12)
-    ax3.set_title('Data Completeness by Region', fontsize=12, fontweight='bold')
-    ax3.set_ylim(0, 100)
-    ax3.tick_params(axis='x', rotation=45)
-    for bar in bars3:
-        height = bar.get_height()
-        ax3.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.1f}%',
-                ha='center', va='bottom', fontsize=9)
-    
-    # Platform split
-    ax4 = axes[1, 1]
-    indeed_counts = []
-    linkedin_counts = []
-    for region_name in regions:
-        df = all_data[region_name]
-        if not df.empty and 'platform' in df.columns:
-            platforms = df['platform'].value_counts()
-            indeed_counts.append(platforms.get('Indeed', 0))
-            linkedin_counts.append(platforms.get('LinkedIn', 0))
-        else:
-            indeed_counts.append(0)
-            linkedin_counts.append(0)
-    
-    x = np.arange(len(regions))
-    width = 0.35
-    ax4.bar(x - width/2, indeed_counts, width, label='Indeed', color='#2164f3')
-    ax4.bar(x + width/2, linkedin_counts, width, label='LinkedIn', color='#0077b5')
-    ax4.set_ylabel('Number of Jobs', fontsize=12)
-    ax4.set_title('Platform Split by Region', fontsize=12, fontweight='bold')
-    ax4.set_xticks(x)
-    ax4.set_xticklabels(regions, rotation=45, ha='right')
-    ax4.legend()
-    
-    plt.tight_layout()
-    
-    chart_path = os.path.join(output_dir, 'region_comparison_chart.png')
-    plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    return chart_path
+    comparison = {'regions': [], 'job_counts': [], 'salary_means': [], 'completeness': [],
+                  'indeed_counts': [], 'linkedin_counts': []}
+    
+    for region_name in analytics.regions:
+        # Overall completeness
+        overall = analytics.overall_completeness(region_name)
+        completeness['regions'].append(region_name)
+        completeness['scores'].append(overall)
+        
+        salary_info = analytics.salary(region_name)
+        if salary_info.get('has_data'):
+            salary_data[region_name] = salary_info['values']
+        
+        time_info = analytics.time_range(region_name)
+        if time_info.get('has_data'):
+            time_data[region_name] = time_info['monthly']
+        
+        platform_info = analytics.platform(region_name)
+        platforms = platform_info.get('distribution', {})
+        if platform_info.get('has_data'):
+            platform_data[region_name] = platforms
+        
+        comparison['regions'].append(region_name)
+        comparison['job_counts'].append(analytics.row_count(region_name))
+        comparison['salary_means'].append(salary_info['mean'] if salary_info.get('has_data') else 0)
+        comparison['completeness'].append(overall)
+        comparison['indeed_counts'].append(platforms.get('Indeed', 0))
+        comparison['linkedin_counts'].append(platforms.get('LinkedIn', 0))
+    
+    jobs = {}
+    if completeness['regions']:
+        jobs['Completeness'] = ChartJob('completeness_chart.png', region_charts.render_completeness, completeness, spec)
+    if salary_data:
+        jobs['Salary'] = ChartJob('salary_distribution_chart.png', region_charts.render_salary_distribution, salary_data, spec)
+    if time_data:
+        jobs['Time Series'] = ChartJob('time_series_chart.png', region_charts.render_time_series, time_data, spec)
+    if platform_data:
+        jobs['Platform'] = ChartJob('platform_distribution_chart.png', region_charts.render_platform_distribution, platform_data, spec)
+    if comparison['regions']:
+        jobs['Comparison'] = ChartJob('region_comparison_chart.png', region_charts.render_region_comparison, comparison, spec)
+    return jobs
 
 
 def add_heading(doc, text, level=1):
     """Add a heading to document"""
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
     heading = doc.add_heading(text, level=level)
     heading.alignment = WD_ALIGN_PARAGRAPH.LEFT
     return heading
@@ -661,15 +263,19 @@ def add_table_from_dict(doc, data_dict, headers=None):
     return table
 
 
-def generate_report(all_data, output_path, source_folder=None):
+def generate_report(analytics, output_path, source_folder=None):
     """
     Generate comprehensive Word report
     
     Args:
-        all_data: Dictionary mapping region names to DataFrames
+        analytics: ReportAnalytics over the region data
         output_path: Path to save the Word document
         source_folder: Path to the source folder (for metadata)
     """
+    from docx import Document
+    from docx.shared import Inches
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from chart_renderer import render_charts
     print(f"\nGenerating report: {output_path}")
     
     doc = Document()
@@ -702,8 +308,8 @@ def generate_report(all_data, output_path, source_folder=None):
     # Executive Summary
     add_heading(doc, 'Executive Summary', 1)
     
-    total_jobs = sum(len(df) for df in all_data.values() if not df.empty)
-    regions_with_data = [r for r, df in all_data.items() if not df.empty]
+    total_jobs = analytics.total_jobs
+    regions_with_data = analytics.regions
     
     summary_text = f"""
 This report analyzes job posting data across {len(regions_with_data)} regions, containing a total of {total_jobs:,} job records.
@@ -727,23 +333,21 @@ The analysis covers data completeness, salary distributions, temporal patterns,
     # Region-by-Region Analysis
     add_heading(doc, 'Regional Analysis', 1)
     
-    for region_name, df in all_data.items():
-        if df.empty:
-            continue
-        
+    for region_name in analytics.regions:
         add_heading(doc, region_name, 2)
         
         # Basic Statistics
         add_heading(doc, 'Basic Statistics', 3)
+        earliest, latest = analytics.date_bounds(region_name)
         basic_stats = {
-            'Total Jobs': len(df),
-            'Date Range': f"{df['posted_date'].min() if 'posted_date' in df.columns and df['posted_date'].notna().any() else 'N/A'} to {df['posted_date'].max() if 'posted_date' in df.columns and df['posted_date'].notna().any() else 'N/A'}"
+            'Total Jobs': analytics.row_count(region_name),
+            'Date Range': f"{earliest if earliest is not None else 'N/A'} to {latest if latest is not None else 'N/A'}"
         }
         add_table_from_dict(doc, basic_stats)
         
         # Completeness Analysis
         add_heading(doc, 'Data Completeness', 3)
-        completeness = calculate_completeness(df)
+        completeness = analytics.completeness(region_name)
         if completeness:
             comp_table = doc.add_table(rows=1, cols=3)
             comp_table.style = 'Light Grid Accent 1'
@@ -762,7 +366,7 @@ The analysis covers data completeness, salary distributions, temporal patterns,
         
         # Salary Analysis
         add_heading(doc, 'Salary Analysis', 3)
-        salary_info = analyze_salary(df, region_name)
+        salary_info = analytics.salary(region_name)
         if salary_info.get('has_data'):
             salary_stats = {
                 'Sample Size': salary_info['count'],
@@ -780,7 +384,7 @@ The analysis covers data completeness, salary distributions, temporal patterns,
         
         # Time Range Analysis
         add_heading(doc, 'Time Range Analysis', 3)
-        time_info = analyze_time_range(df)
+        time_info = analytics.time_range(region_name)
         if time_info.get('has_data'):
             time_stats = {
                 'Jobs with Dates': time_info['count'],
@@ -788,13 +392,17 @@ The analysis covers data completeness, salary distributions, temporal patterns,
                 'Latest Posting': time_info['latest'].strftime('%Y-%m-%d'),
                 'Time Span': f"{time_info['span_days']} days"
             }
+            if time_info['unparsed']:
+                time_stats['Unparsed Dates'] = time_info['unparsed']
             add_table_from_dict(doc, time_stats)
         else:
             add_paragraph(doc, 'No date information available.')
+        if time_info['unparsed']:
+            print(f"  [WARNING] {region_name}: {time_info['unparsed']} posting dates in an unknown format")
         
         # Location Analysis
         add_heading(doc, 'Top Locations', 3)
-        location_info = analyze_location(df)
+        location_info = analytics.location(region_name)
         if location_info.get('has_data'):
             top_locs = location_info['top_locations']
             if top_locs:
@@ -813,7 +421,7 @@ The analysis covers data completeness, salary distributions, temporal patterns,
         
         # Platform Analysis
         add_heading(doc, 'Platform Distribution', 3)
-        platform_info = analyze_platform(df)
+        platform_info = analytics.platform(region_name)
         if platform_info.get('has_data'):
             add_table_from_dict(doc, platform_info['distribution'], ['Platform', 'Count'])
         else:
@@ -830,64 +438,38 @@ The analysis covers data completeness, salary distributions, temporal patterns,
     charts_dir = os.path.join(os.path.dirname(output_path), 'report_charts')
     os.makedirs(charts_dir, exist_ok=True)
     
-    # Generate and add charts
-    chart_paths = {}
-    
-    chart_path = create_chart_completeness(all_data, charts_dir)
-    if chart_path:
-        chart_paths['Completeness'] = chart_path
-        add_heading(doc, 'Data Completeness Comparison', 2)
-        add_paragraph(doc, 'The following chart compares overall data completeness across all regions.')
-        doc.add_picture(chart_path, width=Inches(6))
-    
-    chart_path = create_chart_salary_distribution(all_data, charts_dir)
-    if chart_path:
-        chart_paths['Salary'] = chart_path
-        add_heading(doc, 'Salary Distribution Comparison', 2)
-        add_paragraph(doc, 'Salary distributions across regions, showing mean, median, and quartiles.')
-        doc.add_picture(chart_path, width=Inches(6))
-    
-    chart_path = create_chart_time_series(all_data, charts_dir)
-    if chart_path:
-        chart_paths['Time Series'] = chart_path
-        add_heading(doc, 'Job Postings Over Time', 2)
-        add_paragraph(doc, 'Monthly job posting trends by region.')
-        doc.add_picture(chart_path, width=Inches(6))
-    
-    chart_path = create_chart_platform_distribution(all_data, charts_dir)
-    if chart_path:
-        chart_paths['Platform'] = chart_path
-        add_heading(doc, 'Platform Distribution', 2)
-        add_paragraph(doc, 'Distribution of job postings by platform (Indeed vs LinkedIn).')
-        doc.add_picture(chart_path, width=Inches(6))
-    
-    chart_path = create_chart_region_comparison(all_data, charts_dir)
-    if chart_path:
-        chart_paths['Comparison'] = chart_path
-        add_heading(doc, 'Comprehensive Region Comparison', 2)
-        add_paragraph(doc, 'Multi-dimensional comparison of regions across key metrics.')
-        doc.add_picture(chart_path, width=Inches(6))
+    # Generate and add charts (unchanged charts are reused from charts_dir)
+    chart_jobs = build_chart_jobs(analytics)
+    chart_paths = dict(zip(chart_jobs, render_charts(list(chart_jobs.values()), charts_dir)))
+    
+    chart_sections = [
+        ('Completeness', 'Data Completeness Comparison',
+         'The following chart compares overall data completeness across all regions.'),
+        ('Salary', 'Salary Distribution Comparison',
+         'Salary distributions across regions, showing mean, median, and quartiles.'),
+        ('Time Series', 'Job Postings Over Time', 'Monthly job posting trends by region.'),
+        ('Platform', 'Platform Distribution', 'Distribution of job postings by platform (Indeed vs LinkedIn).'),
+        ('Comparison', 'Comprehensive Region Comparison', 'Multi-dimensional comparison of regions across key metrics.'),
+    ]
+    for key, heading, description in chart_sections:
+        if key in chart_paths:
+            add_heading(doc, heading, 2)
+            add_paragraph(doc, description)
+            doc.add_picture(chart_paths[key], width=Inches(6))
     
     # Cross-Region Statistics Table
     add_heading(doc, 'Cross-Region Statistics', 2)
     
     comparison_data = []
-    for region_name, df in all_data.items():
-        if df.empty:
-            continue
+    for region_name in analytics.regions:
+        overall_comp = analytics.overall_completeness(region_name)
         
-        comp = calculate_completeness(df)
-        total_fields = len(comp)
-        filled_fields = sum(v['count'] for v in comp.values())
-        total_records = len(df)
-        overall_comp = (filled_fields / (total_fields * total_records) * 100) if total_records > 0 else 0
-        
-        salary_info = analyze_salary(df, region_name)
+        salary_info = analytics.salary(region_name)
         avg_salary = salary_info.get('mean', 0) if salary_info.get('has_data') else 0
         
         comparison_data.append({
             'Region': region_name,
-            'Total Jobs': len(df),
+            'Total Jobs': analytics.row_count(region_name),
             'Completeness (%)': f"{overall_comp:.1f}",
             'Avg Salary (USD)': f"${avg_salary:,.0f}" if avg_salary > 0 else 'N/A'
         })
@@ -917,6 +499,7 @@ The analysis covers data completeness, salary distributions, temporal patterns,
 
 def main():
     """Main function"""
+    from report_analytics import ReportAnalytics
     parser = argparse.ArgumentParser(
         description='Generate comprehensive report from local Excel files',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -947,6 +530,10 @@ Expected folder structure:
     
     args = parser.parse_args()
     
+    # UTF-8 console output (set here rather than at import time)
+    if getattr(sys.stdout, 'encoding', '').lower() != 'utf-8':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    
     if not args.folder:
         print("[ERROR] Please specify a folder path using --folder argument")
         print("Example: python generate_local_report.py --folder \"output/BunchGlobal_2025_01_18\"")
@@ -961,8 +548,9 @@ Expected folder structure:
         print(f"\nLoading data from folder: {args.folder}")
         all_data = load_data_from_folder(args.folder)
         
-        # Check if we have any data
-        total_records = sum(len(df) for df in all_data.values() if not df.empty)
+        # Register the region data with the analytics engine and check if we have any
+        analytics = ReportAnalytics(all_data)
+        total_records = analytics.total_jobs
         if total_records == 0:
             print("\n[WARNING] No data found in any Excel file. Cannot generate report.")
             return
@@ -977,7 +565,7 @@ Expected folder structure:
         folder_name = Path(args.folder).name
         output_path = os.path.join(output_dir, f"local_job_analysis_report_{folder_name}_{timestamp}.docx")
         
-        generate_report(all_data, output_path, source_folder=args.folder)
+        generate_report(analytics, output_path, source_folder=args.folder)
         
         print("\n" + "="*60)
         print("Report generation completed!")
@@ -10,6 +10,8 @@ import sys
 import time
 import re
 import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import date, datetime
 import pandas as pd
 import numpy as np
@@ -23,6 +25,8 @@ except ImportError:
 # Import config - try to use jobspy-specific config first, fall back to main config
 try:
     import config_jobspy
+    # Pinned exchange rates file (None = fetch fresh rates each run)
+    EXCHANGE_RATES_SNAPSHOT = getattr(config_jobspy, 'EXCHANGE_RATES_SNAPSHOT', None)
     # Use jobspy-specific config if available
     if hasattr(config_jobspy, 'JOBSPY_RUN_ID') and config_jobspy.JOBSPY_RUN_ID is not None:
         JOBSPY_RUN_ID = config_jobspy.JOBSPY_RUN_ID
@@ -34,11 +38,20 @@ try:
         JOBSPY_RUN_ID = config.RUN_ID
 except ImportError:
     # If jobspy config doesn't exist, use main config
+    EXCHANGE_RATES_SNAPSHOT = None
     import sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     import config
     JOBSPY_RUN_ID = config.RUN_ID
 
+# Shared run metrics (root metrics.py): stage timers, counters, metrics.json/.prom
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from metrics import get_metrics, reset_metrics, timed
+from exporter import StreamingExporter
+from core.seen_key_index import SeenKeyIndex
+from core.raw_job_log import RawJobLog
+from core.currency_converter import CurrencyConverter
+
 JOBSPY_OUTPUT_DIR = f"output/{JOBSPY_RUN_ID}"
 
 # Output configuration based on RUN_ID
@@ -47,75 +60,84 @@ OUTPUT_FILE = f"{OUTPUT_DIR}/jobspy_max_output.xlsx"
 CHECKPOINT_FILE = f"{OUTPUT_DIR}/jobspy_max_checkpoint.json"
 RAW_DATA_FILE = f"{OUTPUT_DIR}/jobspy_max_raw_data.json"
 
-# Check if RUN_ID has changed, clear old checkpoints if changed
-# First, check for .last_run_id in any output subdirectory
-_last_run_id_file = f"{OUTPUT_DIR}/.last_run_id"
-old_run_id = None
-if os.path.exists(_last_run_id_file):
-    try:
-        with open(_last_run_id_file, "r", encoding="utf-8") as f:
-            old_run_id = f.read().strip()
-    except:
-        pass
-else:
-    # Also check in old output directories
-    if os.path.exists("output"):
-        for item in os.listdir("output"):
-            item_path = os.path.join("output", item)
-            if os.path.isdir(item_path):
-                old_id_file = os.path.join(item_path, ".last_run_id")
-                if os.path.exists(old_id_file):
-                    try:
-                        with open(old_id_file, "r", encoding="utf-8") as f:
-                            old_run_id = f.read().strip()
-                            break
-                    except:
-                        pass
+# Pause between keyword+location requests (seconds)
+REQUEST_DELAY = 0.3
 
-if old_run_id and old_run_id != JOBSPY_RUN_ID:
-    # RUN_ID changed, clear old checkpoint files in all region subdirectories
-    print(f"\n{'='*60}")
-    print(f"RUN_ID changed detected: {old_run_id} -> {JOBSPY_RUN_ID}")
-    print(f"{'='*60}")
-    print("Clearing old checkpoint files in all region subdirectories...")
-    
-    old_output_dir = f"output/{old_run_id}"
-    if os.path.exists(old_output_dir):
-        # Clear checkpoints in all region subdirectories
-        regions = ["united_states", "united_kingdom", "australia", "hong_kong", "singapore"]
-        for region in regions:
-            region_dir = os.path.join(old_output_dir, region)
-            if os.path.exists(region_dir):
-                checkpoint_file = os.path.join(region_dir, "jobspy_max_checkpoint.json")
-                raw_data_file = os.path.join(region_dir, "jobspy_max_raw_data.json")
-                for file_path in [checkpoint_file, raw_data_file]:
-                    if os.path.exists(file_path):
+
+def check_run_id_change():
+    """Clear old checkpoints if RUN_ID changed and record the current RUN_ID (called by main)"""
+    # First, check for .last_run_id in any output subdirectory
+    _last_run_id_file = f"{OUTPUT_DIR}/.last_run_id"
+    old_run_id = None
+    if os.path.exists(_last_run_id_file):
+        try:
+            with open(_last_run_id_file, "r", encoding="utf-8") as f:
+                old_run_id = f.read().strip()
+        except:
+            pass
+    else:
+        # Also check in old output directories
+        if os.path.exists("output"):
+            for item in os.listdir("output"):
+                item_path = os.path.join("output", item)
+                if os.path.isdir(item_path):
+                    old_id_file = os.path.join(item_path, ".last_run_id")
+                    if os.path.exists(old_id_file):
                         try:
-                            os.remove(file_path)
-                            print(f"  Deleted: {file_path}")
-                        except Exception as e:
-                            print(f"  Warning: Could not delete {file_path}: {e}")
-    
-    # Also clear root-level checkpoint files (if they exist)
-    checkpoint_files = [
-        CHECKPOINT_FILE,
-        RAW_DATA_FILE,
-    ]
-    for file_path in checkpoint_files:
-        if os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-                print(f"  Deleted: {file_path}")
-            except:
-                pass
-    
-    print(f"Old checkpoint files cleared. New output will be saved to: {OUTPUT_DIR}")
-    print(f"{'='*60}\n")
+                            with open(old_id_file, "r", encoding="utf-8") as f:
+                                old_run_id = f.read().strip()
+                                break
+                        except:
+                            pass
+
+    if old_run_id and old_run_id != JOBSPY_RUN_ID:
+        # RUN_ID changed, clear old checkpoint files in all region subdirectories
+        print(f"\n{'='*60}")
+        print(f"RUN_ID changed detected: {old_run_id} -> {JOBSPY_RUN_ID}")
+        print(f"{'='*60}")
+        print("Clearing old checkpoint files in all region subdirectories...")
+
+        old_output_dir = f"output/{old_run_id}"
+        if os.path.exists(old_output_dir):
+            # Clear checkpoints in all region subdirectories
+            regions = ["united_states", "united_kingdom", "australia", "hong_kong", "singapore"]
+            for region in regions:
+                region_dir = os.path.join(old_output_dir, region)
+                if os.path.exists(region_dir):
+                    # jobspy_max_checkpoint.json / jobspy_max_raw_data.json / jobspy_max_seen_keys.bin plus the per-platform files
+                    region_files = [
+                        os.path.join(region_dir, name) for name in os.listdir(region_dir)
+                        if name.startswith(("jobspy_max_checkpoint", "jobspy_max_raw_data", "jobspy_max_seen_keys"))
+                    ]
+                    for file_path in region_files:
+                        if os.path.exists(file_path):
+                            try:
+                                os.remove(file_path)
+                                print(f"  Deleted: {file_path}")
+                            except Exception as e:
+                                print(f"  Warning: Could not delete {file_path}: {e}")
+
+        # Also clear root-level checkpoint files (if they exist)
+        checkpoint_files = [
+            CHECKPOINT_FILE,
+            RAW_DATA_FILE,
+        ]
+        for file_path in checkpoint_files:
+            if os.path.exists(file_path):
+                try:
+                    os.remove(file_path)
+                    print(f"  Deleted: {file_path}")
+                except:
+                    pass
+
+        print(f"Old checkpoint files cleared. New output will be saved to: {OUTPUT_DIR}")
+        print(f"{'='*60}\n")
+
+    # Save current RUN_ID
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    with open(_last_run_id_file, "w", encoding="utf-8") as f:
+        f.write(JOBSPY_RUN_ID)
 
-# Save current RUN_ID
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-with open(_last_run_id_file, "w", encoding="utf-8") as f:
-    f.write(JOBSPY_RUN_ID)
 
 # Expected fields from example_output.xlsx - exact order
 EXPECTED_FIELDS = [
@@ -409,10 +431,22 @@ def get_region_output_dir(region_name):
     return f"{JOBSPY_OUTPUT_DIR}/{region_safe_name}"
 
 
-def load_checkpoint(region_name):
-    """Load checkpoint for a specific region"""
+def get_checkpoint_files(region_name, platform=None):
+    """
+    Checkpoint, raw data (JSONL) and seen-key files for a region
+    Indeed (and a combined "both" run) keep the original file names; LinkedIn gets
+    its own set so both platforms can scrape the same region at the same time.
+    """
     region_dir = get_region_output_dir(region_name)
-    checkpoint_file = f"{region_dir}/jobspy_max_checkpoint.json"
+    suffix = f"_{platform}" if platform and platform not in ("indeed", "both") else ""
+    return (f"{region_dir}/jobspy_max_checkpoint{suffix}.json",
+            f"{region_dir}/jobspy_max_raw_data{suffix}.jsonl",
+            f"{region_dir}/jobspy_max_seen_keys{suffix}.bin")
+
+
+def load_checkpoint(region_name, platform=None):
+    """Load checkpoint for a specific region (and platform)"""
+    checkpoint_file, _, _ = get_checkpoint_files(region_name, platform)
     try:
         with open(checkpoint_file, "r", encoding="utf-8") as f:
             return json.load(f)
@@ -420,50 +454,91 @@ def load_checkpoint(region_name):
         return None
 
 
-def save_checkpoint(region_name, keyword_idx, location_idx, seen_job_keys, all_jobs):
-    """Save checkpoint for a specific region"""
-    region_dir = get_region_output_dir(region_name)
-    checkpoint_file = f"{region_dir}/jobspy_max_checkpoint.json"
+def load_seen_keys(region_name, checkpoint, platform=None):
+    """
+    Seen-key index for a region (and platform): the hashes recorded by the checkpoint,
+    or the key list of an older checkpoint (written to the hash file on the next save)
+    """
+    _, _, seen_keys_file = get_checkpoint_files(region_name, platform)
+    if "seen_keys_count" in checkpoint:
+        return SeenKeyIndex.load(seen_keys_file, checkpoint["seen_keys_count"])
+    seen_job_keys = SeenKeyIndex(seen_keys_file)
+    seen_job_keys.update(checkpoint.get("seen_job_keys", []))
+    return seen_job_keys
+
+
+@timed("checkpoint.save")
+def save_checkpoint(region_name, keyword_idx, location_idx, seen_job_keys, raw_jobs, platform=None):
+    """
+    Save checkpoint for a specific region (and platform)
+    seen_job_keys is a SeenKeyIndex and raw_jobs a RawJobLog: only the keys and jobs
+    added since the last save are written, and the checkpoint records how many
+    of each are stored (it is the manifest load_raw_data reads back).
+    """
+    checkpoint_file, _, _ = get_checkpoint_files(region_name, platform)
     os.makedirs(os.path.dirname(checkpoint_file), exist_ok=True)
+    with get_metrics().timer("checkpoint.raw_data_save"):
+        raw_data_count = raw_jobs.commit()
     checkpoint = {
         "region": region_name,
         "keyword_idx": keyword_idx,
         "location_idx": location_idx,
-        "seen_job_keys": list(seen_job_keys),
-        "total_jobs": len(all_jobs),
+        "seen_keys_file": os.path.basename(seen_job_keys.path),
+        "seen_keys_count": seen_job_keys.flush(),
+        "raw_data_file": os.path.basename(raw_jobs.path),
+        "raw_data_count": raw_data_count,
+        "total_jobs": raw_data_count,
         "last_update": time.strftime("%Y-%m-%d %H:%M:%S")
     }
     with open(checkpoint_file, "w", encoding="utf-8") as f:
         json.dump(checkpoint, f, ensure_ascii=False, indent=2)
 
 
-def load_raw_data(region_name):
-    """Load raw job data for a specific region"""
-    region_dir = get_region_output_dir(region_name)
-    raw_data_file = f"{region_dir}/jobspy_max_raw_data.json"
+def serialize_job(job):
+    """Job dict with every value JSON-serialisable (see convert_to_serializable)"""
+    return {key: convert_to_serializable(value) for key, value in job.items()}
+
+
+def _load_legacy_raw_data(region_name, platform=None):
+    """Raw data of a checkpoint written before the JSONL log (one JSON list)"""
+    _, raw_data_file, _ = get_checkpoint_files(region_name, platform)
     try:
-        with open(raw_data_file, "r", encoding="utf-8") as f:
+        with open(raw_data_file[:-len(".jsonl")] + ".json", "r", encoding="utf-8") as f:
             return json.load(f)
     except:
         return []
 
 
-def save_raw_data(region_name, all_jobs):
-    """Save raw job data for a specific region"""
-    region_dir = get_region_output_dir(region_name)
-    raw_data_file = f"{region_dir}/jobspy_max_raw_data.json"
-    os.makedirs(os.path.dirname(raw_data_file), exist_ok=True)
-    
-    # Convert all jobs to serializable format
-    serializable_jobs = []
-    for job in all_jobs:
-        serializable_job = {}
-        for key, value in job.items():
-            serializable_job[key] = convert_to_serializable(value)
-        serializable_jobs.append(serializable_job)
-    
-    with open(raw_data_file, "w", encoding="utf-8") as f:
-        json.dump(serializable_jobs, f, ensure_ascii=False, indent=2)
+def open_raw_data(region_name, checkpoint=None, platform=None):
+    """
+    RawJobLog for a region (and platform), resuming at checkpoint, plus the jobs it already holds
+    Jobs of an older checkpoint (jobspy_max_raw_data.json) are rewritten as JSONL on the next save.
+    """
+    _, raw_data_file, _ = get_checkpoint_files(region_name, platform)
+    if checkpoint and "raw_data_count" in checkpoint:
+        raw_jobs = RawJobLog(raw_data_file, checkpoint["raw_data_count"], serialize_job)
+        return raw_jobs, list(raw_jobs.iter_jobs())
+    raw_jobs = RawJobLog(raw_data_file, serialize=serialize_job)
+    all_jobs = _load_legacy_raw_data(region_name, platform) if checkpoint else []
+    raw_jobs.append(all_jobs)
+    return raw_jobs, all_jobs
+
+
+def iter_raw_data(region_name, platform=None):
+    """Stream the raw jobs recorded by a region's (and platform's) checkpoint"""
+    checkpoint = load_checkpoint(region_name, platform)
+    if not checkpoint:
+        return
+    if "raw_data_count" not in checkpoint:
+        yield from _load_legacy_raw_data(region_name, platform)
+        return
+    _, raw_data_file, _ = get_checkpoint_files(region_name, platform)
+    yield from RawJobLog(raw_data_file, checkpoint["raw_data_count"]).iter_jobs()
+
+
+def load_raw_data(region_name, platform=None):
+    """Load raw job data for a specific region (and platform)"""
+    return list(iter_raw_data(region_name, platform))
 
 
 def convert_to_serializable(obj):
@@ -770,6 +845,8 @@ def initialize_exchange_rates():
     """
     Initialize exchange rates before scraping
     Fetches from API if available, otherwise uses fallback rates
+    With EXCHANGE_RATES_SNAPSHOT set, the rates are read from that file, or
+    written to it on the first run, so later runs convert with the same rates
     """
     global _exchange_rate_cache, _exchange_rate_cache_time
     
@@ -782,20 +859,32 @@ def initialize_exchange_rates():
         print(f"[INFO] Using cached exchange rates (age: {int(current_time - _exchange_rate_cache_time)}s)")
         return _exchange_rate_cache
     
+    # Pinned rates from an earlier run
+    if EXCHANGE_RATES_SNAPSHOT and os.path.exists(EXCHANGE_RATES_SNAPSHOT):
+        try:
+            _exchange_rate_cache = CurrencyConverter.from_snapshot(EXCHANGE_RATES_SNAPSHOT).rates
+            _exchange_rate_cache_time = current_time
+            print(f"[INFO] Using pinned exchange rates from {EXCHANGE_RATES_SNAPSHOT}")
+            return _exchange_rate_cache
+        except ValueError as e:
+            print(f"[WARNING] {e}")
+    
     # Try to fetch from API
     print(f"[INFO] Fetching real-time exchange rates from API...")
     rates = fetch_exchange_rates_from_api()
     
     if rates:
         _exchange_rate_cache = rates
-        _exchange_rate_cache_time = current_time
-        return rates
     else:
         # Use fallback rates
         print(f"[WARNING] Using fallback exchange rates (API unavailable)")
         _exchange_rate_cache = get_fallback_exchange_rates()
-        _exchange_rate_cache_time = current_time
-        return _exchange_rate_cache
+    _exchange_rate_cache_time = current_time
+    
+    if EXCHANGE_RATES_SNAPSHOT:
+        CurrencyConverter.from_rates(_exchange_rate_cache).save_snapshot(EXCHANGE_RATES_SNAPSHOT)
+        print(f"[INFO] Pinned exchange rates to {EXCHANGE_RATES_SNAPSHOT}")
+    return _exchange_rate_cache
 
 
 def get_exchange_rate(from_currency, to_currency="USD"):
@@ -851,6 +940,7 @@ def get_exchange_rate(from_currency, to_currency="USD"):
             return 1.0
 
 
+@timed("regex.salary")
 def extract_salary_from_description(description, region_name=None):
     """
     Extract salary information from job description text
@@ -1162,6 +1252,7 @@ def extract_salary_from_description(description, region_name=None):
     }
 
 
+@timed("regex.requirements")
 def extract_requirements_from_description(description):
     """
     Extract requirements from job description using LinkedIn logic
@@ -1253,33 +1344,29 @@ def scrape_jobspy_maximum(keywords, locations, results_per_search=100, max_total
         print("[ERROR] JobSpy not available. Please install: pip install python-jobspy")
         return None
     
-    # Load checkpoint for this region
-    checkpoint = load_checkpoint(region_name)
+    # Load checkpoint for this region/platform
+    checkpoint = load_checkpoint(region_name, platform)
     if checkpoint:
         print(f"\n[CHECKPOINT] Resuming from previous run for {region_name}...")
         print(f"  Last position: Keyword {checkpoint['keyword_idx']+1}/{len(keywords)}, Location {checkpoint['location_idx']+1}/{len(locations)}")
         print(f"  Previous jobs: {checkpoint['total_jobs']}")
         start_keyword_idx = checkpoint['keyword_idx']
         start_location_idx = checkpoint['location_idx']
-        # Support both old format (seen_urls) and new format (seen_job_keys)
-        if 'seen_job_keys' in checkpoint:
-            seen_job_keys = set(checkpoint.get('seen_job_keys', []))
+        raw_jobs, all_jobs = open_raw_data(region_name, checkpoint, platform)
+        # Support old formats (seen_urls, seen_job_keys list) and the hashed seen-key file
+        if 'seen_keys_count' in checkpoint or 'seen_job_keys' in checkpoint:
+            seen_job_keys = load_seen_keys(region_name, checkpoint, platform)
         else:
             # Migration: if old checkpoint exists, rebuild seen_job_keys from all_jobs
             print("  [INFO] Migrating from URL-based to key-based deduplication...")
-            all_jobs = load_raw_data(region_name)
-            seen_job_keys = set()
-            for job in all_jobs:
-                job_key = generate_job_key(job)
-                if job_key:
-                    seen_job_keys.add(job_key)
+            seen_job_keys = SeenKeyIndex(get_checkpoint_files(region_name, platform)[2])
+            seen_job_keys.update(generate_job_key(job) for job in all_jobs)
             print(f"  [INFO] Rebuilt {len(seen_job_keys)} job keys from existing jobs")
-        all_jobs = load_raw_data(region_name)
     else:
         start_keyword_idx = 0
         start_location_idx = 0
-        seen_job_keys = set()
-        all_jobs = []
+        seen_job_keys = SeenKeyIndex(get_checkpoint_files(region_name, platform)[2])
+        raw_jobs, all_jobs = open_raw_data(region_name, None, platform)
     
     # Determine which platforms to scrape
     platforms_to_scrape = []
@@ -1312,6 +1399,7 @@ def scrape_jobspy_maximum(keywords, locations, results_per_search=100, max_total
     successful_requests = 0
     failed_requests = 0
     last_save_time = time.time()
+    metrics = get_metrics()
     
     # Scrape all keyword+location combinations
     for keyword_idx, keyword in enumerate(keywords):
@@ -1366,10 +1454,12 @@ def scrape_jobspy_maximum(keywords, locations, results_per_search=100, max_total
                         # scrape_params["linkedin_fetch_description"] = True
                         pass
                     
-                    jobs = scrape_jobs(**scrape_params)
+                    with metrics.timer(f"fetch.jobspy.{platform_name}"):
+                        jobs = scrape_jobs(**scrape_params)
                     
                     if isinstance(jobs, pd.DataFrame):
                         if not jobs.empty:
+                            parse_started = time.perf_counter()
                             new_jobs = jobs.to_dict('records')
                             # Add platform identifier to each job
                             for job in new_jobs:
@@ -1380,24 +1470,30 @@ def scrape_jobspy_maximum(keywords, locations, results_per_search=100, max_total
                             duplicate_count = 0
                             for job in new_jobs:
                                 job_key = generate_job_key(job)
-                                if job_key and job_key not in seen_job_keys:
-                                    seen_job_keys.add(job_key)
+                                if job_key and seen_job_keys.add(job_key):
                                     unique_new.append(job)
                                 else:
                                     duplicate_count += 1
+                            metrics.observe("parse.jobspy_records", time.perf_counter() - parse_started)
+                            metrics.inc("jobs.fetched", len(new_jobs))
+                            metrics.inc("jobs.duplicate", duplicate_count)
                             
                             # Apply date filter immediately if specified
                             if min_posted_date:
-                                unique_new = filter_jobs_by_date(unique_new, min_posted_date)
+                                with metrics.timer("filter.date"):
+                                    unique_new = filter_jobs_by_date(unique_new, min_posted_date)
                             
                             # Apply AI relevance filter to keep only AI-related jobs
                             if filter_ai_related:
                                 before_ai_filter = len(unique_new)
-                                unique_new = filter_ai_related_jobs(unique_new, verbose=False)
+                                with metrics.timer("filter.ai_related"):
+                                    unique_new = filter_ai_related_jobs(unique_new, verbose=False)
                                 if len(unique_new) < before_ai_filter:
                                     print(f" (AI filtered: {before_ai_filter} -> {len(unique_new)})", end="")
                             
+                            metrics.inc("jobs.kept", len(unique_new))
                             all_jobs.extend(unique_new)
+                            raw_jobs.append(unique_new)
                             successful_requests += 1
                             if duplicate_count > 0:
                                 print(f"[OK] {len(new_jobs)} jobs, {len(unique_new)} new unique, {duplicate_count} duplicates (total: {len(all_jobs)})")
@@ -1410,23 +1506,23 @@ def scrape_jobspy_maximum(keywords, locations, results_per_search=100, max_total
                         
                 except Exception as e:
                     failed_requests += 1
+                    metrics.inc(f"fetch.jobspy.{platform_name}.errors")
                     error_msg = str(e)[:50]
                     print(f"[ERROR] {error_msg}")
             
             # Save checkpoint and raw data every 10 requests or every 5 minutes
             current_time = time.time()
             if (total_requests % 10 == 0) or (current_time - last_save_time > 300):
-                save_checkpoint(region_name, keyword_idx, location_idx, seen_job_keys, all_jobs)
-                save_raw_data(region_name, all_jobs)
+                save_checkpoint(region_name, keyword_idx, location_idx, seen_job_keys, raw_jobs, platform)
                 last_save_time = current_time
                 print(f"  [SAVED] Checkpoint saved ({len(all_jobs)} jobs, {len(seen_job_keys)} unique keys)")
             
             # Small delay between requests
-            time.sleep(0.3)
+            time.sleep(REQUEST_DELAY)
     
     # Final save
-    save_checkpoint(region_name, len(keywords), len(locations), seen_job_keys, all_jobs)
-    save_raw_data(region_name, all_jobs)
+    save_checkpoint(region_name, len(keywords), len(locations), seen_job_keys, raw_jobs, platform)
+    raw_jobs.close()
     
     elapsed_time = time.time() - start_time
     
@@ -1441,193 +1537,235 @@ def scrape_jobspy_maximum(keywords, locations, results_per_search=100, max_total
         print(f"Date filter applied: Only jobs posted on or after {min_posted_date.strftime('%Y-%m-%d')}")
     print(f"Elapsed time: {elapsed_time:.2f} seconds ({elapsed_time/60:.1f} minutes)")
     print(f"Average time per request: {elapsed_time/total_requests:.2f} seconds" if total_requests > 0 else "N/A")
+    print(metrics.summary())
     print(f"{'='*60}\n")
     
     return all_jobs
 
 
-def map_to_template_format(jobs, region_name=None):
+# Region to currency mapping (default currency of salaries without one)
+REGION_CURRENCY_MAP = {
+    'United States': 'USD',
+    'United Kingdom': 'GBP',
+    'Australia': 'AUD',
+    'Singapore': 'SGD',
+    'Hong Kong': 'HKD',
+}
+
+# map_to_template_format: jobs per chunk, and the size from which chunks go to a process pool
+MAP_CHUNK_SIZE = 2000
+MAP_PARALLEL_MIN_JOBS = 5000
+MAP_WORKERS = None  # None = os.cpu_count()
+
+
+def map_job_details(job, region_name=None):
     """
-    Map JobSpy jobs to example_output.xlsx format
-    Extract Requirements from description
-    Extract Salary from description if structured fields are empty
+    Requirements and salary columns for one job (the expensive part of map_to_template_format)
     
-    Args:
-        jobs: List of job dictionaries
-        region_name: Region name to help identify currency (optional)
+    Returns:
+        (requirements, salary_range, estimated_annual, annual_amount, annual_currency)
+        annual_amount is the estimated annual salary in annual_currency (None if unknown);
+        map_to_template_format converts all of them to USD at once
     """
-    print("Mapping to template format and extracting Requirements and Salary...")
+    default_currency = REGION_CURRENCY_MAP.get(region_name, 'USD')
     
-    mapped_data = {}
-    for field in EXPECTED_FIELDS:
-        mapped_data[field] = []
+    # Requirements - Extract from description using LinkedIn logic
+    description = job.get("description", "")
+    requirements = extract_requirements_from_description(description)
     
-    # Region to currency mapping
-    region_currency_map = {
-        'United States': 'USD',
-        'United Kingdom': 'GBP',
-        'Australia': 'AUD',
-        'Singapore': 'SGD',
-        'Hong Kong': 'HKD',
-    }
-    default_currency = region_currency_map.get(region_name, 'USD')
+    # Salary Range - Try structured fields first, then extract from description
+    min_amount = job.get("min_amount", "")
+    max_amount = job.get("max_amount", "")
+    interval = job.get("interval", "")
+    currency = job.get("currency", "")
     
-    for idx, job in enumerate(jobs):
-        if (idx + 1) % 500 == 0:
-            print(f"  Processing {idx + 1}/{len(jobs)}...")
-        
-        # Job Title
-        mapped_data["Job Title"].append(job.get("title", ""))
-        
-        # Company Name
-        company = job.get("company", "")
-        if pd.isna(company):
-            company = ""
-        mapped_data["Company Name"].append(str(company))
-        
-        # Requirements - Extract from description using LinkedIn logic
-        description = job.get("description", "")
-        requirements = extract_requirements_from_description(description)
-        mapped_data["Requirements"].append(requirements)
-        
-        # Location
-        mapped_data["Location"].append(job.get("location", ""))
-        
-        # Salary Range - Try structured fields first, then extract from description
-        min_amount = job.get("min_amount", "")
-        max_amount = job.get("max_amount", "")
-        interval = job.get("interval", "")
-        currency = job.get("currency", "")
-        
-        salary_range = ""
-        estimated_annual = ""
-        estimated_annual_usd = ""
-        extracted_currency = None
+    salary_range = ""
+    estimated_annual = ""
+    annual_amount = None
+    extracted_currency = None
+    
+    # Method 1: Use structured fields from JobSpy (if available)
+    if pd.notna(min_amount) and pd.notna(max_amount):
+        try:
+            min_val = float(min_amount)
+            max_val = float(max_amount)
+            # Detect currency from job data or use region default
+            if currency and pd.notna(currency):
+                extracted_currency = str(currency).upper()
+            else:
+                extracted_currency = default_currency
+            
+            # Convert to annual salary based on interval
+            interval_str = str(interval).lower() if interval and pd.notna(interval) else ""
+            original_min = min_val
+            original_max = max_val
+            
+            if 'monthly' in interval_str:
+                # Convert monthly to annual
+                min_val = min_val * 12
+                max_val = max_val * 12 if max_val else min_val
+            elif 'hourly' in interval_str or '/hr' in interval_str or 'per hour' in interval_str:
+                # Convert hourly to annual (assume 2080 working hours per year)
+                min_val = min_val * 2080
+                max_val = max_val * 2080 if max_val else min_val
+            # If yearly or no interval specified, use values as-is
+            
+            # Format salary range (show original values with interval for display)
+            currency_symbols = {
+                'USD': '$', 'GBP': '£', 'AUD': 'A$', 'SGD': 'S$', 
+                'HKD': 'HK$', 'EUR': '€', 'CAD': 'C$'
+            }
+            symbol = currency_symbols.get(extracted_currency, extracted_currency)
+            
+            if interval and pd.notna(interval):
+                salary_range = f"{symbol}{int(original_min):,} - {symbol}{int(original_max):,} ({interval})"
+            else:
+                salary_range = f"{symbol}{int(original_min):,} - {symbol}{int(original_max):,}"
+            
+            # Calculate annual average (using converted values)
+            avg = (min_val + max_val) / 2
+            estimated_annual = f"{symbol}{int(avg):,}"
+            annual_amount = avg
+        except (ValueError, TypeError):
+            pass
+    
+    # Method 2: Extract from description if structured fields are empty
+    if not salary_range and description:
+        salary_info = extract_salary_from_description(description, region_name)
         
-        # Method 1: Use structured fields from JobSpy (if available)
-        if pd.notna(min_amount) and pd.notna(max_amount):
-            try:
-                min_val = float(min_amount)
-                max_val = float(max_amount)
-                # Detect currency from job data or use region default
-                if currency and pd.notna(currency):
-                    extracted_currency = str(currency).upper()
-                else:
-                    extracted_currency = default_currency
-                
-                # Convert to annual salary based on interval
-                interval_str = str(interval).lower() if interval and pd.notna(interval) else ""
-                original_min = min_val
-                original_max = max_val
-                
-                if 'monthly' in interval_str:
-                    # Convert monthly to annual
-                    min_val = min_val * 12
-                    max_val = max_val * 12 if max_val else min_val
-                elif 'hourly' in interval_str or '/hr' in interval_str or 'per hour' in interval_str:
-                    # Convert hourly to annual (assume 2080 working hours per year)
-                    min_val = min_val * 2080
-                    max_val = max_val * 2080 if max_val else min_val
-                # If yearly or no interval specified, use values as-is
-                
-                # Format salary range (show original values with interval for display)
+        if salary_info['salary_range']:
+            salary_range = salary_info['salary_range']
+            if salary_info['estimated_annual']:
+                extracted_currency = salary_info['currency']
                 currency_symbols = {
                     'USD': '$', 'GBP': '£', 'AUD': 'A$', 'SGD': 'S$', 
                     'HKD': 'HK$', 'EUR': '€', 'CAD': 'C$'
                 }
                 symbol = currency_symbols.get(extracted_currency, extracted_currency)
-                
-                if interval and pd.notna(interval):
-                    salary_range = f"{symbol}{int(original_min):,} - {symbol}{int(original_max):,} ({interval})"
-                else:
-                    salary_range = f"{symbol}{int(original_min):,} - {symbol}{int(original_max):,}"
-                
-                # Calculate annual average (using converted values)
-                avg = (min_val + max_val) / 2
-                estimated_annual = f"{symbol}{int(avg):,}"
-                
-                # Convert to USD
-                if extracted_currency != "USD":
-                    exchange_rate = get_exchange_rate(extracted_currency, "USD")
-                    avg_usd = avg * exchange_rate
-                    estimated_annual_usd = f"${int(avg_usd):,}"
-                else:
-                    estimated_annual_usd = f"${int(avg):,}"
-            except (ValueError, TypeError):
-                pass
-        
-        # Method 2: Extract from description if structured fields are empty
-        if not salary_range and description:
-            salary_info = extract_salary_from_description(description, region_name)
-            
-            if salary_info['salary_range']:
-                salary_range = salary_info['salary_range']
-                if salary_info['estimated_annual']:
-                    extracted_currency = salary_info['currency']
-                    currency_symbols = {
-                        'USD': '$', 'GBP': '£', 'AUD': 'A$', 'SGD': 'S$', 
-                        'HKD': 'HK$', 'EUR': '€', 'CAD': 'C$'
-                    }
-                    symbol = currency_symbols.get(extracted_currency, extracted_currency)
-                    estimated_annual = f"{symbol}{int(salary_info['estimated_annual']):,}"
-                    
-                    # Convert to USD
-                    if extracted_currency and extracted_currency != "USD":
-                        exchange_rate = get_exchange_rate(extracted_currency, "USD")
-                        avg_usd = salary_info['estimated_annual'] * exchange_rate
-                        estimated_annual_usd = f"${int(avg_usd):,}"
-                    else:
-                        estimated_annual_usd = f"${int(salary_info['estimated_annual']):,}"
-        
-        mapped_data["Salary Range"].append(salary_range)
-        mapped_data["Estimated Annual Salary"].append(estimated_annual)
-        mapped_data["Estimated Annual Salary (USD)"].append(estimated_annual_usd)
-        
-        # Job Description
-        mapped_data["Job Description"].append(description)
-        
+                estimated_annual = f"{symbol}{int(salary_info['estimated_annual']):,}"
+                annual_amount = salary_info['estimated_annual']
+    
+    return requirements, salary_range, estimated_annual, annual_amount, extracted_currency
+
+
+def _map_chunk(jobs, region_name):
+    return [map_job_details(job, region_name) for job in jobs]
+
+
+def _map_chunk_in_worker(jobs, region_name):
+    """_map_chunk on a pool process, plus the metrics it recorded there (for Metrics.merge)"""
+    reset_metrics()
+    return _map_chunk(jobs, region_name), get_metrics().export()
+
+
+def convert_to_usd(amounts, currencies):
+    """
+    Convert a column of salaries to USD in one operation
+    
+    Args:
+        amounts: Annual amounts (None = no salary)
+        currencies: Currency code per amount (None = already USD)
+    
+    Returns:
+        list: "$N,NNN" strings, "" where there is no amount
+    """
+    values = np.array([np.nan if amount is None else amount for amount in amounts], dtype=float)
+    if not len(values):
+        return []
+    if not _exchange_rate_cache:
+        initialize_exchange_rates()
+    usd = CurrencyConverter.from_rates(_exchange_rate_cache).convert_many(values, currencies, "USD")
+    return [f"${int(value):,}" if not np.isnan(value) else "" for value in usd]
+
+
+def _job_column(frame, name, default=""):
+    """Column of the raw jobs frame as objects, with missing values (or a missing column) set to default"""
+    if name not in frame:
+        return pd.Series(default, index=frame.index, dtype=object)
+    column = frame[name].astype(object)
+    return column.where(column.notna(), default)
+
+
+def map_to_template_format(jobs, region_name=None, workers=None):
+    """
+    Map JobSpy jobs to example_output.xlsx format
+    Extract Requirements from description
+    Extract Salary from description if structured fields are empty
+    
+    The per-job requirements/salary extraction runs in chunks of MAP_CHUNK_SIZE,
+    on a process pool once there are MAP_PARALLEL_MIN_JOBS jobs (rows keep the
+    input order, the workers' regex timings are merged into this run's metrics);
+    the other columns are built directly on the DataFrame, and the
+    USD salaries are converted as one column.
+    
+    Args:
+        jobs: List of job dictionaries
+        region_name: Region name to help identify currency (optional)
+        workers: Worker processes (None = MAP_WORKERS, 1 = in this process)
+    """
+    print("Mapping to template format and extracting Requirements and Salary...")
+    
+    chunks = [jobs[i:i + MAP_CHUNK_SIZE] for i in range(0, len(jobs), MAP_CHUNK_SIZE)]
+    workers = workers or MAP_WORKERS or os.cpu_count() or 1
+    details = []
+    if workers > 1 and len(chunks) > 1 and len(jobs) >= MAP_PARALLEL_MIN_JOBS:
+        workers = min(workers, len(chunks))
+        print(f"  {len(jobs)} jobs in {len(chunks)} chunks on {workers} processes...")
+        # Spawned, not forked: this runs on a platform thread while the other platform's
+        # thread may hold locks (HTTP pools, metrics, stdout) a forked child would inherit
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as pool:
+            for chunk_details, chunk_metrics in pool.map(_map_chunk_in_worker, chunks, [region_name] * len(chunks)):
+                details.extend(chunk_details)
+                get_metrics().merge(chunk_metrics)
+                print(f"  Processing {len(details)}/{len(jobs)}...")
+    else:
+        for chunk in chunks:
+            details.extend(_map_chunk(chunk, region_name))
+            if len(chunks) > 1:
+                print(f"  Processing {len(details)}/{len(jobs)}...")
+    
+    frame = pd.DataFrame.from_records(jobs) if jobs else pd.DataFrame()
+    requirements, salary_range, estimated_annual, annual_amount, annual_currency = (
+        list(column) for column in zip(*details)
+    ) if details else ([], [], [], [], [])
+    estimated_annual_usd = convert_to_usd(annual_amount, annual_currency)
+    
+    # Company Size / Job Status: only non-empty values count
+    company_size = _job_column(frame, "company_num_employees")
+    employment_type = _job_column(frame, "employment_type")
+    
+    # Platform - use actual source platform if available, otherwise default to "Indeed"
+    source_platform = _job_column(frame, "_source_platform", "Indeed").astype(str)
+    platform_display = source_platform.str.lower().map({"indeed": "Indeed", "linkedin": "LinkedIn"})
+    platform_display = platform_display.fillna(source_platform.str.capitalize()).replace("", "Indeed")
+    
+    mapped_data = {
+        "Job Title": _job_column(frame, "title"),
+        "Company Name": _job_column(frame, "company").astype(str),
+        "Requirements": requirements,
+        "Location": _job_column(frame, "location"),
+        "Salary Range": salary_range,
+        "Estimated Annual Salary": estimated_annual,
+        "Estimated Annual Salary (USD)": estimated_annual_usd,
+        "Job Description": _job_column(frame, "description"),
         # Team Size/Business Line Size - JobSpy doesn't provide
-        mapped_data["Team Size/Business Line Size"].append("")
-        
-        # Company Size
-        company_size = job.get("company_num_employees", "")
-        if pd.notna(company_size) and company_size:
-            mapped_data["Company Size"].append(str(company_size))
-        else:
-            mapped_data["Company Size"].append("")
-        
-        # Posted Date
-        date_posted = job.get("date_posted", "")
-        mapped_data["Posted Date"].append(str(date_posted) if pd.notna(date_posted) else "")
-        
-        # Job Status
-        employment_type = job.get("employment_type", "")
-        if pd.notna(employment_type) and employment_type:
-            mapped_data["Job Status"].append(employment_type)
-        else:
-            mapped_data["Job Status"].append("Active")
-        
-        # Platform - use actual source platform if available, otherwise default to "Indeed"
-        source_platform = job.get("_source_platform", "Indeed")
-        # Capitalize first letter for consistency
-        if source_platform.lower() == "indeed":
-            platform_display = "Indeed"
-        elif source_platform.lower() == "linkedin":
-            platform_display = "LinkedIn"
-        else:
-            platform_display = source_platform.capitalize() if source_platform else "Indeed"
-        mapped_data["Platform"].append(platform_display)
-        
-        # Job Link
-        mapped_data["Job Link"].append(job.get("job_url", ""))
+        "Team Size/Business Line Size": "",
+        "Company Size": company_size.astype(str).where(company_size.astype(bool), ""),
+        "Posted Date": _job_column(frame, "date_posted").map(str),
+        "Job Status": employment_type.where(employment_type.astype(bool), "Active"),
+        "Platform": platform_display,
+        "Job Link": _job_column(frame, "job_url"),
+    }
     
     # Create DataFrame with exact field order
-    df_mapped = pd.DataFrame(mapped_data)
+    df_mapped = pd.DataFrame(mapped_data, index=frame.index)
     df_mapped = df_mapped[EXPECTED_FIELDS]  # Ensure exact order
     
     return df_mapped
 
 
+@timed("storage.supabase_save")
 def save_to_supabase(df, region_name):
     """
     Save jobs DataFrame to Supabase database
@@ -1691,35 +1829,17 @@ def save_to_supabase(df, region_name):
         print("  Fetching existing records for deduplication...")
         existing_keys = set()
         try:
-            # Fetch in batches (Supabase has a limit on how many records can be returned at once)
-            # We'll fetch all existing job_title + company_name pairs
-            offset = 0
-            batch_size_fetch = 1000
-            max_fetch = 50000  # Safety limit
+            # Keyset-paginated, parallel id ranges, only the two key columns (no row cap)
+            from supabase_reader import fetch_table
+            records = fetch_table(supabase, table_name, columns=["job_title", "company_name"])
             
-            while offset < max_fetch:
-                try:
-                    result = supabase.table(table_name).select("job_title, company_name").range(offset, offset + batch_size_fetch - 1).execute()
-                    if not result.data or len(result.data) == 0:
-                        break
-                    
-                    for record in result.data:
-                        job_title = str(record.get('job_title', '')).strip()
-                        company_name = str(record.get('company_name', '')).strip()
-                        if job_title and company_name:
-                            # Create a normalized key for comparison (case-insensitive)
-                            key = f"{job_title.lower()}|||{company_name.lower()}"
-                            existing_keys.add(key)
-                    
-                    print(f"    Fetched {offset + len(result.data)} existing records...")
-                    
-                    if len(result.data) < batch_size_fetch:
-                        break
-                    
-                    offset += batch_size_fetch
-                except Exception as e:
-                    print(f"    Warning: Error fetching batch at offset {offset}: {str(e)[:100]}")
-                    break
+            for record in records:
+                job_title = str(record.get('job_title', '')).strip()
+                company_name = str(record.get('company_name', '')).strip()
+                if job_title and company_name:
+                    # Create a normalized key for comparison (case-insensitive)
+                    key = f"{job_title.lower()}|||{company_name.lower()}"
+                    existing_keys.add(key)
             
             print(f"  Found {len(existing_keys)} existing job records")
         except Exception as e:
@@ -1838,12 +1958,57 @@ def save_to_supabase(df, region_name):
         traceback.print_exc()
 
 
-def scrape_region(region_name, country_code, keywords, results_per_search, max_total_jobs, parsed_min_date, filter_ai_related, platform="indeed"):
+def scrape_platform(platform_name, region_name, country_code, keywords, locations, results_per_search, max_total_jobs, parsed_min_date, filter_ai_related):
+    """Scrape one platform for a region and map the jobs to the template format (None if nothing was scraped)"""
+    print(f"\n{'='*60}")
+    print(f"Scraping from {platform_name.upper()} for {region_name}")
+    print(f"{'='*60}")
+    
+    all_jobs = scrape_jobspy_maximum(
+        keywords=keywords,
+        locations=locations,
+        results_per_search=results_per_search,
+        max_total_jobs=max_total_jobs,
+        min_posted_date=parsed_min_date,
+        filter_ai_related=filter_ai_related,
+        region_name=region_name,
+        country_indeed=country_code,
+        platform=platform_name
+    )
+    
+    if not all_jobs:
+        print(f"[WARNING] No jobs scraped from {platform_name} for {region_name}")
+        return None
+    
+    # Map to template format
+    print(f"\nProcessing and Formatting Data from {platform_name.upper()}...")
+    return map_to_template_format(all_jobs, region_name=region_name)
+
+
+def completeness_stats(df):
+    """Per-field filled counts/percentages and the overall completeness (%) of a template-format DataFrame"""
+    total_jobs = len(df)
+    stats = {}
+    for field in EXPECTED_FIELDS:
+        non_empty = df[field].notna() & (df[field] != "")
+        count = int(non_empty.sum())
+        percentage = (count / total_jobs * 100) if total_jobs > 0 else 0
+        stats[field] = {"count": count, "percentage": percentage}
+    
+    total_fields = len(EXPECTED_FIELDS) * total_jobs
+    filled_fields = sum(stats[f]["count"] for f in EXPECTED_FIELDS)
+    overall_completeness = (filled_fields / total_fields * 100) if total_fields > 0 else 0
+    return stats, overall_completeness
+
+
+def scrape_region(region_name, country_code, keywords, results_per_search, max_total_jobs, parsed_min_date, filter_ai_related, platform="indeed", concurrent_platforms=False):
     """
     Scrape jobs for a specific region with cross-platform deduplication
     
     If platform="both", will scrape from both Indeed and LinkedIn separately,
     then deduplicate based on job_title + company_name, and combine into one table.
+    With concurrent_platforms=True the two platforms are scraped at the same time
+    (each keeps its own checkpoint file, see get_checkpoint_files).
     """
     print(f"\n{'='*80}")
     print(f"Processing Region: {region_name}")
@@ -1879,38 +2044,20 @@ def scrape_region(region_name, country_code, keywords, results_per_search, max_t
         platforms_to_scrape = ["indeed"]  # Default
     
     # Scrape from each platform separately
-    df_indeed = None
-    df_linkedin = None
-    
-    for platform_name in platforms_to_scrape:
-        print(f"\n{'='*60}")
-        print(f"Scraping from {platform_name.upper()} for {region_name}")
-        print(f"{'='*60}")
-        
-        all_jobs = scrape_jobspy_maximum(
-            keywords=keywords,
-            locations=locations,
-            results_per_search=results_per_search,
-            max_total_jobs=max_total_jobs,
-            min_posted_date=parsed_min_date,
-            filter_ai_related=filter_ai_related,
-            region_name=region_name,
-            country_indeed=country_code,
-            platform=platform_name
-        )
-        
-        if not all_jobs:
-            print(f"[WARNING] No jobs scraped from {platform_name} for {region_name}")
-            continue
-        
-        # Map to template format
-        print(f"\nProcessing and Formatting Data from {platform_name.upper()}...")
-        df_platform = map_to_template_format(all_jobs, region_name=region_name)
-        
-        if platform_name == "indeed":
-            df_indeed = df_platform
-        elif platform_name == "linkedin":
-            df_linkedin = df_platform
+    platform_args = (region_name, country_code, keywords, locations, results_per_search,
+                     max_total_jobs, parsed_min_date, filter_ai_related)
+    platform_frames = {}
+    if concurrent_platforms and len(platforms_to_scrape) > 1:
+        # Indeed and LinkedIn are separate sites, so their requests can overlap
+        with ThreadPoolExecutor(max_workers=len(platforms_to_scrape)) as pool:
+            futures = {pool.submit(scrape_platform, name, *platform_args): name for name in platforms_to_scrape}
+            for future in as_completed(futures):
+                platform_frames[futures[future]] = future.result()
+    else:
+        for platform_name in platforms_to_scrape:
+            platform_frames[platform_name] = scrape_platform(platform_name, *platform_args)
+    df_indeed = platform_frames.get("indeed")
+    df_linkedin = platform_frames.get("linkedin")
     
     # Cross-platform deduplication if both platforms were scraped
     if platform == "both" and df_indeed is not None and df_linkedin is not None:
@@ -1929,30 +2076,27 @@ def scrape_region(region_name, country_code, keywords, results_per_search, max_t
     print(f"{'='*60}")
     
     total_jobs = len(df_final)
-    stats = {}
-    
+    stats, overall_completeness = completeness_stats(df_final)
     for field in EXPECTED_FIELDS:
-        non_empty = df_final[field].notna() & (df_final[field] != "")
-        count = non_empty.sum()
-        percentage = (count / total_jobs * 100) if total_jobs > 0 else 0
-        stats[field] = {"count": count, "percentage": percentage}
-        print(f"  {field}: {count}/{total_jobs} ({percentage:.1f}%)")
+        print(f"  {field}: {stats[field]['count']}/{total_jobs} ({stats[field]['percentage']:.1f}%)")
     
-    total_fields = len(EXPECTED_FIELDS) * total_jobs
-    filled_fields = sum(stats[f]["count"] for f in EXPECTED_FIELDS)
-    overall_completeness = (filled_fields / total_fields * 100) if total_fields > 0 else 0
     print(f"\n  Overall Completeness: {overall_completeness:.1f}%")
     
-    # Save to Excel in region-specific directory
-    os.makedirs(region_dir, exist_ok=True)
-    df_final.to_excel(region_output_file, index=False)
-    
-    # Save to Supabase if enabled
+    # Load export/Supabase settings
     try:
         import config_jobspy
         enable_supabase = getattr(config_jobspy, 'ENABLE_SUPABASE', False)
+        export_parquet = getattr(config_jobspy, 'EXPORT_PARQUET', False)
     except:
         enable_supabase = False
+        export_parquet = False
+    
+    # Save to Excel in region-specific directory (streamed, constant memory)
+    os.makedirs(region_dir, exist_ok=True)
+    with StreamingExporter(region_output_file, EXPECTED_FIELDS, parquet=export_parquet) as writer:
+        writer.write_dataframe(df_final[EXPECTED_FIELDS])
+    
+    # Save to Supabase if enabled
     
     if enable_supabase:
         try:
@@ -1975,6 +2119,81 @@ def scrape_region(region_name, country_code, keywords, results_per_search, max_t
     return df_final
 
 
+def region_summary(region_name, df, elapsed):
+    """Small picklable summary of one region's result (what the region workers send back)"""
+    summary = {
+        "region": region_name,
+        "status": "empty" if df is None else "ok",
+        "jobs": 0 if df is None else len(df),
+        "output_file": f"{get_region_output_dir(region_name)}/jobspy_max_output.xlsx",
+        "elapsed_seconds": round(elapsed, 2),
+    }
+    if df is not None:
+        summary["overall_completeness"] = round(completeness_stats(df)[1], 1)
+    return summary
+
+
+def _scrape_region_in_worker(region_name, country_code, region_settings):
+    """Scrape one region in a worker process; metrics go to the region's own directory"""
+    metrics = reset_metrics(JOBSPY_RUN_ID)
+    started = time.time()
+    try:
+        df = scrape_region(region_name, country_code, concurrent_platforms=True, **region_settings)
+        return region_summary(region_name, df, time.time() - started)
+    finally:
+        metrics.write(get_region_output_dir(region_name))
+
+
+def run_regions_parallel(regions_to_process, region_settings, workers=None):
+    """
+    Scrape each region in its own process (Indeed and LinkedIn concurrently within a region)
+    Every region writes to get_region_output_dir, so checkpoints never collide.
+    Returns the per-region summaries.
+    """
+    workers = workers or len(regions_to_process)
+    print(f"\nParallel mode: {len(regions_to_process)} regions, {workers} worker processes")
+    
+    summaries = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_scrape_region_in_worker, region_name, country_code, region_settings): region_name
+            for region_name, country_code in regions_to_process
+        }
+        for future in as_completed(futures):
+            region_name = futures[future]
+            try:
+                summaries.append(future.result())
+            except Exception as e:
+                print(f"\n[ERROR] Failed to process {region_name}: {str(e)}")
+                summaries.append({"region": region_name, "status": "failed", "jobs": 0, "error": str(e)})
+    return summaries
+
+
+def summarize_regions(summaries, regions_to_process):
+    """Print the combined result of all regions and write it to region_summary.json"""
+    order = [region_name for region_name, _ in regions_to_process]
+    summaries = sorted(summaries, key=lambda summary: order.index(summary["region"]))
+    completed = [summary for summary in summaries if summary["status"] == "ok"]
+    
+    print(f"\n{'='*80}")
+    print("Final Summary")
+    print(f"{'='*80}")
+    print(f"Total regions processed: {len(completed)}")
+    for summary in summaries:
+        if summary["status"] == "ok":
+            print(f"  {summary['region']}: {summary['jobs']} jobs "
+                  f"({summary['overall_completeness']:.1f}% complete, {summary['elapsed_seconds']:.0f}s)")
+        else:
+            print(f"  {summary['region']}: {summary['status']}")
+    print(f"  Total: {sum(summary['jobs'] for summary in summaries)} jobs")
+    print(f"{'='*80}\n")
+    
+    os.makedirs(JOBSPY_OUTPUT_DIR, exist_ok=True)
+    with open(f"{JOBSPY_OUTPUT_DIR}/region_summary.json", "w", encoding="utf-8") as f:
+        json.dump({"run_id": JOBSPY_RUN_ID, "regions": summaries}, f, ensure_ascii=False, indent=2)
+    return summaries
+
+
 def main():
     """Main function"""
     print("="*80)
@@ -1982,6 +2201,8 @@ def main():
     print("="*80)
     print(f"RUN_ID: {JOBSPY_RUN_ID}")
     print(f"Base output directory: {JOBSPY_OUTPUT_DIR}")
+    reset_metrics(JOBSPY_RUN_ID)
+    check_run_id_change()
     
     # Try to load jobspy-specific config, fall back to defaults
     try:
@@ -1990,6 +2211,8 @@ def main():
         max_total_jobs = getattr(config_jobspy, 'MAX_TOTAL_JOBS', None)
         min_posted_date = getattr(config_jobspy, 'MIN_POSTED_DATE', None)
         filter_ai_related = getattr(config_jobspy, 'FILTER_AI_RELATED', True)
+        parallel_regions = getattr(config_jobspy, 'PARALLEL_REGIONS', False)
+        region_workers = getattr(config_jobspy, 'REGION_WORKERS', None)
         
         # Platform selection
         enable_indeed = getattr(config_jobspy, 'ENABLE_INDEED', True)
@@ -2014,6 +2237,8 @@ def main():
         max_total_jobs = None
         min_posted_date = None
         filter_ai_related = True
+        parallel_regions = False
+        region_workers = None
         platform = "indeed"  # Default
         enable_us = True
         enable_uk = False
@@ -2085,41 +2310,45 @@ def main():
             print(f"Warning: Invalid date format in config_jobspy.MIN_POSTED_DATE: '{min_posted_date}', ignoring date filter")
             parsed_min_date = None
     
-    # Process each region
-    all_results = {}
-    for region_name, country_code in regions_to_process:
-        try:
-            result = scrape_region(
-                region_name=region_name,
-                country_code=country_code,
-                keywords=keywords,
-                results_per_search=results_per_search,
-                max_total_jobs=max_total_jobs,
-                parsed_min_date=parsed_min_date,
-                filter_ai_related=filter_ai_related,
-                platform=platform
-            )
-            if result is not None:
-                all_results[region_name] = result
-        except Exception as e:
-            print(f"\n[ERROR] Failed to process {region_name}: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            continue
+    region_settings = {
+        "keywords": keywords,
+        "results_per_search": results_per_search,
+        "max_total_jobs": max_total_jobs,
+        "parsed_min_date": parsed_min_date,
+        "filter_ai_related": filter_ai_related,
+        "platform": platform,
+    }
+    
+    if parallel_regions and len(regions_to_process) > 1:
+        summaries = run_regions_parallel(regions_to_process, region_settings, region_workers)
+        metrics_note = f"{JOBSPY_OUTPUT_DIR}/<region>/metrics.json, metrics.prom"
+    else:
+        # Process each region
+        summaries = []
+        for region_name, country_code in regions_to_process:
+            started = time.time()
+            try:
+                result = scrape_region(region_name=region_name, country_code=country_code, **region_settings)
+                summaries.append(region_summary(region_name, result, time.time() - started))
+            except Exception as e:
+                print(f"\n[ERROR] Failed to process {region_name}: {str(e)}")
+                import traceback
+                traceback.print_exc()
+                summaries.append({"region": region_name, "status": "failed", "jobs": 0, "error": str(e)})
+                continue
+            finally:
+                # Cumulative per-run metrics, rewritten after each region
+                get_metrics().write(JOBSPY_OUTPUT_DIR)
+        metrics_note = f"{JOBSPY_OUTPUT_DIR}/metrics.json, {JOBSPY_OUTPUT_DIR}/metrics.prom"
     
     # Final summary
-    print(f"\n{'='*80}")
-    print("Final Summary")
-    print(f"{'='*80}")
-    print(f"Total regions processed: {len(all_results)}")
-    for region_name, df in all_results.items():
-        print(f"  {region_name}: {len(df)} jobs")
-    print(f"{'='*80}\n")
+    summarize_regions(summaries, regions_to_process)
     
     print(f"[OK] All regions completed!")
+    print(f"Summary: {JOBSPY_OUTPUT_DIR}/region_summary.json")
+    print(f"Metrics: {metrics_note}")
     print(f"\nNote: If interrupted, run again to resume from checkpoint for each region")
 
-
 if __name__ == "__main__":
     try:
         main()
@@ -23,10 +23,17 @@ JobScrapper 统一入口程序
 import os
 import sys
 import json
+import time
+import queue
+import itertools
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import List
 
+# 仓库根目录的共享模块（metrics.py、rate_limiter.py），由入口脚本加入路径；
+# 本目录排在它前面（两边都有 locations_config.py）
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -42,16 +49,21 @@ from config_unified import (
     PLATFORMS, KEYWORDS,
     # Scraping limits
     RESULTS_PER_SEARCH, MAX_TOTAL_JOBS, REQUEST_DELAY,
+    PLATFORM_CONCURRENCY, PLATFORM_RATE_LIMITS,
+    EXCHANGE_RATES_SNAPSHOT,
     # Test mode
     TEST_MODE,
     # Filtering
     FILTER_AI_RELATED, MIN_POSTED_DATE,
     # AI config
     ENABLE_AI_ANALYSIS, GEMINI_API_KEY, GEMINI_MODEL,
-    AI_RATE_LIMIT_PER_MINUTE, AI_DAILY_LIMIT,
+    AI_RATE_LIMIT_PER_MINUTE, AI_TOKENS_PER_MINUTE, AI_DAILY_LIMIT,
     PROMPT_TEMPLATE, RESUME_FROM_CHECKPOINT, CHECKPOINT_INTERVAL,
+    AI_CONCURRENCY, AI_JOB_RETRIES, AI_PACK_SIZE,
+    ENABLE_AI_CACHE, AI_CACHE_FILE,
     # Realtime AI config
     ENABLE_REALTIME_AI, AI_BATCH_SIZE, REALTIME_CHECKPOINT_INTERVAL,
+    REALTIME_QUEUE_SIZE, REALTIME_SCRAPE_WORKERS,
     # Output config
     OUTPUT_FIELDS, AI_ANALYSIS_FIELDS,
     # Helper functions
@@ -60,94 +72,98 @@ from config_unified import (
 
 from core.job_data import JobData, JobDataCollection
 from core.currency_converter import CurrencyConverter
+from core.checkpoint_log import CheckpointLog
 from scrapers.jobspy_scraper import JobSpyScraper
 from ai_analysis.gemini_client import GeminiClient
 from ai_analysis.prompts import PromptManager
 from ai_analysis.batch_processor import BatchProcessor
+from ai_analysis.result_cache import ResultCache
+
+# 运行指标与共享限速器（仓库根目录）
+from metrics import get_metrics, reset_metrics
+from rate_limiter import RateLimiter
 
 
 # =============================================================================
 # 实时AI分析检查点工具函数
 # =============================================================================
 
-def load_realtime_checkpoint(filepath: str) -> tuple:
+def load_realtime_checkpoint(log: CheckpointLog, collection: JobDataCollection, legacy_file: str = None) -> set:
     """
-    加载实时分析检查点。
+    加载实时分析检查点：把追加日志流式读入集合。
+
+    旧版单文件JSON检查点（legacy_file）会被导入日志，之后只使用日志。
 
     Args:
-        filepath: 检查点文件路径
+        log: 检查点日志
+        collection: 恢复结果的职位集合
+        legacy_file: 旧版检查点文件路径（可选）
 
     Returns:
-        (processed_ids: set, results: list) - 已处理的职位ID集合和已有结果列表
+        已处理的职位ID集合
     """
-    if os.path.exists(filepath):
+    if not log.exists() and legacy_file and os.path.exists(legacy_file):
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            return set(data.get('processed_ids', [])), data.get('results', [])
+            jobs = []
+            for result in data.get('results', []):
+                try:
+                    jobs.append(JobData.from_dict(result))
+                except Exception as e:
+                    print(f"[WARNING] 恢复职位失败: {e}")
+            log.append(jobs)
+            log.commit(stats=data.get('stats', {}))
+            log.close()
+            print(f"  检查点: 已导入旧版检查点 {legacy_file}")
         except Exception as e:
             print(f"[WARNING] 加载检查点失败: {e}")
-    return set(), []
 
+    try:
+        return log.load_into(collection)
+    except Exception as e:
+        print(f"[WARNING] 加载检查点失败: {e}")
+        return set()
 
-def save_realtime_checkpoint(filepath: str, processed_ids: set, results: list, stats: dict = None):
+
+def save_realtime_checkpoint(log: CheckpointLog, new_jobs: List[JobData], stats: dict = None):
     """
-    保存实时分析检查点。
+    保存实时分析检查点：只追加上次保存之后新提交的职位。
 
     Args:
-        filepath: 检查点文件路径
-        processed_ids: 已处理的职位ID集合
-        results: 职位结果列表（包含AI分析）
+        log: 检查点日志
+        new_jobs: 新提交的职位（启用AI时包含分析结果）
         stats: 可选的统计信息
     """
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    checkpoint_data = {
-        'processed_ids': list(processed_ids),
-        'results': results,
-        'timestamp': datetime.now().isoformat(),
-        'count': len(results),
-    }
-    if stats:
-        checkpoint_data['stats'] = stats
-
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(checkpoint_data, f, ensure_ascii=False, indent=2, default=str)
+        with get_metrics().timer("checkpoint.save"):
+            log.append(new_jobs)
+            log.commit(stats=stats)
     except Exception as e:
         print(f"[WARNING] 保存检查点失败: {e}")
 
 
 def analyze_job_batch(
     jobs: List[JobData],
-    gemini_client: GeminiClient,
+    processor: BatchProcessor,
     prompt: str,
-    verbose: bool = True
+    verbose: bool = True,
 ) -> List[JobData]:
     """
     对一批职位进行AI分析。
 
     Args:
         jobs: 待分析的职位列表
-        gemini_client: Gemini客户端
+        processor: BatchProcessor（按配置并发、打包请求，失败的职位单独重试）
         prompt: Prompt模板
         verbose: 是否打印详细信息
 
     Returns:
-        已分析的职位列表
+        已分析的职位列表（顺序与输入一致）
     """
-    for job in jobs:
-        # 准备职位数据
-        job_data = {
-            "title": job.title,
-            "company": job.company,
-            "location": job.location,
-            "salary_range": job.salary_range or "Not specified",
-            "description": job.description[:4000] if job.description else "No description",
-        }
-
-        # 调用AI分析
-        result = gemini_client.analyze(prompt, job_data)
+    results = processor.analyze_jobs(prompt, jobs)
 
+    for job, result in zip(jobs, results):
         if result:
             job.ai_analysis = result
             job.ai_analyzed = True
@@ -186,6 +202,11 @@ def get_locations_for_region(region_name: str) -> List[str]:
     return fallback.get(region_name, [region_name])
 
 
+def platform_rate_limiters() -> dict:
+    """每个平台一个限速器（PLATFORM_RATE_LIMITS 为 None 的平台不限速）。"""
+    return {platform: RateLimiter(limit) for platform, limit in PLATFORM_RATE_LIMITS.items() if limit}
+
+
 def run_scraping_for_region(region_name: str) -> JobDataCollection:
     """运行单个地区的爬取。"""
     print("\n" + "=" * 60)
@@ -210,6 +231,9 @@ def run_scraping_for_region(region_name: str) -> JobDataCollection:
         platforms=PLATFORMS,
         request_delay=REQUEST_DELAY,
         results_per_search=effective['results_per_search'],
+        platform_concurrency=PLATFORM_CONCURRENCY,
+        rate_limiters=platform_rate_limiters(),
+        rates_snapshot=EXCHANGE_RATES_SNAPSHOT,
     )
 
     # Run scraping
@@ -232,6 +256,10 @@ def run_scraping_with_realtime_ai(region_name: str) -> JobDataCollection:
     """
     运行边爬边分析模式：抓取职位的同时进行AI分析。
 
+    爬取线程把职位推入有界队列，AI分析线程并发消费，两个阶段重叠执行；
+    队列满时爬取线程等待。主线程按入队顺序（offset）提交分析结果，
+    检查点只包含水位线以内连续完成的职位。
+
     优势：
     - 减少内存占用（流式处理）
     - 中断损失更小（每批保存检查点）
@@ -262,41 +290,46 @@ def run_scraping_with_realtime_ai(region_name: str) -> JobDataCollection:
     print(f"  AI批处理大小: {AI_BATCH_SIZE}")
     print()
 
-    # 初始化检查点路径
+    # 初始化检查点路径（追加日志目录）
     region_safe = region_name.replace(' ', '_').lower()
     checkpoint_dir = OUTPUT_DIR / "realtime_checkpoints"
-    checkpoint_file = str(checkpoint_dir / f"{region_safe}_realtime.json")
-
-    # 加载检查点
-    processed_ids, saved_results = load_realtime_checkpoint(checkpoint_file)
-    print(f"  检查点: 已处理 {len(processed_ids)} 个职位")
+    checkpoint_log = CheckpointLog(str(checkpoint_dir / f"{region_safe}_realtime"))
 
-    # 初始化结果集合
+    # 初始化结果集合，从检查点流式恢复已保存的结果
     collection = JobDataCollection()
-
-    # 恢复已保存的结果
-    for result in saved_results:
-        try:
-            job = JobData.from_dict(result)
-            collection.add(job, deduplicate=False)
-        except Exception as e:
-            print(f"[WARNING] 恢复职位失败: {e}")
+    processed_ids = load_realtime_checkpoint(
+        checkpoint_log,
+        collection,
+        legacy_file=str(checkpoint_dir / f"{region_safe}_realtime.json"),
+    )
+    print(f"  检查点: 已处理 {len(processed_ids)} 个职位")
 
     # 初始化AI客户端（如果启用）
     gemini_client = None
+    processor = None
     prompt = None
     if ENABLE_AI_ANALYSIS and GEMINI_API_KEY:
         try:
             gemini_client = GeminiClient(
                 api_key=GEMINI_API_KEY,
                 model=GEMINI_MODEL,
-                rate_limit_per_minute=AI_RATE_LIMIT_PER_MINUTE,
                 daily_limit=AI_DAILY_LIMIT,
+                rate_limiter=RateLimiter(AI_RATE_LIMIT_PER_MINUTE, AI_TOKENS_PER_MINUTE),
+                cache=ResultCache(str(AI_CACHE_FILE)) if ENABLE_AI_CACHE else None,
+                metrics=get_metrics(),
             )
             prompt_manager = PromptManager()
             prompt = prompt_manager.get_template(PROMPT_TEMPLATE)
             if not prompt:
                 prompt = prompt_manager.get_default_template()
+            processor = BatchProcessor(
+                gemini_client=gemini_client,
+                prompt_manager=prompt_manager,
+                checkpoint_dir=str(OUTPUT_DIR / "checkpoints"),
+                max_workers=AI_CONCURRENCY,
+                job_retries=AI_JOB_RETRIES,
+                pack_size=AI_PACK_SIZE,
+            )
             print(f"  AI分析: 已启用 (模型: {GEMINI_MODEL})")
         except Exception as e:
             print(f"  AI分析: 初始化失败 - {e}")
@@ -312,160 +345,235 @@ def run_scraping_with_realtime_ai(region_name: str) -> JobDataCollection:
         platforms=PLATFORMS,
         request_delay=REQUEST_DELAY,
         results_per_search=effective['results_per_search'],
+        platform_concurrency=PLATFORM_CONCURRENCY,
+        rate_limiters=platform_rate_limiters(),
+        rates_snapshot=EXCHANGE_RATES_SNAPSHOT,
     )
     scraper.currency_converter.initialize()
 
-    # 批处理缓冲区
-    batch_buffer = []
-    seen_keys = set(processed_ids)  # 用于去重
+    # 去重集合（爬取线程共享）
+    seen_keys = set(processed_ids)
+    seen_lock = threading.Lock()
+    max_total_jobs = effective['max_total_jobs']
+    restored_count = len(collection)
     total_scraped = 0
-    total_analyzed = 0
-    batch_count = 0
 
-    # 循环爬取
-    total_combinations = len(effective['keywords']) * len(locations) * len(PLATFORMS)
-    current_combo = 0
-
-    for keyword in effective['keywords']:
-        if effective['max_total_jobs'] and len(collection) >= effective['max_total_jobs']:
-            break
-
-        for location in locations:
-            if effective['max_total_jobs'] and len(collection) >= effective['max_total_jobs']:
-                break
-
-            for platform in PLATFORMS:
-                if effective['max_total_jobs'] and len(collection) >= effective['max_total_jobs']:
-                    break
-
-                current_combo += 1
-                progress = f"[{current_combo}/{total_combinations}]"
-                print(f"{progress} {platform.upper()}: '{keyword}' in '{location}'...", end=" ")
-
-                # 爬取
-                try:
+    # 爬取组合（爬取线程共享一个任务队列）
+    combos = [
+        (keyword, location, platform)
+        for keyword in effective['keywords']
+        for location in locations
+        for platform in PLATFORMS
+    ]
+    total_combinations = len(combos)
+    combo_queue = queue.Queue()
+    for index, combo in enumerate(combos, 1):
+        combo_queue.put((index, combo))
+
+    # 有界队列：爬取线程 -> AI分析线程，队列满时爬取线程阻塞（背压）
+    job_queue = queue.Queue(maxsize=REALTIME_QUEUE_SIZE)
+    # 分析完成的职位：AI分析线程 -> 主线程
+    done_queue = queue.Queue()
+    stop_event = threading.Event()
+    offsets = itertools.count()
+    metrics = get_metrics()
+
+    def quota_reached() -> bool:
+        return bool(max_total_jobs) and restored_count + total_scraped >= max_total_jobs
+
+    def prepare_job(job_dict: dict, platform: str):
+        """转换、去重、过滤一个职位；不需要时返回None。"""
+        job = JobData.from_jobspy_dict(job_dict, platform)
+
+        # 去重
+        with seen_lock:
+            if job._dedup_key in seen_keys:
+                return None
+            seen_keys.add(job._dedup_key)
+
+        # 日期过滤
+        if MIN_POSTED_DATE and job.posted_date:
+            if job.posted_date < MIN_POSTED_DATE:
+                return None
+
+        # AI相关性过滤
+        if FILTER_AI_RELATED:
+            if not scraper._is_ai_related(job):
+                return None
+
+        # 处理薪资
+        with metrics.timer("regex.salary"):
+            scraper._process_salary(job, region_name)
+
+        # 提取要求
+        with metrics.timer("regex.requirements"):
+            job.requirements = scraper.salary_processor.extract_requirements(job.description)
+        return job
+
+    def enqueue(job: JobData) -> bool:
+        """放入有界队列，队列满时等待；停止时返回False。"""
+        item = (next(offsets), job)
+        while not stop_event.is_set():
+            try:
+                job_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def scrape_worker():
+        """爬取线程：从组合队列取任务，把新职位推入有界队列。"""
+        nonlocal total_scraped
+        while not stop_event.is_set() and not quota_reached():
+            try:
+                index, (keyword, location, platform) = combo_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            progress = f"[{index}/{total_combinations}]"
+            try:
+                with metrics.timer(f"fetch.jobspy.{platform}"):
                     jobs = scraper._scrape_with_retry(
                         keyword=keyword,
                         location=location,
                         platform=platform,
                         region_name=region_name,
                     )
-                except Exception as e:
-                    print(f"[ERROR] {e}")
-                    continue
-
-                if jobs is None:
-                    print("[FAILED]")
-                    continue
-
-                # 处理职位
-                new_count = 0
-                for job_dict in jobs:
-                    # 转换为JobData
-                    job = JobData.from_jobspy_dict(job_dict, platform)
-
-                    # 去重
-                    if job._dedup_key in seen_keys:
-                        continue
-                    seen_keys.add(job._dedup_key)
-
-                    # 日期过滤
-                    if MIN_POSTED_DATE and job.posted_date:
-                        if job.posted_date < MIN_POSTED_DATE:
-                            continue
-
-                    # AI相关性过滤
-                    if FILTER_AI_RELATED:
-                        if not scraper._is_ai_related(job):
-                            continue
-
-                    # 处理薪资
-                    scraper._process_salary(job, region_name)
-
-                    # 提取要求
-                    job.requirements = scraper.salary_processor.extract_requirements(job.description)
-
-                    # 添加到批处理缓冲区
-                    batch_buffer.append(job)
-                    new_count += 1
-                    total_scraped += 1
+            except Exception as e:
+                print(f"{progress} {platform.upper()}: '{keyword}' in '{location}' [ERROR] {e}")
+                continue
 
-                print(f"[OK] {len(jobs)} found, {new_count} new")
+            if jobs is None:
+                print(f"{progress} {platform.upper()}: '{keyword}' in '{location}' [FAILED]")
+                continue
 
-                # 检查是否需要进行批量AI分析
-                if len(batch_buffer) >= AI_BATCH_SIZE and gemini_client:
-                    print(f"  -> 批量AI分析 ({len(batch_buffer)} 个职位)...")
+            prepared = [job for job in (prepare_job(job_dict, platform) for job_dict in jobs) if job is not None]
+            # 整次搜索的美元薪资一次换算
+            scraper._convert_salaries_to_usd(prepared)
 
-                    # AI分析
-                    analyzed_jobs = analyze_job_batch(
-                        batch_buffer,
-                        gemini_client,
-                        prompt,
-                        verbose=True
-                    )
+            new_count = 0
+            for job in prepared:
+                with seen_lock:
+                    if quota_reached():
+                        break
+                    total_scraped += 1
+                if not enqueue(job):
+                    return
+                new_count += 1
+
+            print(f"{progress} {platform.upper()}: '{keyword}' in '{location}' [OK] {len(jobs)} found, {new_count} new")
+
+            # 请求延迟
+            time.sleep(REQUEST_DELAY)
+
+    def ai_worker():
+        """AI分析线程：每次取一个打包请求的职位数，分析后交给主线程提交。"""
+        take = processor.pack_size if processor else AI_BATCH_SIZE
+        while True:
+            item = job_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            finished = False
+            while len(batch) < take:
+                try:
+                    item = job_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    finished = True
+                    break
+                batch.append(item)
 
-                    # 添加到集合
-                    for job in analyzed_jobs:
-                        collection.add(job, deduplicate=False)
-                        processed_ids.add(job._dedup_key)
-
-                    total_analyzed += len(analyzed_jobs)
-                    batch_count += 1
-
-                    # 保存检查点
-                    if batch_count % REALTIME_CHECKPOINT_INTERVAL == 0:
-                        results_to_save = [job.to_dict() for job in collection]
-                        save_realtime_checkpoint(
-                            checkpoint_file,
-                            processed_ids,
-                            results_to_save,
-                            stats={
-                                'total_scraped': total_scraped,
-                                'total_analyzed': total_analyzed,
-                                'batch_count': batch_count,
-                            }
-                        )
-                        print(f"  -> 检查点已保存 ({len(collection)} 个职位)")
-
-                    # 清空缓冲区
-                    batch_buffer = []
-
-                # 请求延迟
-                import time
-                time.sleep(REQUEST_DELAY)
-
-    # 处理剩余的职位
-    if batch_buffer:
-        if gemini_client:
-            print(f"\n处理剩余 {len(batch_buffer)} 个职位...")
-            analyzed_jobs = analyze_job_batch(
-                batch_buffer,
-                gemini_client,
-                prompt,
-                verbose=True
-            )
-            for job in analyzed_jobs:
-                collection.add(job, deduplicate=False)
-                processed_ids.add(job._dedup_key)
-            total_analyzed += len(analyzed_jobs)
-        else:
-            # 没有AI分析，直接添加
-            for job in batch_buffer:
-                collection.add(job, deduplicate=False)
+            jobs = [job for _, job in batch]
+            if processor and not stop_event.is_set():
+                try:
+                    analyze_job_batch(jobs, processor, prompt, verbose=True)
+                except Exception as e:
+                    print(f"    [AI] 批量分析出错: {e}")
+            for offset, job in batch:
+                done_queue.put((offset, job))
+
+            if finished:
+                return
+
+    scrape_workers = max(1, REALTIME_SCRAPE_WORKERS)
+    ai_workers = max(1, AI_CONCURRENCY) if processor else 1
+    print(f"  流水线: {scrape_workers} 个爬取线程 -> 队列({REALTIME_QUEUE_SIZE}) -> {ai_workers} 个AI分析线程")
+
+    producers = [threading.Thread(target=scrape_worker, daemon=True) for _ in range(scrape_workers)]
+    consumers = [threading.Thread(target=ai_worker, daemon=True) for _ in range(ai_workers)]
+    for thread in producers + consumers:
+        thread.start()
+
+    # 提交水位线：offset 小于 committed 的职位都已分析完并加入集合，
+    # 检查点只保存水位线以内的职位，中断后从连续完成的位置恢复
+    completed = {}
+    committed = 0
+    total_analyzed = 0
+    batch_count = 0
+    since_checkpoint = 0
+    checkpoint_every = max(1, AI_BATCH_SIZE * REALTIME_CHECKPOINT_INTERVAL)
+    queue_closed = False
 
-    # 最终保存检查点
-    results_to_save = [job.to_dict() for job in collection]
-    save_realtime_checkpoint(
-        checkpoint_file,
-        processed_ids,
-        results_to_save,
-        stats={
+    uncheckpointed = []
+
+    def save_committed(completed_run: bool = False):
+        stats = {
             'total_scraped': total_scraped,
             'total_analyzed': total_analyzed,
             'batch_count': batch_count,
-            'completed': True,
+            'committed_offset': committed,
         }
-    )
+        if completed_run:
+            stats['completed'] = True
+        save_realtime_checkpoint(checkpoint_log, uncheckpointed, stats=stats)
+        uncheckpointed.clear()
+
+    try:
+        while True:
+            # 所有爬取线程结束后，给每个AI线程发送结束标记
+            if not queue_closed and not any(t.is_alive() for t in producers):
+                for _ in consumers:
+                    job_queue.put(None)
+                queue_closed = True
+
+            try:
+                offset, job = done_queue.get(timeout=0.5)
+            except queue.Empty:
+                if queue_closed and not any(t.is_alive() for t in consumers) and done_queue.empty():
+                    break
+                continue
+
+            completed[offset] = job
+
+            # 推进水位线
+            while committed in completed:
+                job = completed.pop(committed)
+                collection.add(job, deduplicate=False)
+                uncheckpointed.append(job)
+                if gemini_client:
+                    processed_ids.add(job._dedup_key)
+                    total_analyzed += 1
+                committed += 1
+                since_checkpoint += 1
+
+            # 保存检查点（未启用AI时同样保存已提交的职位）
+            if since_checkpoint >= checkpoint_every:
+                batch_count += 1
+                since_checkpoint = 0
+                save_committed()
+                print(f"  -> 检查点已保存 ({len(collection)} 个职位, 水位线 {committed})")
+    except KeyboardInterrupt:
+        stop_event.set()
+        save_committed()
+        checkpoint_log.close()
+        print(f"\n[中断] 检查点已保存 ({len(collection)} 个职位, 水位线 {committed})")
+        raise
+
+    # 最终保存检查点
+    save_committed(completed_run=True)
+    checkpoint_log.close()
 
     # 打印统计信息
     print("\n" + "=" * 60)
@@ -479,6 +587,8 @@ def run_scraping_with_realtime_ai(region_name: str) -> JobDataCollection:
         print(f"  API调用: {stats['request_count']} 次")
         print(f"  Token用量: {stats['input_tokens']:,} 输入, {stats['output_tokens']:,} 输出")
         print(f"  预估成本: ${stats['estimated_cost_usd']:.4f}")
+        if 'cache_hit_rate' in stats:
+            print(f"  缓存命中率: {stats['cache_hit_rate']:.1%} ({stats['cache_hits']} 命中)")
     print("=" * 60)
 
     return collection
@@ -507,8 +617,10 @@ def run_ai_analysis(collection: JobDataCollection, region_name: str) -> JobDataC
         client = GeminiClient(
             api_key=GEMINI_API_KEY,
             model=GEMINI_MODEL,
-            rate_limit_per_minute=AI_RATE_LIMIT_PER_MINUTE,
             daily_limit=AI_DAILY_LIMIT,
+            rate_limiter=RateLimiter(AI_RATE_LIMIT_PER_MINUTE, AI_TOKENS_PER_MINUTE),
+            cache=ResultCache(str(AI_CACHE_FILE)) if ENABLE_AI_CACHE else None,
+            metrics=get_metrics(),
         )
     except Exception as e:
         print(f"[ERROR] 初始化Gemini客户端失败: {e}")
@@ -530,6 +642,9 @@ def run_ai_analysis(collection: JobDataCollection, region_name: str) -> JobDataC
         prompt_manager=prompt_manager,
         checkpoint_dir=str(OUTPUT_DIR / "checkpoints"),
         checkpoint_interval=CHECKPOINT_INTERVAL,
+        max_workers=AI_CONCURRENCY,
+        job_retries=AI_JOB_RETRIES,
+        pack_size=AI_PACK_SIZE,
     )
 
     # Process collection
@@ -607,6 +722,7 @@ def main():
     # Process each region
     all_results = {}
     total_jobs = 0
+    metrics = reset_metrics(RUN_ID)
 
     for region_idx, region_name in enumerate(regions_to_process, 1):
         print("\n" + "=" * 60)
@@ -646,6 +762,9 @@ def main():
         }
         total_jobs += len(collection)
 
+        # 每个地区完成后更新本次运行的指标文件
+        metrics.write(OUTPUT_DIR)
+
     # Final Summary
     print("\n" + "=" * 60)
     print("全部完成!")
@@ -658,7 +777,10 @@ def main():
     print("-" * 40)
     print(f"  输出目录: {OUTPUT_DIR}")
     print(f"  配置文件: test_jobspy/config_unified.py")
-    print("=" * 60 + "\n")
+    print("=" * 60)
+    print(metrics.summary())
+    metrics.write(OUTPUT_DIR)
+    print(f"  指标文件: {OUTPUT_DIR}/metrics.json, metrics.prom\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Cross-region charts of generate_local_report and generate_supabase_report.
+
+Each render function draws one chart from a small aggregate table built by the
+report's build_chart_jobs() and saves it to path; chart_renderer.render_charts
+runs them on a process pool and skips the ones whose table has not changed.
+"""
+import matplotlib
+matplotlib.use('Agg')  # Backend that works without display
+import matplotlib.pyplot as plt
+import numpy as np
+import seaborn as sns
+
+
+def chart_spec():
+    """Style shared by the report charts (seaborn whitegrid, CJK-capable fonts)"""
+    rc = dict(sns.axes_style("whitegrid"))
+    rc['font.sans-serif'] = ['SimHei', 'Arial Unicode MS', 'DejaVu Sans']
+    rc['axes.unicode_minus'] = False
+    return {'dpi': 300, 'rc': rc}
+
+
+def render_completeness(data, spec, path):
+    """Overall completeness per region: {'regions': [...], 'scores': [...]}"""
+    regions = data['regions']
+    completeness_scores = data['scores']
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    bars = ax.bar(regions, completeness_scores, color=sns.color_palette("husl", len(regions)))
+    ax.set_ylabel('Overall Completeness (%)', fontsize=12)
+    ax.set_xlabel('Region', fontsize=12)
+    ax.set_title('Data Completeness by Region', fontsize=14, fontweight='bold')
+    ax.set_ylim(0, 100)
+
+    # Add value labels on bars
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+                f'{height:.1f}%',
+                ha='center', va='bottom', fontsize=10)
+
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout()
+    plt.savefig(path, dpi=spec['dpi'], bbox_inches='tight')
+    plt.close()
+
+
+def render_salary_distribution(data, spec, path):
+    """USD salaries per region: {region: [values]}"""
+    salary_data = data
+
+    fig, axes = plt.subplots(2, 1, figsize=(12, 10))
+
+    # Box plot
+    ax1 = axes[0]
+    data_for_box = [salary_data[r] for r in salary_data.keys()]
+    labels = list(salary_data.keys())
+    bp = ax1.boxplot(data_for_box, tick_labels=labels, patch_artist=True)
+    for patch in bp['boxes']:
+        patch.set_facecolor(sns.color_palette("husl", len(labels))[bp['boxes'].index(patch)])
+    ax1.set_ylabel('Annual Salary (USD)', fontsize=12)
+    ax1.set_title('Salary Distribution by Region (Box Plot)', fontsize=14, fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+    plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha='right')
+
+    # Bar chart with statistics
+    ax2 = axes[1]
+    means = [np.mean(salary_data[r]) for r in labels]
+    medians = [np.median(salary_data[r]) for r in labels]
+    x = np.arange(len(labels))
+    width = 0.35
+
+    bars1 = ax2.bar(x - width/2, means, width, label='Mean', color='skyblue')
+    bars2 = ax2.bar(x + width/2, medians, width, label='Median', color='lightcoral')
+
+    ax2.set_ylabel('Annual Salary (USD)', fontsize=12)
+    ax2.set_xlabel('Region', fontsize=12)
+    ax2.set_title('Mean vs Median Salary by Region', fontsize=14, fontweight='bold')
+    ax2.set_xticks(x)
+    ax2.set_xticklabels(labels, rotation=45, ha='right')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3, axis='y')
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=spec['dpi'], bbox_inches='tight')
+    plt.close()
+
+
+def render_time_series(data, spec, path):
+    """Monthly posting counts per region: {region: {'months': ['2025-01', ...], 'counts': [...]}}"""
+    fig, ax = plt.subplots(figsize=(14, 6))
+
+    for region_name, monthly_counts in data.items():
+        ax.plot(monthly_counts['months'], monthly_counts['counts'],
+                marker='o', label=region_name, linewidth=2, markersize=6)
+
+    ax.set_xlabel('Month', fontsize=12)
+    ax.set_ylabel('Number of Job Postings', fontsize=12)
+    ax.set_title('Job Postings Over Time by Region', fontsize=14, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout()
+    plt.savefig(path, dpi=spec['dpi'], bbox_inches='tight')
+    plt.close()
+
+
+def render_platform_distribution(data, spec, path):
+    """Jobs per platform per region: {region: {platform: count}}"""
+    platform_data = data
+
+    # Aggregate across all regions
+    total_platforms = {}
+    for region_data in platform_data.values():
+        for platform, count in region_data.items():
+            total_platforms[platform] = total_platforms.get(platform, 0) + count
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+
+    # Overall distribution
+    platforms = list(total_platforms.keys())
+    counts = list(total_platforms.values())
+    colors = sns.color_palette("husl", len(platforms))
+    ax1.pie(counts, labels=platforms, autopct='%1.1f%%', colors=colors, startangle=90)
+    ax1.set_title('Overall Platform Distribution', fontsize=14, fontweight='bold')
+
+    # By region
+    regions = list(platform_data.keys())
+    indeed_counts = [platform_data[r].get('Indeed', 0) for r in regions]
+    linkedin_counts = [platform_data[r].get('LinkedIn', 0) for r in regions]
+
+    x = np.arange(len(regions))
+    width = 0.35
+    ax2.bar(x - width/2, indeed_counts, width, label='Indeed', color='#2164f3')
+    ax2.bar(x + width/2, linkedin_counts, width, label='LinkedIn', color='#0077b5')
+    ax2.set_xlabel('Region', fontsize=12)
+    ax2.set_ylabel('Number of Jobs', fontsize=12)
+    ax2.set_title('Platform Distribution by Region', fontsize=14, fontweight='bold')
+    ax2.set_xticks(x)
+    ax2.set_xticklabels(regions, rotation=45, ha='right')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3, axis='y')
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=spec['dpi'], bbox_inches='tight')
+    plt.close()
+
+
+def render_region_comparison(data, spec, path):
+    """
+    Per-region metrics, one list each: {'regions', 'job_counts', 'salary_means' (0 = no data),
+    'completeness', 'indeed_counts', 'linkedin_counts'}
+    """
+    regions = data['regions']
+
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+
+    # Job count
+    ax1 = axes[0, 0]
+    bars1 = ax1.bar(regions, data['job_counts'], color=sns.color_palette("husl", len(regions)))
+    ax1.set_ylabel('Number of Jobs', fontsize=12)
+    ax1.set_title('Total Job Count by Region', fontsize=12, fontweight='bold')
+    ax1.tick_params(axis='x', rotation=45)
+    for bar in bars1:
+        height = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., height,
+                f'{int(height)}',
+                ha='center', va='bottom', fontsize=9)
+
+    # Average salary
+    ax2 = axes[0, 1]
+    valid_salaries = [(r, s) for r, s in zip(regions, data['salary_means']) if s > 0]
+    if valid_salaries:
+        regions_valid, salaries_valid = zip(*valid_salaries)
+        bars2 = ax2.bar(regions_valid, salaries_valid, color='lightgreen')
+        ax2.set_ylabel('Average Salary (USD)', fontsize=12)
+        ax2.set_title('Average Salary by Region', fontsize=12, fontweight='bold')
+        ax2.tick_params(axis='x', rotation=45)
+        for bar in bars2:
+            height = bar.get_height()
+            ax2.text(bar.get_x() + bar.get_width()/2., height,
+                    f'${int(height):,}',
+                    ha='center', va='bottom', fontsize=9)
+
+    # Completeness
+    ax3 = axes[1, 0]
+    bars3 = ax3.bar(regions, data['completeness'], color='orange')
+    ax3.set_ylabel('Completeness (%)', fontsize=12)
+    ax3.set_title('Data Completeness by Region', fontsize=12, fontweight='bold')
+    ax3.set_ylim(0, 100)
+    ax3.tick_params(axis='x', rotation=45)
+    for bar in bars3:
+        height = bar.get_height()
+        ax3.text(bar.get_x() + bar.get_width()/2., height,
+                f'{height:.1f}%',
+                ha='center', va='bottom', fontsize=9)
+
+    # Platform split
+    ax4 = axes[1, 1]
+    x = np.arange(len(regions))
+    width = 0.35
+    ax4.bar(x - width/2, data['indeed_counts'], width, label='Indeed', color='#2164f3')
+    ax4.bar(x + width/2, data['linkedin_counts'], width, label='LinkedIn', color='#0077b5')
+    ax4.set_ylabel('Number of Jobs', fontsize=12)
+    ax4.set_title('Platform Split by Region', fontsize=12, fontweight='bold')
+    ax4.set_xticks(x)
+    ax4.set_xticklabels(regions, rotation=45, ha='right')
+    ax4.legend()
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=spec['dpi'], bbox_inches='tight')
+    plt.close()
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+Report aggregations of generate_local_report and generate_supabase_report, as
+SQL on an in-process DuckDB database.
+
+    analytics = ReportAnalytics({"Singapore": "output/.../jobspy_max_output.parquet",
+                                 "Hong Kong": df_hong_kong})
+    for region in analytics.regions:
+        salary = analytics.salary(region)   # {'has_data': True, 'count': ..., 'mean': ...}
+
+Each region is registered as a Parquet file (the dataset_loader sidecars use
+the report's snake_case column names) or a DataFrame, and all of them are
+exposed as one `jobs` view with the report columns as text. Every aggregate is
+a single GROUP BY region query, so DuckDB scans the data once on all cores and
+spills to disk when it does not fit in memory; only the small per-region
+result tables come back to Python for the docx tables and chart jobs.
+"""
+import os
+
+import duckdb
+
+# Fields of the completeness table, in report order
+COMPLETENESS_FIELDS = [
+    'job_title', 'company_name', 'requirements', 'location',
+    'salary_range', 'estimated_annual_salary', 'estimated_annual_salary_usd',
+    'job_description', 'team_size', 'company_size',
+    'posted_date', 'job_status', 'platform', 'job_link'
+]
+
+# USD salary amounts, e.g. $100k / 100k first, then $100,000 / 100,000
+SALARY_PATTERNS = [
+    r'[\$£€A\$S\$HK\$C\$]?\s*([\d,]+)\s*[kK]',
+    r'[\$£€A\$S\$HK\$C\$]?\s*([\d,]+)',
+]
+SALARY_RANGE = (10000, 500000)  # Reasonable annual salaries (USD)
+
+# Posted dates that are not ISO 8601, tried in order (month first for 01/02/2024, like pandas)
+DATE_FORMATS = ['%Y/%m/%d', '%Y/%m/%d %H:%M:%S', '%m/%d/%Y', '%d/%m/%Y',
+                '%d %B %Y', '%B %d, %Y', '%d %b %Y', '%b %d, %Y']
+
+TOP_LOCATIONS = 10
+
+
+def _sql_string(value):
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _sql_list(values):
+    return "[" + ", ".join(_sql_string(v) for v in values) + "]"
+
+
+class ReportAnalytics:
+    """Per-region report aggregates over DataFrames and Parquet files"""
+
+    def __init__(self, sources, threads=None):
+        """
+        Args:
+            sources: Dictionary mapping region names to DataFrames or Parquet paths
+            threads: DuckDB worker threads (None = all cores)
+        """
+        self.con = duckdb.connect()
+        if threads:
+            self.con.execute(f"SET threads = {int(threads)}")
+        self._region_names = list(sources)
+        self._tables = {}
+
+        selects = []
+        for region_id, source in enumerate(sources.values()):
+            if isinstance(source, (str, os.PathLike)):
+                try:
+                    relation = self.con.read_parquet(os.fspath(source))
+                except duckdb.InvalidInputException as e:  # e.g. the sidecar of an empty workbook
+                    print(f"[WARNING] Skipping {source}: {str(e)[:100]}")
+                    continue
+            elif len(source.columns) > 0:
+                relation = self.con.from_df(source)
+            else:
+                continue
+            relation.create_view(f"region_{region_id}")
+            columns = set(relation.columns)
+            fields = [f'CAST("{name}" AS VARCHAR) AS {name}' if name in columns else f"NULL::VARCHAR AS {name}"
+                      for name in COMPLETENESS_FIELDS]
+            selects.append(f"SELECT {region_id} AS region_id, {', '.join(fields)} FROM region_{region_id}")
+
+        if selects:
+            self.con.execute("CREATE VIEW jobs AS " + " UNION ALL ".join(selects))
+        else:
+            self.con.execute("CREATE VIEW jobs AS SELECT NULL::INTEGER AS region_id, "
+                             + ", ".join(f"NULL::VARCHAR AS {name}" for name in COMPLETENESS_FIELDS) + " LIMIT 0")
+
+        self._row_counts = {self._region_names[region_id]: count for region_id, count in
+                            self.con.execute("SELECT region_id, count(*) FROM jobs GROUP BY region_id").fetchall()}
+        self.regions = [name for name in self._region_names if self._row_counts.get(name)]
+
+    def close(self):
+        self.con.close()
+
+    def _table(self, name, sql):
+        """Rows of an aggregate query grouped by region (first column region_id), run once"""
+        if name not in self._tables:
+            table = {}
+            for row in self.con.execute(sql).fetchall():
+                table.setdefault(self._region_names[row[0]], []).append(row[1:])
+            self._tables[name] = table
+        return self._tables[name].get
+
+    # ------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------
+    @property
+    def total_jobs(self):
+        return sum(self._row_counts.values())
+
+    def row_count(self, region):
+        return self._row_counts.get(region, 0)
+
+    def date_bounds(self, region):
+        """Smallest and largest posted_date value as stored (None when the region has none)"""
+        rows = self._table('date_bounds', """
+            SELECT region_id, min(posted_date), max(posted_date) FROM jobs GROUP BY region_id
+        """)(region)
+        return tuple(rows[0]) if rows else (None, None)
+
+    def completeness(self, region):
+        """Non-blank values per field: {field: {'count': n, 'percentage': pct}}"""
+        counts = ", ".join(f"count(*) FILTER (WHERE regexp_matches({name}, '\\S'))" for name in COMPLETENESS_FIELDS)
+        rows = self._table('completeness', f"SELECT region_id, {counts} FROM jobs GROUP BY region_id")(region)
+        if not rows:
+            return {}
+        total = self.row_count(region)
+        return {field: {'count': count, 'percentage': (count / total * 100) if total > 0 else 0}
+                for field, count in zip(COMPLETENESS_FIELDS, rows[0])}
+
+    def overall_completeness(self, region):
+        """Share of filled cells over all completeness fields (%)"""
+        completeness = self.completeness(region)
+        total_records = self.row_count(region)
+        if not completeness or total_records == 0:
+            return 0
+        filled_fields = sum(v['count'] for v in completeness.values())
+        return float(filled_fields / (len(completeness) * total_records) * 100)
+
+    def salary(self, region):
+        """USD salary statistics (values sorted) of the salaries within SALARY_RANGE"""
+        first, second = (f"TRY_CAST(replace(regexp_extract(salary, {_sql_string(p)}, 1), ',', '') AS DOUBLE)"
+                         for p in SALARY_PATTERNS)
+        rows = self._table('salary', f"""
+            WITH salaries AS (
+                SELECT region_id,
+                       coalesce({first}, {second})
+                           * CASE WHEN contains(lower(salary), 'k') THEN 1000 ELSE 1 END AS value
+                FROM (SELECT region_id, estimated_annual_salary_usd AS salary FROM jobs)
+            )
+            SELECT region_id, count(*), avg(value), median(value), stddev_pop(value), min(value), max(value),
+                   quantile_cont(value, 0.25), quantile_cont(value, 0.75), list(value ORDER BY value)
+            FROM salaries
+            WHERE value BETWEEN {SALARY_RANGE[0]} AND {SALARY_RANGE[1]}
+            GROUP BY region_id
+        """)(region)
+        if not rows:
+            return {'has_data': False}
+        count, mean, median, std, low, high, q25, q75, values = rows[0]
+        return {
+            'has_data': True,
+            'count': count,
+            'mean': mean,
+            'median': median,
+            'std': std,
+            'min': low,
+            'max': high,
+            'q25': q25,
+            'q75': q75,
+            'values': values
+        }
+
+    def time_range(self, region):
+        """
+        Posted date range plus monthly posting counts ({'months': [...], 'counts': [...]}).
+
+        'unparsed' counts the non-blank dates in none of the known formats.
+        """
+        dates = f"""
+            SELECT region_id, posted_date, coalesce(TRY_CAST(posted_date AS TIMESTAMP),
+                                                    try_strptime(posted_date, {_sql_list(DATE_FORMATS)})) AS posted
+            FROM jobs
+        """
+        summary = self._table('time_range', f"""
+            SELECT region_id, count(posted), min(posted), max(posted),
+                   count(*) FILTER (WHERE posted IS NULL AND regexp_matches(posted_date, '\\S'))
+            FROM ({dates}) GROUP BY region_id
+        """)(region)
+        count, earliest, latest, unparsed = summary[0] if summary else (0, None, None, 0)
+        if not count:
+            return {'has_data': False, 'unparsed': unparsed}
+        months = self._table('monthly', f"""
+            SELECT region_id, strftime(posted, '%Y-%m') AS month, count(*) FROM ({dates})
+            WHERE posted IS NOT NULL GROUP BY region_id, month ORDER BY region_id, month
+        """)(region)
+        return {
+            'has_data': True,
+            'count': count,
+            'earliest': earliest,
+            'latest': latest,
+            'span_days': (latest - earliest).days,
+            'monthly': {'months': [month for month, _ in months], 'counts': [n for _, n in months]},
+            'unparsed': unparsed
+        }
+
+    def _value_counts(self, column):
+        """Non-blank values of column with their counts, most frequent first"""
+        return self._table(f'{column}_counts', f"""
+            SELECT region_id, {column}, count(*) AS n FROM jobs
+            WHERE regexp_matches({column}, '\\S')
+            GROUP BY region_id, {column} ORDER BY region_id, n DESC, {column}
+        """)
+
+    def location(self, region):
+        """Top locations and the number of distinct locations"""
+        counts = self._value_counts('location')(region)
+        if not counts:
+            return {'has_data': False}
+        return {
+            'has_data': True,
+            'total_unique': len(counts),
+            'top_locations': dict(counts[:TOP_LOCATIONS])
+        }
+
+    def platform(self, region):
+        """Jobs per platform"""
+        counts = self._value_counts('platform')(region)
+        if not counts:
+            return {'has_data': False}
+        return {
+            'has_data': True,
+            'distribution': dict(counts)
+        }
@@ -6,7 +6,9 @@ Provides single interface for scraping both platforms with deduplication.
 
 import time
 import re
-from typing import List, Optional, Dict, Any, Set
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Any
 from datetime import datetime
 import pandas as pd
 
@@ -68,6 +70,12 @@ class JobSpyScraper:
         "Canada": "canada",
     }
 
+    # Concurrent searches per platform (LinkedIn throttles much earlier than Indeed)
+    DEFAULT_PLATFORM_CONCURRENCY = {
+        "linkedin": 2,
+        "indeed": 4,
+    }
+
     def __init__(
         self,
         platforms: List[str] = None,
@@ -75,16 +83,24 @@ class JobSpyScraper:
         results_per_search: int = 100,
         retry_attempts: int = 3,
         retry_delay: float = 2.0,
+        platform_concurrency: Optional[Dict[str, int]] = None,
+        rate_limiters: Optional[Dict[str, Any]] = None,
+        rates_snapshot: Optional[str] = None,
     ):
         """
         Initialize JobSpy scraper.
 
         Args:
             platforms: List of platforms to scrape ["linkedin", "indeed"]
-            request_delay: Delay between requests in seconds
+            request_delay: Delay between requests in seconds (per worker thread)
             results_per_search: Number of results to request per search
             retry_attempts: Number of retry attempts on failure
             retry_delay: Base delay for exponential backoff
+            platform_concurrency: Concurrent searches per platform
+                (missing platforms use DEFAULT_PLATFORM_CONCURRENCY, 1 = serial)
+            rate_limiters: Limiter per platform, e.g. rate_limiter.RateLimiter from the
+                repository root (platforms without one are only spaced by request_delay)
+            rates_snapshot: Pinned exchange rates file (see CurrencyConverter)
         """
         self.platforms = platforms or ["linkedin", "indeed"]
         self.request_delay = request_delay
@@ -92,14 +108,21 @@ class JobSpyScraper:
         self.retry_attempts = retry_attempts
         self.retry_delay = retry_delay
 
+        concurrency = dict(self.DEFAULT_PLATFORM_CONCURRENCY)
+        concurrency.update(platform_concurrency or {})
+        self.platform_concurrency = {p: max(1, concurrency.get(p, 1)) for p in self.platforms}
+        self._rate_limiters = dict(rate_limiters or {})
+
         # Initialize processors
-        self.currency_converter = CurrencyConverter()
-        self.salary_processor = SalaryProcessor(self.currency_converter)
+        self.currency_converter = CurrencyConverter(rates_snapshot=rates_snapshot)
+        # No converter here: USD amounts are filled in per search by _convert_salaries_to_usd
+        self.salary_processor = SalaryProcessor()
 
-        # Tracking
+        # Tracking (updated from the worker threads)
         self._total_requests = 0
         self._successful_requests = 0
         self._failed_requests = 0
+        self._stats_lock = threading.Lock()
 
     def scrape(
         self,
@@ -114,6 +137,10 @@ class JobSpyScraper:
         """
         Scrape jobs from configured platforms.
 
+        Each (keyword, location, platform) search runs on that platform's thread
+        pool (platform_concurrency workers, the platform's rate limiter).
+        Once max_total_jobs is reached, searches that have not started are cancelled.
+
         Args:
             keywords: List of search keywords
             locations: List of locations to search
@@ -130,13 +157,13 @@ class JobSpyScraper:
             raise ImportError("JobSpy not available. Install with: pip install python-jobspy")
 
         collection = JobDataCollection()
-        seen_keys: Set[str] = set()
 
         if verbose:
             print("=" * 60)
             print(f"JobSpy Unified Scraper - {region_name}")
             print("=" * 60)
             print(f"  Platforms: {', '.join([p.upper() for p in self.platforms])}")
+            print(f"  Concurrency: {', '.join(f'{p.upper()} x{n}' for p, n in self.platform_concurrency.items())}")
             print(f"  Keywords: {len(keywords)}")
             print(f"  Locations: {len(locations)}")
             print(f"  Results per search: {self.results_per_search}")
@@ -150,85 +177,132 @@ class JobSpyScraper:
         self.currency_converter.initialize()
 
         total_combinations = len(keywords) * len(locations) * len(self.platforms)
-        current_combo = 0
-
-        for keyword in keywords:
-            if max_total_jobs and len(collection) >= max_total_jobs:
-                break
+        completed = 0
+        progress_lock = threading.Lock()
+        quota_lock = threading.Lock()
+        stop_event = threading.Event()
+
+        def run_search(keyword: str, location: str, platform: str) -> Optional[str]:
+            """One keyword+location search on one platform; returns the progress line (None if skipped)."""
+            nonlocal completed
+            if stop_event.is_set():
+                return None
 
-            for location in locations:
-                if max_total_jobs and len(collection) >= max_total_jobs:
-                    break
+            with self._stats_lock:
+                self._total_requests += 1
 
-                for platform in self.platforms:
-                    if max_total_jobs and len(collection) >= max_total_jobs:
-                        break
+            # Scrape with retry
+            jobs = self._scrape_with_retry(
+                keyword=keyword,
+                location=location,
+                platform=platform,
+                region_name=region_name,
+            )
 
-                    current_combo += 1
-                    self._total_requests += 1
+            with progress_lock:
+                completed += 1
+                progress = f"[{completed}/{total_combinations}] {platform.upper()}: '{keyword}' in '{location}'..."
 
-                    if verbose:
-                        progress = f"[{current_combo}/{total_combinations}]"
-                        print(f"{progress} {platform.upper()}: '{keyword}' in '{location}'...", end=" ")
+            if jobs is None:
+                with self._stats_lock:
+                    self._failed_requests += 1
+                return f"{progress} [FAILED]"
 
-                    # Scrape with retry
-                    jobs = self._scrape_with_retry(
-                        keyword=keyword,
-                        location=location,
-                        platform=platform,
-                        region_name=region_name,
-                    )
+            with self._stats_lock:
+                self._successful_requests += 1
 
-                    if jobs is None:
-                        self._failed_requests += 1
-                        if verbose:
-                            print("[FAILED]")
-                        continue
+            # Process jobs
+            accepted = []
+            for job_dict in jobs:
+                # Convert to JobData
+                job = JobData.from_jobspy_dict(job_dict, platform)
 
-                    self._successful_requests += 1
+                # Deduplicate (the collection's key set is shared by all workers)
+                if not collection.claim_key(job._dedup_key):
+                    continue
 
-                    # Process jobs
-                    new_count = 0
-                    for job_dict in jobs:
-                        # Convert to JobData
-                        job = JobData.from_jobspy_dict(job_dict, platform)
+                # Date filter
+                if min_posted_date and job.posted_date:
+                    if job.posted_date < min_posted_date:
+                        continue
 
-                        # Deduplicate
-                        if job._dedup_key in seen_keys:
-                            continue
-                        seen_keys.add(job._dedup_key)
+                # AI relevance filter
+                if filter_ai_related:
+                    if not self._is_ai_related(job):
+                        continue
 
-                        # Date filter
-                        if min_posted_date and job.posted_date:
-                            if job.posted_date < min_posted_date:
-                                continue
+                # Process salary
+                self._process_salary(job, region_name)
 
-                        # AI relevance filter
-                        if filter_ai_related:
-                            if not self._is_ai_related(job):
-                                continue
+                # Extract requirements
+                job.requirements = self.salary_processor.extract_requirements(job.description)
+                accepted.append(job)
 
-                        # Process salary
-                        self._process_salary(job, region_name)
+            # USD salaries of the whole search in one conversion
+            self._convert_salaries_to_usd(accepted)
 
-                        # Extract requirements
-                        job.requirements = self.salary_processor.extract_requirements(job.description)
+            # Add to collection
+            new_count = 0
+            for job in accepted:
+                with quota_lock:
+                    if max_total_jobs and len(collection) >= max_total_jobs:
+                        stop_event.set()
+                        break
+                    if collection.add(job, deduplicate=False):  # Already deduped above
+                        new_count += 1
+                    if max_total_jobs and len(collection) >= max_total_jobs:
+                        stop_event.set()
 
-                        # Add to collection
-                        if collection.add(job, deduplicate=False):  # Already deduped above
-                            new_count += 1
+            # Delay between requests
+            if not stop_event.is_set():
+                time.sleep(self.request_delay)
 
-                    if verbose:
-                        print(f"[OK] {len(jobs)} found, {new_count} new (total: {len(collection)})")
+            return f"{progress} [OK] {len(jobs)} found, {new_count} new (total: {len(collection)})"
 
-                    # Delay between requests
-                    time.sleep(self.request_delay)
+        # One pool per platform, so each platform gets its own concurrency cap
+        executors = {
+            platform: ThreadPoolExecutor(max_workers=self.platform_concurrency[platform],
+                                         thread_name_prefix=f"jobspy-{platform}")
+            for platform in self.platforms
+        }
+        futures = {}
+        try:
+            for keyword in keywords:
+                for location in locations:
+                    for platform in self.platforms:
+                        future = executors[platform].submit(run_search, keyword, location, platform)
+                        futures[future] = (keyword, location, platform)
+
+            cancelled = False
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                keyword, location, platform = futures[future]
+                try:
+                    line = future.result()
+                except Exception as e:
+                    with self._stats_lock:
+                        self._failed_requests += 1
+                    line = f"{platform.upper()}: '{keyword}' in '{location}'... [ERROR] {str(e)[:80]}"
+                if verbose and line:
+                    print(line)
+
+                if stop_event.is_set() and not cancelled:
+                    # max_total_jobs reached: drop the searches that have not started yet
+                    for pending in futures:
+                        pending.cancel()
+                    cancelled = True
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True, cancel_futures=True)
 
         if verbose:
             print()
             print("=" * 60)
             print("Scraping Summary")
             print("=" * 60)
+            if stop_event.is_set():
+                print(f"  Stopped at max total jobs: {max_total_jobs}")
             print(f"  Total requests: {self._total_requests}")
             print(f"  Successful: {self._successful_requests}")
             print(f"  Failed: {self._failed_requests}")
@@ -252,8 +326,14 @@ class JobSpyScraper:
         """
         country_code = self.REGION_COUNTRY_MAP.get(region_name, "usa")
 
+        limiter = self._rate_limiters.get(platform)
+
         for attempt in range(self.retry_attempts):
             try:
+                # Per-platform searches-per-minute budget (shared by that platform's workers)
+                if limiter:
+                    limiter.wait_if_needed()
+
                 # Prepare parameters
                 params = {
                     "site_name": platform,
@@ -341,13 +421,24 @@ class JobSpyScraper:
                 region_name=region_name,
             )
 
-        # Update job with processed salary
+        # Update job with processed salary (non-USD amounts are converted by _convert_salaries_to_usd)
         if result['estimated_annual']:
             job.salary_range = result['salary_range']
             job.estimated_annual = result['estimated_annual']
             job.estimated_annual_usd = result['estimated_annual_usd']
             job.currency = result['currency']
 
+    def _convert_salaries_to_usd(self, jobs: List[JobData]):
+        """Fill in estimated_annual_usd of the non-USD salaries with one convert_many call."""
+        pending = [job for job in jobs if job.estimated_annual and job.estimated_annual_usd is None]
+        if not pending:
+            return
+        usd = self.currency_converter.convert_many(
+            [job.estimated_annual for job in pending], [job.currency for job in pending], "USD"
+        )
+        for job, amount in zip(pending, usd):
+            job.estimated_annual_usd = float(amount)
+
     def deduplicate_cross_platform(
         self,
         indeed_jobs: JobDataCollection,
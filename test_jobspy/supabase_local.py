@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+"""
+Local SQLite stand-in for the Supabase (PostgREST) client.
+
+Implements the part of the supabase-py query builder this project uses, so the
+report/export code can run offline against a local file:
+
+    client = LocalSupabaseClient("output/local_supabase.sqlite")
+    client.table("jobs_united_states").insert(rows).execute()
+    client.table("jobs_united_states").select("id, job_title").gt("id", 0).order("id").limit(100).execute().data
+
+Tables are created on first insert with an autoincrement `id` plus
+`created_at`/`updated_at` timestamps, matching the schema in Supabase配置指南.md
+(updated_at is refreshed on every upsert/update, like the trigger there).
+Pass max_rows to cut every select off like PostgREST's db-max-rows (1000 on Supabase).
+Set SUPABASE_LOCAL_DB in supabase_config.py to use it instead of Supabase.
+"""
+import re
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+
+class LocalResponse:
+    """Mimics the postgrest APIResponse (data + count)"""
+
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+def _quote(name):
+    if not re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', name):
+        raise ValueError(f"Invalid identifier: {name}")
+    return f'"{name}"'
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _to_sql_value(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class LocalQuery:
+    """Query builder for one table (select / insert / upsert / update / delete)"""
+
+    def __init__(self, client, table_name):
+        self._client = client
+        self._table = table_name
+        self._action = "select"
+        self._columns = "*"
+        self._count = None
+        self._rows = None
+        self._values = None
+        self._on_conflict = None
+        self._ignore_duplicates = False
+        self._filters = []
+        self._order = []
+        self._limit = None
+        self._offset = None
+
+    # ---- actions ----
+    def select(self, columns="*", count=None):
+        self._action = "select"
+        self._columns = columns
+        self._count = count
+        return self
+
+    def insert(self, rows):
+        self._action = "insert"
+        self._rows = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def upsert(self, rows, on_conflict=None, ignore_duplicates=False):
+        self._action = "upsert"
+        self._rows = rows if isinstance(rows, list) else [rows]
+        self._on_conflict = on_conflict
+        self._ignore_duplicates = ignore_duplicates
+        return self
+
+    def update(self, values):
+        self._action = "update"
+        self._values = values
+        return self
+
+    def delete(self):
+        self._action = "delete"
+        return self
+
+    # ---- filters ----
+    def _filter(self, column, op, value):
+        self._filters.append((column, op, value))
+        return self
+
+    def eq(self, column, value):
+        return self._filter(column, "=", value)
+
+    def neq(self, column, value):
+        return self._filter(column, "!=", value)
+
+    def gt(self, column, value):
+        return self._filter(column, ">", value)
+
+    def gte(self, column, value):
+        return self._filter(column, ">=", value)
+
+    def lt(self, column, value):
+        return self._filter(column, "<", value)
+
+    def lte(self, column, value):
+        return self._filter(column, "<=", value)
+
+    def in_(self, column, values):
+        return self._filter(column, "IN", list(values))
+
+    def order(self, column, desc=False):
+        self._order.append((column, desc))
+        return self
+
+    def limit(self, count):
+        self._limit = count
+        return self
+
+    def range(self, start, end):
+        self._offset = start
+        self._limit = end - start + 1
+        return self
+
+    # ---- execution ----
+    def _where(self):
+        if not self._filters:
+            return "", []
+        clauses, params = [], []
+        for column, op, value in self._filters:
+            if op == "IN":
+                if not value:
+                    clauses.append("0")
+                    continue
+                clauses.append(f"{_quote(column)} IN ({', '.join('?' for _ in value)})")
+                params.extend(value)
+            else:
+                clauses.append(f"{_quote(column)} {op} ?")
+                params.append(value)
+        return " WHERE " + " AND ".join(clauses), params
+
+    def execute(self):
+        return self._client._execute(self)
+
+
+class LocalSupabaseClient:
+    """SQLite-backed client with the supabase-py table() interface (thread-safe)"""
+
+    def __init__(self, db_path=":memory:", max_rows=None):
+        """
+        Args:
+            db_path: SQLite file (":memory:" for a throwaway database)
+            max_rows: Most rows a select returns, whatever its limit (None = no cap)
+        """
+        self.db_path = db_path
+        self.max_rows = max_rows
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+    def table(self, name):
+        return LocalQuery(self, name)
+
+    # ---- schema ----
+    def _table_columns(self, table):
+        rows = self._conn.execute(f"PRAGMA table_info({_quote(table)})").fetchall()
+        return [row["name"] for row in rows]
+
+    def create_table(self, table, columns, unique=None):
+        """Create a table with id/created_at plus TEXT columns (optional UNIQUE constraint)"""
+        with self._lock:
+            self._create_table(table, columns, unique)
+
+    def _create_table(self, table, columns, unique=None):
+        column_defs = [
+            "id INTEGER PRIMARY KEY AUTOINCREMENT",
+            *(f"{_quote(c)} TEXT" for c in columns if c not in ("id", "created_at", "updated_at")),
+            "created_at TEXT",
+            "updated_at TEXT",
+        ]
+        if unique:
+            column_defs.append(f"UNIQUE({', '.join(_quote(c) for c in unique)})")
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {_quote(table)} ({', '.join(column_defs)})")
+
+    def _ensure_columns(self, table, rows):
+        existing = self._table_columns(table)
+        if not existing:
+            columns = []
+            for row in rows:
+                for column in row:
+                    if column not in columns:
+                        columns.append(column)
+            self._create_table(table, columns)
+            return
+        for row in rows:
+            for column in row:
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(column)} TEXT")
+                    existing.append(column)
+
+    # ---- execution ----
+    def _execute(self, query):
+        with self._lock:
+            if query._action == "select":
+                return self._select(query)
+            if query._action in ("insert", "upsert"):
+                result = self._write(query)
+            elif query._action == "update":
+                result = self._update(query)
+            else:
+                result = self._delete(query)
+            self._conn.commit()
+            return result
+
+    def _select(self, query):
+        if not self._table_columns(query._table):
+            return LocalResponse([], 0)
+
+        if query._columns.strip() == "*":
+            columns_sql = "*"
+        else:
+            columns_sql = ", ".join(_quote(c.strip()) for c in query._columns.split(",") if c.strip())
+        where, params = query._where()
+
+        count = None
+        if query._count:
+            count = self._conn.execute(f"SELECT COUNT(*) FROM {_quote(query._table)}{where}", params).fetchone()[0]
+
+        sql = f"SELECT {columns_sql} FROM {_quote(query._table)}{where}"
+        if query._order:
+            sql += " ORDER BY " + ", ".join(f"{_quote(c)} {'DESC' if desc else 'ASC'}" for c, desc in query._order)
+        limit = query._limit
+        if self.max_rows is not None:
+            limit = self.max_rows if limit is None else min(limit, self.max_rows)
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+            if query._offset:
+                sql += f" OFFSET {int(query._offset)}"
+        rows = self._conn.execute(sql, params).fetchall()
+        return LocalResponse([dict(row) for row in rows], count)
+
+    def _write(self, query):
+        rows = query._rows or []
+        if not rows:
+            return LocalResponse([])
+        self._ensure_columns(query._table, rows)
+
+        conflict = None
+        if query._action == "upsert":
+            conflict = [c.strip() for c in (query._on_conflict or "id").split(",")]
+            if conflict != ["id"]:
+                # PostgREST needs a unique constraint for on_conflict; make sure there is one
+                index_name = _quote(f"ux_{query._table}_{'_'.join(conflict)}")
+                self._conn.execute(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {_quote(query._table)} "
+                    f"({', '.join(_quote(c) for c in conflict)})"
+                )
+
+        inserted = []
+        now = _now()
+        for row in rows:
+            row = dict(row)
+            row.setdefault("created_at", now)
+            row["updated_at"] = now
+            columns = list(row)
+            sql = (
+                f"INSERT INTO {_quote(query._table)} ({', '.join(_quote(c) for c in columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})"
+            )
+            if query._action == "upsert":
+                updates = [c for c in columns if c not in conflict and c != "created_at"]
+                if query._ignore_duplicates or not updates:
+                    sql += f" ON CONFLICT ({', '.join(_quote(c) for c in conflict)}) DO NOTHING"
+                else:
+                    sql += (
+                        f" ON CONFLICT ({', '.join(_quote(c) for c in conflict)}) DO UPDATE SET "
+                        + ", ".join(f"{_quote(c)} = excluded.{_quote(c)}" for c in updates)
+                    )
+            cursor = self._conn.execute(sql, [_to_sql_value(row[c]) for c in columns])
+            if cursor.rowcount:
+                inserted.append(row)
+        return LocalResponse(inserted)
+
+    def _update(self, query):
+        if not query._values:
+            return LocalResponse([])
+        update_values = dict(query._values, updated_at=_now())
+        self._ensure_columns(query._table, [update_values])
+        where, params = query._where()
+        assignments = ", ".join(f"{_quote(c)} = ?" for c in update_values)
+        values = [_to_sql_value(v) for v in update_values.values()]
+        cursor = self._conn.execute(f"UPDATE {_quote(query._table)} SET {assignments}{where}", values + params)
+        return LocalResponse([], cursor.rowcount)
+
+    def _delete(self, query):
+        if not self._table_columns(query._table):
+            return LocalResponse([], 0)
+        where, params = query._where()
+        cursor = self._conn.execute(f"DELETE FROM {_quote(query._table)}{where}", params)
+        return LocalResponse([], cursor.rowcount)
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+Local SQLite mirror of the Supabase region tables.
+
+Reports read from the mirror instead of pulling every table on each run. A sync
+only asks Supabase for rows changed since the stored watermark and merges them
+by primary key (id):
+
+    mirror = SupabaseMirror("output/supabase_mirror.sqlite")
+    mirror.sync_all(client, supabase_config.REGION_TABLE_MAP)
+    all_data = mirror.load_all(supabase_config.REGION_TABLE_MAP, columns=[...])
+
+The watermark column is updated_at (see the migration in Supabase配置指南.md).
+updated_at is set when a row is written, not when its transaction commits, so
+each sync re-reads WATERMARK_OVERLAP before the watermark and rows seen twice
+are merged by id. Tables without it fall back to an id watermark, which only
+picks up new rows.
+Deleted rows are not tracked; use sync(..., full=True) to rebuild a table.
+"""
+import re
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from supabase_reader import fetch_table, MAX_WORKERS
+
+MIRROR_DB = "output/supabase_mirror.sqlite"
+WATERMARK_COLUMN = "updated_at"
+# Rows committed up to this long after the watermark was read may carry an older updated_at
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+def _quote(name):
+    if not re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', name):
+        raise ValueError(f"Invalid identifier: {name}")
+    return f'"{name}"'
+
+
+def _to_sql_value(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class SupabaseMirror:
+    """SQLite copy of the region tables plus a per-table sync watermark (thread-safe)"""
+
+    def __init__(self, db_path=MIRROR_DB):
+        self.db_path = db_path
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS _sync_state ("
+            "table_name TEXT PRIMARY KEY, watermark_column TEXT, watermark TEXT, "
+            "watermark_id INTEGER, rows INTEGER, synced_at TEXT)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    # ---- state ----
+    def get_state(self, table_name):
+        """(watermark_column, watermark, watermark_id) of the last sync, or (None, None, None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT watermark_column, watermark, watermark_id FROM _sync_state WHERE table_name = ?",
+                (table_name,),
+            ).fetchone()
+        return row if row else (None, None, None)
+
+    def _set_state(self, table_name, column, watermark, watermark_id):
+        count = self._conn.execute(f"SELECT COUNT(*) FROM {_quote(table_name)}").fetchone()[0]
+        self._conn.execute(
+            "INSERT OR REPLACE INTO _sync_state VALUES (?, ?, ?, ?, ?, ?)",
+            (table_name, column, watermark, watermark_id, count, datetime.now().isoformat()),
+        )
+
+    # ---- schema ----
+    def _table_columns(self, table_name):
+        rows = self._conn.execute(f"PRAGMA table_info({_quote(table_name)})").fetchall()
+        return [row[1] for row in rows]
+
+    def _ensure_table(self, table_name, rows):
+        existing = self._table_columns(table_name)
+        if not existing:
+            self._conn.execute(f"CREATE TABLE {_quote(table_name)} (id INTEGER PRIMARY KEY)")
+            existing = ["id"]
+        for row in rows:
+            for column in row:
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE {_quote(table_name)} ADD COLUMN {_quote(column)}")
+                    existing.append(column)
+
+    # ---- sync ----
+    def merge(self, table_name, rows):
+        """Insert or replace rows by id"""
+        if not rows:
+            return
+        with self._lock:
+            self._ensure_table(table_name, rows)
+            for row in rows:
+                columns = list(row)
+                self._conn.execute(
+                    f"INSERT INTO {_quote(table_name)} ({', '.join(_quote(c) for c in columns)}) "
+                    f"VALUES ({', '.join('?' for _ in columns)}) ON CONFLICT(id) DO UPDATE SET "
+                    + ", ".join(f"{_quote(c)} = excluded.{_quote(c)}" for c in columns if c != "id"),
+                    [_to_sql_value(row[c]) for c in columns],
+                )
+            self._conn.commit()
+
+    def _mirrored_versions(self, table_name, ids, chunk_size=500):
+        """{id: updated_at} of the mirrored rows among ids"""
+        versions = {}
+        with self._lock:
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start:start + chunk_size]
+                versions.update(self._conn.execute(
+                    f"SELECT id, {_quote(WATERMARK_COLUMN)} FROM {_quote(table_name)} "
+                    f"WHERE id IN ({', '.join('?' for _ in chunk)})", chunk,
+                ).fetchall())
+        return versions
+
+    def sync(self, client, table_name, full=False, executor=None):
+        """
+        Pull rows changed since the last sync and merge them into the mirror.
+
+        Args:
+            client: Supabase or LocalSupabaseClient
+            table_name: Table to mirror
+            full: Drop the local copy and pull the whole table
+            executor: Optional ThreadPoolExecutor for the id-range fetches
+
+        Returns:
+            Number of new or changed rows merged
+        """
+        if full:
+            with self._lock:
+                self._conn.execute(f"DROP TABLE IF EXISTS {_quote(table_name)}")
+                self._conn.execute("DELETE FROM _sync_state WHERE table_name = ?", (table_name,))
+                self._conn.commit()
+
+        column, watermark, watermark_id = self.get_state(table_name)
+        if column == "id":
+            # Table has no updated_at: only new rows can be detected
+            rows = fetch_table(client, table_name, filters=[("gt", "id", watermark_id)], executor=executor)
+        elif watermark:
+            # The watermark is the updated_at of the newest mirrored row. A transaction that
+            # started before the last sync can commit rows stamped earlier than it, so the
+            # overlap window is read again; rows already mirrored at that version are dropped
+            since = (datetime.fromisoformat(watermark) - WATERMARK_OVERLAP).isoformat()
+            rows = fetch_table(client, table_name, filters=[("gte", WATERMARK_COLUMN, since)], executor=executor)
+            mirrored = self._mirrored_versions(table_name, [row["id"] for row in rows])
+            rows = [row for row in rows if mirrored.get(row["id"]) != row.get(WATERMARK_COLUMN)]
+        else:
+            rows = fetch_table(client, table_name, executor=executor)
+            if rows:
+                column = WATERMARK_COLUMN if any(row.get(WATERMARK_COLUMN) for row in rows) else "id"
+
+        self.merge(table_name, rows)
+
+        if rows and column == "id":
+            watermark_id = max(row["id"] for row in rows)
+        elif rows:
+            newest = max((row[WATERMARK_COLUMN], row["id"]) for row in rows if row.get(WATERMARK_COLUMN))
+            # Late rows from the overlap window must not move the watermark back
+            if not watermark or datetime.fromisoformat(newest[0]) > datetime.fromisoformat(watermark):
+                watermark, watermark_id = newest
+        with self._lock:
+            self._ensure_table(table_name, [])
+            self._set_state(table_name, column, watermark, watermark_id)
+            self._conn.commit()
+        return len(rows)
+
+    def sync_all(self, client, region_table_map, full=False, max_workers=MAX_WORKERS, verbose=True):
+        """
+        Sync several region tables in parallel.
+
+        Returns:
+            Dictionary mapping region names to rows pulled (None on error)
+        """
+        pulled = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as range_executor, \
+                ThreadPoolExecutor(max_workers=max(1, len(region_table_map))) as region_executor:
+            futures = {
+                region_name: region_executor.submit(self.sync, client, table_name, full, range_executor)
+                for region_name, table_name in region_table_map.items()
+            }
+            for region_name, future in futures.items():
+                try:
+                    pulled[region_name] = future.result()
+                    if verbose:
+                        print(f"  {region_name}: pulled {pulled[region_name]} changed records")
+                except Exception as e:
+                    pulled[region_name] = None
+                    if verbose:
+                        print(f"  {region_name}: Sync error (using local copy): {str(e)[:100]}")
+        return pulled
+
+    # ---- reading ----
+    def load(self, table_name, columns=None):
+        """Mirrored rows of one table as a DataFrame (ordered by id)"""
+        with self._lock:
+            existing = self._table_columns(table_name)
+            if not existing:
+                return pd.DataFrame(columns=columns or [])
+            if columns is None:
+                selected = existing
+            else:
+                selected = [c for c in columns if c in existing]
+            if not selected:
+                return pd.DataFrame(columns=columns)
+            sql = f"SELECT {', '.join(_quote(c) for c in selected)} FROM {_quote(table_name)} ORDER BY id"
+            return pd.read_sql_query(sql, self._conn)
+
+    def load_all(self, region_table_map, columns=None):
+        """Dictionary mapping region names to mirrored DataFrames"""
+        return {region_name: self.load(table_name, columns) for region_name, table_name in region_table_map.items()}
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Concurrent, keyset-paginated reader for the Supabase job tables.
+
+Offset paging (`range(offset, offset + 999)`) gets slower the deeper it goes and
+`select("*")` transfers every column. This reader:
+- pages by `id` (`id > last_id ORDER BY id LIMIT n`), so every page costs the same
+- splits large tables into id ranges fetched in parallel, and reads regions in parallel
+- selects only the columns the caller asks for
+
+Works with the supabase-py client and with supabase_local.LocalSupabaseClient.
+"""
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+PAGE_SIZE = 1000
+MAX_WORKERS = 8
+# Parallel id ranges per table (only used when the table spans several pages)
+PARTITIONS_PER_TABLE = 4
+
+
+def create_client_from_config(write=False):
+    """
+    Build a client from supabase_config.py.
+
+    Uses the local SQLite stand-in when SUPABASE_LOCAL_DB is set, otherwise
+    Supabase (service key preferred for writes).
+    """
+    import supabase_config
+
+    local_db = getattr(supabase_config, 'SUPABASE_LOCAL_DB', None)
+    if local_db:
+        from supabase_local import LocalSupabaseClient
+        return LocalSupabaseClient(local_db)
+
+    from supabase import create_client
+
+    supabase_url = getattr(supabase_config, 'SUPABASE_URL', None)
+    supabase_key = None
+    if write:
+        supabase_key = getattr(supabase_config, 'SUPABASE_SERVICE_KEY', None)
+    if not supabase_key:
+        supabase_key = getattr(supabase_config, 'SUPABASE_KEY', None)
+    if not supabase_url or not supabase_key:
+        raise ValueError("Supabase credentials not configured")
+    return create_client(supabase_url, supabase_key)
+
+
+def _select_columns(columns):
+    """Column list for select(); id is always included for keyset paging"""
+    if columns is None:
+        return "*"
+    columns = [c for c in columns if c != "id"]
+    return ", ".join(["id"] + columns)
+
+
+def _apply_filters(query, filters):
+    """filters: list of (method, column, value), e.g. ("gte", "created_at", "2025-01-01")"""
+    for method, column, value in filters or []:
+        query = getattr(query, method)(column, value)
+    return query
+
+
+def _id_bound(client, table_name, filters, desc):
+    query = client.table(table_name).select("id")
+    query = _apply_filters(query, filters)
+    result = query.order("id", desc=desc).limit(1).execute()
+    return result.data[0]["id"] if result.data else None
+
+
+def _fetch_id_range(client, table_name, select, filters, low, high, page_size):
+    """Keyset-page all rows with low <= id < high (high=None: no upper bound)"""
+    records = []
+    last_id = None
+    while True:
+        query = client.table(table_name).select(select)
+        query = _apply_filters(query, filters)
+        if last_id is None:
+            query = query.gte("id", low)
+        else:
+            query = query.gt("id", last_id)
+        if high is not None:
+            query = query.lt("id", high)
+        result = query.order("id").limit(page_size).execute()
+        page = result.data or []
+        records.extend(page)
+        if len(page) < page_size:
+            return records
+        last_id = page[-1]["id"]
+
+
+def fetch_table(client, table_name, columns=None, filters=None, page_size=PAGE_SIZE,
+                partitions=PARTITIONS_PER_TABLE, executor=None):
+    """
+    Fetch rows of one table ordered by id.
+
+    Args:
+        client: Supabase or LocalSupabaseClient
+        table_name: Table to read
+        columns: Columns to select (None = all); id is always included
+        filters: List of (method, column, value) filters, e.g. [("gte", "created_at", "...")]
+        page_size: Rows per request
+        partitions: Max id ranges fetched in parallel
+        executor: Optional ThreadPoolExecutor to run partitions on
+
+    Returns:
+        List of row dicts
+    """
+    select = _select_columns(columns)
+    low = _id_bound(client, table_name, filters, desc=False)
+    if low is None:
+        return []
+    high = _id_bound(client, table_name, filters, desc=True)
+
+    # Split the id span into ranges; small tables are read in one go
+    span = high - low + 1
+    partitions = max(1, min(partitions, math.ceil(span / page_size)))
+    step = math.ceil(span / partitions)
+    bounds = [(low + i * step, low + (i + 1) * step if i < partitions - 1 else None) for i in range(partitions)]
+
+    if partitions == 1:
+        return _fetch_id_range(client, table_name, select, filters, low, None, page_size)
+    if executor is not None:
+        return _gather(executor, client, table_name, select, filters, bounds, page_size)
+    with ThreadPoolExecutor(max_workers=partitions) as own_executor:
+        return _gather(own_executor, client, table_name, select, filters, bounds, page_size)
+
+
+def _gather(executor, client, table_name, select, filters, bounds, page_size):
+    futures = [
+        executor.submit(_fetch_id_range, client, table_name, select, filters, lo, hi, page_size)
+        for lo, hi in bounds
+    ]
+    records = []
+    for future in futures:  # ranges are in id order
+        records.extend(future.result())
+    return records
+
+
+def fetch_tables(client, region_table_map, columns=None, filters=None, page_size=PAGE_SIZE,
+                 max_workers=MAX_WORKERS, partitions=PARTITIONS_PER_TABLE, verbose=True):
+    """
+    Fetch several region tables in parallel.
+
+    Returns:
+        Dictionary mapping region names to DataFrames (empty DataFrame on error)
+    """
+    all_data = {}
+    # Partitions run on their own pool so region tasks never wait on a pool they occupy
+    with ThreadPoolExecutor(max_workers=max_workers) as range_executor, \
+            ThreadPoolExecutor(max_workers=max(1, len(region_table_map))) as region_executor:
+        futures = {
+            region_name: region_executor.submit(
+                fetch_table, client, table_name, columns, filters, page_size, partitions, range_executor
+            )
+            for region_name, table_name in region_table_map.items()
+        }
+        for region_name, future in futures.items():
+            try:
+                records = future.result()
+                all_data[region_name] = pd.DataFrame(records)
+                if verbose:
+                    print(f"  {region_name}: loaded {len(records)} records")
+            except Exception as e:
+                if verbose:
+                    print(f"  {region_name}: Error: {str(e)[:100]}")
+                all_data[region_name] = pd.DataFrame()
+    return all_data
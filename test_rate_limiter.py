@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+测试共享限速器 rate_limiter.RateLimiter
+
+- 32个线程并发时，任意窗口内的请求数和token数不超过限制
+  （按限速器返回的放行时间统计，返回后的调度延迟不影响结果）
+- asyncio 接口同样遵守限制
+- ProcessSharedRateLimiter：4个进程共享同一个限额
+- 微基准：窗口已满时的单次调用开销（deque 对比旧版列表重建）
+
+运行: python test_rate_limiter.py
+"""
+import time
+import asyncio
+import threading
+import multiprocessing
+from bisect import bisect_right
+
+from rate_limiter import RateLimiter, ProcessSharedRateLimiter
+
+WORKERS = 32
+WINDOW = 1.0  # short window so the test runs in a few seconds
+
+
+def max_in_window(events, window):
+    """Largest total weight of events within any window (events: sorted (time, weight))"""
+    times = [t for t, _ in events]
+    prefix = [0]
+    for _, weight in events:
+        prefix.append(prefix[-1] + weight)
+    best = 0
+    for i, start in enumerate(times):
+        # events in [start, start + window)
+        j = bisect_right(times, start + window - 1e-9)
+        best = max(best, prefix[j] - prefix[i])
+    return best
+
+
+def run_threads(limiter, duration, tokens=0):
+    events = []
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def worker():
+        while time.monotonic() < deadline:
+            granted = limiter.wait_if_needed(tokens=tokens)
+            with lock:
+                events.append((granted, tokens or 1))
+
+    threads = [threading.Thread(target=worker) for _ in range(WORKERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(events)
+
+
+def test_requests_per_minute_under_32_workers():
+    limit = 20
+    limiter = RateLimiter(requests_per_minute=limit, window_seconds=WINDOW)
+    events = run_threads(limiter, duration=2.5)
+    peak = max_in_window(events, WINDOW)
+    print(f"  RPM: {len(events)} requests, peak {peak}/{limit} per window")
+    assert peak <= limit
+    assert len(events) >= 2 * limit  # limiter lets traffic through, it does not stall
+
+
+def test_tokens_per_minute_under_32_workers():
+    token_limit = 1000
+    limiter = RateLimiter(requests_per_minute=None, tokens_per_minute=token_limit, window_seconds=WINDOW)
+    events = run_threads(limiter, duration=2.5, tokens=90)
+    peak = max_in_window(events, WINDOW)
+    print(f"  TPM: {len(events)} requests, peak {peak}/{token_limit} tokens per window")
+    assert peak <= token_limit
+
+
+def test_async_interface():
+    limit = 15
+    limiter = RateLimiter(requests_per_minute=limit, window_seconds=WINDOW)
+    events = []
+
+    async def task():
+        for _ in range(3):
+            events.append((await limiter.acquire_async(), 1))
+
+    async def main():
+        await asyncio.gather(*(task() for _ in range(WORKERS)))
+
+    asyncio.run(main())
+    peak = max_in_window(sorted(events), WINDOW)
+    print(f"  async: {len(events)} requests, peak {peak}/{limit} per window")
+    assert len(events) == WORKERS * 3
+    assert peak <= limit
+
+
+def process_worker(limiter, deadline, queue):
+    times = []
+    while time.monotonic() < deadline:
+        times.append(limiter.wait_if_needed())
+    queue.put(times)
+
+
+def test_process_shared_limit():
+    limit = 20
+    processes = 4
+    limiter = ProcessSharedRateLimiter(requests_per_minute=limit, window_seconds=WINDOW)
+    queue = multiprocessing.Queue()
+    deadline = time.monotonic() + 2.5
+    workers = [multiprocessing.Process(target=process_worker, args=(limiter, deadline, queue))
+               for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+    times = [t for _ in workers for t in queue.get()]
+    for worker in workers:
+        worker.join()
+    events = [(t, 1) for t in sorted(times)]
+    peak = max_in_window(events, WINDOW)
+    print(f"  processes: {len(events)} requests from {processes} processes, peak {peak}/{limit} per window")
+    assert peak <= limit
+    assert len(events) >= 2 * limit
+
+
+class ListRateLimiter:
+    """Previous implementation: rebuilds the window list on every call"""
+
+    def __init__(self, requests_per_minute):
+        self.requests_per_minute = requests_per_minute
+        self.request_times = []
+
+    def try_acquire(self):
+        now = time.time()
+        window_start = now - 60
+        self.request_times = [t for t in self.request_times if t > window_start]
+        if len(self.request_times) < self.requests_per_minute:
+            self.request_times.append(now)
+            return True
+        return False
+
+
+def benchmark(calls=20000, window_size=5000):
+    """Per-call cost with a full window (the case concurrent workers hit)"""
+    old = ListRateLimiter(window_size)
+    for _ in range(window_size):
+        old.try_acquire()
+    started = time.perf_counter()
+    for _ in range(calls // 10):
+        old.try_acquire()
+    old_us = (time.perf_counter() - started) / (calls // 10) * 1e6
+
+    new = RateLimiter(requests_per_minute=window_size)
+    for _ in range(window_size):
+        new._try_acquire(0)
+    started = time.perf_counter()
+    for _ in range(calls):
+        new._try_acquire(0)
+    new_us = (time.perf_counter() - started) / calls * 1e6
+
+    print(f"  benchmark (window of {window_size}): list {old_us:.1f} us/call, deque {new_us:.2f} us/call")
+    return old_us, new_us
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("RateLimiter tests")
+    print("=" * 60)
+    test_requests_per_minute_under_32_workers()
+    test_tokens_per_minute_under_32_workers()
+    test_async_interface()
+    test_process_shared_limit()
+    benchmark()
+    print("[OK] All rate limiter tests passed")